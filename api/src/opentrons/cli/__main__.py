@@ -2,4 +2,6 @@
 
 from . import main
 
-main()
+# Batch analysis workers may import this module as their main module.
+if __name__ == "__main__":
+    main()
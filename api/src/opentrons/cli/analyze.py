@@ -1,7 +1,9 @@
 """Opentrons analyze CLI."""
 import click
+import time
 
 from anyio import run, Path as AsyncPath
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from pydantic import BaseModel
@@ -39,13 +41,37 @@ from opentrons.protocol_engine import (
     help="Return analysis results as machine-readable JSON.",
     type=click.Path(path_type=AsyncPath),
 )
-def analyze(files: Sequence[Path], json_output: Optional[Path]) -> None:
+@click.option(
+    "--batch",
+    help=(
+        "Analyze each file or directory as a separate protocol,"
+        " and write one line of JSON per protocol as each analysis finishes."
+    ),
+    is_flag=True,
+)
+@click.option(
+    "--jobs",
+    help=(
+        "In batch mode, how many protocols to analyze at once."
+        " Defaults to the number of CPUs."
+    ),
+    type=click.IntRange(min=1),
+)
+def analyze(
+    files: Sequence[Path],
+    json_output: Optional[AsyncPath],
+    batch: bool,
+    jobs: Optional[int],
+) -> None:
     """Analyze a protocol.
 
     You can use `opentrons analyze` to get a protocol's expected
     equipment and commands.
     """
-    run(_analyze, files, json_output)
+    if batch:
+        _analyze_batch(files, json_output, jobs)
+    else:
+        run(_analyze, files, json_output)
 
 
 def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
@@ -67,40 +93,11 @@ async def _analyze(
     input_files = _get_input_files(files_and_dirs)
 
     try:
-        protocol_source = await ProtocolReader().read_saved(
-            files=input_files,
-            directory=None,
-        )
+        results = await _analyze_files(input_files)
     except ProtocolFilesInvalidError as error:
         raise click.ClickException(str(error))
 
-    # TODO(mm, 2022-10-21): If protocol_source says it's for an OT-3, configure this
-    # runner to use an OT-3 simulating hardware controller.
-    runner = await create_simulating_runner()
-    analysis = await runner.run(protocol_source)
-
     if json_output:
-        results = AnalyzeResults(
-            createdAt=datetime.now(tz=timezone.utc),
-            files=[
-                ProtocolFile(name=f.path.name, role=f.role)
-                for f in protocol_source.files
-            ],
-            config=(
-                JsonConfig(schemaVersion=protocol_source.config.schema_version)
-                if isinstance(protocol_source.config, JsonProtocolConfig)
-                else PythonConfig(apiVersion=protocol_source.config.api_version)
-            ),
-            metadata=protocol_source.metadata,
-            robotType=protocol_source.robot_type,
-            commands=analysis.commands,
-            errors=analysis.state_summary.errors,
-            labware=analysis.state_summary.labware,
-            pipettes=analysis.state_summary.pipettes,
-            modules=analysis.state_summary.modules,
-            liquids=analysis.state_summary.liquids,
-        )
-
         await json_output.write_text(
             results.json(exclude_none=True),
             encoding="utf-8",
@@ -112,6 +109,112 @@ async def _analyze(
         )
 
 
+async def _analyze_files(input_files: Sequence[Path]) -> "AnalyzeResults":
+    protocol_source = await ProtocolReader().read_saved(
+        files=input_files,
+        directory=None,
+    )
+
+    # TODO(mm, 2022-10-21): If protocol_source says it's for an OT-3, configure this
+    # runner to use an OT-3 simulating hardware controller.
+    runner = await create_simulating_runner()
+    analysis = await runner.run(protocol_source)
+
+    return AnalyzeResults(
+        createdAt=datetime.now(tz=timezone.utc),
+        files=[
+            ProtocolFile(name=f.path.name, role=f.role) for f in protocol_source.files
+        ],
+        config=(
+            JsonConfig(schemaVersion=protocol_source.config.schema_version)
+            if isinstance(protocol_source.config, JsonProtocolConfig)
+            else PythonConfig(apiVersion=protocol_source.config.api_version)
+        ),
+        metadata=protocol_source.metadata,
+        robotType=protocol_source.robot_type,
+        commands=analysis.commands,
+        errors=analysis.state_summary.errors,
+        labware=analysis.state_summary.labware,
+        pipettes=analysis.state_summary.pipettes,
+        modules=analysis.state_summary.modules,
+        liquids=analysis.state_summary.liquids,
+    )
+
+
+def _analyze_batch(
+    protocols: Sequence[Path],
+    json_output: Optional[AsyncPath],
+    jobs: Optional[int],
+) -> None:
+    if not json_output:
+        raise click.UsageError("Batch mode requires `--json-output`.")
+
+    failed = 0
+
+    # Worker processes are reused from one protocol to the next,
+    # so each one only pays for its imports and warm-up once.
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_warm_up_worker
+    ) as executor, open(json_output, "w", encoding="utf-8") as output:
+        futures = {
+            executor.submit(_analyze_batch_entry, protocol): protocol
+            for protocol in protocols
+        }
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                # E.g. a worker process died, which breaks the whole pool.
+                result = BatchAnalyzeResult(
+                    protocol=str(futures[future]),
+                    error=_describe_error(error),
+                )
+            output.write(result.json(exclude_none=True) + "\n")
+            output.flush()
+            if result.error is not None:
+                failed += 1
+
+    if failed:
+        raise click.ClickException(
+            f"{failed} of {len(protocols)} protocols could not be analyzed."
+        )
+
+
+def _warm_up_worker() -> None:
+    async def _build_runner() -> None:
+        await create_simulating_runner()
+
+    # Building a runner imports the hardware simulator and the Protocol API
+    # ahead of the worker's first protocol.
+    run(_build_runner)
+
+
+def _analyze_batch_entry(protocol: Path) -> "BatchAnalyzeResult":
+    start = time.perf_counter()
+
+    try:
+        results = run(_analyze_files, _get_input_files([protocol]))
+    except Exception as error:
+        return BatchAnalyzeResult(
+            protocol=str(protocol),
+            durationSeconds=time.perf_counter() - start,
+            error=_describe_error(error),
+        )
+
+    return BatchAnalyzeResult(
+        protocol=str(protocol),
+        durationSeconds=time.perf_counter() - start,
+        analysis=results,
+    )
+
+
+def _describe_error(error: Exception) -> str:
+    if isinstance(error, ProtocolFilesInvalidError):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
 class ProtocolFile(BaseModel):
     """A file in a protocol analysis."""
 
@@ -147,3 +250,12 @@ class AnalyzeResults(BaseModel):
     modules: List[LoadedModule]
     liquids: List[Liquid]
     errors: List[ErrorOccurrence]
+
+
+class BatchAnalyzeResult(BaseModel):
+    """One line of batch analysis output, for a single protocol."""
+
+    protocol: str
+    durationSeconds: Optional[float]
+    analysis: Optional[AnalyzeResults]
+    error: Optional[str]
@@ -198,6 +198,11 @@ class SmoothieDriver:
         }
 
         self._is_hard_halting = asyncio.Event()
+        #: Whether moves go into Smoothieware's planner without an M400,
+        #: see queued_moves
+        self._queue_moves = False
+        #: Whether any queued move may still be running
+        self._moves_pending = False
         self._move_split_config: MoveSplits = {}
         #: Cache of currently configured splits from callers
         self._axes_moved_at = AxisMoveTimestamp(AXES)
@@ -824,6 +829,7 @@ class SmoothieDriver:
         suppress_error_msg: bool = False,
         ack_timeout: float = DEFAULT_ACK_TIMEOUT,
         suppress_home_after_error: bool = False,
+        queue: bool = False,
     ) -> str:
         """
         Submit a GCODE command to the robot, followed by M400 to block until
@@ -859,12 +865,16 @@ class SmoothieDriver:
             like home, it should be long enough to allow the command to
             complete in the worst case. If this is None, the timeout will
             be infinite. This is almost certainly not what you want.
+        :param queue: leave the command in Smoothieware's planner instead of
+            waiting for it with an M400. The next command that isn't queued
+            waits for it to finish first.
         """
         if self.simulating:
             return ""
+        moves_pending = self._moves_pending
         try:
             return await self._send_command_unsynchronized(
-                command, ack_timeout, timeout
+                command, ack_timeout, timeout, queue
             )
         except SmoothieError as se:
             # XXX: This is a reentrancy error because another command could
@@ -876,7 +886,7 @@ class SmoothieDriver:
             if not suppress_error_msg:
                 log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
             if (
-                GCODE.MOVE in command or GCODE.PROBE in command
+                GCODE.MOVE in command or GCODE.PROBE in command or moves_pending
             ) and not suppress_home_after_error:
                 if error_axis not in "XYZABC":
                     error_axis = AXES
@@ -885,21 +895,55 @@ class SmoothieDriver:
             raise SmoothieError(se.ret_code, str(command))
 
     async def _send_command_unsynchronized(
-        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+        self,
+        command: CommandBuilder,
+        ack_timeout: float,
+        execute_timeout: float,
+        queue: bool = False,
     ) -> str:
         assert self._connection, "There is no connection."
         command_result = ""
         try:
-            command_result = await self._connection.send_command(
-                command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
-            )
+            if queue:
+                command_result = await self._connection.send_command(
+                    command=command,
+                    retries=DEFAULT_COMMAND_RETRIES,
+                    timeout=ack_timeout,
+                )
+                self._moves_pending = True
+                return command_result
+
             wait_command = CommandBuilder(
                 terminator=SMOOTHIE_COMMAND_TERMINATOR
             ).add_gcode(gcode=GCODE.WAIT)
+            if command == wait_command:
+                # Only waiting for queued moves, see queued_moves
+                await self._connection.send_command(
+                    command=wait_command, retries=0, timeout=execute_timeout
+                )
+                self._moves_pending = False
+                return command_result
+
+            if self._moves_pending:
+                # Smoothieware runs the gcodes in a line in order, so a
+                # leading M400 holds the command back until queued moves
+                # are done.
+                command = (
+                    _command_builder()
+                    .add_gcode(gcode=GCODE.WAIT)
+                    .add_builder(builder=command)
+                )
+                ack_timeout = execute_timeout
+            command_result = await self._connection.send_command(
+                command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
+            )
             await self._connection.send_command(
                 command=wait_command, retries=0, timeout=execute_timeout
             )
+            self._moves_pending = False
         except AlarmResponse as e:
+            # An alarm halts Smoothieware and drops its planner queue.
+            self._moves_pending = False
             self._handle_return(ret_code=e.response, is_alarm=True)
         except ErrorResponse as e:
             self._handle_return(ret_code=e.response, is_error=True)
@@ -1230,6 +1274,9 @@ class SmoothieDriver:
 
         This command respects the run flag and will wait until it is set.
 
+        Inside a `queued_moves` block, the move may still be running when
+        this returns.
+
         The function may issue up to 3 moves:
         - if move splitting is required, the split move
         - the actual move, plus a bit extra to give room to preload backlash
@@ -1322,7 +1369,18 @@ class SmoothieDriver:
         primary_command_string = create_coords_list(moving_target)
         backlash_command_string = create_coords_list(backlash_target)
 
-        self.dwell_axes("".join(non_moving_axes))
+        plunger_axis_moved = "".join(set("BC") & set(target.keys()))
+        # Plunger moves are followed by a current change, and split moves are
+        # preceded by one, so neither can be left running in the planner.
+        queue = (
+            self._queue_moves and not plunger_axis_moved and not split_command_string
+        )
+
+        # A queued move's currents take effect while earlier queued moves are
+        # still running, so don't lower the current of any axis until they're
+        # done.
+        if not queue:
+            self.dwell_axes("".join(non_moving_axes))
         self.activate_axes("".join(moving_axes))
 
         checked_speed = speed or self._combined_speed
@@ -1404,10 +1462,11 @@ class SmoothieDriver:
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
             await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            await self._send_command(
+                command, timeout=DEFAULT_EXECUTE_TIMEOUT, queue=queue
+            )
         finally:
             # dwell pipette motors because they get hot
-            plunger_axis_moved = "".join(set("BC") & set(target.keys()))
             if plunger_axis_moved:
                 self.dwell_axes(plunger_axis_moved)
                 await self._set_saved_current()
@@ -1415,6 +1474,35 @@ class SmoothieDriver:
 
         self._update_position(target)
 
+    @contextlib.asynccontextmanager
+    async def queued_moves(self) -> AsyncIterator[None]:
+        """Stream moves into Smoothieware's planner until the block exits.
+
+        Gantry moves made in the block are not each followed by an M400, so
+        Smoothieware can blend them without stopping, and without waiting on
+        a serial round trip between them. A single M400 when the block exits
+        waits for all of them to finish.
+
+        Any other command, and any move of a plunger or that has to be split,
+        still waits for the queued moves to finish before it runs. An alarm
+        from a queued move is handled like one from any other move.
+        """
+        if self._queue_moves:
+            yield
+            return
+
+        self._queue_moves = True
+        try:
+            yield
+        finally:
+            self._queue_moves = False
+
+        if self._moves_pending:
+            await self._send_command(
+                _command_builder().add_gcode(gcode=GCODE.WAIT),
+                timeout=DEFAULT_EXECUTE_TIMEOUT,
+            )
+
     async def home(
         self, axis: str = AXES, disabled: str = DISABLE_AXES
     ) -> Dict[str, float]:
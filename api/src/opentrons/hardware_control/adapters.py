@@ -1,8 +1,10 @@
 """ Adapters for the :py:class:`.hardware_control.API` instances.
 """
 import asyncio
+import contextlib
 import functools
-from typing import Generic, TypeVar, Callable, Any, cast
+import threading
+from typing import Generic, TypeVar, Callable, Any, Coroutine, Iterator, cast
 from .protocols import AsyncioConfigurable
 
 
@@ -11,6 +13,27 @@ WrappedReturn = TypeVar("WrappedReturn")
 WrappedFunc = TypeVar("WrappedFunc", bound=Callable[..., WrappedReturn])
 
 
+_in_thread_state = threading.local()
+
+
+@contextlib.contextmanager
+def resolve_in_thread(loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+    """Make SynchronousAdapters on this thread run ``loop`` themselves.
+
+    For code that owns ``loop`` and only makes blocking calls while the loop
+    is stopped, like a protocol simulated on the same thread as its
+    ProtocolEngine. Within this context, a SynchronousAdapter called from this
+    thread for an object on ``loop`` runs the loop until the call completes,
+    instead of handing the call to the thread running the loop.
+    """
+    previous = getattr(_in_thread_state, "loop", None)
+    _in_thread_state.loop = loop
+    try:
+        yield
+    finally:
+        _in_thread_state.loop = previous
+
+
 # TODO: BC 2020-02-25 instead of overwriting __get_attribute__ in this class
 # use inspect.getmembers to iterate over appropriate members of adapted
 # instance and setattr on the outer instance with the proper async resolution
@@ -29,7 +52,8 @@ class SynchronousAdapter(Generic[WrappedObj]):
     In these Cases, it is often helpful to instantiate the API via the
     :py:class:`opentrons.hardware_control.ThreadManager` to ensure that
     all API coroutines are resolved in a thread/loop other than the
-    main thread/loop.
+    main thread/loop. Code that owns the loop and calls the adapter while the
+    loop is stopped can use :py:func:`resolve_in_thread` instead.
 
     Example
     -------
@@ -58,9 +82,18 @@ class SynchronousAdapter(Generic[WrappedObj]):
         *args: Any,
         **kwargs: Any,
     ) -> WrappedReturn:
+        return SynchronousAdapter._resolve(loop, to_call(*args, **kwargs))
+
+    @staticmethod
+    def _resolve(
+        loop: asyncio.AbstractEventLoop,
+        coro: Coroutine[Any, Any, WrappedReturn],
+    ) -> WrappedReturn:
+        if loop is getattr(_in_thread_state, "loop", None):
+            return loop.run_until_complete(coro)
         fut = cast(
             "asyncio.Future[WrappedReturn]",
-            asyncio.run_coroutine_threadsafe(to_call(*args, **kwargs), loop),
+            asyncio.run_coroutine_threadsafe(coro, loop),
         )
         return fut.result()
 
@@ -93,7 +126,6 @@ class SynchronousAdapter(Generic[WrappedObj]):
             )
         elif asyncio.iscoroutine(check):
             # Catch awaitable properties and reify the future before returning
-            fut = asyncio.run_coroutine_threadsafe(check, obj_to_adapt._loop)
-            return fut.result()
+            return SynchronousAdapter._resolve(obj_to_adapt._loop, check)
 
         return inner_attr
@@ -677,6 +677,41 @@ class API(
         await self._cache_and_maybe_retract_mount(mount)
         await self._move(target_position, speed=speed, max_speeds=max_speeds)
 
+    async def move_to_waypoints(
+        self,
+        mount: top_types.Mount,
+        waypoints: Sequence[Tuple[top_types.Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Optional[Dict[Axis, float]] = None,
+    ) -> None:
+        """
+        Move the critical point of the specified mount through a path of
+        locations relative to the deck.
+
+        The moves are queued in the Smoothie's planner, so the mount doesn't
+        stop and wait for the Smoothie at each waypoint before the next move
+        is sent.
+        """
+        all_sent = False
+        try:
+            async with self._backend.queued_moves():
+                for position, critical_point in waypoints:
+                    await self.move_to(
+                        mount,
+                        position,
+                        speed=speed,
+                        critical_point=critical_point,
+                        max_speeds=max_speeds,
+                    )
+                all_sent = True
+        except Exception:
+            if all_sent:
+                # The moves were cached as done when they were queued, but
+                # one of them failed while the queue drained.
+                self._log.exception("Move failed")
+                self._current_position.clear()
+            raise
+
     async def move_rel(
         self,
         mount: top_types.Mount,
@@ -1,10 +1,11 @@
 from __future__ import annotations
 import asyncio
-from contextlib import contextmanager, AsyncExitStack
+from contextlib import contextmanager, asynccontextmanager, AsyncExitStack
 import logging
 from typing import (
     Callable,
     Iterator,
+    AsyncIterator,
     Any,
     Dict,
     List,
@@ -160,6 +161,11 @@ class Controller:
                 target_position, home_flagged_axes=home_flagged_axes, speed=speed
             )
 
+    @asynccontextmanager
+    async def queued_moves(self) -> AsyncIterator[None]:
+        async with self._smoothie_driver.queued_moves():
+            yield
+
     async def home(self, axes: Optional[List[str]] = None) -> Dict[str, float]:
         if axes:
             args: Tuple[Any, ...] = ("".join(axes),)
@@ -8,6 +8,7 @@ from copy import deepcopy
 from typing import (
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -81,6 +82,7 @@ from opentrons.hardware_control.types import (
     InvalidPipetteModel,
     InstrumentProbeType,
     MotorStatus,
+    PositionReadStatistics,
 )
 from opentrons_hardware.hardware_control.motion import (
     MoveStopCondition,
@@ -116,6 +118,8 @@ class OT3Controller:
     _position: Dict[NodeId, float]
     _encoder_position: Dict[NodeId, float]
     _motor_status: Dict[NodeId, MotorStatus]
+    _position_trusted: bool
+    _position_reads: PositionReadStatistics
     _tool_detector: detector.OneshotToolDetector
 
     @classmethod
@@ -147,6 +151,8 @@ class OT3Controller:
         self._position = self._get_home_position()
         self._encoder_position = self._get_home_position()
         self._motor_status = {}
+        self._position_trusted = False
+        self._position_reads = PositionReadStatistics()
         try:
             self._event_watcher = self._build_event_watcher()
         except AttributeError:
@@ -167,7 +173,28 @@ class OT3Controller:
         """Retreieve motor and encoder status and position from all present nodes"""
         assert len(self._present_nodes)
         response = await get_motor_position(self._messenger, self._present_nodes)
-        self._handle_motor_status_response(response)
+        self._position_reads.queried += 1
+        self._position_trusted = True
+        self._handle_motor_status_response(response, self._present_nodes)
+
+    @property
+    def position_read_statistics(self) -> PositionReadStatistics:
+        """How many position reads were queried and how many were reused."""
+        return self._position_reads
+
+    def reset_position_read_statistics(self) -> None:
+        self._position_reads = PositionReadStatistics()
+
+    async def _refresh_untrusted_position(self) -> None:
+        """Query the motor positions if the cached ones can't be trusted.
+
+        The positions reported when the last moves completed are trusted until
+        homing, an error, or a stall puts them in doubt.
+        """
+        if self._position_trusted:
+            self._position_reads.reused += 1
+        elif self._present_nodes:
+            await self.update_motor_status()
 
     @property
     def motor_run_currents(self) -> OT3AxisMap[float]:
@@ -218,15 +245,18 @@ class OT3Controller:
 
     async def update_position(self) -> OT3AxisMap[float]:
         """Get the current position."""
+        await self._refresh_untrusted_position()
         return axis_convert(self._position, 0.0)
 
     async def update_encoder_position(self) -> OT3AxisMap[float]:
         """Get the encoder current position."""
+        await self._refresh_untrusted_position()
         return axis_convert(self._encoder_position, 0.0)
 
     def _handle_motor_status_response(
         self,
         response: NodeMap[Tuple[float, float, bool, bool]],
+        expected_nodes: Iterable[NodeId] = (),
     ) -> None:
         for axis, pos in response.items():
             self._position.update({axis: pos[0]})
@@ -234,6 +264,24 @@ class OT3Controller:
             self._motor_status.update(
                 {axis: MotorStatus(motor_ok=pos[2], encoder_ok=pos[3])}
             )
+        # A node that didn't report its position, or reported that it isn't ok
+        # (after a stall, for instance), leaves the cached positions in doubt.
+        if set(expected_nodes) - set(response.keys()) or not all(
+            pos[2] and pos[3] for pos in response.values()
+        ):
+            self._position_trusted = False
+
+    async def _run_move_group(self, move_group: MoveGroup) -> None:
+        """Run a move group and cache the positions reported by its nodes."""
+        runner = MoveGroupRunner(move_groups=[move_group])
+        try:
+            positions = await runner.run(can_messenger=self._messenger)
+        except Exception:
+            self._position_trusted = False
+            raise
+        self._handle_motor_status_response(
+            positions, {node for step in move_group for node in step}
+        )
 
     async def move(
         self,
@@ -253,9 +301,7 @@ class OT3Controller:
         """
         group = create_move_group(origin, moves, self._present_nodes, stop_condition)
         move_group, _ = group
-        runner = MoveGroupRunner(move_groups=[move_group])
-        positions = await runner.run(can_messenger=self._messenger)
-        self._handle_motor_status_response(positions)
+        await self._run_move_group(move_group)
 
     def _build_home_pipettes_runner(
         self, axes: Sequence[OT3Axis]
@@ -347,6 +393,8 @@ class OT3Controller:
         if not checked_axes:
             return {}
 
+        # Query the positions again once the axes are homed.
+        self._position_trusted = False
         maybe_runners = (
             self._build_home_gantry_z_runner(checked_axes),
             self._build_home_pipettes_runner(checked_axes),
@@ -395,24 +443,18 @@ class OT3Controller:
         stop_condition: MoveStopCondition = MoveStopCondition.none,
     ) -> None:
         move_group = create_gripper_jaw_grip_group(duty_cycle, stop_condition)
-        runner = MoveGroupRunner(move_groups=[move_group])
-        positions = await runner.run(can_messenger=self._messenger)
-        self._handle_motor_status_response(positions)
+        await self._run_move_group(move_group)
 
     async def gripper_hold_jaw(
         self,
         encoder_position_um: int,
     ) -> None:
         move_group = create_gripper_jaw_hold_group(encoder_position_um)
-        runner = MoveGroupRunner(move_groups=[move_group])
-        positions = await runner.run(can_messenger=self._messenger)
-        self._handle_motor_status_response(positions)
+        await self._run_move_group(move_group)
 
     async def gripper_home_jaw(self) -> None:
         move_group = create_gripper_jaw_home_group()
-        runner = MoveGroupRunner(move_groups=[move_group])
-        positions = await runner.run(can_messenger=self._messenger)
-        self._handle_motor_status_response(positions)
+        await self._run_move_group(move_group)
 
     @staticmethod
     def _synthesize_model_name(name: FirmwarePipetteName, model: str) -> "PipetteModel":
@@ -649,11 +691,11 @@ class OT3Controller:
 
     async def halt(self) -> None:
         """Halt the motors."""
-        return None
+        self._position_trusted = False
 
     async def hard_halt(self) -> None:
         """Halt the motors."""
-        return None
+        self._position_trusted = False
 
     async def probe(self, axis: OT3Axis, distance: float) -> OT3AxisMap[float]:
         """Probe."""
@@ -812,6 +854,7 @@ class OT3Controller:
         )
 
         self._position[axis_to_node(moving)] = pos
+        self._position_trusted = False
 
     async def capacitive_pass(
         self,
@@ -830,4 +873,5 @@ class OT3Controller:
             sensor_id_for_instrument(probe),
         )
         self._position[axis_to_node(moving)] += distance_mm
+        self._position_trusted = False
         return data
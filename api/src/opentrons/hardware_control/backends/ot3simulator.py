@@ -49,6 +49,7 @@ from opentrons.hardware_control.types import (
     OT3SubSystem,
     InstrumentProbeType,
     MotorStatus,
+    PositionReadStatistics,
 )
 from opentrons_hardware.hardware_control.motion import MoveStopCondition
 
@@ -72,6 +73,7 @@ class OT3Simulator:
     _position: Dict[NodeId, float]
     _encoder_position: Dict[NodeId, float]
     _motor_status: Dict[NodeId, MotorStatus]
+    _position_reads: PositionReadStatistics
 
     @classmethod
     async def build(
@@ -152,6 +154,7 @@ class OT3Simulator:
         self._position = self._get_home_position()
         self._encoder_position = self._get_home_position()
         self._motor_status = {}
+        self._position_reads = PositionReadStatistics()
         self._present_nodes: Set[NodeId] = set()
         self._current_settings: Optional[OT3AxisMap[CurrentConfig]] = None
 
@@ -200,12 +203,22 @@ class OT3Simulator:
             for status in get_stat(axes)
         )
 
+    @property
+    def position_read_statistics(self) -> PositionReadStatistics:
+        """How many position reads were queried and how many were reused."""
+        return self._position_reads
+
+    def reset_position_read_statistics(self) -> None:
+        self._position_reads = PositionReadStatistics()
+
     async def update_position(self) -> OT3AxisMap[float]:
         """Get the current position."""
+        self._position_reads.reused += 1
         return axis_convert(self._position, 0.0)
 
     async def update_encoder_position(self) -> OT3AxisMap[float]:
         """Get the encoder current position."""
+        self._position_reads.reused += 1
         return axis_convert(self._encoder_position, 0.0)
 
     async def move(
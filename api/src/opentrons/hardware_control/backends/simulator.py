@@ -3,8 +3,17 @@ import asyncio
 import copy
 import logging
 from threading import Event
-from typing import Dict, Optional, List, Tuple, TYPE_CHECKING, Sequence, Iterator
-from contextlib import contextmanager
+from typing import (
+    Dict,
+    Optional,
+    List,
+    Tuple,
+    TYPE_CHECKING,
+    Sequence,
+    Iterator,
+    AsyncIterator,
+)
+from contextlib import contextmanager, asynccontextmanager
 
 from opentrons_shared_data.pipette import dummy_model_for_name
 
@@ -191,6 +200,10 @@ class Simulator:
         self._position.update(target_position)
         self._engaged_axes.update({ax: True for ax in target_position})
 
+    @asynccontextmanager
+    async def queued_moves(self) -> AsyncIterator[None]:
+        yield
+
     async def home(self, axes: Optional[List[str]] = None) -> Dict[str, float]:
         # driver_3_0-> HOMED_POSITION
         checked_axes = "".join(axes) if axes else "XYZABC"
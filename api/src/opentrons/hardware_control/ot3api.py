@@ -15,6 +15,7 @@ from typing import (
     Sequence,
     Set,
     Any,
+    Tuple,
     TypeVar,
 )
 
@@ -34,6 +35,7 @@ from opentrons.config.types import (
 )
 from opentrons.drivers.rpi_drivers.types import USBPort
 from opentrons_hardware.hardware_control.motion_planning import (
+    Move,
     MoveManager,
     MoveTarget,
     ZeroLengthMoveError,
@@ -75,6 +77,7 @@ from .types import (
     InstrumentProbeType,
     GripperProbe,
     GripperNotAttachedError,
+    PositionReadStatistics,
 )
 from . import modules
 from .robot_calibration import (
@@ -112,12 +115,29 @@ from .dev_types import (
     GripperDict,
 )
 from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
     MoveConditionNotMet,
 )
 
 mod_log = logging.getLogger(__name__)
 
 
+def _drop_repeated_positions(
+    origin: OT3AxisMap[float], positions: Sequence[OT3AxisMap[float]]
+) -> List[OT3AxisMap[float]]:
+    """Drop each position that is too close to the one before it to move to."""
+    kept = []
+    previous = origin
+    for position in positions:
+        if any(
+            abs(previous.get(ax, 0) - pos) >= FLOAT_THRESHOLD
+            for ax, pos in position.items()
+        ):
+            kept.append(position)
+            previous = position
+    return kept
+
+
 class OT3API(
     ExecutionManagerProvider,
     # This MUST be kept last in the inheritance list so that it is
@@ -569,6 +589,10 @@ class OT3API(
 
     async def reset(self) -> None:
         """Reset the stored state of the system."""
+        self._log.info(
+            f"Position reads since last reset: {self.position_read_statistics}"
+        )
+        self._backend.reset_position_read_statistics()
         self._pause_manager.reset()
         await self._execution_manager.reset()
         await self._pipette_handler.reset()
@@ -615,6 +639,12 @@ class OT3API(
             await self._move(target_pos, acquire_lock=False, home_flagged_axes=False)
             await self.current_position_ot3(mount=checked_mount, refresh=True)
 
+    @property
+    def position_read_statistics(self) -> PositionReadStatistics:
+        """How many position reads since the last reset were queried from the
+        motors, and how many reused the positions reported by earlier moves."""
+        return self._backend.position_read_statistics
+
     @lru_cache(1)
     def _carriage_offset(self) -> top_types.Point:
         return top_types.Point(*self._config.carriage_offset)
@@ -801,6 +831,42 @@ class OT3API(
         await self._move_gripper_to_idle_position(realmount)
         await self._move(target_position, speed=speed, max_speeds=checked_max)
 
+    async def move_to_waypoints(
+        self,
+        mount: Union[top_types.Mount, OT3Mount],
+        waypoints: Sequence[Tuple[top_types.Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Union[None, Dict[Axis, float], OT3AxisMap[float]] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through a path of
+        locations relative to the deck, at the specified speed.
+
+        The whole path is planned as one blended list of targets and run as a
+        single move group, so the mount doesn't stop at each waypoint."""
+        if not waypoints:
+            return
+        realmount = OT3Mount.from_mount(mount)
+
+        axes_moving = [OT3Axis.X, OT3Axis.Y, OT3Axis.by_mount(mount)]
+        if not self._backend.check_ready_for_movement(axes_moving):
+            await self.home(axes_moving)
+
+        target_positions = [
+            target_position_from_absolute(
+                realmount,
+                position,
+                partial(self.critical_point_for, cp_override=critical_point),
+                top_types.Point(*self._config.left_mount_offset),
+                top_types.Point(*self._config.right_mount_offset),
+                top_types.Point(*self._config.gripper_mount_offset),
+            )
+            for position, critical_point in waypoints
+        ]
+
+        await self._cache_and_maybe_retract_mount(realmount)
+        await self._move_gripper_to_idle_position(realmount)
+        await self._move_path(target_positions, speed=speed)
+
     async def move_rel(
         self,
         mount: Union[top_types.Mount, OT3Mount],
@@ -894,49 +960,65 @@ class OT3API(
         check_bounds: MotionChecks = MotionChecks.NONE,
     ) -> None:
         """Worker function to apply robot motion."""
-        machine_pos = machine_from_deck(
-            target_position,
-            self._transforms.deck_calibration.attitude,
-            self._transforms.carriage_offset,
+        await self._move_path(
+            [target_position],
+            speed=speed,
+            acquire_lock=acquire_lock,
+            check_bounds=check_bounds,
         )
-        bounds = self._backend.axis_bounds
-        to_check = {
-            ax: machine_pos[ax]
-            for ax in target_position.keys()
-            if ax in OT3Axis.gantry_axes()
-        }
-        check_motion_bounds(to_check, target_position, bounds, check_bounds)
+
+    @ExecutionManagerProvider.wait_for_running
+    async def _move_path(
+        self,
+        target_positions: Sequence["OrderedDict[OT3Axis, float]"],
+        speed: Optional[float] = None,
+        acquire_lock: bool = True,
+        check_bounds: MotionChecks = MotionChecks.NONE,
+    ) -> None:
+        """Worker function to move through target positions as one move group.
+
+        Targets that wouldn't move from the previous position are skipped.
+        """
+        machine_positions = [
+            self._checked_machine_position(target_position, check_bounds)
+            for target_position in target_positions
+        ]
 
         # TODO: (2022-02-10) Use actual max speed for MoveTarget
         checked_speed = speed or 400
         self._move_manager.update_constraints(
             get_system_constraints(self._config.motion_settings, self._gantry_load)
         )
-        move_target = MoveTarget.build(position=machine_pos, max_speed=checked_speed)
         origin = await self._backend.update_position()
+        move_targets = [
+            MoveTarget.build(position=machine_pos, max_speed=checked_speed)
+            for machine_pos in _drop_repeated_positions(origin, machine_positions)
+        ]
+        if not move_targets:
+            self._log.info(f"{target_positions} is a zero length move, ignoring")
+            return
         try:
-            blended, moves = self._move_manager.plan_motion(
-                origin=origin, target_list=[move_target]
-            )
+            moves = self._plan_move_group(origin, move_targets)
         except ZeroLengthMoveError as zero_length_error:
             self._log.info(f"{str(zero_length_error)}, ignoring")
             return
         self._log.info(
-            f"move: {target_position} becomes {machine_pos} from {origin} "
+            f"move: {target_positions} becomes {machine_positions} from {origin} "
             f"requiring {moves}"
         )
         async with contextlib.AsyncExitStack() as stack:
             if acquire_lock:
                 await stack.enter_async_context(self._motion_lock)
             try:
-                await self._backend.move(origin, moves[0])
+                await self._backend.move(origin, moves)
                 encoder_machine_pos = await self._backend.update_encoder_position()
             except Exception:
                 self._log.exception("Move failed")
                 self._current_position.clear()
                 raise
             else:
-                self._current_position.update(target_position)
+                for target_position in target_positions:
+                    self._current_position.update(target_position)
                 encoder_position = deck_from_machine(
                     encoder_machine_pos,
                     self._transforms.deck_calibration.attitude,
@@ -944,6 +1026,56 @@ class OT3API(
                 )
                 self._encoder_current_position.update(encoder_position)
 
+    def _checked_machine_position(
+        self,
+        target_position: "OrderedDict[OT3Axis, float]",
+        check_bounds: MotionChecks,
+    ) -> OT3AxisMap[float]:
+        """Get the machine position of a deck position and check its bounds."""
+        machine_pos = machine_from_deck(
+            target_position,
+            self._transforms.deck_calibration.attitude,
+            self._transforms.carriage_offset,
+        )
+        to_check = {
+            ax: machine_pos[ax]
+            for ax in target_position.keys()
+            if ax in OT3Axis.gantry_axes()
+        }
+        check_motion_bounds(
+            to_check, target_position, self._backend.axis_bounds, check_bounds
+        )
+        return machine_pos
+
+    def _plan_move_group(
+        self,
+        origin: OT3AxisMap[float],
+        move_targets: List[MoveTarget[OT3Axis]],
+    ) -> List[Move[OT3Axis]]:
+        """Plan blended moves through the targets.
+
+        If blending doesn't converge, each target is planned on its own
+        instead, stopping at each of them.
+        """
+        blended, moves = self._move_manager.plan_motion(
+            origin=origin, target_list=move_targets
+        )
+        if blended:
+            return moves[-1]
+        self._log.warning(
+            f"Could not blend moves through {len(move_targets)} targets, "
+            "stopping at each one instead"
+        )
+        unblended: List[Move[OT3Axis]] = []
+        target_origin = origin
+        for move_target in move_targets:
+            _, target_moves = self._move_manager.plan_motion(
+                origin=target_origin, target_list=[move_target]
+            )
+            unblended.extend(target_moves[0])
+            target_origin = {ax: float(pos) for ax, pos in move_target.position.items()}
+        return unblended
+
     @ExecutionManagerProvider.wait_for_running
     async def home(
         self, axes: Optional[Union[List[Axis], List[OT3Axis]]] = None
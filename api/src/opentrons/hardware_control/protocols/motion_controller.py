@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from typing_extensions import Protocol
 
 from opentrons.types import Mount, Point
@@ -158,6 +158,30 @@ class MotionController(Protocol):
         """
         ...
 
+    async def move_to_waypoints(
+        self,
+        mount: Mount,
+        waypoints: Sequence[Tuple[Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Optional[Dict[Axis, float]] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through a path of
+        locations relative to the deck, at the specified speed.
+
+        Each waypoint is an absolute position in deck coordinates and the
+        critical point to move there, as for :py:meth:`move_to`. Hardware
+        that can blend consecutive moves plans the whole path at once, so
+        that the mount does not stop at each waypoint along the way.
+
+        :param mount: The mount to move
+        :param waypoints: The positions to move through, in order, and the
+                          critical point to use for each of them
+        :param speed: An overall head speed to use during the moves
+        :param max_speeds: An optional override for per-axis maximum speeds,
+                           as for :py:meth:`move_to`
+        """
+        ...
+
     async def move_rel(
         self,
         mount: Mount,
@@ -298,6 +298,18 @@ class MotorStatus:
     encoder_ok: bool
 
 
+@dataclass
+class PositionReadStatistics:
+    """How the backend answered requests for the current position.
+
+    Positions are either queried from the motors, or reused from what the
+    motors reported at the end of the last move.
+    """
+
+    queried: int = 0
+    reused: int = 0
+
+
 class DoorState(enum.Enum):
     OPEN = False
     CLOSED = True
@@ -55,9 +55,11 @@ class Deck(UserDict):  # type: ignore[type-arg]
         # to decouple from config (and environment) reading / loading
         self._definition = load_deck(deck_type(), DEFAULT_DECK_DEFINITION_VERSION)
         self._positions = {}
+        self._slot_definitions: Dict[str, SlotDefV3] = {}
         for slot in self._definition["locations"]["orderedSlots"]:
             self.data[int(slot["id"])] = None
             self._positions[int(slot["id"])] = Point(*slot["position"])
+            self._slot_definitions[slot["id"]] = slot
         self._highest_z = 0.0
         self._load_fixtures()
         self._thermocycler_present = False
@@ -188,10 +190,9 @@ class Deck(UserDict):  # type: ignore[type-arg]
             self._highest_z = max(item.highest_z, self._highest_z)
 
     def get_slot_definition(self, slot_name: str) -> SlotDefV3:
-        slots = self._definition["locations"]["orderedSlots"]
-        slot_def = next((slot for slot in slots if slot["id"] == slot_name), None)
+        slot_def = self._slot_definitions.get(slot_name)
         if not slot_def:
-            slot_ids = [slot["id"] for slot in slots]
+            slot_ids = list(self._slot_definitions)
             raise ValueError(
                 f"slot {slot_name} could not be found,"
                 f"valid deck slots are: {slot_ids}"
@@ -13,7 +13,12 @@ from opentrons.hardware_control import (
     SynchronousAdapter,
 )
 from opentrons.protocol_engine import ProtocolEngine
-from opentrons.protocol_engine.clients import SyncClient, ChildThreadTransport
+from opentrons.protocol_engine.clients import (
+    SyncClient,
+    AbstractSyncTransport,
+    ChildThreadTransport,
+    InThreadTransport,
+)
 from opentrons.protocols.api_support.types import APIVersion
 
 from .protocol_context import ProtocolContext
@@ -36,6 +41,7 @@ def create_protocol_context(
     hardware_api: Union[HardwareControlAPI, ThreadManager[HardwareControlAPI]],
     protocol_engine: Optional[ProtocolEngine] = None,
     protocol_engine_loop: Optional[asyncio.AbstractEventLoop] = None,
+    protocol_engine_in_thread: bool = False,
     broker: Optional[Broker] = None,
     equipment_broker: Optional[EquipmentBroker[Any]] = None,
     use_simulating_core: bool = False,
@@ -53,6 +59,8 @@ def create_protocol_context(
             all be (0, 0, 0) and ProtocolEngine-based core will not work.
         protocol_engine_loop: An event loop running in the thread where
             ProtocolEngine mutations must occur.
+        protocol_engine_in_thread: Whether the protocol will run on the same
+            thread as `protocol_engine_loop`, while the loop is stopped.
         broker: A message broker for protocol command event publishing.
         equipment_broker: A message broker for equipment load event publishing.
         use_simulating_core: For pre-ProtocolEngine API versions,
@@ -89,9 +97,15 @@ def create_protocol_context(
             protocol_engine is not None and protocol_engine_loop is not None
         ), "ProtocolEngine PAPI core is enabled, but no ProtocolEngine given."
 
-        engine_client_transport = ChildThreadTransport(
-            engine=protocol_engine, loop=protocol_engine_loop
-        )
+        engine_client_transport: AbstractSyncTransport
+        if protocol_engine_in_thread:
+            engine_client_transport = InThreadTransport(
+                engine=protocol_engine, loop=protocol_engine_loop
+            )
+        else:
+            engine_client_transport = ChildThreadTransport(
+                engine=protocol_engine, loop=protocol_engine_loop
+            )
         engine_client = SyncClient(transport=engine_client_transport)
         core = ProtocolCore(
             engine_client=engine_client,
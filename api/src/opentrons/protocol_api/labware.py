@@ -285,15 +285,13 @@ class Labware:
 
         well_columns = implementation.get_well_columns()
         self._well_grid = well_grid.create(columns=well_columns)
-        self._wells_by_name = {
-            well_name: Well(
-                parent=self,
-                well_implementation=implementation.get_well_core(well_name),
-                api_version=api_version,
-            )
-            for column in well_columns
-            for well_name in column
-        }
+        self._well_names = [
+            well_name for column in well_columns for well_name in column
+        ]
+
+        # Well objects are created on first access, see `_get_well`
+        self._wells_by_name: Dict[str, Optional[Well]] = dict.fromkeys(self._well_names)
+        self._all_wells_by_name: Optional[Dict[str, Well]] = None
 
     @property
     def separate_calibration(self) -> bool:
@@ -309,7 +307,7 @@ class Labware:
         return self._api_version
 
     def __getitem__(self, key: str) -> Well:
-        return self.wells_by_name()[key]
+        return self._get_well(key)
 
     @property  # type: ignore
     @requires_version(2, 0)
@@ -404,9 +402,9 @@ class Labware:
     def well(self, idx: Union[int, str]) -> Well:
         """Deprecated---use result of `wells` or `wells_by_name`"""
         if isinstance(idx, int):
-            return self.wells()[idx]
+            return self._get_well(self._well_names[idx])
         elif isinstance(idx, str):
-            return self.wells_by_name()[idx]
+            return self._get_well(idx)
         else:
             raise TypeError(
                 f"`Labware.well` must be called with an `int` or `str`, but got {idx}"
@@ -431,15 +429,13 @@ class Labware:
         :return: Ordered list of all wells in a labware
         """
         if not args:
-            return list(self._wells_by_name.values())
+            return list(self._get_all_wells_by_name().values())
 
         elif validation.is_all_integers(args):
-            wells = self.wells()
-            return [wells[idx] for idx in args]
+            return [self._get_well(self._well_names[idx]) for idx in args]
 
         elif validation.is_all_strings(args):
-            wells_by_name = self.wells_by_name()
-            return [wells_by_name[idx] for idx in args]
+            return [self._get_well(idx) for idx in args]
 
         else:
             raise TypeError(
@@ -458,7 +454,7 @@ class Labware:
 
         :return: Dictionary of well objects keyed by well name
         """
-        return dict(self._wells_by_name)
+        return dict(self._get_all_wells_by_name())
 
     @requires_version(2, 0)
     def wells_by_index(self) -> Dict[str, Well]:
@@ -490,7 +486,7 @@ class Labware:
         """
         if not args:
             return [
-                [self._wells_by_name[well_name] for well_name in row]
+                [self._get_well(well_name) for well_name in row]
                 for row in self._well_grid.rows_by_name.values()
             ]
 
@@ -520,7 +516,7 @@ class Labware:
         :return: Dictionary of Well lists keyed by row name
         """
         return {
-            row_name: [self._wells_by_name[well_name] for well_name in row]
+            row_name: [self._get_well(well_name) for well_name in row]
             for row_name, row in self._well_grid.rows_by_name.items()
         }
 
@@ -553,7 +549,7 @@ class Labware:
         """
         if not args:
             return [
-                [self._wells_by_name[well_name] for well_name in column]
+                [self._get_well(well_name) for well_name in column]
                 for column in self._well_grid.columns_by_name.values()
             ]
 
@@ -584,7 +580,7 @@ class Labware:
         :return: Dictionary of Well lists keyed by column name
         """
         return {
-            column_name: [self._wells_by_name[well_name] for well_name in column]
+            column_name: [self._get_well(well_name) for well_name in column]
             for column_name, column in self._well_grid.columns_by_name.items()
         }
 
@@ -653,7 +649,7 @@ class Labware:
             starting_tip=starting_tip._impl if starting_tip else None,
         )
 
-        return self._wells_by_name[well_name] if well_name is not None else None
+        return self._get_well(well_name) if well_name is not None else None
 
     # TODO(mc, 2022-11-09): implementation detail; deprecate public method
     def use_tips(self, start_well: Well, num_channels: int = 1) -> None:
@@ -715,7 +711,7 @@ class Labware:
         well_core = self._implementation.get_tip_tracker().previous_tip(
             num_tips=num_tips
         )
-        return self._wells_by_name[well_core.get_name()] if well_core else None
+        return self._get_well(well_core.get_name()) if well_core else None
 
     # TODO(mc, 2022-11-09): implementation detail; deprecate public method
     def return_tips(self, start_well: Well, num_channels: int = 1) -> None:
@@ -750,6 +746,32 @@ class Labware:
         """Reset all tips in a tiprack."""
         self._implementation.reset_tips()
 
+    def _get_well(self, well_name: str) -> Well:
+        """Get a well by name, creating its `Well` object on first access.
+
+        Raises:
+            KeyError: the labware has no well with this name.
+        """
+        well = self._wells_by_name[well_name]
+
+        if well is None:
+            well = self._wells_by_name[well_name] = Well(
+                parent=self,
+                well_implementation=self._implementation.get_well_core(well_name),
+                api_version=self._api_version,
+            )
+
+        return well
+
+    def _get_all_wells_by_name(self) -> Dict[str, Well]:
+        """Get every well in definition order, creating any that don't exist yet."""
+        if self._all_wells_by_name is None:
+            self._all_wells_by_name = {
+                well_name: self._get_well(well_name) for well_name in self._well_names
+            }
+
+        return self._all_wells_by_name
+
 
 # TODO(mc, 2022-11-09): implementation detail, move to core
 def split_tipracks(tip_racks: List[Labware]) -> Tuple[Labware, List[Labware]]:
@@ -1,5 +1,10 @@
 """ProtocolEngine clients."""
 from .sync_client import SyncClient
-from .transports import AbstractSyncTransport, ChildThreadTransport
+from .transports import AbstractSyncTransport, ChildThreadTransport, InThreadTransport
 
-__all__ = ["SyncClient", "AbstractSyncTransport", "ChildThreadTransport"]
+__all__ = [
+    "SyncClient",
+    "AbstractSyncTransport",
+    "ChildThreadTransport",
+    "InThreadTransport",
+]
@@ -10,7 +10,7 @@ from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from ..protocol_engine import ProtocolEngine
 from ..errors import ProtocolEngineError
 from ..state import StateView
-from ..commands import CommandCreate, CommandResult
+from ..commands import Command, CommandCreate, CommandResult
 
 
 class AbstractSyncTransport(ABC):
@@ -103,13 +103,7 @@ class ChildThreadTransport(AbstractSyncTransport):
             loop=self._loop,
         ).result()
 
-        if command.error is not None:
-            error = command.error
-            raise ProtocolEngineError(f"{error.errorType}: {error.detail}")
-
-        assert command.result is not None, f"Expected Command {command} to have result"
-
-        return command.result
+        return _get_command_result(command)
 
     def call_method(self, method_name: str, **kwargs: Any) -> Any:
         """Execute a ProtocolEngine method, returning the result."""
@@ -122,3 +116,53 @@ class ChildThreadTransport(AbstractSyncTransport):
         method = getattr(self._engine, method_name)
         assert callable(method), f"{method_name} is not a method of ProtocolEngine"
         return method(**kwargs)
+
+
+class InThreadTransport(AbstractSyncTransport):
+    """Concrete transport implementation for a ProtocolEngine on the same thread.
+
+    Each command runs the engine's event loop until the command completes,
+    rather than handing the command to another thread.
+    """
+
+    def __init__(self, engine: ProtocolEngine, loop: AbstractEventLoop) -> None:
+        """Initialize a ProtocolEngine transport for use in the engine's own thread.
+
+        Args:
+            engine: An instance of a ProtocolEngine to interact with hardware
+                and other run procedures.
+            loop: The event loop the ProtocolEngine was created with. It must
+                belong to the thread the client is used from, and must not be
+                running while the client is used.
+        """
+        self._engine = engine
+        self._loop = loop
+
+    @property
+    def state(self) -> StateView:
+        """Get a view of the Protocol Engine's state."""
+        return self._engine.state_view
+
+    def execute_command(self, request: CommandCreate) -> CommandResult:
+        """Execute a command, running the event loop until it completes."""
+        command = self._loop.run_until_complete(
+            self._engine.add_and_execute_command(request=request)
+        )
+
+        return _get_command_result(command)
+
+    def call_method(self, method_name: str, **kwargs: Any) -> Any:
+        """Execute a ProtocolEngine method, returning the result."""
+        method = getattr(self._engine, method_name)
+        assert callable(method), f"{method_name} is not a method of ProtocolEngine"
+        return method(**kwargs)
+
+
+def _get_command_result(command: Command) -> CommandResult:
+    if command.error is not None:
+        error = command.error
+        raise ProtocolEngineError(f"{error.errorType}: {error.detail}")
+
+    assert command.result is not None, f"Expected Command {command} to have result"
+
+    return command.result
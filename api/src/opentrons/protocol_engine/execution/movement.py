@@ -154,14 +154,14 @@ class MovementHandler:
             pipette_id=pipette_id, requested_speed=speed
         )
 
-        # move through the waypoints
-        for waypoint in waypoints:
-            await self._hardware_api.move_to(
-                mount=hw_mount,
-                abs_position=waypoint.position,
-                critical_point=waypoint.critical_point,
-                speed=speed,
-            )
+        # move through the waypoints as one path
+        await self._hardware_api.move_to_waypoints(
+            mount=hw_mount,
+            waypoints=[
+                (waypoint.position, waypoint.critical_point) for waypoint in waypoints
+            ],
+            speed=speed,
+        )
 
     async def move_relative(
         self,
@@ -307,11 +307,11 @@ class MovementHandler:
             pipette_id=pipette_id, requested_speed=speed
         )
 
-        # move through the waypoints
-        for waypoint in waypoints:
-            await self._hardware_api.move_to(
-                mount=hw_mount,
-                abs_position=waypoint.position,
-                critical_point=waypoint.critical_point,
-                speed=speed,
-            )
+        # move through the waypoints as one path
+        await self._hardware_api.move_to_waypoints(
+            mount=hw_mount,
+            waypoints=[
+                (waypoint.position, waypoint.critical_point) for waypoint in waypoints
+            ],
+            speed=speed,
+        )
@@ -15,7 +15,7 @@ from .execution import (
     DoorWatcher,
     HardwareStopper,
 )
-from .state import StateStore, StateView
+from .state import StateStore, StateView, StateSlice
 from .plugins import AbstractPlugin, PluginStarter
 from .actions import (
     ActionDispatcher,
@@ -162,6 +162,7 @@ class ProtocolEngine:
         await self._state_store.wait_for(
             self._state_store.commands.get_is_complete,
             command_id=command_id,
+            state_slices=[StateSlice.COMMANDS],
         )
 
     async def add_and_execute_command(
@@ -203,7 +204,8 @@ class ProtocolEngine:
             CommandExecutionFailedError: if any protocol command failed.
         """
         await self._state_store.wait_for(
-            condition=self._state_store.commands.get_all_complete
+            condition=self._state_store.commands.get_all_complete,
+            state_slices=[StateSlice.COMMANDS],
         )
 
     async def finish(
@@ -4,11 +4,15 @@ This module is a wrapper around existing, but older, internal APIs to
 abstract away rough edges until we can improve those underlying interfaces.
 """
 import logging
+from functools import lru_cache
 from anyio import to_thread
-from typing import Optional
+from typing import Optional, Tuple
 
 from opentrons.protocols.models import LabwareDefinition
-from opentrons.protocols.labware import get_labware_definition
+from opentrons.protocols.labware import (
+    get_labware_definition,
+    get_labware_definition_path,
+)
 
 # TODO (lc 09-26-2022) We should conditionally import ot2 or ot3 calibration
 from opentrons.hardware_control.instruments.ot2 import (
@@ -19,6 +23,10 @@ from opentrons.calibration_storage.types import TipLengthCalNotFound
 
 log = logging.getLogger(__name__)
 
+# Parsed definitions are large, especially for 384-well plates, so only keep
+# enough of them around to cover the labware of a typical protocol
+_DEFINITION_CACHE_SIZE = 32
+
 
 class LabwareDataProvider:
     """Labware data provider."""
@@ -32,7 +40,9 @@ class LabwareDataProvider:
         """Get a labware definition given the labware's identification.
 
         Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        implications if it is called often. Parsed definitions are cached
+        until their definition file changes; the returned model is shared
+        between callers and must not be modified.
         """
         return await to_thread.run_sync(
             LabwareDataProvider._get_labware_definition_sync,
@@ -45,8 +55,17 @@ class LabwareDataProvider:
     def _get_labware_definition_sync(
         load_name: str, namespace: str, version: int
     ) -> LabwareDefinition:
-        return LabwareDefinition.parse_obj(
-            get_labware_definition(load_name, namespace, version)
+        try:
+            stat = get_labware_definition_path(load_name, namespace, version).stat()
+        except OSError:
+            # let the uncached lookup raise its usual not-found error
+            return _parse_labware_definition(load_name, namespace, version)
+
+        return _parse_labware_definition_cached(
+            load_name.lower(),
+            namespace.lower(),
+            version,
+            (stat.st_mtime_ns, stat.st_size),
         )
 
     @staticmethod
@@ -78,3 +97,20 @@ class LabwareDataProvider:
         except TipLengthCalNotFound as e:
             log.debug("No calibrated tip length found for {pipette_serial}", exc_info=e)
             return None
+
+
+def _parse_labware_definition(
+    load_name: str, namespace: str, version: int
+) -> LabwareDefinition:
+    return LabwareDefinition.parse_obj(
+        get_labware_definition(load_name, namespace, version)
+    )
+
+
+@lru_cache(maxsize=_DEFINITION_CACHE_SIZE)
+def _parse_labware_definition_cached(
+    load_name: str, namespace: str, version: int, file_stamp: Tuple[int, int]
+) -> LabwareDefinition:
+    # file_stamp is only part of the cache key, so that a custom definition
+    # saved over an existing one is re-read instead of served from the cache
+    return _parse_labware_definition(load_name, namespace, version)
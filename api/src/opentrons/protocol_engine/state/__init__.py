@@ -1,6 +1,7 @@
 """Protocol engine state module."""
 
 from .state import State, StateStore, StateView
+from .abstract_store import StateSlice
 from .state_summary import StateSummary
 from .config import Config
 from .commands import CommandState, CommandView, CommandSlice, CurrentCommand
@@ -27,6 +28,7 @@ __all__ = [
     "StateStore",
     "StateView",
     "StateSummary",
+    "StateSlice",
     # static engine configuration
     "Config",
     # command state and values
@@ -1,5 +1,6 @@
 """Abstract state store interfaces."""
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import Generic, TypeVar
 
 from ..actions import Action
@@ -7,6 +8,20 @@ from ..actions import Action
 StateT = TypeVar("StateT")
 
 
+class StateSlice(str, Enum):
+    """The independently-updated slices of ProtocolEngine state.
+
+    Each slice is owned by a single substore.
+    """
+
+    COMMANDS = "commands"
+    LABWARE = "labware"
+    PIPETTES = "pipettes"
+    MODULES = "modules"
+    LIQUIDS = "liquids"
+    TIPS = "tips"
+
+
 class HasState(ABC, Generic[StateT]):
     """Abstract interface for an object that has a state data member."""
 
@@ -22,6 +37,11 @@ class HandlesActions(ABC):
     """Abstract interface for an object that reacts to actions."""
 
     @abstractmethod
-    def handle_action(self, action: Action) -> None:
-        """React to a state-change action."""
+    def handle_action(self, action: Action) -> bool:
+        """React to a state-change action.
+
+        Returns:
+            Whether the action may have changed the state.
+            This may be a false positive, but it must never be a false negative.
+        """
         ...
@@ -1,19 +1,69 @@
 """Simple state change notification interface."""
 import asyncio
+from typing import Collection, FrozenSet, List, Optional, Tuple
+
+from .abstract_store import StateSlice
+
+
+_Waiter = Tuple[Optional[FrozenSet[StateSlice]], "asyncio.Future[None]"]
 
 
 class ChangeNotifier:
-    """An interface tto emit or subscribe to state change notifications."""
+    """An interface to emit or subscribe to state change notifications."""
 
     def __init__(self) -> None:
-        """Initialize the ChangeNotifier with an internal Event."""
-        self._event = asyncio.Event()
+        """Initialize the ChangeNotifier with no waiters."""
+        self._waiters: List[_Waiter] = []
+        self._notify_count = 0
+        self._wakeup_count = 0
+
+    @property
+    def notify_count(self) -> int:
+        """The number of times `notify` has been called."""
+        return self._notify_count
+
+    @property
+    def wakeup_count(self) -> int:
+        """The number of `wait`'ers that have been woken up so far."""
+        return self._wakeup_count
+
+    def notify(self, changed_slices: Optional[Collection[StateSlice]] = None) -> None:
+        """Notify `wait`'ers that the state has changed.
+
+        Arguments:
+            changed_slices: The slices of state that changed. Only waiters
+                subscribed to at least one of these slices, or to all slices,
+                will be woken. If omitted, every slice is considered changed.
+        """
+        remaining_waiters: List[_Waiter] = []
+        self._notify_count += 1
+
+        for slices, future in self._waiters:
+            if future.done():
+                # The waiting task was cancelled.
+                continue
+
+            if (
+                changed_slices is None
+                or (slices is None and len(changed_slices) > 0)
+                or (slices is not None and not slices.isdisjoint(changed_slices))
+            ):
+                future.set_result(None)
+                self._wakeup_count += 1
+            else:
+                remaining_waiters.append((slices, future))
+
+        self._waiters = remaining_waiters
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
-        self._event.set()
+    async def wait(self, slices: Optional[Collection[StateSlice]] = None) -> None:
+        """Wait until the next relevant state change notification.
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+        Arguments:
+            slices: Only wake up when one of these slices of state changes.
+                If omitted, wake up when any slice changes.
+        """
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(
+            (frozenset(slices) if slices is not None else None, future)
+        )
+        await future
@@ -153,6 +153,20 @@ class CommandState:
     This value can be used to generate future hashes.
     """
 
+    latest_completed_command_id: Optional[str]
+    """The ID of the completed command with the highest index, if any.
+
+    Kept up to date as commands complete so that `CommandView.get_current`
+    does not need to search the whole command list.
+    """
+
+    failed_command_ids: OrderedSet[str]
+    """The IDs of non-setup commands that failed with an error, in FIFO order.
+
+    Kept up to date as commands fail so that `CommandView.get_all_complete`
+    does not need to search the whole command list.
+    """
+
 
 class CommandStore(HasState[CommandState], HandlesActions):
     """Command state container."""
@@ -180,9 +194,11 @@ class CommandStore(HasState[CommandState], HandlesActions):
             run_completed_at=None,
             run_started_at=None,
             latest_command_hash=None,
+            latest_completed_command_id=None,
+            failed_command_ids=OrderedSet(),
         )
 
-    def handle_action(self, action: Action) -> None:  # noqa: C901
+    def handle_action(self, action: Action) -> bool:  # noqa: C901
         """Modify state in reaction to an action."""
         errors_by_id: Mapping[str, ErrorOccurrence]
 
@@ -208,9 +224,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
 
             next_index = len(self._state.all_command_ids)
             self._state.all_command_ids.append(action.command_id)
-            self._state.commands_by_id[queued_command.id] = CommandEntry(
-                index=next_index,
-                command=queued_command,
+            self._set_command_entry(
+                CommandEntry(index=next_index, command=queued_command)
             )
 
             if action.request.intent == CommandIntent.SETUP:
@@ -231,14 +246,10 @@ class CommandStore(HasState[CommandState], HandlesActions):
             if prev_entry is None:
                 index = len(self._state.all_command_ids)
                 self._state.all_command_ids.append(command.id)
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=index,
-                    command=command,
-                )
+                self._set_command_entry(CommandEntry(index=index, command=command))
             else:
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=command,
+                self._set_command_entry(
+                    CommandEntry(index=prev_entry.index, command=command)
                 )
 
             self._state.queued_command_ids.discard(command.id)
@@ -258,18 +269,20 @@ class CommandStore(HasState[CommandState], HandlesActions):
             )
 
             prev_entry = self._state.commands_by_id[action.command_id]
-            self._state.commands_by_id[action.command_id] = CommandEntry(
-                index=prev_entry.index,
-                # TODO(mc, 2022-06-06): add new "cancelled" status or similar
-                # and don't set `completedAt` in commands other than the
-                # specific one that failed
-                command=prev_entry.command.copy(
-                    update={
-                        "error": error_occurrence,
-                        "completedAt": action.failed_at,
-                        "status": CommandStatus.FAILED,
-                    }
-                ),
+            self._set_command_entry(
+                CommandEntry(
+                    index=prev_entry.index,
+                    # TODO(mc, 2022-06-06): add new "cancelled" status or similar
+                    # and don't set `completedAt` in commands other than the
+                    # specific one that failed
+                    command=prev_entry.command.copy(
+                        update={
+                            "error": error_occurrence,
+                            "completedAt": action.failed_at,
+                            "status": CommandStatus.FAILED,
+                        }
+                    ),
+                )
             )
 
             if prev_entry.command.intent == CommandIntent.SETUP:
@@ -286,14 +299,16 @@ class CommandStore(HasState[CommandState], HandlesActions):
             for command_id in other_command_ids_to_fail:
                 prev_entry = self._state.commands_by_id[command_id]
 
-                self._state.commands_by_id[command_id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=prev_entry.command.copy(
-                        update={
-                            "completedAt": action.failed_at,
-                            "status": CommandStatus.FAILED,
-                        }
-                    ),
+                self._set_command_entry(
+                    CommandEntry(
+                        index=prev_entry.index,
+                        command=prev_entry.command.copy(
+                            update={
+                                "completedAt": action.failed_at,
+                                "status": CommandStatus.FAILED,
+                            }
+                        ),
+                    )
                 )
 
             if self._state.running_command_id == action.command_id:
@@ -359,6 +374,30 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 elif action.door_state == DoorState.CLOSED:
                     self._state.is_door_blocking = False
 
+        else:
+            return False
+
+        return True
+
+    def _set_command_entry(self, entry: CommandEntry) -> None:
+        """Store a command entry and update the indexes derived from it."""
+        command = entry.command
+        self._state.commands_by_id[command.id] = entry
+
+        if (
+            command.status == CommandStatus.SUCCEEDED
+            or command.status == CommandStatus.FAILED
+        ):
+            latest_id = self._state.latest_completed_command_id
+            if (
+                latest_id is None
+                or self._state.commands_by_id[latest_id].index <= entry.index
+            ):
+                self._state.latest_completed_command_id = command.id
+
+        if command.error is not None and command.intent != CommandIntent.SETUP:
+            self._state.failed_command_ids.add(command.id)
+
 
 class CommandView(HasState[CommandState]):
     """Read-only command state view."""
@@ -438,17 +477,14 @@ class CommandView(HasState[CommandState]):
                 index=entry.index,
             )
 
-        # TODO(mc, 2022-02-07): this is O(n) in the worst case for no good reason.
-        # Resolve prior to JSONv6 support, where this will matter.
-        for reverse_index, cid in enumerate(reversed(self._state.all_command_ids)):
-            if self.get_is_complete(cid):
-                entry = self._state.commands_by_id[cid]
-                return CurrentCommand(
-                    command_id=entry.command.id,
-                    command_key=entry.command.key,
-                    created_at=entry.command.createdAt,
-                    index=len(self._state.all_command_ids) - reverse_index - 1,
-                )
+        if self._state.latest_completed_command_id:
+            entry = self._state.commands_by_id[self._state.latest_completed_command_id]
+            return CurrentCommand(
+                command_id=entry.command.id,
+                command_key=entry.command.key,
+                created_at=entry.command.createdAt,
+                index=entry.index,
+            )
 
         return None
 
@@ -527,10 +563,11 @@ class CommandView(HasState[CommandState]):
         no_command_queued = len(self._state.queued_command_ids) == 0
 
         if no_command_running and no_command_queued:
-            for command_id in self._state.all_command_ids:
-                command = self._state.commands_by_id[command_id].command
-                if command.error and command.intent != CommandIntent.SETUP:
-                    raise ProtocolCommandFailedError(command.error.detail)
+            failed_command_id = next(iter(self._state.failed_command_ids), None)
+            if failed_command_id is not None:
+                command = self._state.commands_by_id[failed_command_id].command
+                assert command.error is not None, "Failed command must have an error"
+                raise ProtocolCommandFailedError(command.error.detail)
             return True
         else:
             return False
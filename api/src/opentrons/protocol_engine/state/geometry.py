@@ -1,6 +1,6 @@
 """Geometry state getters."""
-from dataclasses import dataclass
-from typing import Optional, List, Set, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List, Set, Tuple, Union
 
 from opentrons.types import Point, DeckSlotName
 from opentrons.hardware_control.dev_types import PipetteDict
@@ -45,6 +45,17 @@ class TipGeometry:
     volume: int
 
 
+@dataclass
+class _GeometryCache:
+    """Memoized geometry, valid for one version of labware and module state."""
+
+    labware_version: int
+    module_version: int
+    labware_positions: Dict[str, Point] = field(default_factory=dict)
+    labware_highest_z: Dict[str, float] = field(default_factory=dict)
+    all_labware_highest_z: Optional[float] = None
+
+
 # TODO(mc, 2021-06-03): continue evaluation of which selectors should go here
 # vs which selectors should be in LabwareView
 class GeometryView:
@@ -54,34 +65,67 @@ class GeometryView:
         """Initialize a GeometryView instance."""
         self._labware = labware_view
         self._modules = module_view
+        self._cache: Optional[_GeometryCache] = None
+
+    def _get_cache(self) -> _GeometryCache:
+        """Get the memoized geometry, discarding it if labware or modules changed.
+
+        Labware and modules are placed far less often than they're moved to,
+        so between loads and moves, these selectors are dictionary lookups.
+        """
+        labware_version = self._labware.get_version()
+        module_version = self._modules.get_version()
+
+        if (
+            self._cache is None
+            or self._cache.labware_version != labware_version
+            or self._cache.module_version != module_version
+        ):
+            self._cache = _GeometryCache(
+                labware_version=labware_version,
+                module_version=module_version,
+            )
+
+        return self._cache
 
     def get_labware_highest_z(self, labware_id: str) -> float:
         """Get the highest Z-point of a labware."""
-        labware_data = self._labware.get(labware_id)
+        cache = self._get_cache()
+        highest_z = cache.labware_highest_z.get(labware_id)
+
+        if highest_z is None:
+            labware_data = self._labware.get(labware_id)
+            highest_z = self._get_highest_z_from_labware_data(labware_data)
+            cache.labware_highest_z[labware_id] = highest_z
 
-        return self._get_highest_z_from_labware_data(labware_data)
+        return highest_z
 
     # TODO(mc, 2022-06-24): rename this method
     def get_all_labware_highest_z(self) -> float:
         """Get the highest Z-point across all labware."""
-        highest_labware_z = max(
-            (
-                self._get_highest_z_from_labware_data(lw_data)
-                for lw_data in self._labware.get_all()
-                if lw_data.location != OFF_DECK_LOCATION
-            ),
-            default=0.0,
-        )
+        cache = self._get_cache()
+
+        if cache.all_labware_highest_z is None:
+            highest_labware_z = max(
+                (
+                    self.get_labware_highest_z(lw_data.id)
+                    for lw_data in self._labware.get_all()
+                    if lw_data.location != OFF_DECK_LOCATION
+                ),
+                default=0.0,
+            )
 
-        highest_module_z = max(
-            (
-                self._modules.get_overall_height(module.id)
-                for module in self._modules.get_all()
-            ),
-            default=0.0,
-        )
+            highest_module_z = max(
+                (
+                    self._modules.get_overall_height(module.id)
+                    for module in self._modules.get_all()
+                ),
+                default=0.0,
+            )
+
+            cache.all_labware_highest_z = max(highest_labware_z, highest_module_z)
 
-        return max(highest_labware_z, highest_module_z)
+        return cache.all_labware_highest_z
 
     def get_min_travel_z(
         self,
@@ -145,14 +189,20 @@ class GeometryView:
 
     def get_labware_position(self, labware_id: str) -> Point:
         """Get the calibrated origin of the labware."""
-        origin_pos = self.get_labware_origin_position(labware_id)
-        cal_offset = self._labware.get_labware_offset_vector(labware_id)
+        cache = self._get_cache()
+        position = cache.labware_positions.get(labware_id)
+
+        if position is None:
+            origin_pos = self.get_labware_origin_position(labware_id)
+            cal_offset = self._labware.get_labware_offset_vector(labware_id)
+            position = Point(
+                x=origin_pos.x + cal_offset.x,
+                y=origin_pos.y + cal_offset.y,
+                z=origin_pos.z + cal_offset.z,
+            )
+            cache.labware_positions[labware_id] = position
 
-        return Point(
-            x=origin_pos.x + cal_offset.x,
-            y=origin_pos.y + cal_offset.y,
-            z=origin_pos.z + cal_offset.z,
-        )
+        return position
 
     def get_well_position(
         self,
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Union
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3, SlotDefV3
 from opentrons_shared_data.pipette.dev_types import LabwareUri
@@ -27,6 +27,7 @@ from ..types import (
     LabwareLocation,
     LoadedLabware,
     ModuleLocation,
+    ModuleModel,
 )
 from ..actions import (
     Action,
@@ -47,6 +48,17 @@ _MAGDECK_HALF_MM_LABWARE = {
 
 _INSTRUMENT_ATTACH_SLOT = DeckSlotName.SLOT_2
 
+# What a labware offset has to match exactly to apply to a labware load:
+# its definition URI, and its location's slot name and module model.
+LabwareOffsetKey = Tuple[str, DeckSlotName, Optional[ModuleModel]]
+
+
+def get_labware_offset_key(
+    definition_uri: str, location: LabwareOffsetLocation
+) -> LabwareOffsetKey:
+    """Get the key that a labware offset for this URI and location is indexed by."""
+    return definition_uri, location.slotName, location.moduleModel
+
 
 @dataclass
 class LabwareState:
@@ -61,9 +73,20 @@ class LabwareState:
     # We rely on Python 3.7+ preservation of dict insertion order.
     labware_offsets_by_id: Dict[str, LabwareOffset]
 
+    # The ID of the most recently added offset in labware_offsets_by_id
+    # for each definition URI and location.
+    latest_labware_offset_ids: Dict[LabwareOffsetKey, str]
+
     definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV3
 
+    # The slots of deck_definition, indexed by slot ID.
+    deck_slots_by_id: Dict[str, SlotDefV3]
+
+    # Incremented whenever the store changes this state,
+    # so derived selectors can tell when their memoized values are stale.
+    version: int = 0
+
 
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
@@ -102,14 +125,25 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
         self._state = LabwareState(
             definitions_by_uri=definitions_by_uri,
             labware_offsets_by_id={},
+            latest_labware_offset_ids={},
             labware_by_id=labware_by_id,
             deck_definition=deck_definition,
+            deck_slots_by_id={
+                slot_def["id"]: slot_def
+                for slot_def in deck_definition["locations"]["orderedSlots"]
+            },
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = self._handle_action(action)
+        if changed:
+            self._state.version += 1
+        return changed
+
+    def _handle_action(self, action: Action) -> bool:
         if isinstance(action, UpdateCommandAction):
-            self._handle_command(action.command)
+            return self._handle_command(action.command)
 
         elif isinstance(action, AddLabwareOffsetAction):
             labware_offset = LabwareOffset.construct(
@@ -129,7 +163,12 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             )
             self._state.definitions_by_uri[uri] = action.definition
 
-    def _handle_command(self, command: Command) -> None:
+        else:
+            return False
+
+        return True
+
+    def _handle_command(self, command: Command) -> bool:
         """Modify state in reaction to a command."""
         if isinstance(command.result, LoadLabwareResult):
             # If the labware load refers to an offset, that offset must actually exist.
@@ -162,6 +201,11 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             self._state.labware_by_id[labware_id].offsetId = new_offset_id
             self._state.labware_by_id[labware_id].location = new_location
 
+        else:
+            return False
+
+        return True
+
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
 
@@ -172,6 +216,12 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
         assert labware_offset.id not in self._state.labware_offsets_by_id
 
         self._state.labware_offsets_by_id[labware_offset.id] = labware_offset
+        self._state.latest_labware_offset_ids[
+            get_labware_offset_key(
+                definition_uri=labware_offset.definitionUri,
+                location=labware_offset.location,
+            )
+        ] = labware_offset.id
 
 
 class LabwareView(HasState[LabwareState]):
@@ -187,6 +237,10 @@ class LabwareView(HasState[LabwareState]):
         """
         self._state = state
 
+    def get_version(self) -> int:
+        """Get a number that changes whenever labware state changes."""
+        return self._state.version
+
     def get(self, labware_id: str) -> LoadedLabware:
         """Get labware data by the labware's unique identifier."""
         try:
@@ -244,15 +298,13 @@ class LabwareView(HasState[LabwareState]):
 
     def get_slot_definition(self, slot: DeckSlotName) -> SlotDefV3:
         """Get the definition of a slot in the deck."""
-        deck_def = self.get_deck_definition()
-
-        for slot_def in deck_def["locations"]["orderedSlots"]:
-            if slot_def["id"] == str(slot):
-                return slot_def
-
-        raise errors.SlotDoesNotExistError(
-            f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
-        )
+        try:
+            return self._state.deck_slots_by_id[str(slot)]
+        except KeyError as e:
+            deck_def = self.get_deck_definition()
+            raise errors.SlotDoesNotExistError(
+                f"Slot ID {slot} does not exist in deck {deck_def['otId']}"
+            ) from e
 
     def get_slot_position(self, slot: DeckSlotName) -> Point:
         """Get the position of a deck slot."""
@@ -453,14 +505,14 @@ class LabwareView(HasState[LabwareState]):
         This implies that if the location involves a module,
         it will *not* match a module that's compatible but not identical.
         """
-        for candidate in reversed(list(self._state.labware_offsets_by_id.values())):
-            if (
-                candidate.definitionUri == definition_uri
-                and candidate.location == location
-            ):
-                return candidate
+        offset_id = self._state.latest_labware_offset_ids.get(
+            get_labware_offset_key(definition_uri=definition_uri, location=location)
+        )
 
-        return None
+        if offset_id is None:
+            return None
+
+        return self._state.labware_offsets_by_id[offset_id]
 
     def get_fixed_trash_id(self) -> str:
         """Get the identifier of labware loaded into the fixed trash location.
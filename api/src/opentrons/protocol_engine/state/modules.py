@@ -102,6 +102,10 @@ class ModuleState:
     hardware_by_module_id: Dict[str, HardwareModule]
     substate_by_module_id: Dict[str, ModuleSubStateType]
 
+    # Incremented whenever the store changes this state,
+    # so derived selectors can tell when their memoized values are stale.
+    version: int = 0
+
 
 class ModuleStore(HasState[ModuleState], HandlesActions):
     """Module state container."""
@@ -114,10 +118,16 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             slot_by_module_id={}, hardware_by_module_id={}, substate_by_module_id={}
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = self._handle_action(action)
+        if changed:
+            self._state.version += 1
+        return changed
+
+    def _handle_action(self, action: Action) -> bool:
         if isinstance(action, UpdateCommandAction):
-            self._handle_command(action.command)
+            return self._handle_command(action.command)
 
         elif isinstance(action, AddModuleAction):
             self._add_module_substate(
@@ -126,8 +136,11 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 definition=action.definition,
                 module_live_data=action.module_live_data,
             )
+            return True
+
+        return False
 
-    def _handle_command(self, command: Command) -> None:
+    def _handle_command(self, command: Command) -> bool:
         if isinstance(command.result, LoadModuleResult):
             self._add_module_substate(
                 module_id=command.result.moduleId,
@@ -135,6 +148,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 definition=command.result.definition,
                 slot_name=command.params.location.slotName,
             )
+            return True
 
         if isinstance(
             command.result,
@@ -148,6 +162,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             ),
         ):
             self._handle_heater_shaker_commands(command)
+            return True
 
         if isinstance(
             command.result,
@@ -157,6 +172,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             ),
         ):
             self._handle_temperature_module_commands(command)
+            return True
 
         if isinstance(
             command.result,
@@ -170,6 +186,9 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             ),
         ):
             self._handle_thermocycler_module_commands(command)
+            return True
+
+        return False
 
     def _add_module_substate(
         self,
@@ -380,6 +399,10 @@ class ModuleView(HasState[ModuleState]):
         """Initialize the view with its backing state value."""
         self._state = state
 
+    def get_version(self) -> int:
+        """Get a number that changes whenever module state changes."""
+        return self._state.version
+
     def get(self, module_id: str) -> LoadedModule:
         """Get module data by the module's unique identifier."""
         try:
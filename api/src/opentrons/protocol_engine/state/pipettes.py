@@ -89,10 +89,10 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             static_config_by_id={},
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         if isinstance(action, UpdateCommandAction):
-            self._handle_command(action.command)
+            return self._handle_command(action.command)
         elif isinstance(action, SetPipetteMovementSpeedAction):
             self._state.movement_speed_by_id[action.pipette_id] = action.speed
         elif isinstance(action, AddPipetteConfigAction):
@@ -101,9 +101,13 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
                 min_volume=action.min_volume,
                 max_volume=action.max_volume,
             )
+        else:
+            return False
 
-    def _handle_command(self, command: Command) -> None:
-        self._update_current_well(command)
+        return True
+
+    def _handle_command(self, command: Command) -> bool:
+        current_well_changed = self._update_current_well(command)
 
         if isinstance(command.result, LoadPipetteResult):
             pipette_id = command.result.pipetteId
@@ -145,7 +149,12 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             pipette_id = command.params.pipetteId
             self._state.aspirated_volume_by_id[pipette_id] = 0
 
-    def _update_current_well(self, command: Command) -> None:
+        else:
+            return current_well_changed
+
+        return True
+
+    def _update_current_well(self, command: Command) -> bool:
         # These commands leave the pipette in a new well.
         # Update current_well to reflect that.
         if isinstance(
@@ -165,6 +174,7 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
                 labware_id=command.params.labwareId,
                 well_name=command.params.wellName,
             )
+            return True
 
         # These commands leave the pipette in a place that we can't logically associate
         # with a well. Clear current_well to reflect the fact that it's now unknown.
@@ -180,6 +190,7 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             ),
         ):
             self._state.current_well = None
+            return True
 
         # Heater-Shaker commands may have left the pipette in a place that we can't
         # associate with a logical location, depending on their result.
@@ -192,6 +203,7 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
         ):
             if command.result.pipetteRetracted:
                 self._state.current_well = None
+                return True
 
         # A moveLabware command may have moved the labware that contains the current
         # well out from under the pipette. Clear the current well to reflect the
@@ -204,11 +216,15 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             if command.params.strategy == "usingGripper":
                 # All mounts will have been retracted.
                 self._state.current_well = None
+                return True
             elif (
                 self._state.current_well is not None
                 and self._state.current_well.labware_id == moved_labware_id
             ):
                 self._state.current_well = None
+                return True
+
+        return False
 
 
 class PipetteView(HasState[PipetteState]):
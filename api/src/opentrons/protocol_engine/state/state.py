@@ -3,13 +3,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, TypeVar
+from typing import Any, Callable, Collection, Dict, Optional, Sequence, TypeVar
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 
 from ..resources import DeckFixedLabware
 from ..actions import Action, ActionHandler
-from .abstract_store import HasState, HandlesActions
+from .abstract_store import HasState, HandlesActions, StateSlice
 from .change_notifier import ChangeNotifier
 from .commands import CommandState, CommandStore, CommandView
 from .labware import LabwareState, LabwareStore, LabwareView
@@ -149,14 +149,14 @@ class StateStore(StateView, ActionHandler):
         self._liquid_store = LiquidStore()
         self._tip_store = TipStore()
 
-        self._substores: List[HandlesActions] = [
-            self._command_store,
-            self._pipette_store,
-            self._labware_store,
-            self._module_store,
-            self._liquid_store,
-            self._tip_store,
-        ]
+        self._substores: Dict[StateSlice, HandlesActions] = {
+            StateSlice.COMMANDS: self._command_store,
+            StateSlice.PIPETTES: self._pipette_store,
+            StateSlice.LABWARE: self._labware_store,
+            StateSlice.MODULES: self._module_store,
+            StateSlice.LIQUIDS: self._liquid_store,
+            StateSlice.TIPS: self._tip_store,
+        }
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
         self._initialize_state()
@@ -168,15 +168,19 @@ class StateStore(StateView, ActionHandler):
             action: An action object representing a state change. Will be
                 passed to all substores so they can react accordingly.
         """
-        for substore in self._substores:
-            substore.handle_action(action)
+        changed_slices = {
+            state_slice
+            for state_slice, substore in self._substores.items()
+            if substore.handle_action(action)
+        }
 
-        self._update_state_views()
+        self._update_state_views(changed_slices)
 
     async def wait_for(
         self,
         condition: Callable[..., Optional[ReturnT]],
         *args: Any,
+        state_slices: Optional[Collection[StateSlice]] = None,
         **kwargs: Any,
     ) -> ReturnT:
         """Wait for a condition to become true, checking whenever state changes.
@@ -215,6 +219,9 @@ class StateStore(StateView, ActionHandler):
             condition: A function that returns a truthy value when the `await`
                 should resolve.
             *args: Positional arguments to pass to `condition`.
+            state_slices: The slices of state that `condition` reads.
+                If specified, `condition` is only re-checked when one of these
+                slices changes. If omitted, it is re-checked on any change.
             **kwargs: Named arguments to pass to `condition`.
 
         Returns:
@@ -227,7 +234,7 @@ class StateStore(StateView, ActionHandler):
         is_done = predicate()
 
         while not is_done:
-            await self._change_notifier.wait()
+            await self._change_notifier.wait(slices=state_slices)
             is_done = predicate()
 
         return is_done
@@ -268,7 +275,7 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
+    def _update_state_views(self, changed_slices: Collection[StateSlice]) -> None:
         """Update state view interfaces to use latest underlying values."""
         next_state = self._get_next_state()
         self._state = next_state
@@ -278,4 +285,4 @@ class StateStore(StateView, ActionHandler):
         self._modules._state = next_state.modules
         self._liquid._state = next_state.liquids
         self._tips._state = next_state.tips
-        self._change_notifier.notify()
+        self._change_notifier.notify(changed_slices=changed_slices)
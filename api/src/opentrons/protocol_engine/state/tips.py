@@ -45,7 +45,7 @@ class TipStore(HasState[TipState], HandlesActions):
             channels_by_pipette_id={},
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         if (
             isinstance(action, UpdateCommandAction)
@@ -84,6 +84,11 @@ class TipStore(HasState[TipState], HandlesActions):
         elif isinstance(action, AddPipetteConfigAction):
             self._state.channels_by_pipette_id[action.pipette_id] = action.channels
 
+        else:
+            return False
+
+        return True
+
     def _set_used_tips(self, pipette_id: str, well_name: str, labware_id: str) -> None:
         pipette_channels = self._state.channels_by_pipette_id.get(pipette_id)
         columns = self._state.column_by_labware_id.get(labware_id, [])
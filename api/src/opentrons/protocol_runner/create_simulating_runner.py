@@ -1,19 +1,84 @@
 """Simulating ProtocolRunner factory."""
+import asyncio
+from typing import Optional, Union, overload
+
+from anyio import to_thread
+from typing_extensions import Literal
 
 from opentrons.config import feature_flags
 from opentrons.hardware_control import API as HardwareAPI, HardwareControlAPI
+from opentrons.hardware_control.adapters import resolve_in_thread
 from opentrons.protocol_engine import (
     Config as ProtocolEngineConfig,
     create_protocol_engine,
 )
+from opentrons.protocol_reader import ProtocolSource
 
 from opentrons_shared_data.robot.dev_types import RobotType
 
-from .legacy_wrappers import LegacySimulatingContextCreator
-from .protocol_runner import ProtocolRunner
+from .in_thread_caller import InThreadCaller
+from .legacy_wrappers import (
+    LegacySimulatingContextCreator,
+    InThreadLegacySimulatingContextCreator,
+    InThreadLegacyExecutor,
+)
+from .protocol_runner import ProtocolRunner, ProtocolRunResult
+from .python_context_creator import InThreadPythonContextCreator
+from .python_executor import InThreadPythonExecutor
+
+
+class InThreadSimulatingRunner:
+    """Simulate protocol runs with the protocol and ProtocolEngine on one thread.
+
+    Every run gets a fresh simulating ProtocolRunner on a worker thread. The
+    protocol runs on that same thread, so each ProtocolEngine command and
+    hardware call it makes runs the worker's event loop directly, instead of
+    being handed to another thread and waited for.
+    """
+
+    async def run(self, protocol_source: ProtocolSource) -> ProtocolRunResult:
+        """Run a given protocol to completion."""
+        return await to_thread.run_sync(self._run, protocol_source)
+
+    @staticmethod
+    def _run(protocol_source: ProtocolSource) -> ProtocolRunResult:
+        caller = InThreadCaller()
 
+        async def _simulate() -> ProtocolRunResult:
+            with resolve_in_thread(asyncio.get_running_loop()):
+                runner = await _create_simulating_runner(in_thread_caller=caller)
+                return await runner.run(protocol_source)
 
+        return caller.run(_simulate())
+
+
+@overload
 async def create_simulating_runner() -> ProtocolRunner:
+    ...
+
+
+@overload
+async def create_simulating_runner(in_thread: Literal[False]) -> ProtocolRunner:
+    ...
+
+
+@overload
+async def create_simulating_runner(
+    in_thread: Literal[True],
+) -> InThreadSimulatingRunner:
+    ...
+
+
+@overload
+async def create_simulating_runner(
+    in_thread: bool,
+) -> Union[ProtocolRunner, InThreadSimulatingRunner]:
+    ...
+
+
+async def create_simulating_runner(
+    in_thread: bool = False,
+) -> Union[ProtocolRunner, InThreadSimulatingRunner]:
     """Create a ProtocolRunner wired to a simulating HardwareControlAPI.
 
     Example:
@@ -35,7 +100,22 @@ async def create_simulating_runner() -> ProtocolRunner:
         runner: ProtocolRunner = await create_simulating_runner()
         commands: List[Command] = await runner.run(protocol)
         ```
+
+    Args:
+        in_thread: Instead of a ProtocolRunner, return an
+            InThreadSimulatingRunner, which only supports `run`. It runs
+            Python protocols on the same thread as their ProtocolEngine,
+            which is much faster for protocols with many commands.
     """
+    if in_thread:
+        return InThreadSimulatingRunner()
+
+    return await _create_simulating_runner()
+
+
+async def _create_simulating_runner(
+    in_thread_caller: Optional[InThreadCaller] = None,
+) -> ProtocolRunner:
     if feature_flags.enable_ot3_hardware_controller():
         # Inline import because OT3API is not safe to import on an OT2 system
         from opentrons.hardware_control.ot3api import OT3API
@@ -61,13 +141,26 @@ async def create_simulating_runner() -> ProtocolRunner:
         ),
     )
 
-    simulating_legacy_context_creator = LegacySimulatingContextCreator(
-        hardware_api=simulating_hardware_api,
-        protocol_engine=protocol_engine,
-    )
+    if in_thread_caller is None:
+        simulating_legacy_context_creator = LegacySimulatingContextCreator(
+            hardware_api=simulating_hardware_api,
+            protocol_engine=protocol_engine,
+        )
+
+        return ProtocolRunner(
+            protocol_engine=protocol_engine,
+            hardware_api=simulating_hardware_api,
+            legacy_context_creator=simulating_legacy_context_creator,
+        )
 
     return ProtocolRunner(
         protocol_engine=protocol_engine,
         hardware_api=simulating_hardware_api,
-        legacy_context_creator=simulating_legacy_context_creator,
+        python_context_creator=InThreadPythonContextCreator(),
+        python_executor=InThreadPythonExecutor(caller=in_thread_caller),
+        legacy_context_creator=InThreadLegacySimulatingContextCreator(
+            hardware_api=simulating_hardware_api,
+            protocol_engine=protocol_engine,
+        ),
+        legacy_executor=InThreadLegacyExecutor(caller=in_thread_caller),
     )
@@ -0,0 +1,90 @@
+"""Make blocking calls on the thread that runs an event loop."""
+
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Coroutine, Deque, Optional, Tuple, TypeVar
+
+
+_T = TypeVar("_T")
+
+
+class InThreadCaller:
+    """Run an event loop in the current thread, with blocking calls in between.
+
+    Coroutines on the loop may ask for a blocking function to be called on the
+    loop's own thread. The function is called while the loop is stopped, so it
+    can in turn run the loop until something it's waiting for is done.
+
+    This is how a protocol and its ProtocolEngine can share one thread: the
+    protocol is a blocking call, and each command it sends the engine runs the
+    loop until the command completes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the caller."""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._calls: Deque[Tuple[Callable[[], Any], asyncio.Future[Any]]] = deque()
+
+    def run(self, main: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine to completion on a new event loop in this thread.
+
+        The loop is closed afterwards, cancelling any tasks that are left.
+        """
+        assert self._loop is None, "An InThreadCaller can only run one loop at a time."
+        loop = self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            task = loop.create_task(main)
+            task.add_done_callback(lambda _: loop.stop())
+
+            while True:
+                loop.run_forever()
+                if task.done():
+                    return task.result()
+                self._make_calls()
+
+        finally:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            asyncio.set_event_loop(None)
+            loop.close()
+            self._loop = None
+
+    async def call(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Call a blocking function on this thread, with the event loop stopped.
+
+        Must be awaited from within `run`.
+        """
+        loop = asyncio.get_running_loop()
+        assert loop is self._loop, "InThreadCaller.call must be awaited within run."
+
+        future: asyncio.Future[_T] = loop.create_future()
+        self._calls.append((partial(func, *args), future))
+        loop.stop()
+
+        return await future
+
+    def _make_calls(self) -> None:
+        while self._calls:
+            func, future = self._calls.popleft()
+
+            try:
+                result = func()
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    tasks = asyncio.all_tasks(loop)
+
+    for task in tasks:
+        task.cancel()
+
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
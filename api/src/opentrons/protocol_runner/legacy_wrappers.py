@@ -46,6 +46,8 @@ from opentrons.protocols.types import (
     PythonProtocol as LegacyPythonProtocol,
 )
 
+from .in_thread_caller import InThreadCaller
+
 # The earliest Python Protocol API version ("apiLevel") where the protocol's simulation
 # and execution will be handled by Protocol Engine, rather than the legacy machinery.
 #
@@ -95,6 +97,7 @@ class LegacyContextCreator:
     """Interface to construct Protocol API v2 contexts."""
 
     _USE_SIMULATING_CORE = False
+    _ENGINE_IN_THREAD = False
 
     def __init__(
         self,
@@ -136,6 +139,7 @@ class LegacyContextCreator:
             hardware_api=self._hardware_api,
             protocol_engine=self._protocol_engine,
             protocol_engine_loop=asyncio.get_running_loop(),
+            protocol_engine_in_thread=self._ENGINE_IN_THREAD,
             broker=broker,
             equipment_broker=equipment_broker,
             extra_labware=extra_labware,
@@ -163,6 +167,30 @@ class LegacyExecutor:
         await to_thread.run_sync(run_protocol, protocol, context)
 
 
+class InThreadLegacySimulatingContextCreator(LegacySimulatingContextCreator):
+    """Interface to construct simulating PAPIv2 contexts for in-thread execution.
+
+    The contexts expect to run on the thread running the ProtocolEngine's loop,
+    with the loop stopped. See `InThreadLegacyExecutor`.
+    """
+
+    _ENGINE_IN_THREAD = True
+
+
+class InThreadLegacyExecutor(LegacyExecutor):
+    """Interface to execute PAPIv2 protocols on the ProtocolEngine's own thread."""
+
+    def __init__(self, caller: InThreadCaller) -> None:
+        """Initialize the executor with the caller that runs the engine's loop."""
+        self._caller = caller
+
+    async def execute(  # type: ignore[override]
+        self, protocol: LegacyProtocol, context: LegacyProtocolContext
+    ) -> None:
+        """Execute a PAPIv2 protocol with the event loop stopped."""
+        await self._caller.call(run_protocol, protocol, context)
+
+
 __all__ = [
     # Re-exports of user-facing Python Protocol APIv2 stuff:
     # TODO(mc, 2022-08-22): remove, no longer "legacy", so re-exports unnecessary
@@ -1,7 +1,11 @@
 """Factory for Python Protocol API instances."""
 import asyncio
 from opentrons.protocol_engine import ProtocolEngine
-from opentrons.protocol_engine.clients import SyncClient, ChildThreadTransport
+from opentrons.protocol_engine.clients import (
+    SyncClient,
+    ChildThreadTransport,
+    InThreadTransport,
+)
 from opentrons.protocol_api_experimental import ProtocolContext
 
 
@@ -16,3 +20,16 @@ class PythonContextCreator:
         client = SyncClient(transport=transport)
 
         return ProtocolContext(engine_client=client)
+
+
+class InThreadPythonContextCreator(PythonContextCreator):
+    """A factory for ProtocolContexts run on the ProtocolEngine's own thread."""
+
+    @staticmethod
+    def create(protocol_engine: ProtocolEngine) -> ProtocolContext:
+        """Create a fresh ProtocolContext wired to a ProtocolEngine."""
+        loop = asyncio.get_running_loop()
+        transport = InThreadTransport(engine=protocol_engine, loop=loop)
+        client = SyncClient(transport=transport)
+
+        return ProtocolContext(engine_client=client)
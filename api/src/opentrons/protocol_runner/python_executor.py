@@ -5,6 +5,7 @@ from functools import partial
 
 from opentrons.protocol_api_experimental import ProtocolContext
 from .python_file_reader import PythonProtocol
+from .in_thread_caller import InThreadCaller
 
 
 class PythonExecutor:
@@ -23,3 +24,21 @@ class PythonExecutor:
                 executor=executor,
                 func=partial(protocol.run, context),
             )
+
+
+class InThreadPythonExecutor(PythonExecutor):
+    """Execute a PythonProtocol on the thread running the ProtocolEngine's loop."""
+
+    def __init__(self, caller: InThreadCaller) -> None:
+        """Initialize the executor with the caller that runs the engine's loop."""
+        self._caller = caller
+
+    async def execute(  # type: ignore[override]
+        self, protocol: PythonProtocol, context: ProtocolContext
+    ) -> None:
+        """Execute a PythonProtocol using the given ProtocolContext.
+
+        Runs the protocol with the event loop stopped, so the context must be
+        wired to the ProtocolEngine with an InThreadTransport.
+        """
+        await self._caller.call(protocol.run, context)
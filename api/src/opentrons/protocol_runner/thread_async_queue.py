@@ -7,6 +7,7 @@ from collections import deque
 from threading import Condition
 from typing import AsyncIterable, Deque, Generic, Iterable, TypeVar
 
+from anyio.lowlevel import checkpoint
 from anyio.to_thread import run_sync
 
 
@@ -96,6 +97,13 @@ class ThreadAsyncQueue(Generic[_T]):
             The proper way to interrupt a waiting `get_async()`
             is to close the queue, just like you have to do with `get()`.
         """
+        # Don't bother a helper thread if there's already a value to get,
+        # but still yield to the event loop like waiting would.
+        await checkpoint()
+        with self._condition:
+            if len(self._deque) > 0:
+                return self._deque.popleft()
+
         return await run_sync(
             self.get,
             # We keep `cancellable` False so we don't leak this helper thread.
@@ -63,6 +63,19 @@ def get_labware_definition(
     return _get_standard_labware_definition(load_name, namespace, version)
 
 
+def get_labware_definition_path(load_name: str, namespace: str, version: int) -> Path:
+    """
+    Return the path at which a standard or custom definition would be stored.
+
+    The file is not guaranteed to exist.
+
+    :param str load_name: corresponds to 'loadName' key in definition
+    :param str namespace: The namespace the labware definition belongs to
+    :param int version: The version of the labware definition
+    """
+    return _get_path_to_labware(load_name.lower(), namespace.lower(), version)
+
+
 def get_all_labware_definitions() -> List[str]:
     """
     Return a list of standard and custom labware definitions with load_name +
@@ -1,14 +1,19 @@
 """Test cli execution."""
+import importlib
 import json
+import os
 
-from typing import Iterator
+from typing import Iterator, Sequence
 from pathlib import Path
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
 from opentrons.cli.analyze import analyze
 
+# `opentrons.cli.analyze` is shadowed by the command of the same name.
+analyze_module = importlib.import_module("opentrons.cli.analyze")
+
 
 def _list_fixtures(version: int) -> Iterator[Path]:
     return Path(__file__).parent.glob(
@@ -39,3 +44,114 @@ def test_analyze(
     assert "labware" in analysis_output_json
     assert "liquids" in analysis_output_json
     assert "modules" in analysis_output_json
+
+
+def test_analyze_batch(tmp_path: Path) -> None:
+    """It should analyze each protocol separately, one JSON line per protocol."""
+    fixture_paths = sorted(_list_fixtures(6))[:2]
+    invalid_path = tmp_path / "invalid.txt"
+    invalid_path.write_text("not a protocol")
+    analysis_output_path = tmp_path / "analysis_output.jsonl"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        analyze,
+        [
+            *(str(p.resolve()) for p in fixture_paths),
+            str(invalid_path),
+            "--batch",
+            "--jobs",
+            "2",
+            "--json-output",
+            str(analysis_output_path),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "1 of 3 protocols could not be analyzed" in result.output
+
+    lines = [
+        json.loads(line)
+        for line in analysis_output_path.read_text(encoding="utf-8").splitlines()
+    ]
+    results_by_protocol = {line["protocol"]: line for line in lines}
+
+    assert len(lines) == 3
+    for fixture_path in fixture_paths:
+        line = results_by_protocol[str(fixture_path.resolve())]
+        assert line["durationSeconds"] > 0
+        assert "error" not in line
+        assert line["analysis"]["commands"]
+        assert [f["name"] for f in line["analysis"]["files"]] == [fixture_path.name]
+
+    invalid_line = results_by_protocol[str(invalid_path)]
+    assert "analysis" not in invalid_line
+    assert invalid_line["error"]
+
+
+async def _raise_runtime_error(input_files: Sequence[Path]) -> None:
+    raise RuntimeError("oh no")
+
+
+def _exit_worker(protocol: Path) -> None:
+    os._exit(1)
+
+
+def _run_batch(protocols: Sequence[Path], output_path: Path) -> Result:
+    return CliRunner().invoke(
+        analyze,
+        [
+            *(str(p) for p in protocols),
+            "--batch",
+            "--jobs",
+            "1",
+            "--json-output",
+            str(output_path),
+        ],
+    )
+
+
+def test_analyze_batch_unexpected_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should report an unexpected error as that protocol's result."""
+    fixture_path = sorted(_list_fixtures(6))[0].resolve()
+    analysis_output_path = tmp_path / "analysis_output.jsonl"
+    # Worker processes are forked from this one, so they see the patch.
+    monkeypatch.setattr(analyze_module, "_analyze_files", _raise_runtime_error)
+
+    result = _run_batch([fixture_path], analysis_output_path)
+
+    assert result.exit_code == 1
+    assert "1 of 1 protocols could not be analyzed" in result.output
+    [line] = [
+        json.loads(line)
+        for line in analysis_output_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert line["protocol"] == str(fixture_path)
+    assert line["error"] == "RuntimeError: oh no"
+    assert line["durationSeconds"] >= 0
+
+
+def test_analyze_batch_worker_died(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should still write a line for every protocol if a worker dies."""
+    fixture_paths = [p.resolve() for p in sorted(_list_fixtures(6))[:2]]
+    analysis_output_path = tmp_path / "analysis_output.jsonl"
+    monkeypatch.setattr(analyze_module, "_analyze_batch_entry", _exit_worker)
+
+    result = _run_batch(fixture_paths, analysis_output_path)
+
+    assert result.exit_code == 1
+    assert "2 of 2 protocols could not be analyzed" in result.output
+    lines = [
+        json.loads(line)
+        for line in analysis_output_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert sorted(line["protocol"] for line in lines) == sorted(
+        str(p) for p in fixture_paths
+    )
+    for line in lines:
+        assert "BrokenProcessPool" in line["error"]
+        assert "analysis" not in line
@@ -464,3 +464,28 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+async def test_auto_recover_on_queued_move_alarm(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """An alarm while waiting for queued moves should home like any move's."""
+    sent = []
+
+    async def send_command(command, retries, timeout):
+        sent.append(command.build().strip())
+        if command.build().strip() == "M400":
+            raise AlarmResponse(port="", response="ALARM: Hard limit -X")
+        return "ok"
+
+    mock_connection.send_command.side_effect = send_command
+    with patch.object(smoothie, "_reset_from_error"), patch.object(smoothie, "home"):
+        mocked_home = cast(AsyncMock, smoothie.home)
+        with pytest.raises(SmoothieError):
+            async with smoothie.queued_moves():
+                await smoothie.move({"X": 10})
+                await smoothie.move({"Y": 20})
+        mocked_home.assert_called_once_with("X")
+
+    assert [c.split(" G0 ")[-1] for c in sent] == ["X10", "Y20", "M400"]
+    assert not smoothie._moves_pending
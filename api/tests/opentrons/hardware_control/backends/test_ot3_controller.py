@@ -548,3 +548,86 @@ async def test_ready_for_movement(
 
     axes = [OT3Axis.X, OT3Axis.Y, OT3Axis.Z_L]
     assert controller.check_ready_for_movement(axes) == ready
+
+
+@pytest.fixture
+def mock_get_motor_position(mock_present_nodes: OT3Controller):
+    async def fake_gmp(can_messenger, nodes):
+        return {node: (1.0, 1.0, True, True) for node in nodes}
+
+    with patch(
+        "opentrons.hardware_control.backends.ot3controller.get_motor_position",
+        AsyncMock(side_effect=fake_gmp),
+    ) as mock_gmp:
+        yield mock_gmp
+
+
+async def test_position_reused_after_move(
+    controller: OT3Controller, mock_move_group_run, mock_get_motor_position
+) -> None:
+    mock_move_group_run.return_value = {NodeId.gripper_g: (5.0, 5.0, True, True)}
+    await controller.update_position()
+    assert mock_get_motor_position.call_count == 1
+
+    await controller.gripper_hold_jaw(encoder_position_um=5000)
+    await controller.update_position()
+    await controller.update_encoder_position()
+
+    assert mock_get_motor_position.call_count == 1
+    assert controller.position_read_statistics.queried == 1
+    assert controller.position_read_statistics.reused == 2
+
+
+@pytest.mark.parametrize(
+    "completions",
+    [
+        # the node never reported completing its move
+        {},
+        # the node reported that its position is not ok, as after a stall
+        {NodeId.gripper_g: (5.0, 5.0, False, True)},
+    ],
+)
+async def test_position_queried_after_doubtful_move(
+    controller: OT3Controller,
+    mock_move_group_run,
+    mock_get_motor_position,
+    completions,
+) -> None:
+    await controller.update_position()
+    mock_move_group_run.return_value = completions
+
+    await controller.gripper_hold_jaw(encoder_position_um=5000)
+    await controller.update_position()
+
+    assert mock_get_motor_position.call_count == 2
+
+
+async def test_position_queried_after_move_error(
+    controller: OT3Controller, mock_move_group_run, mock_get_motor_position
+) -> None:
+    await controller.update_position()
+    mock_move_group_run.side_effect = RuntimeError("oh no")
+
+    with pytest.raises(RuntimeError):
+        await controller.gripper_home_jaw()
+    await controller.update_position()
+
+    assert mock_get_motor_position.call_count == 2
+
+
+async def test_position_queried_after_home(
+    controller: OT3Controller, mock_move_group_run, mock_get_motor_position
+) -> None:
+    await controller.update_position()
+    mock_move_group_run.side_effect = move_group_run_side_effect(
+        controller, [OT3Axis.X]
+    )
+
+    await controller.home([OT3Axis.X])
+    await controller.update_position()
+
+    assert mock_get_motor_position.call_count == 2
+    assert controller.position_read_statistics.queried == 2
+
+    controller.reset_position_read_statistics()
+    assert controller.position_read_statistics.queried == 0
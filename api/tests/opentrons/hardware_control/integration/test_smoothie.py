@@ -441,3 +441,46 @@ async def test_do_relative_splits_during_home_for(
         "G90 M52 M54 M92 B1.0 C1.0 G4 P0.01 G0 F24000",
         "M400",
     ]
+
+
+async def test_queued_moves(subject: SmoothieDriver, spy: MagicMock):
+    await subject.home()
+    spy.reset_mock()
+
+    async with subject.queued_moves():
+        await subject.move({"Z": 100})
+        await subject.move({"X": 10, "Y": 20})
+        await subject.move({"Z": 50})
+    expected = [
+        # Only raise currents until the queued moves are done
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.8 G4 P0.005 G0 Z100",
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 X10 Y20",
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 Z50",
+        "M400",
+    ]
+    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    assert command_log == expected
+    assert subject.position["X"] == 10
+    assert subject.position["Z"] == 50
+
+    spy.reset_mock()
+
+    async with subject.queued_moves():
+        await subject.move({"X": 20})
+        await subject.move({"B": 2})
+        await subject.move({"Y": 30})
+    await subject.move({"X": 30})
+    expected = [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 X20",
+        # Plunger moves wait for the queue to drain
+        "M400 M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y1.25 Z0.1 G4 P0.005 G0 Y30",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X30",
+        "M400",
+    ]
+    command_log = [x.kwargs["data"].strip() for x in spy.call_args_list]
+    assert command_log == expected
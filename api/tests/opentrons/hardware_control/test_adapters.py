@@ -1,5 +1,8 @@
+import asyncio
+
 from opentrons.types import Mount
-from opentrons.hardware_control import API, ThreadManager
+from opentrons.hardware_control import API, SynchronousAdapter, ThreadManager
+from opentrons.hardware_control.adapters import resolve_in_thread
 
 
 async def test_synch_adapter():
@@ -8,3 +11,17 @@ async def test_synch_adapter():
     synch.cache_instruments({Mount.LEFT: "p10_single"})
     assert synch.attached_instruments[Mount.LEFT]["name"].startswith("p10_single")
     thread_manager.clean_up()
+
+
+def test_synch_adapter_resolve_in_thread():
+    loop = asyncio.new_event_loop()
+    try:
+        api = loop.run_until_complete(API.build_hardware_simulator(loop=loop))
+        synch = SynchronousAdapter(api)
+        with resolve_in_thread(loop):
+            synch.cache_instruments({Mount.LEFT: "p10_single"})
+            assert synch.attached_instruments[Mount.LEFT]["name"].startswith(
+                "p10_single"
+            )
+    finally:
+        loop.close()
@@ -1,4 +1,5 @@
 import asyncio
+from contextlib import asynccontextmanager
 
 import mock
 import pytest
@@ -139,6 +140,45 @@ async def test_move(hardware_api):
     assert hardware_api._current_position == target_position2
 
 
+async def test_move_to_waypoints(hardware_api, monkeypatch):
+    mock_be_move = mock.AsyncMock()
+    monkeypatch.setattr(hardware_api._backend, "move", mock_be_move)
+    await hardware_api.home()
+    mock_be_move.reset_mock()
+    await hardware_api.move_to_waypoints(
+        types.Mount.RIGHT,
+        [
+            (types.Point(30, 20, 100), CriticalPoint.XY_CENTER),
+            (types.Point(30, 20, 10), None),
+        ],
+        speed=30,
+    )
+    assert mock_be_move.call_count == 2
+    assert [call[1]["speed"] for call in mock_be_move.call_args_list] == [30, 30]
+    assert await hardware_api.gantry_position(types.Mount.RIGHT) == types.Point(
+        30, 20, 10
+    )
+
+
+async def test_move_to_waypoints_queue_fails(hardware_api, monkeypatch):
+    """It should forget its position if a queued move fails."""
+
+    @asynccontextmanager
+    async def queued_moves():
+        yield
+        raise RuntimeError("Hard limit")
+
+    monkeypatch.setattr(hardware_api._backend, "queued_moves", queued_moves)
+    await hardware_api.home()
+    with pytest.raises(RuntimeError):
+        await hardware_api.move_to_waypoints(
+            types.Mount.RIGHT,
+            [(types.Point(30, 20, 100), None), (types.Point(30, 20, 10), None)],
+        )
+    with pytest.raises(MustHomeError):
+        await hardware_api.gantry_position(types.Mount.RIGHT)
+
+
 async def test_move_extras_passed_through(hardware_api, monkeypatch):
     mock_be_move = mock.AsyncMock()
     monkeypatch.setattr(hardware_api._backend, "move", mock_be_move)
@@ -260,6 +260,53 @@ async def test_move_to_without_homing_first(
     assert ot3_hardware._backend.check_ready_for_movement(homed_axis)
 
 
+async def test_move_to_waypoints_blends_one_path(
+    ot3_hardware: ThreadManager[OT3API],
+) -> None:
+    """All the waypoints should be planned together and run as one move group."""
+    await ot3_hardware.home()
+    waypoints = [
+        (Point(10, 20, 100), CriticalPoint.XY_CENTER),
+        (Point(50, 60, 100), None),
+        (Point(50, 60, 30), None),
+    ]
+    manager = ot3_hardware.managed_obj._move_manager
+    with patch.object(
+        manager, "plan_motion", Mock(wraps=manager.plan_motion)
+    ) as mock_plan, patch.object(
+        ot3_hardware.managed_obj._backend,
+        "move",
+        AsyncMock(wraps=ot3_hardware.managed_obj._backend.move),
+    ) as mock_backend_move:
+        await ot3_hardware.move_to_waypoints(OT3Mount.RIGHT, waypoints)
+
+    mock_plan.assert_called_once()
+    assert len(mock_plan.call_args[1]["target_list"]) == 3
+    mock_backend_move.assert_called_once()
+    assert await ot3_hardware.gantry_position(OT3Mount.RIGHT) == Point(50, 60, 30)
+
+
+async def test_move_to_waypoints_skips_repeated_waypoints(
+    ot3_hardware: ThreadManager[OT3API],
+) -> None:
+    """Waypoints that don't move from the previous one shouldn't be planned."""
+    await ot3_hardware.home()
+    await ot3_hardware.move_to(OT3Mount.RIGHT, Point(10, 20, 100))
+    waypoints = [
+        (Point(10, 20, 100), None),
+        (Point(50, 60, 100), None),
+        (Point(50, 60, 100), None),
+    ]
+    manager = ot3_hardware.managed_obj._move_manager
+    with patch.object(
+        manager, "plan_motion", Mock(wraps=manager.plan_motion)
+    ) as mock_plan:
+        await ot3_hardware.move_to_waypoints(OT3Mount.RIGHT, waypoints)
+
+    assert len(mock_plan.call_args[1]["target_list"]) == 1
+    assert await ot3_hardware.gantry_position(OT3Mount.RIGHT) == Point(50, 60, 100)
+
+
 @pytest.mark.parametrize(
     "mount,moving",
     [
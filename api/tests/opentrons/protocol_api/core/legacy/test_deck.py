@@ -123,3 +123,12 @@ def test_item_collisions(
         subject[7] = module_item
 
     assert subject[7] is None
+
+
+def test_get_slot_definition(subject: Deck) -> None:
+    """It should look up slot definitions by slot name."""
+    slot_def = subject.get_slot_definition("5")
+    assert slot_def["id"] == "5"
+
+    with pytest.raises(ValueError, match="slot 13 could not be found"):
+        subject.get_slot_definition("13")
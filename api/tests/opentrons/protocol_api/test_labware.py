@@ -107,6 +107,42 @@ def test_wells(
     assert subject.columns_by_name() == {"1": [result_a1, result_b1]}
 
 
+def test_wells_created_on_access(
+    decoy: Decoy,
+    api_version: APIVersion,
+    mock_labware_core: LabwareCore,
+) -> None:
+    """It should create each Well on first access and reuse it afterwards."""
+    mock_well_core = decoy.mock(cls=WellCore)
+    grid = well_grid.WellGrid(
+        columns_by_name={"1": ["A1", "B1"]},
+        rows_by_name={"A": ["A1"], "B": ["B1"]},
+    )
+
+    decoy.when(mock_well_core.get_name()).then_return("B1")
+    decoy.when(mock_labware_core.get_well_columns()).then_return([["A1", "B1"]])
+    decoy.when(mock_labware_core.get_well_core("B1")).then_return(mock_well_core)
+    decoy.when(well_grid.create([["A1", "B1"]])).then_return(grid)
+
+    subject = Labware(implementation=mock_labware_core, api_version=api_version)
+    decoy.verify(mock_labware_core.get_well_core("A1"), times=0)
+
+    result = subject["B1"]
+    assert result.well_name == "B1"
+    assert subject["B1"] is result
+    assert subject.well(1) is result
+    assert subject.well(-1) is result
+    assert subject.wells(1)[0] is result
+    assert subject.wells("B1")[0] is result
+    decoy.verify(mock_labware_core.get_well_core("A1"), times=0)
+
+    with pytest.raises(KeyError):
+        subject["C1"]
+
+    with pytest.raises(IndexError):
+        subject.well(2)
+
+
 def test_reset_tips(
     decoy: Decoy, mock_labware_core: LabwareCore, subject: Labware
 ) -> None:
@@ -0,0 +1,126 @@
+"""Tests for an InThreadTransport."""
+import asyncio
+import threading
+from datetime import datetime
+from typing import Any, Callable, TypeVar
+
+import pytest
+from decoy import Decoy
+
+from opentrons_shared_data.labware.dev_types import LabwareUri
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+
+from opentrons.protocol_engine import ProtocolEngine, commands
+from opentrons.protocol_engine.errors import ErrorOccurrence, ProtocolEngineError
+from opentrons.protocol_engine.clients.transports import InThreadTransport
+
+
+_T = TypeVar("_T")
+
+
+@pytest.fixture
+async def engine(decoy: Decoy) -> ProtocolEngine:
+    """Get a stubbed out ProtocolEngine."""
+    return decoy.mock(cls=ProtocolEngine)
+
+
+async def _use_in_thread(
+    engine: ProtocolEngine, use: Callable[[InThreadTransport], _T]
+) -> _T:
+    """Use a transport from a thread with an idle event loop of its own."""
+
+    def _use() -> _T:
+        loop = asyncio.new_event_loop()
+        try:
+            return use(InThreadTransport(engine=engine, loop=loop))
+        finally:
+            loop.close()
+
+    return await asyncio.get_running_loop().run_in_executor(None, _use)
+
+
+async def test_execute_command(decoy: Decoy, engine: ProtocolEngine) -> None:
+    """It should execute a command by running the idle loop."""
+    cmd_data = commands.MoveToWellParams(
+        pipetteId="pipette-id",
+        labwareId="labware-id",
+        wellName="A1",
+    )
+    cmd_result = commands.MoveToWellResult()
+    cmd_request = commands.MoveToWellCreate(params=cmd_data)
+
+    decoy.when(await engine.add_and_execute_command(request=cmd_request)).then_return(
+        commands.MoveToWell(
+            id="cmd-id",
+            key="cmd-key",
+            status=commands.CommandStatus.SUCCEEDED,
+            params=cmd_data,
+            result=cmd_result,
+            createdAt=datetime.now(),
+        )
+    )
+
+    result = await _use_in_thread(
+        engine, lambda subject: subject.execute_command(request=cmd_request)
+    )
+
+    assert result == cmd_result
+
+
+async def test_execute_command_failure(decoy: Decoy, engine: ProtocolEngine) -> None:
+    """It should raise the error of a failed command."""
+    cmd_data = commands.MoveToWellParams(
+        pipetteId="pipette-id",
+        labwareId="labware-id",
+        wellName="A1",
+    )
+    cmd_request = commands.MoveToWellCreate(params=cmd_data)
+    error = ErrorOccurrence(
+        id="error-id",
+        errorType="PrettyBadError",
+        createdAt=datetime(year=2021, month=1, day=1),
+        detail="Things are not looking good.",
+    )
+
+    decoy.when(await engine.add_and_execute_command(request=cmd_request)).then_return(
+        commands.MoveToWell(
+            id="cmd-id",
+            key="cmd-key",
+            params=cmd_data,
+            status=commands.CommandStatus.FAILED,
+            error=error,
+            createdAt=datetime.now(),
+        )
+    )
+
+    with pytest.raises(ProtocolEngineError, match="Things are not looking good"):
+        await _use_in_thread(
+            engine, lambda subject: subject.execute_command(request=cmd_request)
+        )
+
+
+async def test_call_method(decoy: Decoy, engine: ProtocolEngine) -> None:
+    """It should call a synchronous method on the calling thread."""
+    labware_def = LabwareDefinition.construct(namespace="hello")  # type: ignore[call-arg]
+    labware_uri = LabwareUri("hello/world/123")
+    calling_thread_id = None
+
+    def _record_calling_thread(*args: Any, **kwargs: Any) -> LabwareUri:
+        nonlocal calling_thread_id
+        calling_thread_id = threading.current_thread().ident
+        return labware_uri
+
+    decoy.when(engine.add_labware_definition(labware_def)).then_do(
+        _record_calling_thread
+    )
+
+    def _call(subject: InThreadTransport) -> Any:
+        assert calling_thread_id is None
+        result = subject.call_method("add_labware_definition", definition=labware_def)
+        assert calling_thread_id == threading.current_thread().ident
+        return result
+
+    result = await _use_in_thread(engine, _call)
+
+    assert result == labware_uri
+    assert calling_thread_id != threading.current_thread().ident
@@ -193,16 +193,12 @@ async def test_move_to_well(
             is_multi_channel=False,
             destination_is_tip_rack=False,
         ),
-        await hardware_api.move_to(
+        await hardware_api.move_to_waypoints(
             mount=Mount.LEFT,
-            abs_position=Point(1, 2, 3),
-            critical_point=CriticalPoint.XY_CENTER,
-            speed=39339.5,
-        ),
-        await hardware_api.move_to(
-            mount=Mount.LEFT,
-            abs_position=Point(4, 5, 6),
-            critical_point=None,
+            waypoints=[
+                (Point(1, 2, 3), CriticalPoint.XY_CENTER),
+                (Point(4, 5, 6), None),
+            ],
             speed=39339.5,
         ),
     )
@@ -312,10 +308,9 @@ async def test_move_to_well_from_starting_location(
             is_multi_channel=False,
             destination_is_tip_rack=False,
         ),
-        await hardware_api.move_to(
+        await hardware_api.move_to_waypoints(
             mount=Mount.RIGHT,
-            abs_position=Point(1, 2, 3),
-            critical_point=CriticalPoint.XY_CENTER,
+            waypoints=[(Point(1, 2, 3), CriticalPoint.XY_CENTER)],
             speed=39339.5,
         ),
     )
@@ -558,7 +553,7 @@ async def test_move_to_coordinates(
     hardware_api: HardwareAPI,
     subject: MovementHandler,
 ) -> None:
-    """Test that move_to_coordinates correctly calls api.move_to."""
+    """Test that move_to_coordinates correctly calls api.move_to_waypoints."""
     mount = Mount.RIGHT
 
     current_position = Point(4.44, 5.55, 6.66)
@@ -614,16 +609,12 @@ async def test_move_to_coordinates(
     )
 
     decoy.verify(
-        await hardware_api.move_to(
-            mount=mount,
-            abs_position=planned_waypoint_1.position,
-            critical_point=planned_waypoint_1.critical_point,
-            speed=39339.5,
-        ),
-        await hardware_api.move_to(
+        await hardware_api.move_to_waypoints(
             mount=mount,
-            abs_position=planned_waypoint_2.position,
-            critical_point=planned_waypoint_2.critical_point,
+            waypoints=[
+                (planned_waypoint_1.position, planned_waypoint_1.critical_point),
+                (planned_waypoint_2.position, planned_waypoint_2.critical_point),
+            ],
             speed=39339.5,
         ),
     )
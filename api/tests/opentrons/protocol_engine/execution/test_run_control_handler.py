@@ -4,7 +4,7 @@ from time import monotonic as time_monotonic
 import pytest
 from decoy import Decoy, matchers
 
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateStore, StateSlice
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
 from opentrons.protocol_engine.state import Config
@@ -53,7 +53,8 @@ async def test_pause(
     decoy.verify(
         mock_action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL)),
         await mock_state_store.wait_for(
-            condition=mock_state_store.commands.get_is_running
+            condition=mock_state_store.commands.get_is_running,
+            state_slices=[StateSlice.COMMANDS],
         ),
     )
 
@@ -1,10 +1,14 @@
 """Functional tests for the LabwareDataProvider."""
+from pathlib import Path
 from typing import cast
 
+import pytest
+
 from opentrons_shared_data.labware.dev_types import LabwareDefinition as LabwareDefDict
 from opentrons.calibration_storage.helpers import hash_labware_def
 from opentrons.protocols.models import LabwareDefinition
-from opentrons.protocol_api.labware import get_labware_definition
+from opentrons.protocols import labware as labware_module
+from opentrons.protocol_api.labware import get_labware_definition, save_definition
 
 from opentrons.protocol_engine.resources import LabwareDataProvider
 
@@ -25,6 +29,65 @@ async def test_labware_data_gets_standard_definition() -> None:
     assert result == LabwareDefinition.parse_obj(expected)
 
 
+async def test_labware_data_caches_definition() -> None:
+    """It should re-use the parsed definition for repeated requests."""
+    subject = LabwareDataProvider()
+    result_1 = await subject.get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+    result_2 = await subject.get_labware_definition(
+        load_name="OPENTRONS_96_TIPRACK_300UL",
+        namespace="opentrons",
+        version=1,
+    )
+
+    assert result_2 is result_1
+
+
+async def test_labware_data_reloads_changed_custom_definition(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should not serve a cached definition whose file has been overwritten."""
+    monkeypatch.setattr(labware_module, "USER_DEFS_PATH", tmp_path)
+    definition = get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+    definition["namespace"] = "custom_beta"
+    definition["metadata"]["displayName"] = "Custom Tip Rack"
+    save_definition(definition)
+
+    subject = LabwareDataProvider()
+    result = await subject.get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="custom_beta",
+        version=1,
+    )
+    assert result.metadata.displayName == "Custom Tip Rack"
+
+    definition["metadata"]["displayName"] = "Updated Custom Tip Rack"
+    save_definition(definition, force=True)
+
+    result = await subject.get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="custom_beta",
+        version=1,
+    )
+    assert result.metadata.displayName == "Updated Custom Tip Rack"
+
+    (tmp_path / "custom_beta" / "opentrons_96_tiprack_300ul" / "1.json").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        await subject.get_labware_definition(
+            load_name="opentrons_96_tiprack_300ul",
+            namespace="custom_beta",
+            version=1,
+        )
+
+
 async def test_labware_hash_match() -> None:
     """Labware dict vs Pydantic model hashing should match.
 
@@ -1,6 +1,7 @@
 """Tests for the ChangeNotifier interface."""
 import asyncio
 import pytest
+from opentrons.protocol_engine.state import StateSlice
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
 
 
@@ -54,3 +55,43 @@ async def test_multiple_subscribers(count: int) -> None:
     await asyncio.gather(task_1, task_2, task_3)
 
     assert results == [1, 2, 3]
+
+
+async def test_slice_subscribers() -> None:
+    """Test that subscribers are only woken by changes to their slices."""
+    subject = ChangeNotifier()
+    commands_result = asyncio.create_task(subject.wait(slices=[StateSlice.COMMANDS]))
+    labware_result = asyncio.create_task(subject.wait(slices=[StateSlice.LABWARE]))
+    any_result = asyncio.create_task(subject.wait())
+    await asyncio.sleep(0)
+
+    subject.notify(changed_slices=[StateSlice.LABWARE])
+    await asyncio.sleep(0)
+
+    assert commands_result.done() is False
+    assert labware_result.done() is True
+    assert any_result.done() is True
+
+    subject.notify(changed_slices=[])
+    await asyncio.sleep(0)
+    assert commands_result.done() is False
+
+    subject.notify(changed_slices=[StateSlice.COMMANDS, StateSlice.TIPS])
+    await commands_result
+
+    assert subject.notify_count == 3
+    assert subject.wakeup_count == 3
+
+
+async def test_cancelled_subscriber() -> None:
+    """Test that a cancelled subscriber is not counted as woken."""
+    subject = ChangeNotifier()
+    result = asyncio.create_task(subject.wait())
+    await asyncio.sleep(0)
+
+    result.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await result
+
+    subject.notify()
+    assert subject.wakeup_count == 0
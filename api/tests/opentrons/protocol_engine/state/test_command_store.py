@@ -80,6 +80,8 @@ def test_initial_state(
         commands_by_id=OrderedDict(),
         errors_by_id={},
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -605,6 +607,33 @@ def test_setup_command_failure_only_clears_setup_command_queue() -> None:
         "command-id-2": CommandEntry(index=1, command=expected_failed_cmd_2),
         "command-id-3": CommandEntry(index=2, command=expected_failed_cmd_3),
     }
+    assert subject.state.latest_completed_command_id == "command-id-3"
+    assert subject.state.failed_command_ids == OrderedSet()
+
+
+def test_command_store_tracks_latest_completed_command() -> None:
+    """It should track the completed command with the highest index."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    command_2 = create_running_command(command_id="command-id-2")
+    command_3 = create_queued_command(command_id="command-id-3")
+
+    subject = CommandStore(is_door_open=False, config=_make_config())
+
+    subject.handle_action(UpdateCommandAction(command=command_1))
+    subject.handle_action(UpdateCommandAction(command=command_2))
+    subject.handle_action(UpdateCommandAction(command=command_3))
+    assert subject.state.latest_completed_command_id == "command-id-1"
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-id-3"))
+    )
+    assert subject.state.latest_completed_command_id == "command-id-3"
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="command-id-2"))
+    )
+    assert subject.state.latest_completed_command_id == "command-id-3"
+    assert subject.state.failed_command_ids == OrderedSet()
 
 
 def test_command_store_preserves_handle_order() -> None:
@@ -656,6 +685,8 @@ def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
         commands_by_id=OrderedDict(),
         errors_by_id={},
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -678,6 +709,8 @@ def test_command_store_handles_play_action(pause_source: PauseSource) -> None:
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -701,6 +734,8 @@ def test_command_store_handles_finish_action() -> None:
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -734,6 +769,8 @@ def test_command_store_handles_stop_action() -> None:
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -756,6 +793,8 @@ def test_command_store_cannot_restart_after_should_stop() -> None:
         errors_by_id={},
         run_started_at=None,
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -822,6 +861,8 @@ def test_command_store_saves_unknown_finish_error() -> None:
         },
         run_started_at=None,
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -846,6 +887,8 @@ def test_command_store_ignores_stop_after_graceful_finish() -> None:
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -870,6 +913,8 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -916,6 +961,8 @@ def test_command_store_handles_command_failed() -> None:
         errors_by_id={},
         run_started_at=None,
         latest_command_hash=None,
+        latest_completed_command_id="command-id",
+        failed_command_ids=OrderedSet(["command-id"]),
     )
 
 
@@ -938,6 +985,8 @@ def test_handles_hardware_stopped() -> None:
         errors_by_id={},
         run_started_at=None,
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_command_ids=OrderedSet(),
     )
 
 
@@ -52,6 +52,16 @@ def get_command_view(
         command.id: CommandEntry(index=index, command=command)
         for index, command in enumerate(commands)
     }
+    completed_command_ids = [
+        command.id
+        for command in commands
+        if command.status in (cmd.CommandStatus.SUCCEEDED, cmd.CommandStatus.FAILED)
+    ]
+    failed_command_ids = [
+        command.id
+        for command in commands
+        if command.error is not None and command.intent != cmd.CommandIntent.SETUP
+    ]
 
     state = CommandState(
         queue_status=queue_status,
@@ -66,6 +76,10 @@ def get_command_view(
         commands_by_id=commands_by_id,
         run_started_at=run_started_at,
         latest_command_hash=latest_command_hash,
+        latest_completed_command_id=(
+            completed_command_ids[-1] if completed_command_ids else None
+        ),
+        failed_command_ids=OrderedSet(failed_command_ids),
     )
 
     return CommandView(state=state)
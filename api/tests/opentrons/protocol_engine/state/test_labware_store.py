@@ -24,11 +24,16 @@ from opentrons.protocol_engine.actions import (
     AddLabwareDefinitionAction,
     UpdateCommandAction,
 )
-from opentrons.protocol_engine.state.labware import LabwareStore, LabwareState
+from opentrons.protocol_engine.state.labware import (
+    LabwareStore,
+    LabwareState,
+    get_labware_offset_key,
+)
 
 from .command_fixtures import (
     create_load_labware_command,
     create_move_labware_command,
+    create_succeeded_command,
 )
 
 
@@ -74,7 +79,12 @@ def test_initial_state(
             )
         },
         labware_offsets_by_id={},
+        latest_labware_offset_ids={},
         definitions_by_uri={expected_trash_uri: fixed_trash_def},
+        deck_slots_by_id={
+            slot_def["id"]: slot_def
+            for slot_def in standard_deck_def["locations"]["orderedSlots"]
+        },
     )
 
 
@@ -148,8 +158,10 @@ def test_handles_load_labware(
             created_at=datetime(year=2021, month=1, day=2),
         )
     )
-    subject.handle_action(UpdateCommandAction(command=command))
+    changed = subject.handle_action(UpdateCommandAction(command=command))
 
+    assert changed is True
+    assert subject.state.version == 2
     assert subject.state.labware_by_id["test-labware-id"] == expected_labware_data
 
     assert subject.state.definitions_by_uri[expected_definition_uri] == well_plate_def
@@ -245,3 +257,35 @@ def test_handles_move_labware_off_deck(
     subject.handle_action(UpdateCommandAction(command=move_labware_off_deck_cmd))
     assert subject.state.labware_by_id["my-labware-id"].location == OFF_DECK_LOCATION
     assert subject.state.labware_by_id["my-labware-id"].offsetId is None
+
+
+def test_reports_unchanged_state(subject: LabwareStore) -> None:
+    """It should report that commands without labware results change nothing."""
+    command = create_succeeded_command()
+
+    assert subject.handle_action(UpdateCommandAction(command=command)) is False
+    assert subject.state.version == 0
+
+
+def test_indexes_latest_labware_offset(subject: LabwareStore) -> None:
+    """It should index each offset by its URI and location, latest first."""
+    location = LabwareOffsetLocation(slotName=DeckSlotName.SLOT_1)
+
+    for offset_id in ["offset-id-1", "offset-id-2"]:
+        subject.handle_action(
+            AddLabwareOffsetAction(
+                labware_offset_id=offset_id,
+                created_at=datetime(year=2021, month=1, day=2),
+                request=LabwareOffsetCreate(
+                    definitionUri="offset-definition-uri",
+                    location=location,
+                    vector=LabwareOffsetVector(x=1, y=2, z=3),
+                ),
+            )
+        )
+
+    assert subject.state.latest_labware_offset_ids == {
+        get_labware_offset_key(
+            definition_uri="offset-definition-uri", location=location
+        ): "offset-id-2"
+    }
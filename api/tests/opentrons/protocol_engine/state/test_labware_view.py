@@ -21,7 +21,11 @@ from opentrons.protocol_engine.types import (
     ModuleLocation,
 )
 
-from opentrons.protocol_engine.state.labware import LabwareState, LabwareView
+from opentrons.protocol_engine.state.labware import (
+    LabwareState,
+    LabwareView,
+    get_labware_offset_key,
+)
 
 
 plate = LoadedLabware(
@@ -65,11 +69,26 @@ def get_labware_view(
     deck_definition: Optional[DeckDefinitionV3] = None,
 ) -> LabwareView:
     """Get a labware view test subject."""
+    labware_offsets_by_id = labware_offsets_by_id or {}
     state = LabwareState(
         labware_by_id=labware_by_id or {},
-        labware_offsets_by_id=labware_offsets_by_id or {},
+        labware_offsets_by_id=labware_offsets_by_id,
+        latest_labware_offset_ids={
+            get_labware_offset_key(
+                definition_uri=offset.definitionUri, location=offset.location
+            ): offset.id
+            for offset in labware_offsets_by_id.values()
+        },
         definitions_by_uri=definitions_by_uri or {},
         deck_definition=deck_definition or cast(DeckDefinitionV3, {"fake": True}),
+        deck_slots_by_id=(
+            {
+                slot_def["id"]: slot_def
+                for slot_def in deck_definition["locations"]["orderedSlots"]
+            }
+            if deck_definition
+            else {}
+        ),
     )
 
     return LabwareView(state=state)
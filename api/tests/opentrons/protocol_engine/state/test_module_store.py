@@ -121,6 +121,7 @@ def test_load_module(
             )
         },
         substate_by_module_id={"module-id": expected_substate},
+        version=1,
     )
 
 
@@ -205,6 +206,7 @@ def test_add_module_action(
             )
         },
         substate_by_module_id={"module-id": expected_substate},
+        version=1,
     )
 
 
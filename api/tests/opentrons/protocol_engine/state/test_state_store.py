@@ -6,8 +6,9 @@ import pytest
 from decoy import Decoy
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
-from opentrons.protocol_engine.state import State, StateStore, Config
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.state import State, StateStore, StateSlice, Config
+from opentrons.protocol_engine.actions import PlayAction, AddLiquidAction
+from opentrons.protocol_engine.types import Liquid
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
 
 
@@ -66,7 +67,27 @@ def test_notify_on_state_change(
     """It should notify state changes when actions are handled."""
     decoy.verify(change_notifier.notify(), times=0)
     subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(
+        change_notifier.notify(changed_slices={StateSlice.COMMANDS}),
+        times=1,
+    )
+
+
+def test_notify_only_changed_slices(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only report the slices of state that the action changed."""
+    subject.handle_action(
+        AddLiquidAction(
+            liquid=Liquid(id="liquid-id", displayName="water", description="")
+        )
+    )
+    decoy.verify(
+        change_notifier.notify(changed_slices={StateSlice.LIQUIDS}),
+        times=1,
+    )
 
 
 async def test_wait_for_state(
@@ -86,7 +107,30 @@ async def test_wait_for_state(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=2)
+    decoy.verify(await change_notifier.wait(slices=None), times=2)
+
+
+async def test_wait_for_state_slices(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only wait for changes to the requested slices of state."""
+    check_condition: Callable[..., Optional[str]] = decoy.mock()
+
+    decoy.when(check_condition(bar="baz")).then_return(None, "hello world")
+
+    result = await subject.wait_for(
+        check_condition,
+        bar="baz",
+        state_slices=[StateSlice.COMMANDS],
+    )
+    assert result == "hello world"
+
+    decoy.verify(
+        await change_notifier.wait(slices=[StateSlice.COMMANDS]),
+        times=1,
+    )
 
 
 async def test_wait_for_state_short_circuit(
@@ -102,7 +146,7 @@ async def test_wait_for_state_short_circuit(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=0)
+    decoy.verify(await change_notifier.wait(slices=None), times=0)
 
 
 async def test_wait_for_already_true(decoy: Decoy, subject: StateStore) -> None:
@@ -28,7 +28,7 @@ from opentrons.protocol_engine.execution import (
     DoorWatcher,
 )
 from opentrons.protocol_engine.resources import ModelUtils, ModuleDataProvider
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateStore, StateSlice
 from opentrons.protocol_engine.plugins import AbstractPlugin, PluginStarter
 
 from opentrons.protocol_engine.actions import (
@@ -283,6 +283,7 @@ async def test_add_and_execute_command(
         await state_store.wait_for(
             condition=state_store.commands.get_is_complete,
             command_id="command-id",
+            state_slices=[StateSlice.COMMANDS],
         ),
     ).then_do(_stub_completed)
 
@@ -502,7 +503,10 @@ async def test_wait_until_complete(
     await subject.wait_until_complete()
 
     decoy.verify(
-        await state_store.wait_for(condition=state_store.commands.get_all_complete)
+        await state_store.wait_for(
+            condition=state_store.commands.get_all_complete,
+            state_slices=[StateSlice.COMMANDS],
+        )
     )
 
 
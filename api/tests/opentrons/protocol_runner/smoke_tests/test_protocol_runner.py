@@ -100,8 +100,9 @@ async def test_runner_with_python(
     assert expected_command in commands_result
 
 
+@pytest.mark.parametrize("in_thread", [False, True])
 async def test_runner_with_json(
-    json_protocol_file: Path, enable_load_liquid: None
+    json_protocol_file: Path, enable_load_liquid: None, in_thread: bool
 ) -> None:
     """It should run a JSON protocol on the ProtocolRunner."""
     protocol_reader = ProtocolReader()
@@ -110,7 +111,7 @@ async def test_runner_with_json(
         directory=None,
     )
 
-    subject = await create_simulating_runner()
+    subject = await create_simulating_runner(in_thread=in_thread)
     result = await subject.run(protocol_source)
     commands_result = result.commands
     pipettes_result = result.state_summary.pipettes
@@ -155,7 +156,10 @@ async def test_runner_with_json(
     assert expected_command in commands_result
 
 
-async def test_runner_with_legacy_python(legacy_python_protocol_file: Path) -> None:
+@pytest.mark.parametrize("in_thread", [False, True])
+async def test_runner_with_legacy_python(
+    legacy_python_protocol_file: Path, in_thread: bool
+) -> None:
     """It should run a Python protocol on the ProtocolRunner."""
     protocol_reader = ProtocolReader()
     protocol_source = await protocol_reader.read_saved(
@@ -163,7 +167,7 @@ async def test_runner_with_legacy_python(legacy_python_protocol_file: Path) -> N
         directory=None,
     )
 
-    subject = await create_simulating_runner()
+    subject = await create_simulating_runner(in_thread=in_thread)
     result = await subject.run(protocol_source)
 
     commands_result = result.commands
@@ -0,0 +1,74 @@
+"""Tests for in_thread_caller."""
+import asyncio
+import threading
+
+import pytest
+
+from opentrons.protocol_runner.in_thread_caller import InThreadCaller
+
+
+def test_run_returns_result() -> None:
+    """It should run a coroutine to completion and return its result."""
+    subject = InThreadCaller()
+
+    async def _main() -> int:
+        await asyncio.sleep(0)
+        return 42
+
+    assert subject.run(_main()) == 42
+
+
+def test_call_runs_on_loop_thread_with_loop_stopped() -> None:
+    """Calls should be made on the same thread, where they can run the loop."""
+    subject = InThreadCaller()
+    main_thread = threading.get_ident()
+
+    async def _in_loop(value: int) -> int:
+        await asyncio.sleep(0)
+        return value * 2
+
+    def _blocking(value: int) -> int:
+        assert threading.get_ident() == main_thread
+        loop = asyncio.get_event_loop()
+        assert not loop.is_running()
+        return loop.run_until_complete(_in_loop(value))
+
+    async def _main() -> int:
+        return await subject.call(_blocking, 21)
+
+    assert subject.run(_main()) == 42
+
+
+def test_call_raises() -> None:
+    """Errors from a call should be raised to the awaiting coroutine."""
+    subject = InThreadCaller()
+
+    def _blocking() -> None:
+        raise RuntimeError("oh no")
+
+    async def _main() -> None:
+        await subject.call(_blocking)
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        subject.run(_main())
+
+
+def test_leftover_tasks_cancelled() -> None:
+    """Tasks left over when the coroutine is done should be cancelled."""
+    subject = InThreadCaller()
+    cancelled = False
+
+    async def _background() -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    async def _main() -> None:
+        asyncio.get_running_loop().create_task(_background())
+        await asyncio.sleep(0)
+
+    subject.run(_main())
+    assert cancelled
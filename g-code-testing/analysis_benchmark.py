@@ -0,0 +1,73 @@
+"""Time protocol analysis of the G-Code test protocols.
+
+Compares the default simulating ProtocolRunner, which runs the protocol in a
+child thread and hands every call to the event loop's thread, with the
+in-thread simulating runner.
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import List
+
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocol_runner import create_simulating_runner
+
+PROTOCOLS_DIR = Path(__file__).parent / "g_code_test_data" / "protocol" / "protocols"
+
+
+def _default_protocols() -> List[Path]:
+    return sorted(
+        path for path in PROTOCOLS_DIR.glob("*/*.py") if path.name != "__init__.py"
+    )
+
+
+async def _time_analysis(protocol: Path, in_thread: bool) -> float:
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol], directory=None
+    )
+    start = time.perf_counter()
+    runner = await create_simulating_runner(in_thread=in_thread)
+    await runner.run(protocol_source)
+    return time.perf_counter() - start
+
+
+async def _run(protocols: List[Path], repeats: int) -> None:
+    print(f"{'protocol':<48}{'thread (s)':>12}{'in-thread (s)':>15}{'speedup':>9}")
+    for protocol in protocols:
+        child_thread = min(
+            [await _time_analysis(protocol, in_thread=False) for _ in range(repeats)]
+        )
+        in_thread = min(
+            [await _time_analysis(protocol, in_thread=True) for _ in range(repeats)]
+        )
+        print(
+            f"{protocol.parent.name + '/' + protocol.name:<48}"
+            f"{child_thread:>12.2f}{in_thread:>15.2f}{child_thread / in_thread:>9.2f}"
+        )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Time the analysis of protocols with each simulating runner."
+    )
+    parser.add_argument(
+        "protocols",
+        help="Protocol files to analyze. Defaults to the G-Code test protocols.",
+        type=Path,
+        nargs="*",
+    )
+    parser.add_argument(
+        "--repeats",
+        help="Analyze each protocol this many times, and report the fastest.",
+        type=int,
+        default=3,
+    )
+    args = parser.parse_args()
+    asyncio.run(_run(args.protocols or _default_protocols(), args.repeats))
+
+
+if __name__ == "__main__":
+    main()
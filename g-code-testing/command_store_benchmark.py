@@ -0,0 +1,77 @@
+"""Time ProtocolEngine command state updates as the number of commands grows.
+
+Each measured action stores one more completed command in a CommandStore and
+then reads CommandView.get_current and CommandView.get_all_complete, like the
+StateStore.wait_for predicates do after every action.
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import List
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import UpdateCommandAction
+from opentrons.protocol_engine.state import Config
+from opentrons.protocol_engine.state.commands import CommandStore, CommandView
+
+
+def _update(store: CommandStore, index: int, created_at: datetime) -> None:
+    command = commands.WaitForResume.construct(  # type: ignore[call-arg]
+        id=f"command-{index}",
+        key=f"command-key-{index}",
+        createdAt=created_at,
+        params=commands.WaitForResumeParams(),
+        status=commands.CommandStatus.SUCCEEDED,
+    )
+    store.handle_action(UpdateCommandAction(command=command))
+    view = CommandView(store.state)
+    view.get_current()
+    view.get_all_complete()
+
+
+def _time_actions(command_count: int, actions: int) -> float:
+    """Return the mean time per action once the store holds command_count commands."""
+    store = CommandStore(
+        config=Config(robot_type="OT-2 Standard"),
+        is_door_open=False,
+    )
+    created_at = datetime.now()
+    for index in range(command_count):
+        _update(store, index, created_at)
+
+    start = time.perf_counter()
+    for index in range(command_count, command_count + actions):
+        _update(store, index, created_at)
+    return (time.perf_counter() - start) / actions
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Time command state updates for stores of different sizes."
+    )
+    parser.add_argument(
+        "--commands",
+        help="Numbers of commands to store before timing.",
+        type=int,
+        nargs="+",
+        default=[1000, 20000, 100000],
+    )
+    parser.add_argument(
+        "--actions",
+        help="Number of actions to time at each store size.",
+        type=int,
+        default=1000,
+    )
+    args = parser.parse_args()
+
+    command_counts: List[int] = args.commands
+    print(f"{'commands':>10}{'us/action':>12}")
+    for command_count in command_counts:
+        per_action = _time_actions(command_count, args.actions)
+        print(f"{command_count:>10}{per_action * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
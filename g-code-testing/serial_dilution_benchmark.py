@@ -0,0 +1,240 @@
+"""Time a 96-well serial dilution run through ProtocolEngine on a simulating OT-2.
+
+The deck holds 9 labware and a temperature module, so the arc moves between
+wells have plenty of labware heights to look up. With --profile, the
+cumulative time of the GeometryView and MotionView selectors those moves use
+is also reported.
+"""
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import statistics
+import time
+from typing import List, NamedTuple, Optional
+
+from opentrons.hardware_control import API
+from opentrons.protocol_engine import (
+    Config,
+    DeckSlotLocation,
+    LabwareLocation,
+    ModuleLocation,
+    ModuleModel,
+    ProtocolEngine,
+    WellLocation,
+    commands,
+    create_protocol_engine,
+)
+from opentrons.protocol_engine.state import geometry, motion
+from opentrons.types import DeckSlotName, MountType
+from opentrons_shared_data.pipette.dev_types import PipetteNameType
+
+WELLS = [f"{row}{column}" for column in range(1, 13) for row in "ABCDEFGH"]
+MIXES = 3
+PROFILED_SELECTORS = [
+    (motion.MotionView, "get_movement_waypoints_to_well"),
+    (geometry.GeometryView, "get_all_labware_highest_z"),
+    (geometry.GeometryView, "get_labware_position"),
+]
+
+
+class _Deck(NamedTuple):
+    pipette: str
+    tip_racks: List[str]
+    plate: str
+    reservoir: str
+
+
+async def _load_labware(
+    engine: ProtocolEngine,
+    load_name: str,
+    location: LabwareLocation,
+) -> str:
+    result = await engine.add_and_execute_command(
+        commands.LoadLabwareCreate(
+            params=commands.LoadLabwareParams(
+                loadName=load_name,
+                namespace="opentrons",
+                version=1,
+                location=location,
+            )
+        )
+    )
+    assert isinstance(result.result, commands.LoadLabwareResult)
+    return result.result.labwareId
+
+
+async def _set_up(engine: ProtocolEngine) -> _Deck:
+    def slot(name: str) -> DeckSlotLocation:
+        return DeckSlotLocation(slotName=DeckSlotName(name))
+
+    tip_racks = [
+        await _load_labware(engine, "opentrons_96_tiprack_300ul", slot(name))
+        for name in ("1", "4")
+    ]
+    plate = await _load_labware(engine, "corning_96_wellplate_360ul_flat", slot("2"))
+    reservoir = await _load_labware(engine, "nest_12_reservoir_15ml", slot("3"))
+    module = await engine.add_and_execute_command(
+        commands.LoadModuleCreate(
+            params=commands.LoadModuleParams(
+                model=ModuleModel.TEMPERATURE_MODULE_V2, location=slot("6")
+            )
+        )
+    )
+    assert isinstance(module.result, commands.LoadModuleResult)
+    await _load_labware(
+        engine,
+        "opentrons_96_aluminumblock_generic_pcr_strip_200ul",
+        ModuleLocation(moduleId=module.result.moduleId),
+    )
+    for name in ("5", "7", "8", "9"):
+        await _load_labware(engine, "corning_96_wellplate_360ul_flat", slot(name))
+    pipette = await engine.add_and_execute_command(
+        commands.LoadPipetteCreate(
+            params=commands.LoadPipetteParams(
+                pipetteName=PipetteNameType.P300_SINGLE_GEN2,
+                mount=MountType.RIGHT,
+            )
+        )
+    )
+    assert isinstance(pipette.result, commands.LoadPipetteResult)
+    return _Deck(pipette.result.pipetteId, tip_racks, plate, reservoir)
+
+
+async def _dilute(engine: ProtocolEngine, deck: _Deck) -> int:
+    """Run the serial dilution and return the number of commands it took."""
+    command_count = 0
+
+    async def run(command: commands.CommandCreate) -> None:
+        nonlocal command_count
+        await engine.add_and_execute_command(command)
+        command_count += 1
+
+    async def aspirate(labware: str, well: str, volume: float) -> None:
+        await run(
+            commands.AspirateCreate(
+                params=commands.AspirateParams(
+                    pipetteId=deck.pipette,
+                    labwareId=labware,
+                    wellName=well,
+                    volume=volume,
+                    flowRate=1000,
+                    wellLocation=WellLocation(),
+                )
+            )
+        )
+
+    async def dispense(labware: str, well: str, volume: float) -> None:
+        await run(
+            commands.DispenseCreate(
+                params=commands.DispenseParams(
+                    pipetteId=deck.pipette,
+                    labwareId=labware,
+                    wellName=well,
+                    volume=volume,
+                    flowRate=1000,
+                    wellLocation=WellLocation(),
+                )
+            )
+        )
+
+    for index, well in enumerate(WELLS):
+        await run(
+            commands.PickUpTipCreate(
+                params=commands.PickUpTipParams(
+                    pipetteId=deck.pipette,
+                    labwareId=deck.tip_racks[0],
+                    wellName=well,
+                )
+            )
+        )
+        if index == 0:
+            await aspirate(deck.reservoir, "A1", 100)
+        else:
+            await aspirate(deck.plate, WELLS[index - 1], 100)
+        await dispense(deck.plate, well, 100)
+        for _ in range(MIXES):
+            await aspirate(deck.plate, well, 50)
+            await dispense(deck.plate, well, 50)
+        await run(
+            commands.DropTipCreate(
+                params=commands.DropTipParams(
+                    pipetteId=deck.pipette, labwareId="fixedTrash", wellName="A1"
+                )
+            )
+        )
+    return command_count
+
+
+async def _time_dilution(profiler: Optional[cProfile.Profile]) -> float:
+    """Return the time per command of one serial dilution, in seconds."""
+    hardware = await API.build_hardware_simulator()
+    await hardware.home()
+    engine = await create_protocol_engine(
+        hardware_api=hardware,
+        config=Config(
+            robot_type="OT-2 Standard",
+            ignore_pause=True,
+            use_virtual_modules=True,
+        ),
+    )
+    engine.play()
+    deck = await _set_up(engine)
+
+    if profiler is not None:
+        profiler.enable()
+    start = time.perf_counter()
+    command_count = await _dilute(engine, deck)
+    elapsed = time.perf_counter() - start
+    if profiler is not None:
+        profiler.disable()
+
+    await engine.finish()
+    return elapsed / command_count
+
+
+def _print_selector_times(profiler: cProfile.Profile, repeats: int) -> None:
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    print(f"{'selector':<34}{'calls':>8}{'cumulative (ms)':>18}")
+    for cls, name in PROFILED_SELECTORS:
+        code = getattr(cls, name).__code__
+        key = (code.co_filename, code.co_firstlineno, code.co_name)
+        _, calls, _, cumulative, _ = stats.get(key, (0, 0, 0, 0.0, {}))
+        print(f"{name:<34}{calls // repeats:>8}{cumulative / repeats * 1000:>18.1f}")
+
+
+async def _run(repeats: int, profile: bool) -> None:
+    profiler = cProfile.Profile() if profile else None
+    per_command = [await _time_dilution(profiler) for _ in range(repeats)]
+    print(
+        f"{len(WELLS)}-well serial dilution: median"
+        f" {statistics.median(per_command) * 1000:.2f} ms per command"
+        f" over {repeats} runs"
+    )
+    if profiler is not None:
+        _print_selector_times(profiler, repeats)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Time a 96-well serial dilution through ProtocolEngine."
+    )
+    parser.add_argument(
+        "--repeats",
+        help="Number of times to run the dilution.",
+        type=int,
+        default=5,
+    )
+    parser.add_argument(
+        "--profile",
+        help="Also report the time spent in the geometry selectors, per run.",
+        action="store_true",
+    )
+    args = parser.parse_args()
+    asyncio.run(_run(args.repeats, args.profile))
+
+
+if __name__ == "__main__":
+    main()
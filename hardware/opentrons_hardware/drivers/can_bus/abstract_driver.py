@@ -1,6 +1,8 @@
 """The can bus transport."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import Iterable
+
 from opentrons_hardware.firmware_bindings import CanMessage
 
 
@@ -19,6 +21,18 @@ class AbstractCanDriver(ABC):
         """
         ...
 
+    async def send_many(self, messages: Iterable[CanMessage]) -> None:
+        """Send can messages in order.
+
+        Args:
+            messages: The messages to send.
+
+        Returns:
+            None
+        """
+        for message in messages:
+            await self.send(message)
+
     @abstractmethod
     async def read(self) -> CanMessage:
         """Read a message.
@@ -2,7 +2,18 @@
 from __future__ import annotations
 import asyncio
 from inspect import Traceback
-from typing import Optional, Callable, Tuple, Dict, Union, List, cast
+from itertools import count
+from typing import (
+    Optional,
+    Callable,
+    Tuple,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Union,
+    List,
+    cast,
+)
 
 import logging
 
@@ -52,6 +63,17 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+_ListenerKey = Tuple[int, Optional[int]]
+"""A message id and originating node id, or None for any node."""
+
+
+class _ListenerRegistration(NamedTuple):
+    order: int
+    listener: MessageListenerCallback
+    filter: Optional[MessageListenerCallbackFilter]
+    keys: Tuple[_ListenerKey, ...]
+
+
 _AckResponses = Union[ErrorMessage, Acknowledgement]
 _AckPacket = Tuple[ArbitrationId, _AckResponses]
 _Acks = List[_AckPacket]
@@ -130,12 +152,7 @@ class AcknowledgeListener:
     async def send_and_verify_recieved(self) -> ErrorCode:
         """Send the message and wait for an Ack."""
         try:
-            self._can_messenger.add_listener(
-                self,
-                lambda arbitration_id: bool(
-                    arbitration_id.parts.message_id in _AckIdFilter
-                ),
-            )
+            self._can_messenger.add_listener(self, message_ids=_AckIdFilter)
             self._event.clear()
             await self._can_messenger.send(self._node_id, self._message)
             await asyncio.wait_for(
@@ -163,7 +180,10 @@ class CanMessenger:
 
     The background task can be controlled with start/stop methods.
 
-    To receive message notifications add a listener using add_listener
+    To receive message notifications add a listener using add_listener.
+    Listeners that give the message ids (and optionally the nodes) they want
+    are looked up by those instead of being offered every message, and a
+    message's payload is only decoded if some listener wants it.
     """
 
     def __init__(self, driver: AbstractCanDriver) -> None:
@@ -173,14 +193,38 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
+        self._listeners: Dict[MessageListenerCallback, _ListenerRegistration] = {}
+        # Listeners with no message ids, which are offered every message.
+        self._unkeyed_listeners: Dict[
+            MessageListenerCallback, _ListenerRegistration
+        ] = {}
+        self._keyed_listeners: Dict[
+            _ListenerKey, Dict[MessageListenerCallback, _ListenerRegistration]
         ] = {}
+        self._listener_order = count()
         self._task: Optional[asyncio.Task[None]] = None
 
     async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
         """Send a message."""
+        await self._drive.send(message=self._build_can_message(node_id, message))
+
+    async def send_many(
+        self, messages: Iterable[Tuple[NodeId, MessageDefinition]]
+    ) -> None:
+        """Send messages in order, as one batch.
+
+        Args:
+            messages: The node to send each message to, and the message.
+        """
+        await self._drive.send_many(
+            messages=[
+                self._build_can_message(node_id, message)
+                for node_id, message in messages
+            ]
+        )
+
+    @staticmethod
+    def _build_can_message(node_id: NodeId, message: MessageDefinition) -> CanMessage:
         func = (
             FunctionCode.error
             if message.message_id == MessageId.error_message
@@ -197,12 +241,11 @@ class CanMessenger:
         )
         data = message.payload.serialize()
         log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
-        )
-        await self._drive.send(
-            message=CanMessage(arbitration_id=arbitration_id, data=data)
+            "Sending -->\n\tarbitration_id: %s,\n\tpayload: %s",
+            arbitration_id,
+            message.payload,
         )
+        return CanMessage(arbitration_id=arbitration_id, data=data)
 
     async def ensure_send(
         self,
@@ -261,14 +304,69 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Args:
+            listener: Called with each message it accepts.
+            filter: Optional function that accepts messages by arbitration id.
+            message_ids: Only accept messages with these ids.
+            node_ids: Only accept messages from these nodes. Ignored unless
+                message_ids is given.
+        """
+        self.remove_listener(listener)
+        keys: Tuple[_ListenerKey, ...] = ()
+        if message_ids is not None:
+            nodes: List[Optional[int]] = (
+                [None] if node_ids is None else [int(n) for n in node_ids]
+            )
+            # Repeated ids would otherwise register the same key twice.
+            keys = tuple(dict.fromkeys((int(m), n) for m in message_ids for n in nodes))
+        registration = _ListenerRegistration(
+            next(self._listener_order), listener, filter, keys
+        )
+        self._listeners[listener] = registration
+        if message_ids is None:
+            self._unkeyed_listeners[listener] = registration
+        for key in keys:
+            self._keyed_listeners.setdefault(key, {})[listener] = registration
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
-        if listener in self._listeners:
-            del self._listeners[listener]
+        registration = self._listeners.pop(listener, None)
+        if registration is None:
+            return
+        self._unkeyed_listeners.pop(listener, None)
+        for key in registration.keys:
+            keyed = self._keyed_listeners[key]
+            del keyed[listener]
+            if not keyed:
+                del self._keyed_listeners[key]
+
+    def _listeners_for(
+        self, arbitration_id: ArbitrationId
+    ) -> List[_ListenerRegistration]:
+        """Get the listeners that accept a message, in the order they were added."""
+        message_id = arbitration_id.parts.message_id
+        candidates = list(self._unkeyed_listeners.values())
+        keyed = [
+            self._keyed_listeners.get(
+                (message_id, arbitration_id.parts.originating_node_id)
+            ),
+            self._keyed_listeners.get((message_id, None)),
+        ]
+        for listeners in keyed:
+            if listeners:
+                candidates.extend(listeners.values())
+        if any(keyed) and len(candidates) > 1:
+            candidates.sort(key=lambda registration: registration.order)
+        return [
+            registration
+            for registration in candidates
+            if registration.filter is None or registration.filter(arbitration_id)
+        ]
 
     async def _read_task_shield(self) -> None:
         try:
@@ -282,30 +380,29 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
-            if message_definition:
-                try:
-                    build = message_definition.payload_type.build(message.data)
-                    log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
-                    )
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            log.debug("message ignored by filter")
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                    if (
-                        message.arbitration_id.parts.message_id
-                        == MessageId.error_message
-                    ):
-                        await self._handle_error(build)
-                except BinarySerializableException:
-                    log.exception(f"Failed to build from {message}")
-            else:
-                log.error(f"Message {message} is not recognized.")
+            message_id = MessageId(message.arbitration_id.parts.message_id)
+            message_definition = get_definition(message_id)
+            if not message_definition:
+                log.error("Message %s is not recognized.", message)
+                continue
+            listeners = self._listeners_for(message.arbitration_id)
+            is_error = message_id == MessageId.error_message
+            if not listeners and not is_error:
+                # Nobody wants it, so don't bother decoding it.
+                continue
+            try:
+                build = message_definition.payload_type.build(message.data)
+                log.debug(
+                    "Received <--\n\tarbitration_id: %s,\n\tpayload: %s",
+                    message.arbitration_id,
+                    build,
+                )
+                for registration in listeners:
+                    registration.listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
+                if is_error:
+                    await self._handle_error(build)
+            except BinarySerializableException:
+                log.exception(f"Failed to build from {message}")
 
     async def _handle_error(self, build: BinarySerializable) -> None:
         err_msg = ErrorMessage(payload=build)  # type: ignore[arg-type]
@@ -332,15 +429,21 @@ class WaitableCallback:
         self,
         messenger: CanMessenger,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Constructor.
 
         Args:
             messenger: Messenger to listen on.
             filter: Optional message filtering function
+            message_ids: Optional message ids to listen for
+            node_ids: Optional nodes to listen to, if message_ids is given
         """
         self._messenger = messenger
         self._filter = filter
+        self._message_ids = message_ids
+        self._node_ids = node_ids
         self._queue: asyncio.Queue[
             Tuple[MessageDefinition, ArbitrationId]
         ] = asyncio.Queue()
@@ -353,7 +456,9 @@ class WaitableCallback:
 
     def __enter__(self) -> WaitableCallback:
         """Enter context manager."""
-        self._messenger.add_listener(self, self._filter)
+        self._messenger.add_listener(
+            self, self._filter, message_ids=self._message_ids, node_ids=self._node_ids
+        )
         return self
 
     def __exit__(
@@ -387,6 +492,8 @@ class MultipleMessagesWaitableCallback(WaitableCallback):
         messenger: CanMessenger,
         filter: Optional[MessageListenerCallbackFilter] = None,
         number_of_messages: Optional[int] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Constructor.
 
@@ -395,8 +502,10 @@ class MultipleMessagesWaitableCallback(WaitableCallback):
             filter: Optional message filtering function
             number_of_messages: Optional number of messages to wait for or
             default to 1.
+            message_ids: Optional message ids to listen for
+            node_ids: Optional nodes to listen to, if message_ids is given
         """
-        super().__init__(messenger, filter)
+        super().__init__(messenger, filter, message_ids, node_ids)
         self._number_of_messages: int = number_of_messages or 1
 
     async def __anext__(self) -> Tuple[MessageDefinition, ArbitrationId]:
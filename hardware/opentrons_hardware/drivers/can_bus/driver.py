@@ -3,14 +3,14 @@ from __future__ import annotations
 import logging
 import asyncio
 import platform
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, Iterable, List, Tuple
 import concurrent.futures
 
 from can import Notifier, Bus, AsyncBufferedReader, Message
 
 from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 from opentrons_hardware.firmware_bindings.message import CanMessage
-from .errors import ErrorFrameCanError
+from .errors import CanError, ErrorFrameCanError
 from .abstract_driver import AbstractCanDriver
 from .settings import calculate_fdcan_parameters, PCANParameters
 
@@ -36,21 +36,45 @@ if platform.system() == "Darwin":
     # end super bad monkey patch
 
 
-class CanDriver(AbstractCanDriver):
-    """The can driver."""
+_SendRequest = Tuple[Message, "asyncio.Future[None]"]
+
+_SHUTDOWN_MESSAGE = "The can driver was shut down."
+
 
-    def __init__(self, bus: Bus, loop: asyncio.AbstractEventLoop) -> None:
+class CanDriver(AbstractCanDriver):
+    """The can driver.
+
+    Messages are sent from a single thread, in the order they were sent. When
+    messages are sent faster than the bus takes them, they queue up for a
+    writer task, which hands everything that has been queued to the bus in one
+    go instead of paying for a thread handoff per message.
+    """
+
+    def __init__(
+        self,
+        bus: Bus,
+        loop: asyncio.AbstractEventLoop,
+        send_queue_size: int = 256,
+    ) -> None:
         """Constructor.
 
         Args:
             bus: The can bus to communicate with
             loop: Event loop
+            send_queue_size: How many messages may wait to be sent before
+                senders have to wait for room.
         """
         self._bus = bus
         self._loop = loop
         self._reader = AsyncBufferedReader(loop=loop)
         self._notifier = Notifier(bus=self._bus, listeners=[self._reader], loop=loop)
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._send_queue: "asyncio.Queue[_SendRequest]" = asyncio.Queue(
+            maxsize=send_queue_size
+        )
+        self._writer: Optional["asyncio.Task[None]"] = None
+        # How many sends to the bus are under way.
+        self._writing = 0
 
     @classmethod
     async def build(
@@ -97,6 +121,13 @@ class CanDriver(AbstractCanDriver):
 
     def shutdown(self) -> None:
         """Stop the driver."""
+        if self._writer:
+            self._writer.cancel()
+            self._writer = None
+        while not self._send_queue.empty():
+            _, future = self._send_queue.get_nowait()
+            if not future.done():
+                future.set_exception(CanError(_SHUTDOWN_MESSAGE))
         self._notifier.stop()
         self._bus.shutdown()
 
@@ -109,13 +140,98 @@ class CanDriver(AbstractCanDriver):
         Returns:
             None
         """
-        m = Message(
+        if self._writing or not self._send_queue.empty():
+            await self.send_many([message])
+            return
+        # The bus is idle, so there is nothing to batch this message with.
+        self._writing += 1
+        try:
+            await self._loop.run_in_executor(
+                self._executor, self._bus.send, self._bus_message(message)
+            )
+        finally:
+            self._writing -= 1
+
+    async def send_many(self, messages: Iterable[CanMessage]) -> None:
+        """Send can messages in order.
+
+        Waits for room whenever the send queue is full, and returns once all
+        the messages have been sent.
+
+        Args:
+            messages: The messages to send.
+
+        Returns:
+            None
+
+        Raises:
+            The first error the bus raised while sending the messages.
+        """
+        if not self._writer:
+            self._writer = self._loop.create_task(self._write_task())
+        futures: List["asyncio.Future[None]"] = []
+        for message in messages:
+            future: "asyncio.Future[None]" = self._loop.create_future()
+            await self._send_queue.put((self._bus_message(message), future))
+            futures.append(future)
+        for result in await asyncio.gather(*futures, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _write_task(self) -> None:
+        """Hand everything that's queued to the bus, until cancelled."""
+        while True:
+            burst = [await self._send_queue.get()]
+            while not self._send_queue.empty():
+                burst.append(self._send_queue.get_nowait())
+            self._writing += 1
+            try:
+                errors = await self._loop.run_in_executor(
+                    self._executor, self._send_burst, [m for m, _ in burst]
+                )
+            except asyncio.CancelledError:
+                # Shut down mid-burst. Caught ahead of Exception, which it
+                # subclasses before python 3.8.
+                self._settle_burst(burst, [CanError(_SHUTDOWN_MESSAGE)] * len(burst))
+                raise
+            except Exception as e:
+                errors = [e] * len(burst)
+            finally:
+                self._writing -= 1
+            self._settle_burst(burst, errors)
+
+    @staticmethod
+    def _settle_burst(
+        burst: List[_SendRequest], errors: List[Optional[Exception]]
+    ) -> None:
+        """Resolve each message's future with its send result."""
+        for (_, future), error in zip(burst, errors):
+            if future.done():
+                continue
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(None)
+
+    @staticmethod
+    def _bus_message(message: CanMessage) -> Message:
+        return Message(
             arbitration_id=message.arbitration_id.id,
             is_extended_id=True,
             is_fd=True,
             data=message.data,
         )
-        await self._loop.run_in_executor(self._executor, self._bus.send, m)
+
+    def _send_burst(self, messages: List[Message]) -> List[Optional[Exception]]:
+        """Send messages to the bus from the executor thread."""
+        errors: List[Optional[Exception]] = []
+        for m in messages:
+            try:
+                self._bus.send(m)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
 
     async def read(self) -> CanMessage:
         """Read a message.
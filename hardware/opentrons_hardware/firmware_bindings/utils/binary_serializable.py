@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Generic, Optional, Tuple, Type, TypeVar
 
 
 class BinarySerializableException(BaseException):
@@ -138,6 +138,19 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+@dataclass(frozen=True)
+class _Codec:
+    """The compiled packing information of a BinarySerializable class."""
+
+    struct: struct.Struct
+    names: Tuple[str, ...]
+    """The names of all fields, in packing order."""
+    builders: Tuple[Callable[[Any], BinaryFieldBase[Any]], ...]
+    """The field constructors, in packing order."""
+    init: Tuple[bool, ...]
+    """Whether each field is an argument of the class constructor."""
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -148,6 +161,7 @@ class BinarySerializable:
     Data will be packed big endian.
     """
 
+    This = TypeVar("This", bound="BinarySerializable")
     ENDIAN = ">"
     """The big endian format string"""
 
@@ -157,15 +171,33 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
         try:
-            return struct.pack(string, *vals)
+            return codec.struct.pack(*(getattr(self, n).value for n in codec.names))
         except struct.error as e:
             raise SerializationException(str(e))
 
+    def pack_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """Serialize into an existing, writable byte buffer.
+
+        Args:
+            buffer: The buffer to write into.
+            offset: The position in the buffer to start writing at.
+
+        Returns:
+            The number of bytes written.
+        """
+        codec = self._get_codec()
+        try:
+            codec.struct.pack_into(
+                buffer, offset, *(getattr(self, n).value for n in codec.names)
+            )
+        except struct.error as e:
+            raise SerializationException(str(e))
+        return codec.struct.size
+
     @classmethod
-    def build(cls, data: bytes) -> BinarySerializable:
+    def build(cls: Type[This], data: bytes) -> This:
         """Create a BinarySerializable from a byte buffer.
 
         The byte buffer must be at least enough bytes to satisfy all fields.
@@ -181,34 +213,65 @@ class BinarySerializable:
         Returns:
             cls
         """
+        return cls.unpack_from(data)
+
+    @classmethod
+    def unpack_from(cls: Type[This], buffer: bytes, offset: int = 0) -> This:
+        """Create a BinarySerializable from a position in a byte buffer.
+
+        Like `build`, bytes beyond the end of the fields are ignored.
+
+        Args:
+            buffer: Byte buffer, or a memoryview of one
+            offset: The position in the buffer that the fields start at.
+
+        Returns:
+            cls
+        """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
-            # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
-            # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
-            args = {
-                v.name: v.type.build(b[i])
-                for i, v in enumerate(fields(cls))
-                if not (v.name == "message_index")
-            }
-            message_index = next(
-                (
-                    v.type.build(b[i])
-                    for i, v in enumerate(fields(cls))
-                    if v.name == "message_index"
-                ),
-                None,
-            )
-            # Mypy is not liking constructing the derived types.
-            ret_instance = cls(**args)  # type: ignore[call-arg]
-            if message_index is not None:
-                ret_instance.message_index = message_index  # type: ignore[attr-defined]
-            return ret_instance
+            values = codec.struct.unpack_from(buffer, offset)
         except struct.error as e:
             raise InvalidFieldException(str(e))
 
+        args = {}
+        late_args = {}
+        for name, builder, init, value in zip(
+            codec.names, codec.builders, codec.init, values
+        ):
+            # Fields that can't be constructor arguments, like message_index
+            # (see payloads.py), are set once the instance exists.
+            if init:
+                args[name] = builder(value)
+            else:
+                late_args[name] = builder(value)
+        # Mypy is not liking constructing the derived types.
+        ret_instance = cls(**args)  # type: ignore[call-arg]
+        for name, field_value in late_args.items():
+            setattr(ret_instance, name, field_value)
+        return ret_instance
+
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        """Get the compiled packing information for this class.
+
+        It's computed on first use rather than at class creation, because
+        the dataclass decorator only sets up the fields after that.
+        """
+        # Look only at this class's own namespace; a subclass must not use
+        # the codec of its parent.
+        codec: Optional[_Codec] = cls.__dict__.get("_codec")
+        if codec is None:
+            dataclass_fields = fields(cls)
+            codec = _Codec(
+                struct=struct.Struct(cls._get_format_string()),
+                names=tuple(v.name for v in dataclass_fields),
+                builders=tuple(v.type.build for v in dataclass_fields),
+                init=tuple(v.init for v in dataclass_fields),
+            )
+            setattr(cls, "_codec", codec)
+        return codec
+
     @classmethod
     def _get_format_string(cls) -> str:
         """Get the `struct` format string for this class.
@@ -229,7 +292,7 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().struct.size
 
 
 class LittleEndianMixIn:
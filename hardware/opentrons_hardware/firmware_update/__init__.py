@@ -3,12 +3,13 @@
 from .initiator import (
     FirmwareUpdateInitiator,
 )
-from .downloader import FirmwareUpdateDownloader
+from .downloader import FirmwareUpdateDownloader, DownloadStatistics
 from .hex_file import from_hex_file_path, from_hex_file, HexRecordProcessor
 from .eraser import FirmwareUpdateEraser
-from .run import run_update
+from .run import run_update, run_updates, UpdateProgress, UpdateStatus
 
 __all__ = [
+    "DownloadStatistics",
     "FirmwareUpdateDownloader",
     "FirmwareUpdateInitiator",
     "FirmwareUpdateEraser",
@@ -16,4 +17,7 @@ __all__ = [
     "from_hex_file",
     "HexRecordProcessor",
     "run_update",
+    "run_updates",
+    "UpdateProgress",
+    "UpdateStatus",
 ]
@@ -2,6 +2,8 @@
 import asyncio
 import binascii
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 
 from opentrons_hardware.firmware_bindings import NodeId
 from opentrons_hardware.firmware_bindings.constants import ErrorCode
@@ -22,6 +24,32 @@ from opentrons_hardware.firmware_bindings.messages import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class DownloadStatistics:
+    """Summary of a completed firmware download."""
+
+    num_messages: int
+    num_bytes: int
+    num_retransmits: int
+    elapsed_seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average payload throughput of the download."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.num_bytes / self.elapsed_seconds
+
+
+@dataclass
+class _InFlightChunk:
+    """A data message that has been sent but not yet acknowledged."""
+
+    message: message_definitions.FirmwareUpdateData
+    deadline: float
+    attempts: int = 1
+
+
 class FirmwareUpdateDownloader:
     """Class that downloads FW using CAN messages."""
 
@@ -29,49 +57,121 @@ class FirmwareUpdateDownloader:
         """Constructor."""
         self._messenger = messenger
 
-    async def run(
+    async def run(  # noqa: C901
         self,
         node_id: NodeId,
         hex_processor: HexRecordProcessor,
         ack_wait_seconds: float,
-    ) -> None:
+        window_size: int = 1,
+        retry_count: int = 0,
+    ) -> DownloadStatistics:
         """Download hex record chunks to node.
 
+        With a window size greater than one, up to that many data messages are
+        kept in flight at once instead of waiting for each one to be
+        acknowledged before sending the next. Acknowledgements are matched to
+        data messages by address, so the target must accept chunks (and
+        retransmitted chunks) in any order.
+
         Args:
             node_id: The target node id.
             hex_processor: The producer of hex chunks.
             ack_wait_seconds: Number of seconds to wait for an ACK
+            window_size: Maximum number of unacknowledged data messages.
+            retry_count: Number of times to retransmit a data message that
+                times out or is acknowledged with an error before giving up.
+                The complete message counts each chunk once, so the target
+                must ignore a chunk it has already received.
 
         Returns:
-            None
+            Statistics about the download.
         """
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1.")
+
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+
         with WaitableCallback(self._messenger) as reader:
             num_messages = 0
+            num_bytes = 0
+            num_retransmits = 0
             crc32 = 0
-            for chunk in hex_processor.process(
-                fields.FirmwareUpdateDataField.NUM_BYTES
-            ):
-                logger.debug(
-                    f"Sending chunk {num_messages} to address {chunk.address:x}."
-                )
-                # Create and send message from this chunk
-                data = bytes(chunk.data)
-                data_message = message_definitions.FirmwareUpdateData(
-                    payload=payloads.FirmwareUpdateData.create(
-                        address=chunk.address, data=data
+            in_flight: "OrderedDict[int, _InFlightChunk]" = OrderedDict()
+            chunks = iter(
+                hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES)
+            )
+            chunks_exhausted = False
+
+            while True:
+                while not chunks_exhausted and len(in_flight) < window_size:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        chunks_exhausted = True
+                        break
+
+                    logger.debug(
+                        f"Sending chunk {num_messages} to address {chunk.address:x}."
                     )
-                )
-                await self._messenger.send(node_id=node_id, message=data_message)
+                    # Create and send message from this chunk
+                    data = bytes(chunk.data)
+                    data_message = message_definitions.FirmwareUpdateData(
+                        payload=payloads.FirmwareUpdateData.create(
+                            address=chunk.address, data=data
+                        )
+                    )
+                    in_flight[chunk.address] = _InFlightChunk(
+                        message=data_message,
+                        deadline=loop.time() + ack_wait_seconds,
+                    )
+                    await self._messenger.send(node_id=node_id, message=data_message)
+
+                    crc32 = binascii.crc32(data, crc32)
+                    num_messages += 1
+                    num_bytes += len(data)
+
+                if not in_flight:
+                    break
+
+                next_chunk = min(in_flight.values(), key=lambda c: c.deadline)
                 try:
                     # Wait for ack.
-                    await asyncio.wait_for(
-                        self._wait_data_message_ack(node_id, reader), ack_wait_seconds
+                    ack = await asyncio.wait_for(
+                        self._wait_data_message_ack(
+                            node_id, reader, next_chunk.message
+                        ),
+                        max(next_chunk.deadline - loop.time(), 0),
                     )
                 except asyncio.TimeoutError:
-                    raise TimeoutResponse(data_message)
+                    for in_flight_chunk in list(in_flight.values()):
+                        if in_flight_chunk.deadline <= loop.time():
+                            await self._retransmit(
+                                node_id=node_id,
+                                in_flight_chunk=in_flight_chunk,
+                                retry_count=retry_count,
+                                ack_wait_seconds=ack_wait_seconds,
+                                failure=TimeoutResponse(in_flight_chunk.message),
+                            )
+                            num_retransmits += 1
+                    continue
 
-                crc32 = binascii.crc32(data, crc32)
-                num_messages += 1
+                acked_chunk = in_flight.get(ack.payload.address.value)
+                if acked_chunk is None:
+                    # A late ack for a chunk that was already retransmitted
+                    # and acknowledged.
+                    continue
+
+                if ack.payload.error_code.value != ErrorCode.ok:
+                    await self._retransmit(
+                        node_id=node_id,
+                        in_flight_chunk=acked_chunk,
+                        retry_count=retry_count,
+                        ack_wait_seconds=ack_wait_seconds,
+                        failure=ErrorResponse(ack),
+                    )
+                    num_retransmits += 1
+                else:
+                    del in_flight[ack.payload.address.value]
 
             # Create and send firmware update complete message.
             complete_message = message_definitions.FirmwareUpdateComplete(
@@ -88,17 +188,57 @@ class FirmwareUpdateDownloader:
             except asyncio.TimeoutError:
                 raise TimeoutResponse(complete_message)
 
+        statistics = DownloadStatistics(
+            num_messages=num_messages,
+            num_bytes=num_bytes,
+            num_retransmits=num_retransmits,
+            elapsed_seconds=loop.time() - start_time,
+        )
+        logger.info(
+            f"Downloaded {statistics.num_bytes} bytes in {statistics.num_messages}"
+            f" messages to {node_id.name} in {statistics.elapsed_seconds:.2f}s"
+            f" ({statistics.bytes_per_second:.0f} B/s,"
+            f" {statistics.num_retransmits} retransmits)."
+        )
+        return statistics
+
+    async def _retransmit(
+        self,
+        node_id: NodeId,
+        in_flight_chunk: _InFlightChunk,
+        retry_count: int,
+        ack_wait_seconds: float,
+        failure: Exception,
+    ) -> None:
+        """Resend an unacknowledged data message, or raise if out of retries."""
+        if in_flight_chunk.attempts > retry_count:
+            raise failure
+        logger.warning(
+            f"Retransmitting chunk at address"
+            f" {in_flight_chunk.message.payload.address.value:x}: {failure}"
+        )
+        in_flight_chunk.attempts += 1
+        in_flight_chunk.deadline = asyncio.get_event_loop().time() + ack_wait_seconds
+        await self._messenger.send(node_id=node_id, message=in_flight_chunk.message)
+
     @staticmethod
-    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> None:
-        """Wait for response to data."""
+    async def _wait_data_message_ack(
+        node_id: NodeId,
+        reader: WaitableCallback,
+        waiting_for: message_definitions.FirmwareUpdateData,
+    ) -> message_definitions.FirmwareUpdateDataAcknowledge:
+        """Wait for response to data.
+
+        Raises TimeoutResponse for the data message being waited for if the
+        reader stops before any acknowledgement arrives.
+        """
         async for response, arbitration_id in reader:
             if arbitration_id.parts.originating_node_id == node_id:
                 if isinstance(
                     response, message_definitions.FirmwareUpdateDataAcknowledge
                 ):
-                    if response.payload.error_code.value != ErrorCode.ok:
-                        raise ErrorResponse(response)
-                    break
+                    return response
+        raise TimeoutResponse(waiting_for)
 
     @staticmethod
     async def _wait_update_complete_ack(
@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, List, Generator, TextIO
+from typing import Dict, Iterable, List, Generator, TextIO
 import binascii
 import struct
 import logging
@@ -69,7 +69,7 @@ class BadChunkSizeException(HexFileException):
 def from_hex_file_path(file_path: Path) -> Iterable[HexRecord]:
     """A generator that processes a hex file at file_path."""
     with file_path.open() as hex_file:
-        return from_hex_file(hex_file)
+        yield from from_hex_file(hex_file)
 
 
 def from_hex_file(hex_file: TextIO) -> Iterable[HexRecord]:
@@ -139,12 +139,17 @@ class HexRecordProcessor:
     """Process an iterable of hex records.
 
     Iterate through the process generator to get data chunks and start_address.
+
+    The chunks of each completed pass are kept, so processing the same
+    records again with the same chunk size doesn't re-read them. This lets
+    one processor be shared by several downloads of the same image.
     """
 
     def __init__(self, records: Iterable[HexRecord]) -> None:
         """Constructor."""
         self._records = records
         self._start_address: int = 0
+        self._chunks_by_size: Dict[int, List[Chunk]] = {}
 
     @classmethod
     def from_file_path(cls, file_path: Path) -> HexRecordProcessor:
@@ -164,7 +169,7 @@ class HexRecordProcessor:
         """
         return self._start_address
 
-    def process(self, chunk_size: int) -> Generator[Chunk, None, None]:  # noqa: C901
+    def process(self, chunk_size: int) -> Generator[Chunk, None, None]:
         """Process the records.
 
         Args:
@@ -177,6 +182,19 @@ class HexRecordProcessor:
         if chunk_size <= 0:
             raise BadChunkSizeException("chunk size must be greater than 0.")
 
+        cached = self._chunks_by_size.get(chunk_size)
+        if cached is not None:
+            yield from cached
+            return
+
+        chunks: List[Chunk] = []
+        for chunk in self._process(chunk_size):
+            chunks.append(chunk)
+            yield chunk
+        self._chunks_by_size[chunk_size] = chunks
+
+    def _process(self, chunk_size: int) -> Generator[Chunk, None, None]:  # noqa: C901
+        """Convert the records into chunks of chunk_size bytes."""
         # Address offset set by the StartLinearAddress record type
         address_offset = 0
         # The accumulated buffer that will yield a new Chunk
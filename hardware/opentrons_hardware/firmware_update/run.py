@@ -1,9 +1,16 @@
 """Complete FW updater."""
+import asyncio
 import logging
-from typing import Optional, TextIO
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, TextIO, Union
 
 from opentrons_hardware.drivers.can_bus import CanMessenger
 from opentrons_hardware.firmware_bindings import NodeId
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    FirmwareUpdateDataField,
+)
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     FirmwareUpdateStartApp,
 )
@@ -18,6 +25,31 @@ from opentrons_hardware.firmware_update.target import Target
 logger = logging.getLogger(__name__)
 
 
+class UpdateStatus(str, Enum):
+    """The stage a node's firmware update is in."""
+
+    queued = "queued"
+    initializing = "initializing"
+    erasing = "erasing"
+    downloading = "downloading"
+    restarting = "restarting"
+    done = "done"
+    failed = "failed"
+
+
+@dataclass(frozen=True)
+class UpdateProgress:
+    """A progress report for one node's firmware update."""
+
+    node_id: NodeId
+    status: UpdateStatus
+    attempt: int = 0
+    error: Optional[BaseException] = None
+
+
+ProgressCallback = Callable[[UpdateProgress], None]
+
+
 async def run_update(
     messenger: CanMessenger,
     node_id: NodeId,
@@ -25,6 +57,8 @@ async def run_update(
     retry_count: int,
     timeout_seconds: float,
     erase: Optional[bool] = True,
+    window_size: int = 1,
+    download_retry_count: int = 0,
 ) -> None:
     """Perform a firmware update on a node target.
 
@@ -32,21 +66,199 @@ async def run_update(
         messenger: The can messenger to use.
         node_id: The node being updated.
         hex_file: File containing firmware.
-        retry_count: Number of times to retry.
+        retry_count: Number of times to retry bootloader detection.
         timeout_seconds: How much to wait for responses.
         erase: Whether to erase flash before updating.
+        window_size: Number of firmware data messages to keep in flight.
+        download_retry_count: Number of times to retransmit each unacknowledged
+            firmware data message. Only use this with a bootloader that ignores
+            repeated data messages.
 
     Returns:
         None
     """
     hex_processor = HexRecordProcessor.from_file(hex_file)
+    await _update_node(
+        messenger=messenger,
+        node_id=node_id,
+        hex_processor=hex_processor,
+        retry_count=retry_count,
+        timeout_seconds=timeout_seconds,
+        erase=erase,
+        window_size=window_size,
+        download_retry_count=download_retry_count,
+        on_status=lambda status: None,
+    )
+
+
+async def run_updates(
+    messenger: CanMessenger,
+    hex_files: Dict[NodeId, Path],
+    retry_count: int,
+    timeout_seconds: float,
+    erase: Optional[bool] = True,
+    window_size: int = 1,
+    download_retry_count: int = 0,
+    attempts: int = 1,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> Dict[NodeId, UpdateProgress]:
+    """Perform firmware updates on several node targets at once.
+
+    Each hex file is parsed once and shared by all the nodes it's for. The
+    nodes are then updated concurrently over the same messenger. A node whose
+    update fails is retried on its own, and never interrupts the other nodes.
+
+    Args:
+        messenger: The can messenger to use.
+        hex_files: The path of the firmware file for each node to update.
+        retry_count: Number of times to retry bootloader detection.
+        timeout_seconds: How much to wait for responses.
+        erase: Whether to erase flash before updating.
+        window_size: Number of firmware data messages to keep in flight.
+        download_retry_count: Number of times to retransmit each unacknowledged
+            firmware data message. Only use this with a bootloader that ignores
+            repeated data messages.
+        attempts: Number of times to try each node's whole update.
+        progress_callback: Called whenever a node's update changes stage.
+
+    Returns:
+        The final progress report of each node.
+    """
+    if attempts < 1:
+        raise ValueError("attempts must be at least 1.")
+
+    results: Dict[NodeId, UpdateProgress] = {}
+
+    def report(progress: UpdateProgress) -> None:
+        results[progress.node_id] = progress
+        if progress_callback is not None:
+            progress_callback(progress)
+
+    for node_id in hex_files:
+        report(UpdateProgress(node_id=node_id, status=UpdateStatus.queued))
 
+    processors = await _load_hex_files(set(hex_files.values()))
+
+    await asyncio.gather(
+        *(
+            _try_update_node(
+                messenger=messenger,
+                node_id=node_id,
+                hex_processor=processors[hex_file],
+                retry_count=retry_count,
+                timeout_seconds=timeout_seconds,
+                erase=erase,
+                window_size=window_size,
+                download_retry_count=download_retry_count,
+                attempts=attempts,
+                report=report,
+            )
+            for node_id, hex_file in hex_files.items()
+        )
+    )
+    return results
+
+
+async def _try_update_node(
+    messenger: CanMessenger,
+    node_id: NodeId,
+    hex_processor: Union[HexRecordProcessor, BaseException],
+    retry_count: int,
+    timeout_seconds: float,
+    erase: Optional[bool],
+    window_size: int,
+    download_retry_count: int,
+    attempts: int,
+    report: ProgressCallback,
+) -> None:
+    """Update one node, reporting its failure instead of raising."""
+    if isinstance(hex_processor, BaseException):
+        report(
+            UpdateProgress(
+                node_id=node_id, status=UpdateStatus.failed, error=hex_processor
+            )
+        )
+        return
+
+    error: Optional[BaseException] = None
+    for attempt in range(1, attempts + 1):
+        try:
+            await _update_node(
+                messenger=messenger,
+                node_id=node_id,
+                hex_processor=hex_processor,
+                retry_count=retry_count,
+                timeout_seconds=timeout_seconds,
+                erase=erase,
+                window_size=window_size,
+                download_retry_count=download_retry_count,
+                on_status=lambda status: report(
+                    UpdateProgress(node_id=node_id, status=status, attempt=attempt)
+                ),
+            )
+        except Exception as e:
+            logger.exception(f"Attempt {attempt} to update {node_id.name} failed.")
+            error = e
+        else:
+            report(
+                UpdateProgress(
+                    node_id=node_id, status=UpdateStatus.done, attempt=attempt
+                )
+            )
+            return
+
+    report(
+        UpdateProgress(
+            node_id=node_id, status=UpdateStatus.failed, attempt=attempts, error=error
+        )
+    )
+
+
+async def _load_hex_files(
+    paths: Set[Path],
+) -> Dict[Path, Union[HexRecordProcessor, BaseException]]:
+    """Parse each hex file into a processor whose chunks are already cached.
+
+    A file that can't be read or parsed maps to the exception it raised.
+    """
+    loop = asyncio.get_event_loop()
+    ordered_paths = list(paths)
+    loaded = await asyncio.gather(
+        *(loop.run_in_executor(None, _load_hex_file, path) for path in ordered_paths),
+        return_exceptions=True,
+    )
+    for path, result in zip(ordered_paths, loaded):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to load {path}: {result!r}")
+    return dict(zip(ordered_paths, loaded))
+
+
+def _load_hex_file(path: Path) -> HexRecordProcessor:
+    processor = HexRecordProcessor.from_file_path(path)
+    # Do a complete pass now so that the downloads only read the cached chunks.
+    for _ in processor.process(FirmwareUpdateDataField.NUM_BYTES):
+        pass
+    return processor
+
+
+async def _update_node(
+    messenger: CanMessenger,
+    node_id: NodeId,
+    hex_processor: HexRecordProcessor,
+    retry_count: int,
+    timeout_seconds: float,
+    erase: Optional[bool],
+    window_size: int,
+    download_retry_count: int,
+    on_status: Callable[[UpdateStatus], None],
+) -> None:
     initiator = FirmwareUpdateInitiator(messenger)
     downloader = FirmwareUpdateDownloader(messenger)
 
     target = Target(system_node=node_id)
 
     logger.info(f"Initiating FW Update on {target}.")
+    on_status(UpdateStatus.initializing)
 
     await initiator.run(
         target=target,
@@ -56,6 +268,7 @@ async def run_update(
     if erase:
         eraser = FirmwareUpdateEraser(messenger)
         logger.info(f"Erasing existing FW Update on {target}.")
+        on_status(UpdateStatus.erasing)
         await eraser.run(
             node_id=target.bootloader_node,
             timeout_sec=timeout_seconds,
@@ -64,13 +277,17 @@ async def run_update(
         logger.info("Skipping erase step.")
 
     logger.info(f"Downloading FW to {target.bootloader_node}.")
+    on_status(UpdateStatus.downloading)
     await downloader.run(
         node_id=target.bootloader_node,
         hex_processor=hex_processor,
         ack_wait_seconds=timeout_seconds,
+        window_size=window_size,
+        retry_count=download_retry_count,
     )
 
     logger.info(f"Restarting FW on {target.system_node}.")
+    on_status(UpdateStatus.restarting)
     await messenger.send(
         node_id=target.bootloader_node,
         message=FirmwareUpdateStartApp(),
@@ -0,0 +1,539 @@
+"""Array-backed motion planning.
+
+This plans every move of a target list at once with NumPy arrays, rather than
+building one Move at a time like move_utils does. Each step mirrors its
+counterpart in move_utils, using the same operations in the same order, so
+that the plans are identical to MoveManager.plan_motion_by_move.
+"""
+import dataclasses
+import logging
+from typing import Dict, List, Tuple, TYPE_CHECKING, cast
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Coordinates,
+    CoordinateValue,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class _AxisConstraintArrays:
+    """System constraints as arrays in axis order."""
+
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+    max_speed: "NDArray[np.float64]"
+
+    @classmethod
+    def build(
+        cls, constraints: SystemConstraints[AxisKey], axes: List[AxisKey]
+    ) -> "_AxisConstraintArrays":
+        return cls(
+            max_acceleration=np.array([constraints[a].max_acceleration for a in axes]),
+            max_speed_discont=np.array(
+                [constraints[a].max_speed_discont for a in axes]
+            ),
+            max_direction_change_speed_discont=np.array(
+                [constraints[a].max_direction_change_speed_discont for a in axes]
+            ),
+            max_speed=np.array([constraints[a].max_speed for a in axes]),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class _MoveArrays:
+    """A list of moves as arrays.
+
+    Per-move arrays have one row per move. Per-block arrays have a column for
+    each of a move's three blocks, and per-axis arrays a column for each axis.
+    """
+
+    unit_vector: "NDArray[np.float64]"
+    distance: "NDArray[np.float64]"
+    max_speed: "NDArray[np.float64]"
+    block_distance: "NDArray[np.float64]"
+    block_initial_speed: "NDArray[np.float64]"
+    block_acceleration: "NDArray[np.float64]"
+    block_final_speed: "NDArray[np.float64]"
+    block_time: "NDArray[np.float64]"
+
+    @property
+    def initial_speed(self) -> "NDArray[np.float64]":
+        """The initial speed of the first block that has a distance."""
+        return _first_nonzero_block_value(self.block_distance, self.block_initial_speed)
+
+    @property
+    def final_speed(self) -> "NDArray[np.float64]":
+        """The final speed of the last block that has a distance."""
+        return _first_nonzero_block_value(
+            self.block_distance[:, ::-1], self.block_final_speed[:, ::-1]
+        )
+
+
+def plan_motion(
+    origin: Coordinates[AxisKey, CoordinateValue],
+    target_list: List[MoveTarget[AxisKey]],
+    constraints: SystemConstraints[AxisKey],
+    iteration_limit: int = 10,
+) -> Tuple[bool, List[List[Move[AxisKey]]]]:
+    """Create and blend moves from targets.
+
+    Returns:
+        Whether the moves converged, and the moves built by each iteration
+        of blending. Like MoveManager.plan_motion_by_move, the moves of every
+        iteration except a converged one are padded with dummy moves.
+    """
+    assert target_list, "Check target list"
+    axes, unit_vectors, moves = _moves_from_targets(origin, target_list, constraints)
+    constraint_arrays = _AxisConstraintArrays.build(constraints, axes)
+    blend_log: List[List[Move[AxisKey]]] = []
+
+    for i in range(iteration_limit):
+        log.debug(f"Motion blending iteration: {i}")
+        moves = _blend(moves, constraint_arrays)
+        built = _to_moves(moves, unit_vectors)
+        if _all_blended(moves, constraint_arrays):
+            blend_log.append(built)
+            log.info(
+                f"built {len(built)} moves with "
+                f"{sum(m.nonzero_blocks for m in built)} "
+                f"non-zero blocks after {i+1} iteration(s)"
+            )
+            return True, blend_log
+        blend_log.append([Move.build_dummy(axes)] + built + [Move.build_dummy(axes)])
+
+    log.error("Could not converge!")
+    return False, blend_log
+
+
+def _row_norms(vectors: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Get the magnitude of each row.
+
+    This is a stack of dot products, which sums in the same order as the
+    np.linalg.norm() of each row that move_utils uses.
+    """
+    dot: "NDArray[np.float64]" = (vectors[:, None, :] @ vectors[:, :, None])[:, 0, 0]
+    return cast("NDArray[np.float64]", np.sqrt(dot))
+
+
+def _first_nonzero_block_value(
+    block_distance: "NDArray[np.float64]", values: "NDArray[np.float64]"
+) -> "NDArray[np.float64]":
+    """Get each row's value from the first block with a distance, or 0."""
+    has_distance: "NDArray[np.bool_]" = block_distance != 0
+    first = np.argmax(has_distance, axis=1)
+    picked = values[np.arange(len(values)), first]
+    return cast(
+        "NDArray[np.float64]",
+        np.where(has_distance.any(axis=1), picked, np.float64(0.0)),
+    )
+
+
+def _block_final_speed_and_time(
+    distance: "NDArray[np.float64]",
+    initial_speed: "NDArray[np.float64]",
+    acceleration: "NDArray[np.float64]",
+) -> Tuple["NDArray[np.float64]", "NDArray[np.float64]"]:
+    """Compute what Block.__post_init__ computes, for many blocks."""
+    speed_squared = np.square(initial_speed) + acceleration * distance * 2
+    negative: "NDArray[np.bool_]" = speed_squared < 0
+    if negative.any():
+        log.warning(
+            f"Block encountered negative values in final_speed "
+            f"({speed_squared[negative]}). Setting Block.final_speed to 0.0 instead."
+        )
+    final_speed = np.sqrt(np.where(negative, np.float64(0.0), speed_squared))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        time = np.where(
+            acceleration != 0,
+            (final_speed - initial_speed) / acceleration,
+            np.where(initial_speed != 0, distance / initial_speed, np.float64(0.0)),
+        )
+    return final_speed, time
+
+
+def _moves_from_targets(
+    origin: Coordinates[AxisKey, CoordinateValue],
+    target_list: List[MoveTarget[AxisKey]],
+    constraints: SystemConstraints[AxisKey],
+) -> Tuple[List[AxisKey], List[Dict[AxisKey, np.float64]], _MoveArrays]:
+    """Build the unblended moves, like move_utils.targets_to_moves."""
+    all_axes = set()
+    for target in target_list:
+        all_axes.update(set(target.position.keys()))
+    axes = list(all_axes)
+
+    positions = np.array(
+        [[np.float64(origin.get(k, 0)) for k in axes]]
+        + [
+            [np.float64(target.position.get(k, 0)) for k in axes]
+            for target in target_list
+        ]
+    )
+    displacement = positions[1:] - positions[:-1]
+    distance = _row_norms(displacement)
+    zero_length = (distance == 0) | np.all(positions[1:] == positions[:-1], axis=1)
+    if zero_length.any():
+        i = int(np.argmax(zero_length))
+        raise ZeroLengthMoveError(
+            dict(zip(axes, positions[i])), dict(zip(axes, positions[i + 1]))
+        )
+    unit_vector = displacement / distance[:, None]
+    unit_vectors = [dict(zip(axes, row)) for row in unit_vector]
+    invalid = ~np.isclose(_row_norms(unit_vector), 1.0)
+    if invalid.any():
+        raise ValueError(
+            f"{unit_vectors[int(np.argmax(invalid))]} is not a valid unit vector."
+        )
+
+    # Limit each move's speed to fall inside the max speed of every axis,
+    # like move_utils.limit_max_speed.
+    target_speed = np.array([target.max_speed for target in target_list])
+    axis_speed = unit_vector * target_speed[:, None]
+    constraint_arrays = _AxisConstraintArrays.build(constraints, axes)
+    with np.errstate(divide="ignore"):
+        axis_ratio = np.where(
+            axis_speed != 0,
+            constraint_arrays.max_speed / np.abs(axis_speed),
+            np.inf,
+        )
+    scale = np.minimum(np.float64(1), axis_ratio.min(axis=1))
+    speed = target_speed * scale
+
+    block_distance: "NDArray[np.float64]" = np.repeat(
+        np.divide(distance, 3)[:, None], 3, axis=1
+    )
+    block_initial_speed = np.repeat(speed[:, None], 3, axis=1)
+    block_acceleration = np.zeros_like(block_distance)
+    block_final_speed, block_time = _block_final_speed_and_time(
+        block_distance, block_initial_speed, block_acceleration
+    )
+    return (
+        axes,
+        unit_vectors,
+        _MoveArrays(
+            unit_vector=unit_vector,
+            distance=distance,
+            max_speed=speed,
+            block_distance=block_distance,
+            block_initial_speed=block_initial_speed,
+            block_acceleration=block_acceleration,
+            block_final_speed=block_final_speed,
+            block_time=block_time,
+        ),
+    )
+
+
+def _neighbor_components(
+    moves: _MoveArrays, offset: int
+) -> Tuple["NDArray[np.float64]", "NDArray[np.float64]"]:
+    """Get the unit vectors of each move's neighbor, and their final/initial speeds.
+
+    An offset of -1 gets each move's previous move, and +1 its next move. The
+    first and last moves are neighbored by a stopped, zero-length move.
+    Components of moves that are too short to count are zeroed.
+    """
+    long_enough: "NDArray[np.bool_]" = moves.distance > FLOAT_THRESHOLD
+    components: "NDArray[np.float64]" = np.where(
+        long_enough[:, None],
+        moves.unit_vector,
+        np.float64(0),
+    )
+    speed = moves.final_speed if offset < 0 else moves.initial_speed
+    stopped_components = np.zeros((1, components.shape[1]))
+    stopped_speed = np.zeros(1)
+    if offset < 0:
+        return (
+            np.concatenate(  # type: ignore[no-untyped-call]
+                [stopped_components, components[:-1]]
+            ),
+            np.concatenate([stopped_speed, speed[:-1]]),  # type: ignore[no-untyped-call]
+        )
+    return (
+        np.concatenate(  # type: ignore[no-untyped-call]
+            [components[1:], stopped_components]
+        ),
+        np.concatenate([speed[1:], stopped_speed]),  # type: ignore[no-untyped-call]
+    )
+
+
+def _junction_speed_limit(
+    axis_component: "NDArray[np.float64]",
+    neighbor_component: "NDArray[np.float64]",
+    neighbor_speed: "NDArray[np.float64]",
+    max_speed_discont: np.float64,
+    max_direction_change_speed_discont: np.float64,
+) -> "NDArray[np.float64]":
+    """Compute an axis's speed limit at a junction with a neighbor.
+
+    This is move_utils.initial_speed_limit_from_axis and
+    move_utils.final_speed_limit_from_axis, which share their logic.
+    """
+    same_direction_speed = np.maximum(
+        np.abs(neighbor_speed * neighbor_component), max_speed_discont
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        limit: "NDArray[np.float64]" = np.where(
+            (neighbor_component == 0) | (neighbor_speed == 0),
+            np.abs(max_speed_discont / axis_component),
+            np.where(
+                neighbor_component * axis_component > 0,
+                np.abs(same_direction_speed / axis_component),
+                np.abs(max_direction_change_speed_discont / axis_component),
+            ),
+        )
+    return limit
+
+
+def _blend(moves: _MoveArrays, constraints: _AxisConstraintArrays) -> _MoveArrays:
+    """Rebuild every move against its neighbors, like move_utils.build_move."""
+    prev_component, prev_final_speed = _neighbor_components(moves, -1)
+    next_component, next_initial_speed = _neighbor_components(moves, 1)
+    unit_vector = moves.unit_vector
+    num_axes = unit_vector.shape[1]
+
+    # find_initial_speed and find_final_speed
+    initial_speed = moves.initial_speed
+    final_speed = moves.final_speed
+    for axis in range(num_axes):
+        component = unit_vector[:, axis]
+        initial_limit = _junction_speed_limit(
+            component,
+            prev_component[:, axis],
+            prev_final_speed,
+            constraints.max_speed_discont[axis],
+            constraints.max_direction_change_speed_discont[axis],
+        )
+        initial_speed = np.where(
+            np.abs(component * initial_speed) < FLOAT_THRESHOLD,
+            initial_speed,
+            np.minimum(initial_limit, initial_speed),
+        )
+        final_limit = _junction_speed_limit(
+            component,
+            next_component[:, axis],
+            next_initial_speed,
+            constraints.max_speed_discont[axis],
+            constraints.max_direction_change_speed_discont[axis],
+        )
+        final_speed = np.where(
+            np.abs(component * final_speed) < FLOAT_THRESHOLD,
+            final_speed,
+            np.minimum(final_limit, final_speed),
+        )
+
+    # achievable_final
+    for axis in range(num_axes):
+        component = unit_vector[:, axis]
+        max_axis_final_velocity_sq = (
+            initial_speed * component
+        ) ** 2 + 2 * constraints.max_acceleration[axis] * moves.distance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            max_axis_final_velocity = (
+                np.copysign(
+                    np.sqrt(max_axis_final_velocity_sq) / component,
+                    final_speed - initial_speed,
+                )
+                + initial_speed
+            )
+        final_speed = np.where(
+            component != 0,
+            np.copysign(
+                np.minimum(np.abs(max_axis_final_velocity), np.abs(final_speed)),
+                final_speed,
+            ),
+            final_speed,
+        )
+
+    return _build_blocks(moves, initial_speed, final_speed, constraints)
+
+
+def _build_blocks(
+    moves: _MoveArrays,
+    initial_speed: "NDArray[np.float64]",
+    final_speed: "NDArray[np.float64]",
+    constraints: _AxisConstraintArrays,
+) -> _MoveArrays:
+    """Build every move's blocks, like move_utils.build_blocks."""
+    for name, speed in (("initial", initial_speed), ("final", final_speed)):
+        exceeds = ~(
+            (np.abs(speed) <= moves.max_speed)
+            | np.isclose(np.abs(speed), moves.max_speed)
+        )
+        if exceeds.any():
+            i = int(np.argmax(exceeds))
+            raise AssertionError(
+                f"{name} speed {speed[i]} exceeds max speed {moves.max_speed[i]}"
+            )
+
+    unit_vector = moves.unit_vector
+    max_acc = np.where(unit_vector != 0, constraints.max_acceleration, np.float64(0.0))
+    acc_v = _row_norms(max_acc)[:, None] * unit_vector
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for axis in range(unit_vector.shape[1]):
+            a_i = acc_v[:, axis]
+            over = np.abs(a_i) > max_acc[:, axis]
+            acc_v = np.where(
+                over[:, None], acc_v * (max_acc[:, axis] / a_i)[:, None], acc_v
+            )
+    max_acceleration = _row_norms(acc_v)
+
+    distance = moves.distance
+    initial_speed_sq: "NDArray[np.float64]" = initial_speed**2
+    final_speed_sq: "NDArray[np.float64]" = final_speed**2
+    max_achievable_speed = np.sqrt(
+        0.5 * (2 * max_acceleration * distance + initial_speed_sq + final_speed_sq)
+    )
+    max_speed_sq = np.minimum(max_achievable_speed, moves.max_speed) ** 2
+
+    first_distance = np.abs(max_speed_sq - initial_speed_sq) / (2 * max_acceleration)
+    first_final_speed, first_time = _block_final_speed_and_time(
+        first_distance, initial_speed, max_acceleration
+    )
+    final_distance = np.abs(max_speed_sq - final_speed_sq) / (2 * max_acceleration)
+    final_final_speed, final_time = _block_final_speed_and_time(
+        final_distance, first_final_speed, -max_acceleration
+    )
+
+    # Trim the top speed when the math didn't quite work out. Like in
+    # move_utils, only the block distances are updated.
+    trim = first_distance + final_distance > (distance + FLOAT_THRESHOLD)
+    trimmed_max_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+    first_distance = np.where(
+        trim,
+        np.abs(trimmed_max_speed_sq - initial_speed_sq) / (2 * max_acceleration),
+        first_distance,
+    )
+    final_distance = np.where(
+        trim,
+        np.abs(trimmed_max_speed_sq - final_speed_sq) / (2 * max_acceleration),
+        final_distance,
+    )
+
+    coast = first_distance + final_distance < (distance - FLOAT_THRESHOLD)
+    zero = np.zeros_like(distance)
+    coast_distance = np.where(coast, distance - first_distance - final_distance, zero)
+    coast_initial_speed = np.where(coast, first_final_speed, zero)
+    coast_final_speed, coast_time = _block_final_speed_and_time(
+        coast_distance, coast_initial_speed, zero
+    )
+
+    return dataclasses.replace(
+        moves,
+        block_distance=np.stack([first_distance, coast_distance, final_distance], 1),
+        block_initial_speed=np.stack(
+            [initial_speed, coast_initial_speed, first_final_speed], 1
+        ),
+        block_acceleration=np.stack([max_acceleration, zero, -max_acceleration], 1),
+        block_final_speed=np.stack(
+            [first_final_speed, coast_final_speed, final_final_speed], 1
+        ),
+        block_time=np.stack([first_time, coast_time, final_time], 1),
+    )
+
+
+def _check_less_or_close(
+    constraint: "NDArray[np.float64]", value: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    """Vectorized move_utils.check_less_or_close."""
+    return cast(
+        "NDArray[np.bool_]",
+        (np.abs(value) <= constraint) | np.isclose(value, constraint),
+    )
+
+
+def _all_blended(moves: _MoveArrays, constraints: _AxisConstraintArrays) -> bool:
+    """Check if consecutive moves are all blended, like move_utils.all_blended."""
+    if len(moves.distance) < 2:
+        return True
+
+    distance_sum = (
+        moves.block_distance[:, 0] + moves.block_distance[:, 1]
+    ) + moves.block_distance[:, 2]
+    if np.any(np.abs(distance_sum - moves.distance) > FLOAT_THRESHOLD) or not np.all(
+        np.isclose(distance_sum, moves.distance)
+    ):
+        return False
+
+    first_uv = moves.unit_vector[:-1]
+    second_uv = moves.unit_vector[1:]
+    final_speed = moves.block_final_speed[:-1, 2][:, None] * first_uv
+    initial_speed = moves.block_initial_speed[1:, 0][:, None] * second_uv
+    same_direction_ok = (np.abs(initial_speed - final_speed) < FLOAT_THRESHOLD) | (
+        _check_less_or_close(constraints.max_speed_discont, final_speed)
+        | _check_less_or_close(constraints.max_speed_discont, initial_speed)
+    )
+    direction_change_ok: "NDArray[np.bool_]" = _check_less_or_close(
+        constraints.max_direction_change_speed_discont, final_speed
+    ) | _check_less_or_close(
+        constraints.max_direction_change_speed_discont, initial_speed
+    )
+    return bool(
+        np.all(
+            np.where(first_uv * second_uv > 0, same_direction_ok, direction_change_ok)
+        )
+    )
+
+
+def _to_moves(
+    moves: _MoveArrays, unit_vectors: List[Dict[AxisKey, np.float64]]
+) -> List[Move[AxisKey]]:
+    """Make a Move for each row of the arrays."""
+    columns = zip(
+        *(
+            list(array.T.ravel())
+            for array in (
+                moves.block_distance,
+                moves.block_initial_speed,
+                moves.block_acceleration,
+                moves.block_final_speed,
+                moves.block_time,
+            )
+        )
+    )
+    block_values = list(columns)
+    n = len(unit_vectors)
+    nonzero_blocks = np.count_nonzero(moves.block_time, axis=1).tolist()
+
+    built: List[Move[AxisKey]] = []
+    for i, (unit_vector, distance, max_speed, initial_speed, final_speed) in enumerate(
+        zip(
+            unit_vectors,
+            moves.distance,
+            moves.max_speed,
+            moves.initial_speed,
+            moves.final_speed,
+        )
+    ):
+        built.append(
+            Move.build_precomputed(
+                unit_vector=unit_vector,
+                distance=distance,
+                max_speed=max_speed,
+                blocks=(
+                    Block.build_precomputed(*block_values[i]),
+                    Block.build_precomputed(*block_values[n + i]),
+                    Block.build_precomputed(*block_values[2 * n + i]),
+                ),
+                initial_speed=initial_speed,
+                final_speed=final_speed,
+                nonzero_blocks=nonzero_blocks[i],
+            )
+        )
+    return built
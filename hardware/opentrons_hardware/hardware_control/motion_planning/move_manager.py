@@ -1,7 +1,10 @@
 """Move manager."""
 import logging
 from typing import List, Tuple, Generic
-from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning import (
+    batch_planner,
+    move_utils,
+)
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     Move,
@@ -59,7 +62,26 @@ class MoveManager(Generic[AxisKey]):
         target_list: List[MoveTarget[AxisKey]],
         iteration_limit: int = 10,
     ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
-        """Create and blend moves from targets."""
+        """Create and blend moves from targets.
+
+        All the moves are planned at once with arrays. The result is identical
+        to that of plan_motion_by_move.
+        """
+        converged, self._blend_log = batch_planner.plan_motion(
+            origin, target_list, self._constraints, iteration_limit
+        )
+        return converged, self._blend_log
+
+    def plan_motion_by_move(
+        self,
+        origin: Coordinates[AxisKey, CoordinateValue],
+        target_list: List[MoveTarget[AxisKey]],
+        iteration_limit: int = 10,
+    ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
+        """Create and blend moves from targets, building one move at a time.
+
+        This is the reference implementation of plan_motion.
+        """
         self._clear_blend_log()
         to_blend = self._get_initial_moves_from_targets(origin, target_list)
         assert to_blend, "Check target list"
@@ -81,6 +81,28 @@ class Block:
         self.final_speed = _final_speed()
         self.time = _time()
 
+    @classmethod
+    def build_precomputed(
+        cls,
+        distance: np.float64,
+        initial_speed: np.float64,
+        acceleration: np.float64,
+        final_speed: np.float64,
+        time: np.float64,
+    ) -> Block:
+        """Build a Block whose final speed and time are already computed.
+
+        Skips computing them again, for planners that compute them for many
+        blocks at once.
+        """
+        block: Block = cls.__new__(cls)
+        block.distance = distance
+        block.initial_speed = initial_speed
+        block.acceleration = acceleration
+        block.final_speed = final_speed
+        block.time = time
+        return block
+
 
 @dataclasses.dataclass
 class Move(Generic[AxisKey]):
@@ -187,6 +209,32 @@ class Move(Generic[AxisKey]):
             blocks=blocks,
         )
 
+    @classmethod
+    def build_precomputed(
+        cls,
+        unit_vector: Coordinates[AxisKey, np.float64],
+        distance: np.float64,
+        max_speed: np.float64,
+        blocks: Tuple[Block, Block, Block],
+        initial_speed: np.float64,
+        final_speed: np.float64,
+        nonzero_blocks: int,
+    ) -> Move[AxisKey]:
+        """Build a Move whose derived fields are already computed.
+
+        Skips checking the unit vector and computing the derived fields again,
+        for planners that compute them for many moves at once.
+        """
+        move: Move[AxisKey] = cls.__new__(cls)
+        move.unit_vector = unit_vector
+        move.distance = distance
+        move.max_speed = max_speed
+        move.blocks = blocks
+        move.initial_speed = initial_speed
+        move.final_speed = final_speed
+        move.nonzero_blocks = nonzero_blocks
+        return move
+
     def to_dict(self) -> Dict[str, Any]:
         """Return Move a dict."""
         return dataclasses.asdict(self)
@@ -11,10 +11,8 @@ from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     MotorPositionRequest,
     MotorPositionResponse,
 )
-from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
-    MessageId,
     MotorPositionFlags,
 )
 
@@ -59,14 +57,11 @@ async def get_motor_position(
     can_messenger: CanMessenger, nodes: Set[NodeId], timeout: float = 1.0
 ) -> MotorPositionStatus:
     """Request node to respond with motor and encoder status."""
-
-    def _listener_filter(arbitration_id: ArbitrationId) -> bool:
-        return (NodeId(arbitration_id.parts.originating_node_id) in nodes) and (
-            MessageId(arbitration_id.parts.message_id)
-            == MotorPositionResponse.message_id
-        )
-
-    with MultipleMessagesWaitableCallback(can_messenger, _listener_filter) as reader:
+    with MultipleMessagesWaitableCallback(
+        can_messenger,
+        message_ids=[MotorPositionResponse.message_id],
+        node_ids=nodes,
+    ) as reader:
         await can_messenger.send(
             node_id=NodeId.broadcast, message=MotorPositionRequest()
         )
@@ -2,7 +2,7 @@
 import asyncio
 from collections import defaultdict
 import logging
-from typing import List, Set, Tuple, Iterator, Union
+from typing import Awaitable, Callable, List, Set, Tuple, Iterator, Union
 import numpy as np
 
 from opentrons_hardware.firmware_bindings import ArbitrationId
@@ -63,19 +63,87 @@ _AcceptableMoves = Union[MoveCompleted, TipActionResponse]
 _CompletionPacket = Tuple[ArbitrationId, _AcceptableMoves]
 _Completions = List[_CompletionPacket]
 
+STREAM_SLOTS = 2
+"""The number of move group ids a streaming runner cycles through."""
+
+
+def _streamed_group_id(start_at_index: int, group_index: int) -> int:
+    return start_at_index + group_index % STREAM_SLOTS
+
+
+class MoveGroupTimeout(RuntimeError):
+    """A streamed move group did not complete in time."""
+
+    def __init__(self, group_id: int, timeout: float) -> None:
+        """Constructor."""
+        super().__init__(
+            f"Move group {group_id} did not complete within {timeout:.2f} s."
+        )
+        self.group_id = group_id
+        self.timeout = timeout
+
+
+def _zero_step(step: SingleMoveStep) -> MoveGroupSingleAxisStep:
+    if not isinstance(step, MoveGroupSingleAxisStep):
+        raise ValueError(
+            f"A streamed {type(step).__name__} can't be cleared from its slot"
+        )
+    return MoveGroupSingleAxisStep(
+        distance_mm=np.float64(0),
+        velocity_mm_sec=np.float64(0),
+        duration_sec=np.float64(0),
+    )
+
+
+def _pad_streamed_groups(move_groups: MoveGroups) -> MoveGroups:
+    """Fill in the steps each streamed group leaves over from its slot's last group.
+
+    Uploading a move group only overwrites the steps that it has, so a group
+    that reuses a slot gets a zero-length step for every step of the slot's
+    previous group that it doesn't overwrite itself.
+    """
+    padded: MoveGroups = []
+    for group_index, move_group in enumerate(move_groups):
+        if group_index < STREAM_SLOTS:
+            padded.append(move_group)
+            continue
+        previous = padded[group_index - STREAM_SLOTS]
+        group = [dict(sequence) for sequence in move_group]
+        group.extend({} for _ in range(len(previous) - len(group)))
+        for seq_i, sequence in enumerate(previous):
+            for node, step in sequence.items():
+                if node not in group[seq_i]:
+                    group[seq_i][node] = _zero_step(step)
+        padded.append(group)
+    return padded
+
 
 class MoveGroupRunner:
     """A move command scheduler."""
 
-    def __init__(self, move_groups: MoveGroups, start_at_index: int = 0) -> None:
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        start_at_index: int = 0,
+        streaming: bool = False,
+    ) -> None:
         """Constructor.
 
         Args:
             move_groups: The move groups to run.
             start_at_index: The index the MoveGroupManager will start at
+            streaming: Upload each move group while the one before it is
+                executing, instead of uploading them all before starting.
+                The groups take turns using two group ids, so any number of
+                them can be run. Steps a group would leave behind in its slot
+                are replaced by empty moves, which only works for stepper
+                motors.
         """
-        self._move_groups = move_groups
+        self._move_groups = (
+            _pad_streamed_groups(move_groups) if streaming else move_groups
+        )
         self._start_at_index = start_at_index
+        self._streaming = streaming
         self._is_prepped: bool = False
 
     @staticmethod
@@ -119,7 +187,9 @@ class MoveGroupRunner:
         except RuntimeError:
             log.error("raising error from Move group runner")
             raise
-        return self._accumulate_move_completions(move_completion_data)
+        return self._accumulate_move_completions(
+            move_completion_data, by_arrival=self._streaming
+        )
 
     async def run(
         self, can_messenger: CanMessenger
@@ -147,14 +217,19 @@ class MoveGroupRunner:
     @staticmethod
     def _accumulate_move_completions(
         completions: _Completions,
+        by_arrival: bool = False,
     ) -> NodeDict[Tuple[float, float, bool, bool]]:
         position: NodeDict[
             List[Tuple[Tuple[int, int], float, float, bool, bool]]
         ] = defaultdict(list)
-        for arbid, completion in completions:
+        for arrival, (arbid, completion) in enumerate(completions):
             position[NodeId(arbid.parts.originating_node_id)].append(
                 (
-                    (
+                    # streamed groups reuse their ids, so only the order the
+                    # completions arrived in tells which one is the latest
+                    (arrival, 0)
+                    if by_arrival
+                    else (
                         completion.payload.group_id.value,
                         completion.payload.seq_id.value,
                     ),
@@ -193,16 +268,37 @@ class MoveGroupRunner:
         )
 
     async def _send_groups(self, can_messenger: CanMessenger) -> None:
-        """Send commands to set up the message groups."""
-        for group_i, group in enumerate(self._move_groups):
-            for seq_i, sequence in enumerate(group):
-                for node, step in sequence.items():
-                    await can_messenger.send(
-                        node_id=node,
-                        message=self._get_message_type(
-                            step, group_i + self._start_at_index, seq_i
-                        ),
-                    )
+        """Send commands to set up the message groups.
+
+        A streaming runner only sends the groups that fit in its slots; the
+        rest are sent by the scheduler as slots free up.
+        """
+        group_count = len(self._move_groups)
+        if self._streaming:
+            group_count = min(group_count, STREAM_SLOTS)
+        await can_messenger.send_many(
+            [
+                message
+                for group_i in range(group_count)
+                for message in self._group_messages(group_i)
+            ]
+        )
+
+    async def _send_group(self, group_i: int, can_messenger: CanMessenger) -> None:
+        """Send the commands to set up one message group."""
+        await can_messenger.send_many(self._group_messages(group_i))
+
+    def _group_messages(self, group_i: int) -> List[Tuple[NodeId, MessageDefinition]]:
+        """The node and message for each step of one message group."""
+        if self._streaming:
+            group_id = _streamed_group_id(self._start_at_index, group_i)
+        else:
+            group_id = group_i + self._start_at_index
+        return [
+            (node, self._get_message_type(step, group_id, seq_i))
+            for seq_i, sequence in enumerate(self._move_groups[group_i])
+            for node, step in sequence.items()
+        ]
 
     def _convert_velocity(
         self, velocity: Union[float, np.float64], interrupts: int
@@ -291,9 +387,13 @@ class MoveGroupRunner:
         self, can_messenger: CanMessenger, start_at_index: int
     ) -> _Completions:
         """Run all the move groups."""
-        scheduler = MoveScheduler(self._move_groups, start_at_index)
+        scheduler = (
+            StreamingMoveScheduler(self._move_groups, self._send_group, start_at_index)
+            if self._streaming
+            else MoveScheduler(self._move_groups, start_at_index)
+        )
         try:
-            can_messenger.add_listener(scheduler)
+            can_messenger.add_listener(scheduler, message_ids=MoveScheduler.message_ids)
             completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
@@ -303,6 +403,14 @@ class MoveGroupRunner:
 class MoveScheduler:
     """A message listener that manages the sending of execute move group messages."""
 
+    message_ids = [
+        MoveCompleted.message_id,
+        TipActionResponse.message_id,
+        ErrorMessage.message_id,
+        Acknowledgement.message_id,
+    ]
+    """The ids of the messages the scheduler listens for."""
+
     def __init__(self, move_groups: MoveGroups, start_at_index: int = 0) -> None:
         """Constructor."""
         # For each move group create a set identifying the node and seq id.
@@ -330,9 +438,9 @@ class MoveScheduler:
         self, message: _AcceptableMoves, arbitration_id: ArbitrationId
     ) -> None:
         seq_id = message.payload.seq_id.value
-        group_id = message.payload.group_id.value - self._start_at_index
         node_id = arbitration_id.parts.originating_node_id
         try:
+            group_id = self._group_index(message.payload.group_id.value)
             in_group = (node_id, seq_id) in self._moves[group_id]
             self._moves[group_id].remove((node_id, seq_id))
             self._completion_queue.put_nowait((arbitration_id, message))
@@ -341,7 +449,7 @@ class MoveScheduler:
                 f", which {'is' if in_group else 'isn''t'} in group"
             )
             if not self._moves[group_id]:
-                log.info(f"Move group {group_id+self._start_at_index} has completed.")
+                log.info(f"Move group {message.payload.group_id.value} has completed.")
                 self._event.set()
         except KeyError:
             log.warning(
@@ -360,9 +468,9 @@ class MoveScheduler:
         raise RuntimeError("Firmware Error Revieved", message)
 
     def _handle_move_completed(self, message: MoveCompleted) -> None:
-        group_id = message.payload.group_id.value - self._start_at_index
         ack_id = message.payload.ack_id.value
         try:
+            group_id = self._group_index(message.payload.group_id.value)
             if self._stop_condition[
                 group_id
             ] == MoveStopCondition.limit_switch and ack_id != UInt8Field(2):
@@ -376,9 +484,9 @@ class MoveScheduler:
             pass
 
     def _handle_tip_action(self, message: TipActionResponse) -> None:
-        group_id = message.payload.group_id.value - self._start_at_index
         ack_id = message.payload.ack_id.value
         try:
+            group_id = self._group_index(message.payload.group_id.value)
             limit_switch = bool(
                 self._stop_condition[group_id] == MoveStopCondition.limit_switch
             )
@@ -410,19 +518,48 @@ class MoveScheduler:
         elif isinstance(message, Acknowledgement):
             self._handle_acknowledge(message)
 
-    def _get_nodes_in_move_group(self, group_id: int) -> List[NodeId]:
+    def _group_id(self, group_index: int) -> int:
+        """The id the move group at group_index was sent with."""
+        return group_index + self._start_at_index
+
+    def _group_index(self, group_id: int) -> int:
+        """The index of the move group sent with group_id.
+
+        Raises IndexError for a group this scheduler doesn't own.
+        """
+        group_index = group_id - self._start_at_index
+        if not 0 <= group_index < len(self._moves):
+            raise IndexError(group_id)
+        return group_index
+
+    def _get_nodes_in_move_group(self, group_index: int) -> List[NodeId]:
         nodes = []
-        for (node_id, seq_id) in self._moves[group_id - self._start_at_index]:
+        for (node_id, seq_id) in self._moves[group_index]:
             if node_id not in nodes:
                 nodes.append(NodeId(node_id))
         return nodes
 
+    async def _while_executing(
+        self, group_index: int, can_messenger: CanMessenger
+    ) -> None:
+        """Called once the move group at group_index has started."""
+        pass
+
+    def _handle_timeout(self, group_index: int, timeout: float) -> None:
+        """Called if the move group at group_index didn't complete in time."""
+        group_id = self._group_id(group_index)
+        log.warning(
+            f"Move set {str(group_id)} timed out, expected duration {str(timeout)}"
+        )
+        log.warning(
+            f"Expected nodes in group {str(group_id)}: {str(self._get_nodes_in_move_group(group_index))}"
+        )
+
     async def run(self, can_messenger: CanMessenger) -> _Completions:
         """Start each move group after the prior has completed."""
-        for group_id in range(
-            self._start_at_index, self._start_at_index + len(self._moves)
-        ):
+        for group_index in range(len(self._moves)):
             self._event.clear()
+            group_id = self._group_id(group_index)
 
             log.info(f"Executing move group {group_id}.")
             error = await can_messenger.ensure_send(
@@ -436,28 +573,22 @@ class MoveScheduler:
                         cancel_trigger=UInt8Field(0),
                     )
                 ),
-                expected_nodes=self._get_nodes_in_move_group(group_id),
+                expected_nodes=self._get_nodes_in_move_group(group_index),
             )
             if error != ErrorCode.ok:
                 log.error(f"recieved error trying to execute move group {str(error)}")
-
+            await self._while_executing(group_index, can_messenger)
+
+            # TODO: The max here can be removed once can_driver.send() no longer
+            # returns before the message actually hits the bus. Right now it
+            # returns when the message is enqueued in the kernel, meaning that
+            # for short move durations we can see the timeout expiring before
+            # the execute even gets sent.
+            timeout = max(1.0, self._durations[group_index] * 1.1)
             try:
-                # TODO: The max here can be removed once can_driver.send() no longer
-                # returns before the message actually hits the bus. Right now it
-                # returns when the message is enqueued in the kernel, meaning that
-                # for short move durations we can see the timeout expiring before
-                # the execute even gets sent.
-                await asyncio.wait_for(
-                    self._event.wait(),
-                    max(1.0, self._durations[group_id - self._start_at_index] * 1.1),
-                )
+                await asyncio.wait_for(self._event.wait(), timeout)
             except asyncio.TimeoutError:
-                log.warning(
-                    f"Move set {str(group_id)} timed out, expected duration {str(max(1.0, self._durations[group_id - self._start_at_index] * 1.1))}"
-                )
-                log.warning(
-                    f"Expected nodes in group {str(group_id)}: {str(self._get_nodes_in_move_group(group_id))}"
-                )
+                self._handle_timeout(group_index, timeout)
             except RuntimeError:
                 log.error("canceling move group scheduler")
                 raise
@@ -467,3 +598,58 @@ class MoveScheduler:
                 yield self._completion_queue.get_nowait()
 
         return list(_reify_queue_iter())
+
+
+class StreamingMoveScheduler(MoveScheduler):
+    """A move scheduler that uploads each move group while the prior one executes.
+
+    The move groups take turns using STREAM_SLOTS group ids. Once a group has
+    started, the next group waiting for a slot is uploaded into the slot of
+    the group that just completed, so it's ready to start as soon as the
+    running group completes. A group that doesn't complete in time raises
+    MoveGroupTimeout rather than letting the next groups reuse its slot.
+    """
+
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        send_group: Callable[[int, CanMessenger], Awaitable[None]],
+        start_at_index: int = 0,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            move_groups: The move groups to run.
+            send_group: Uploads the move group at an index into its slot.
+            start_at_index: The group id of the first slot.
+        """
+        super().__init__(move_groups, start_at_index)
+        self._send_group = send_group
+        # The index of the move group that was last uploaded into each slot.
+        self._slot_groups = list(range(STREAM_SLOTS))
+
+    def _group_id(self, group_index: int) -> int:
+        return _streamed_group_id(self._start_at_index, group_index)
+
+    def _group_index(self, group_id: int) -> int:
+        slot = group_id - self._start_at_index
+        if not 0 <= slot < min(STREAM_SLOTS, len(self._moves)):
+            raise IndexError(group_id)
+        return self._slot_groups[slot]
+
+    async def _while_executing(
+        self, group_index: int, can_messenger: CanMessenger
+    ) -> None:
+        next_index = group_index + STREAM_SLOTS - 1
+        if STREAM_SLOTS <= next_index < len(self._moves):
+            self._slot_groups[next_index % STREAM_SLOTS] = next_index
+            await self._send_group(next_index, can_messenger)
+
+    def _handle_timeout(self, group_index: int, timeout: float) -> None:
+        """Abort, since the group's slot can't be reused while it may be running.
+
+        The next group was uploaded into the other slot when this one started,
+        and the group after that would overwrite this one's slot.
+        """
+        super()._handle_timeout(group_index, timeout)
+        raise MoveGroupTimeout(self._group_id(group_index), timeout)
@@ -1,6 +1,7 @@
 """Functions for commanding motion limited by tool sensors."""
 import asyncio
-from typing import Union, List, Iterator, Tuple
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Union, List, Tuple, cast
 from logging import getLogger
 from numpy import float64
 from math import copysign
@@ -14,8 +15,12 @@ from opentrons_hardware.firmware_bindings.constants import (
 from opentrons_hardware.sensors.types import SensorDataType
 from opentrons_hardware.sensors.sensor_types import SensorInformation
 from opentrons_hardware.sensors.scheduler import SensorScheduler
+from opentrons_hardware.sensors.capture import SensorCapture, DEFAULT_CAPTURE_CAPACITY
 from opentrons_hardware.sensors.utils import SensorThresholdInformation
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    StopRequest,
+)
 from opentrons_hardware.hardware_control.motion import (
     MoveStopCondition,
     create_step,
@@ -80,15 +85,29 @@ async def capacitive_probe(
         return position[mover][:2]
 
 
-async def capacitive_pass(
+@asynccontextmanager
+async def capacitive_capture(
     messenger: CanMessenger,
     tool: ProbeTarget,
     mover: NodeId,
     distance: float,
     speed: float,
     sensor_id: SensorId = SensorId.S0,
-) -> List[float]:
-    """Move the specified axis while capturing capacitive sensor readings."""
+    capacity: int = DEFAULT_CAPTURE_CAPACITY,
+) -> AsyncIterator[SensorCapture]:
+    """Move the specified axis while streaming capacitive sensor readings.
+
+    The readings are timestamped into a ring buffer of the given capacity,
+    which can be iterated over while the axis moves; iteration ends when the
+    move does. Leaving the context before the move is done stops the axis
+    where it is, for instance once an edge has been found:
+
+        async with capacitive_capture(...) as capture:
+            async for timestamp, value in capture:
+                if value > threshold:
+                    break
+        readings = capture.values()
+    """
     sensor_scheduler = SensorScheduler()
     sensor_info = SensorInformation(
         sensor_type=SensorType.capacitive,
@@ -98,14 +117,39 @@ async def capacitive_pass(
     pass_group = _build_pass_step(mover, distance, speed)
     runner = MoveGroupRunner(move_groups=[[pass_group]])
     await runner.prep(messenger)
-    async with sensor_scheduler.capture_output(sensor_info, messenger) as output_queue:
-        await runner.execute(messenger)
+    async with sensor_scheduler.stream_output(
+        sensor_info, messenger, SensorCapture(capacity)
+    ) as capture:
+        move = asyncio.get_event_loop().create_task(runner.execute(messenger))
+        move.add_done_callback(lambda _: capture.close())
+        stopped = False
+        try:
+            yield capture
+        finally:
+            if not move.done():
+                stopped = True
+                await messenger.send(node_id=mover, message=StopRequest())
+                move.cancel()
+                await asyncio.wait([move])
+        if not stopped:
+            await move
 
-    def _drain() -> Iterator[float]:
-        while True:
-            try:
-                yield output_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
 
-    return list(_drain())
+async def capacitive_pass(
+    messenger: CanMessenger,
+    tool: ProbeTarget,
+    mover: NodeId,
+    distance: float,
+    speed: float,
+    sensor_id: SensorId = SensorId.S0,
+) -> List[float]:
+    """Move the specified axis while capturing capacitive sensor readings."""
+    async with capacitive_capture(
+        messenger, tool, mover, distance, speed, sensor_id
+    ) as capture:
+        await capture.wait_closed()
+    if capture.overwritten:
+        LOG.warning(
+            f"capacitive pass kept the last {len(capture)} of {capture.count} readings"
+        )
+    return cast(List[float], capture.values().tolist())
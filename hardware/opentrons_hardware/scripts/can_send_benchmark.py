@@ -0,0 +1,100 @@
+"""A script to measure the per-frame cost of sending on a CanDriver."""
+import argparse
+import asyncio
+import concurrent.futures
+import time
+from typing import Awaitable, Callable, List
+
+from can import Bus, Message
+
+from opentrons_hardware.drivers.can_bus import CanDriver, CanMessage, ArbitrationId
+
+
+def frames(count: int) -> List[CanMessage]:
+    """Build some move-group sized frames."""
+    return [
+        CanMessage(arbitration_id=ArbitrationId(id=i), data=bytearray(range(20)))
+        for i in range(count)
+    ]
+
+
+async def per_frame_executor(driver: CanDriver, messages: List[CanMessage]) -> None:
+    """Send each frame with its own executor call, as CanDriver used to."""
+    loop = asyncio.get_event_loop()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        for message in messages:
+            m = Message(
+                arbitration_id=message.arbitration_id.id,
+                is_extended_id=True,
+                is_fd=True,
+                data=message.data,
+            )
+            await loop.run_in_executor(executor, driver._bus.send, m)
+
+
+async def send(driver: CanDriver, messages: List[CanMessage]) -> None:
+    """Await CanDriver.send for each frame in turn."""
+    for message in messages:
+        await driver.send(message)
+
+
+async def send_concurrently(driver: CanDriver, messages: List[CanMessage]) -> None:
+    """Call CanDriver.send for every frame at once."""
+    await asyncio.gather(*(driver.send(message) for message in messages))
+
+
+async def send_many(driver: CanDriver, messages: List[CanMessage]) -> None:
+    """Send all the frames with CanDriver.send_many."""
+    await driver.send_many(messages)
+
+
+METHODS: List[Callable[[CanDriver, List[CanMessage]], Awaitable[None]]] = [
+    per_frame_executor,
+    send,
+    send_concurrently,
+    send_many,
+]
+
+
+async def run(count: int, channel: str) -> None:
+    """Benchmark each way of sending."""
+    driver = await CanDriver.build(channel=channel, interface="virtual", bitrate=0)
+    receiver = Bus(channel, interface="virtual")
+    messages = frames(count)
+    try:
+        print(f"{'method':<24}{'us/frame':>12}")
+        for method in METHODS:
+            start = time.perf_counter()
+            await method(driver, messages)
+            elapsed = time.perf_counter() - start
+            while receiver.recv(timeout=0):
+                pass
+            print(f"{method.__name__:<24}{elapsed / count * 1e6:>12.1f}")
+    finally:
+        receiver.shutdown()
+        driver.shutdown()
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Measure the per-frame cost of CanDriver sends."
+    )
+    parser.add_argument(
+        "--count",
+        help="Number of frames to send with each method.",
+        type=int,
+        default=5000,
+    )
+    parser.add_argument(
+        "--channel",
+        help="The virtual can bus channel to send on.",
+        type=str,
+        default="send_benchmark",
+    )
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(run(args.count, args.channel))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""A script to measure how fast a CanMessenger dispatches frames from a socket."""
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+from opentrons_hardware.drivers.can_bus import CanMessenger
+from opentrons_hardware.drivers.can_bus.socket_driver import SocketDriver
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanMessage,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    SensorIdField,
+    SensorTypeField,
+)
+from opentrons_hardware.firmware_bindings.messages.payloads import (
+    EmptyPayload,
+    ReadFromSensorResponsePayload,
+)
+from opentrons_hardware.firmware_bindings.utils import Int32Field, UInt32Field
+
+SENDER = NodeId.pipette_left
+"""The node that floods the bus with sensor readings."""
+
+LISTENER_NODES = [
+    NodeId.gantry_x,
+    NodeId.gantry_y,
+    NodeId.head_l,
+    NodeId.head_r,
+    NodeId.gripper_z,
+    NodeId.gripper_g,
+    NodeId.pipette_right,
+]
+LISTENER_MESSAGES = [
+    MessageId.acknowledgement,
+    MessageId.move_completed,
+    MessageId.read_sensor_response,
+]
+
+
+class Counter:
+    """A listener that counts messages until it has seen enough."""
+
+    def __init__(self, count: int) -> None:
+        """Constructor."""
+        self.remaining = count
+        self.done = asyncio.Event()
+
+    def __call__(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        """Count a message."""
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.done.set()
+
+
+def ignore(message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
+    """A listener for messages that never arrive."""
+    pass
+
+
+def add_listener(
+    messenger: CanMessenger,
+    listener: object,
+    message_id: MessageId,
+    node_id: NodeId,
+    keyed: bool,
+) -> None:
+    """Listen for one message from one node, like an AcknowledgeListener does."""
+    if keyed:
+        messenger.add_listener(
+            listener,  # type: ignore[arg-type]
+            message_ids=[message_id],
+            node_ids=[node_id],
+        )
+    else:
+        messenger.add_listener(
+            listener,  # type: ignore[arg-type]
+            lambda arbitration_id: bool(
+                arbitration_id.parts.message_id == message_id
+                and arbitration_id.parts.originating_node_id == node_id
+            ),
+        )
+
+
+def frame(message_id: MessageId, data: bytes) -> CanMessage:
+    """Build a frame from the sender to the host."""
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=SENDER,
+            )
+        ),
+        data=data,
+    )
+
+
+async def measure(count: int, listeners: int, keyed: bool, wanted: bool) -> float:
+    """Send count sensor readings to a messenger and return frames per second."""
+    connected: "asyncio.Future[SocketDriver]" = asyncio.get_event_loop().create_future()
+
+    def on_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connected.set_result(SocketDriver(reader, writer))
+
+    server = await asyncio.start_server(on_connect, host="127.0.0.1", port=0)
+    assert server.sockets
+    port = server.sockets[0].getsockname()[1]
+    host_driver = await SocketDriver.build("127.0.0.1", port)
+    sender = await connected
+    messenger = CanMessenger(host_driver)
+
+    for i in range(listeners):
+        add_listener(
+            messenger,
+            lambda m, a: ignore(m, a),
+            LISTENER_MESSAGES[i % len(LISTENER_MESSAGES)],
+            LISTENER_NODES[i % len(LISTENER_NODES)],
+            keyed,
+        )
+    # Every run ends with a heartbeat, so unwanted readings can be timed too.
+    counter = Counter(count + 1 if wanted else 1)
+    add_listener(
+        messenger,
+        lambda m, a: counter(m, a),
+        MessageId.heartbeat_response,
+        SENDER,
+        keyed,
+    )
+    if wanted:
+        add_listener(messenger, counter, MessageId.read_sensor_response, SENDER, keyed)
+
+    reading = ReadFromSensorResponsePayload(
+        sensor=SensorTypeField(0),
+        sensor_id=SensorIdField(0),
+        sensor_data=Int32Field(0),
+    )
+    reading.message_index = UInt32Field(0)
+    heartbeat = EmptyPayload()
+    heartbeat.message_index = UInt32Field(0)
+    frames: List[CanMessage] = [
+        frame(MessageId.read_sensor_response, reading.serialize())
+    ] * count + [frame(MessageId.heartbeat_response, heartbeat.serialize())]
+
+    messenger.start()
+    start = time.perf_counter()
+    for f in frames:
+        await sender.send(f)
+    await counter.done.wait()
+    elapsed = time.perf_counter() - start
+
+    await messenger.stop()
+    host_driver.shutdown()
+    sender.shutdown()
+    server.close()
+    await server.wait_closed()
+    return count / elapsed
+
+
+async def run(count: int, listener_counts: List[int], keyed: Optional[bool]) -> None:
+    """Benchmark each number of listeners."""
+    modes = [False, True] if keyed is None else [keyed]
+    print(f"{'listeners':>10}{'registration':>14}{'wanted':>12}{'unwanted':>12}")
+    for listeners in listener_counts:
+        for mode in modes:
+            results = [
+                await measure(count, listeners, mode, wanted)
+                for wanted in (True, False)
+            ]
+            print(
+                f"{listeners:>10}{'keyed' if mode else 'filter':>14}"
+                + "".join(f"{result:>12.0f}" for result in results)
+            )
+    print("(frames/s)")
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Measure CanMessenger dispatch rates over a socket driver."
+    )
+    parser.add_argument(
+        "--count",
+        help="Number of frames to send for each measurement.",
+        type=int,
+        default=20000,
+    )
+    parser.add_argument(
+        "--listeners",
+        help="Numbers of unrelated listeners to register.",
+        type=int,
+        nargs="+",
+        default=[0, 8, 32],
+    )
+    parser.add_argument(
+        "--registration",
+        help="How to register the listeners; by default both ways are measured.",
+        choices=["filter", "keyed"],
+        default=None,
+    )
+    args = parser.parse_args()
+    keyed = None if args.registration is None else args.registration == "keyed"
+    asyncio.get_event_loop().run_until_complete(run(args.count, args.listeners, keyed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""A script to measure the gaps between move groups, with and without streaming.
+
+A simulated node on the other end of a socket driver stores move groups and
+executes them, taking each step's duration. It waits a fixed time for every
+frame it reads, to stand in for the time the frame spends on the bus.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+from numpy import float64
+
+from opentrons_hardware.drivers.can_bus import CanMessenger
+from opentrons_hardware.drivers.can_bus.socket_driver import SocketDriver
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanMessage,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    MotorPositionFlagsField,
+)
+from opentrons_hardware.firmware_bindings.utils import (
+    BinarySerializable,
+    Int32Field,
+    UInt8Field,
+    UInt32Field,
+)
+from opentrons_hardware.hardware_control.constants import interrupts_per_sec
+from opentrons_hardware.hardware_control.motion import (
+    MoveGroups,
+    MoveGroupSingleAxisStep,
+)
+from opentrons_hardware.hardware_control.move_group_runner import MoveGroupRunner
+
+NODE = NodeId.gantry_x
+"""The simulated node that runs every move."""
+
+
+class SimulatedNode:
+    """A node that stores move groups and executes them when asked."""
+
+    def __init__(self, driver: SocketDriver, frame_seconds: float) -> None:
+        """Constructor."""
+        self._driver = driver
+        self._frame_seconds = frame_seconds
+        self._durations: Dict[Tuple[int, int], int] = {}
+        self.execute_times: List[float] = []
+        self.group_done_times: List[float] = []
+
+    async def run(self) -> None:
+        """Handle frames from the host until cancelled."""
+        loop = asyncio.get_event_loop()
+        while True:
+            message = await self._driver.read()
+            await asyncio.sleep(self._frame_seconds)
+            message_id = message.arbitration_id.parts.message_id
+            if message_id == MessageId.clear_all_move_groups_request:
+                self._durations.clear()
+            elif message_id == MessageId.add_move_request:
+                move = payloads.AddLinearMoveRequestPayload.build(message.data)
+                key = (move.group_id.value, move.seq_id.value)
+                self._durations[key] = move.duration.value
+            elif message_id == MessageId.execute_move_group_request:
+                self.execute_times.append(time.perf_counter())
+                execute = payloads.ExecuteMoveGroupRequestPayload.build(message.data)
+                ack = payloads.EmptyPayload()
+                ack.message_index = execute.message_index
+                await self._reply(MessageId.acknowledgement, ack)
+                loop.create_task(self._execute(execute.group_id.value))
+
+    async def _execute(self, group_id: int) -> None:
+        steps = sorted(
+            (seq_id, duration)
+            for (group, seq_id), duration in self._durations.items()
+            if group == group_id
+        )
+        for seq_id, duration in steps:
+            await asyncio.sleep(duration / interrupts_per_sec)
+            await self._reply(
+                MessageId.move_completed,
+                payloads.MoveCompletedPayload(
+                    group_id=UInt8Field(group_id),
+                    seq_id=UInt8Field(seq_id),
+                    current_position_um=UInt32Field(0),
+                    encoder_position_um=Int32Field(0),
+                    position_flags=MotorPositionFlagsField(0),
+                    ack_id=UInt8Field(1),
+                ),
+            )
+        self.group_done_times.append(time.perf_counter())
+
+    async def _reply(self, message_id: MessageId, payload: BinarySerializable) -> None:
+        if payload.message_index.value is None:  # type: ignore[attr-defined]
+            payload.message_index = UInt32Field(0)  # type: ignore[attr-defined]
+        await self._driver.send(
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message_id,
+                        node_id=NodeId.host,
+                        function_code=0,
+                        originating_node_id=NODE,
+                    )
+                ),
+                data=payload.serialize(),
+            )
+        )
+
+
+def move_groups(groups: int, steps: int, step_seconds: float) -> MoveGroups:
+    """Build groups of short moves on the simulated node."""
+    step = MoveGroupSingleAxisStep(
+        distance_mm=float64(1),
+        velocity_mm_sec=float64(1 / step_seconds),
+        duration_sec=float64(step_seconds),
+    )
+    return [[{NODE: step} for _ in range(steps)] for _ in range(groups)]
+
+
+async def measure(
+    streaming: bool, groups: int, steps: int, step_seconds: float, frame_seconds: float
+) -> str:
+    """Run the move groups once and describe how long the node waited."""
+    connected: "asyncio.Future[SocketDriver]" = asyncio.get_event_loop().create_future()
+
+    def on_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connected.set_result(SocketDriver(reader, writer))
+
+    server = await asyncio.start_server(on_connect, host="127.0.0.1", port=0)
+    assert server.sockets
+    port = server.sockets[0].getsockname()[1]
+    host_driver = await SocketDriver.build("127.0.0.1", port)
+    node_driver = await connected
+    node = SimulatedNode(node_driver, frame_seconds)
+    node_task = asyncio.get_event_loop().create_task(node.run())
+    messenger = CanMessenger(host_driver)
+    messenger.start()
+
+    runner = MoveGroupRunner(
+        move_groups(groups, steps, step_seconds), streaming=streaming
+    )
+    start = time.perf_counter()
+    await runner.run(messenger)
+    total = time.perf_counter() - start
+
+    node_task.cancel()
+    await messenger.stop()
+    host_driver.shutdown()
+    node_driver.shutdown()
+    server.close()
+    await server.wait_closed()
+
+    gaps = [
+        (executed - done) * 1000
+        for done, executed in zip(node.group_done_times, node.execute_times[1:])
+    ]
+    first_move = (node.execute_times[0] - start) * 1000
+    return (
+        f"{groups:>8}{'streaming' if streaming else 'baseline':>11}"
+        f"{first_move:>13.1f}{statistics.median(gaps) if gaps else 0:>12.2f}"
+        f"{max(gaps, default=0):>10.2f}{total * 1000:>11.1f}"
+    )
+
+
+async def run(
+    group_counts: List[int], steps: int, step_seconds: float, frame_seconds: float
+) -> None:
+    """Measure each number of groups with and without streaming."""
+    print(
+        f"{'groups':>8}{'mode':>11}{'first move':>13}{'median gap':>12}"
+        f"{'max gap':>10}{'total':>11}"
+    )
+    for groups in group_counts:
+        for streaming in (False, True):
+            print(await measure(streaming, groups, steps, step_seconds, frame_seconds))
+    print("(ms)")
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Measure the gaps between move groups over a socket driver."
+    )
+    parser.add_argument(
+        "--groups",
+        help="Numbers of move groups to run.",
+        type=int,
+        nargs="+",
+        default=[4, 64],
+    )
+    parser.add_argument(
+        "--steps", help="Number of steps in each move group.", type=int, default=16
+    )
+    parser.add_argument(
+        "--step-ms", help="Duration of each step.", type=float, default=2.0
+    )
+    parser.add_argument(
+        "--frame-ms",
+        help="Time the simulated node takes to read each frame.",
+        type=float,
+        default=0.25,
+    )
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(
+        run(args.groups, args.steps, args.step_ms / 1000, args.frame_ms / 1000)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""A script to measure how long MoveManager takes to plan long target lists."""
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import move_manager
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Move,
+    MoveTarget,
+)
+
+AXES = ["X", "Y", "Z", "A", "B", "C"]
+
+PlanFunction = Callable[..., Tuple[bool, List[List[Move[str]]]]]
+
+
+def targets(count: int, seed: int) -> List[MoveTarget[str]]:
+    """Build random targets within a 300 mm cube."""
+    rng = np.random.default_rng(seed)
+    return [
+        MoveTarget.build(
+            {axis: np.float64(v) for axis, v in zip(AXES, rng.uniform(0, 300, 6))},
+            np.float64(200),
+        )
+        for _ in range(count)
+    ]
+
+
+def best_time(
+    plan: PlanFunction, target_list: List[MoveTarget[str]], repeats: int
+) -> float:
+    """Plan the targets repeatedly and return the fastest time."""
+    origin = {axis: np.float64(0) for axis in AXES}
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        plan(origin=origin, target_list=target_list)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(counts: List[int], repeats: int, seed: int) -> None:
+    """Benchmark each target list length with each planner."""
+    constraints = {
+        axis: AxisConstraints.build(
+            max_acceleration=2000,
+            max_speed_discont=20,
+            max_direction_change_speed_discont=10,
+            max_speed=500,
+        )
+        for axis in AXES
+    }
+    manager = move_manager.MoveManager(constraints=constraints)
+    planners: Dict[str, PlanFunction] = {
+        "plan_motion_by_move": manager.plan_motion_by_move,
+        "plan_motion": manager.plan_motion,
+    }
+    print(f"{'targets':>8}" + "".join(f"{name:>22}" for name in planners))
+    for count in counts:
+        target_list = targets(count, seed)
+        print(
+            f"{count:>8}"
+            + "".join(
+                f"{best_time(plan, target_list, repeats) * 1000:>22.1f}"
+                for plan in planners.values()
+            )
+        )
+    print("(ms)")
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Measure MoveManager planning time for long target lists."
+    )
+    parser.add_argument(
+        "--targets",
+        help="Numbers of targets to plan.",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+    )
+    parser.add_argument(
+        "--repeats",
+        help="Plan each target list this many times, and report the fastest.",
+        type=int,
+        default=3,
+    )
+    parser.add_argument(
+        "--seed", help="Seed for the random targets.", type=int, default=0
+    )
+    args = parser.parse_args()
+    run(args.targets, args.repeats, args.seed)
+
+
+if __name__ == "__main__":
+    main()
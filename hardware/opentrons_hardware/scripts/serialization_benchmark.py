@@ -0,0 +1,63 @@
+"""A script to measure how fast CAN payloads are encoded and decoded."""
+import argparse
+import time
+from typing import Callable, List, Type
+
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings.utils import BinarySerializable
+
+PAYLOAD_TYPES: List[Type[BinarySerializable]] = [
+    payloads.AddLinearMoveRequestPayload,
+    payloads.MoveCompletedPayload,
+    payloads.ReadFromSensorResponsePayload,
+    payloads.FirmwareUpdateData,
+]
+
+
+def frames_per_second(func: Callable[[], object], count: int) -> float:
+    """Call func count times and return the calls per second."""
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return count / (time.perf_counter() - start)
+
+
+def run(count: int) -> None:
+    """Benchmark each payload type."""
+    print(
+        f"{'payload':<32}{'serialize':>12}{'pack_into':>12}"
+        f"{'build':>12}{'unpack_from':>12}  (frames/s)"
+    )
+    for payload_type in PAYLOAD_TYPES:
+        data = bytes(payload_type.get_size())
+        payload = payload_type.build(data)
+        buffer = bytearray(64)
+        results = [
+            frames_per_second(payload.serialize, count),
+            frames_per_second(lambda: payload.pack_into(buffer), count),
+            frames_per_second(lambda: payload_type.build(data), count),
+            frames_per_second(lambda: payload_type.unpack_from(buffer), count),
+        ]
+        print(
+            f"{payload_type.__name__:<32}"
+            + "".join(f"{result:>12.0f}" for result in results)
+        )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(
+        description="Measure CAN payload encode and decode rates."
+    )
+    parser.add_argument(
+        "--count",
+        help="Number of times to encode and decode each payload.",
+        type=int,
+        default=100000,
+    )
+    args = parser.parse_args()
+    run(args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -61,6 +61,8 @@ async def run(args: argparse.Namespace) -> None:
             retry_count=retry_count,
             timeout_seconds=timeout_seconds,
             erase=erase,
+            window_size=args.window_size,
+            download_retry_count=args.download_retry_count,
         )
 
     logger.info("Done")
@@ -93,6 +95,19 @@ def main() -> None:
     parser.add_argument(
         "--timeout-seconds", help="Number of seconds to wait.", type=float, default=10
     )
+    parser.add_argument(
+        "--window-size",
+        help="Number of data messages to send before waiting for acknowledgements.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "--download-retry-count",
+        help="Number of times to retransmit an unacknowledged data message. "
+        "Only use this if the bootloader ignores repeated data messages.",
+        type=int,
+        default=0,
+    )
     parser.add_argument(
         "--no-erase",
         help="Don't erase existing application from flash.",
@@ -0,0 +1,124 @@
+"""Fixed-size capture of streamed sensor readings."""
+import asyncio
+from typing import AsyncIterator, Tuple, TYPE_CHECKING, cast
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+DEFAULT_CAPTURE_CAPACITY = 1 << 16
+"""How many readings a capture keeps unless it's told otherwise."""
+
+
+class SensorCapture:
+    """Timestamped sensor readings, kept in a preallocated ring buffer.
+
+    Once the buffer is full, each new reading overwrites the oldest one. The
+    readings that are kept can be read as arrays at any time, or iterated over
+    as they arrive; iteration ends when the capture is closed.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPTURE_CAPACITY) -> None:
+        """Constructor.
+
+        Args:
+            capacity: The most readings to keep.
+        """
+        if capacity < 1:
+            raise ValueError(f"A capture must hold at least one reading: {capacity}")
+        self._capacity = capacity
+        self._timestamps: "NDArray[np.float64]" = np.zeros(capacity, dtype=np.float64)
+        self._values: "NDArray[np.float64]" = np.zeros(capacity, dtype=np.float64)
+        # How many readings have ever been added.
+        self._count = 0
+        self._closed = False
+        self._arrived = asyncio.Event()
+        self._done = asyncio.Event()
+
+    @property
+    def capacity(self) -> int:
+        """The most readings the capture keeps."""
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        """How many readings have been added, including overwritten ones."""
+        return self._count
+
+    @property
+    def overwritten(self) -> int:
+        """How many readings were dropped to make room for newer ones."""
+        return max(0, self._count - self._capacity)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the capture has stopped taking readings."""
+        return self._closed
+
+    def __len__(self) -> int:
+        """How many readings are kept."""
+        return min(self._count, self._capacity)
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Add a reading, overwriting the oldest one if the buffer is full.
+
+        Readings added after the capture is closed are dropped.
+        """
+        if self._closed:
+            return
+        index = self._count % self._capacity
+        self._values[index] = value
+        self._timestamps[index] = timestamp
+        self._count += 1
+        self._arrived.set()
+
+    def close(self) -> None:
+        """Stop taking readings, and end any iteration once it catches up."""
+        self._closed = True
+        self._arrived.set()
+        self._done.set()
+
+    async def wait_closed(self) -> None:
+        """Wait until the capture is closed."""
+        await self._done.wait()
+
+    def values(self) -> "NDArray[np.float64]":
+        """The kept readings, oldest first."""
+        return self._ordered(self._values)
+
+    def timestamps(self) -> "NDArray[np.float64]":
+        """When each of the kept readings arrived, oldest first."""
+        return self._ordered(self._timestamps)
+
+    def _ordered(self, data: "NDArray[np.float64]") -> "NDArray[np.float64]":
+        if self._count <= self._capacity:
+            return cast("NDArray[np.float64]", data[: self._count].copy())
+        start = self._count % self._capacity
+        return cast(
+            "NDArray[np.float64]",
+            np.concatenate(  # type: ignore[no-untyped-call]
+                (data[start:], data[:start])
+            ),
+        )
+
+    def __aiter__(self) -> AsyncIterator[Tuple[float, float]]:
+        """Iterate over (timestamp, value) pairs as they arrive.
+
+        Iteration starts at the oldest reading that's kept. A reader that falls
+        more than a buffer behind skips the readings that were overwritten.
+        """
+        return self._follow()
+
+    async def _follow(self) -> AsyncIterator[Tuple[float, float]]:
+        cursor = 0
+        while True:
+            while cursor < self._count:
+                cursor = max(cursor, self._count - self._capacity)
+                index = cursor % self._capacity
+                yield float(self._timestamps[index]), float(self._values[index])
+                cursor += 1
+            if self._closed:
+                return
+            self._arrived.clear()
+            await self._arrived.wait()
@@ -1,9 +1,10 @@
 """Sensor driver message scheduler."""
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 
-from typing import Optional, TypeVar, Callable, AsyncIterator, List
+from typing import TypeVar, Callable, AsyncIterator, List
 
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
@@ -50,6 +51,7 @@ from opentrons_hardware.firmware_bindings.messages.fields import (
 )
 from opentrons_hardware.sensors.types import SensorDataType
 from opentrons_hardware.sensors.sensor_types import SensorInformation
+from opentrons_hardware.sensors.capture import SensorCapture
 
 from opentrons_hardware.sensors.utils import (
     ReadSensorInformation,
@@ -75,27 +77,6 @@ def _format_sensor_response(response: MessageDefinition) -> SensorDataType:
 class SensorScheduler:
     """Sensor message scheduler."""
 
-    @staticmethod
-    def _create_filter(
-        node_id: Optional[NodeId] = None, message_id: Optional[MessageId] = None
-    ) -> Optional[Callable[[ArbitrationId], bool]]:
-        """Create listener filter by NodeId and MessageId."""
-        if not node_id and not message_id:
-            return None
-
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id) == node_id
-                if node_id
-                else True
-            ) and (
-                MessageId(arbitration_id.parts.message_id) == message_id
-                if message_id
-                else True
-            )
-
-        return _filter
-
     async def run_poll(
         self,
         sensor: PollSensorInformation,
@@ -107,7 +88,8 @@ class SensorScheduler:
         sensor_info = sensor.sensor
         with MultipleMessagesWaitableCallback(
             can_messenger,
-            self._create_filter(sensor_info.node_id, ReadFromSensorResponse.message_id),
+            message_ids=[ReadFromSensorResponse.message_id],
+            node_ids=[sensor_info.node_id],
             number_of_messages=expected_num_messages,
         ) as reader:
             data_list: List[SensorDataType] = []
@@ -167,7 +149,8 @@ class SensorScheduler:
 
         with MultipleMessagesWaitableCallback(
             can_messenger,
-            self._create_filter(sensor_info.node_id, MessageId.read_sensor_response),
+            message_ids=[MessageId.read_sensor_response],
+            node_ids=[sensor_info.node_id],
             number_of_messages=expected_num_messages,
         ) as reader:
             data_list: List[SensorDataType] = []
@@ -208,7 +191,8 @@ class SensorScheduler:
 
         with MultipleMessagesWaitableCallback(
             can_messenger,
-            self._create_filter(node_id, MessageId.read_sensor_response),
+            message_ids=[MessageId.read_sensor_response],
+            node_ids=[node_id],
             number_of_messages=expected_num_messages,
         ) as reader:
             try:
@@ -233,9 +217,8 @@ class SensorScheduler:
 
         with WaitableCallback(
             can_messenger,
-            self._create_filter(
-                sensor_info.node_id, SensorThresholdResponse.message_id
-            ),
+            message_ids=[SensorThresholdResponse.message_id],
+            node_ids=[sensor_info.node_id],
         ) as reader:
             await can_messenger.send(
                 node_id=sensor_info.node_id,
@@ -310,7 +293,8 @@ class SensorScheduler:
         """Send threshold message."""
         with MultipleMessagesWaitableCallback(
             can_messenger,
-            self._create_filter(node_id, PeripheralStatusResponse.message_id),
+            message_ids=[PeripheralStatusResponse.message_id],
+            node_ids=[node_id],
         ) as reader:
             await can_messenger.send(
                 node_id=node_id,
@@ -401,29 +385,58 @@ class SensorScheduler:
     ) -> AsyncIterator["asyncio.Queue[float]"]:
         """While acquired, capture the sensor's logging output."""
         response_queue: "asyncio.Queue[float]" = asyncio.Queue()
+        async with self._report_output(
+            target_sensor, can_messenger, response_queue.put_nowait
+        ):
+            yield response_queue
+
+    @asynccontextmanager
+    async def stream_output(
+        self,
+        target_sensor: SensorInformation,
+        can_messenger: CanMessenger,
+        capture: SensorCapture,
+    ) -> AsyncIterator[SensorCapture]:
+        """While acquired, stream the sensor's logging output into a capture.
+
+        Each reading is timestamped with time.monotonic() when it arrives. The
+        capture is closed on release.
+        """
+        async with self._report_output(
+            target_sensor,
+            can_messenger,
+            lambda value: capture.add(value, time.monotonic()),
+        ):
+            try:
+                yield capture
+            finally:
+                capture.close()
+
+    @asynccontextmanager
+    async def _report_output(
+        self,
+        target_sensor: SensorInformation,
+        can_messenger: CanMessenger,
+        on_reading: Callable[[float], None],
+    ) -> AsyncIterator[None]:
+        """While acquired, bind the sensor to report and handle its readings."""
 
         def _logging_listener(
             message: MessageDefinition, arb_id: ArbitrationId
         ) -> None:
             if isinstance(message, ReadFromSensorResponse):
                 payload = message.payload
-                response_queue.put_nowait(
+                on_reading(
                     SensorDataType.build(payload.sensor_data, payload.sensor).to_float()
                 )
             if isinstance(message, ErrorMessage):
                 log.error(f"Recieved error message {str(message)}")
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id)
-                == target_sensor.node_id
-            ) and (
-                MessageId(arbitration_id.parts.message_id)
-                == MessageId.read_sensor_response
-                or MessageId(arbitration_id.parts.message_id) == MessageId.error_message
-            )
-
-        can_messenger.add_listener(_logging_listener, _filter)
+        can_messenger.add_listener(
+            _logging_listener,
+            message_ids=[MessageId.read_sensor_response, MessageId.error_message],
+            node_ids=[target_sensor.node_id],
+        )
         error = await can_messenger.ensure_send(
             node_id=target_sensor.node_id,
             message=BindSensorOutputRequest(
@@ -441,7 +454,7 @@ class SensorScheduler:
             )
 
         try:
-            yield response_queue
+            yield
         finally:
             can_messenger.remove_listener(_logging_listener)
             error = await can_messenger.ensure_send(
@@ -4,7 +4,7 @@ import asyncio
 from asyncio import Queue
 
 import pytest
-from mock import AsyncMock, Mock
+from mock import AsyncMock, Mock, patch
 
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
@@ -122,6 +122,29 @@ async def test_send(
     )
 
 
+async def test_send_many(subject: CanMessenger, mock_driver: AsyncMock) -> None:
+    """It should hand every message to the driver in one batch, in order."""
+    heartbeat = HeartbeatRequest()
+    await subject.send_many([(NodeId.head, heartbeat), (NodeId.gantry_x, heartbeat)])
+    mock_driver.send_many.assert_called_once_with(
+        messages=[
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=heartbeat.message_id,
+                        node_id=node_id,
+                        function_code=0,
+                        originating_node_id=NodeId.host,
+                    )
+                ),
+                data=heartbeat.payload.serialize(),
+            )
+            for node_id in (NodeId.head, NodeId.gantry_x)
+        ]
+    )
+    mock_driver.send.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "node_id,message",
     [
@@ -491,7 +514,9 @@ async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
     with WaitableCallback(mock_messenger) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback, None)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, None, message_ids=None, node_ids=None
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
 
 
@@ -503,5 +528,112 @@ async def test_waitable_callback_context_with_filter() -> None:
         return False
 
     with WaitableCallback(mock_messenger, some_func) as callback:
-        mock_messenger.add_listener.assert_called_once_with(callback, some_func)
+        mock_messenger.add_listener.assert_called_once_with(
+            callback, some_func, message_ids=None, node_ids=None
+        )
     mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+def _move_group_request_from(node: NodeId) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=MessageId.get_move_group_request,
+                node_id=0,
+                function_code=0,
+                originating_node_id=node,
+            )
+        ),
+        data=b"\x00\x00\x00\x01\1",
+    )
+
+
+async def test_keyed_listeners(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should only call keyed listeners with the messages they listen for."""
+    incoming_messages.put_nowait(_move_group_request_from(NodeId.gantry_x))
+    incoming_messages.put_nowait(_move_group_request_from(NodeId.gantry_y))
+
+    calls: List[str] = []
+    subject.add_listener(lambda m, a: calls.append("any"))
+    subject.add_listener(
+        lambda m, a: calls.append("gantry_y"),
+        message_ids=[MessageId.get_move_group_request],
+        node_ids=[NodeId.gantry_y],
+    )
+    subject.add_listener(
+        lambda m, a: calls.append("any node"),
+        message_ids=[MessageId.get_move_group_request],
+    )
+    subject.add_listener(
+        lambda m, a: calls.append("wrong message"),
+        message_ids=[MessageId.move_completed],
+    )
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    # Listeners are called in the order they were added.
+    assert calls == ["any", "any node", "any", "gantry_y", "any node"]
+
+
+async def test_remove_keyed_listener(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should not call a keyed listener once removed."""
+    incoming_messages.put_nowait(_move_group_request_from(NodeId.gantry_x))
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(listener, message_ids=[MessageId.get_move_group_request])
+    subject.remove_listener(listener)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    listener.assert_not_called()
+
+
+async def test_keyed_listener_repeated_ids(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should call a listener once per message, even if it repeats ids."""
+    incoming_messages.put_nowait(_move_group_request_from(NodeId.gantry_x))
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(
+        listener,
+        message_ids=[MessageId.get_move_group_request] * 2,
+        node_ids=[NodeId.gantry_x, NodeId.gantry_x],
+    )
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    listener.assert_called_once()
+    subject.remove_listener(listener)
+
+
+async def test_unwanted_messages_not_decoded(
+    subject: CanMessenger,
+    incoming_messages: Queue[CanMessage],
+) -> None:
+    """It should not decode a message that no listener wants."""
+    incoming_messages.put_nowait(_move_group_request_from(NodeId.gantry_x))
+    subject.add_listener(
+        Mock(spec=MessageListenerCallback), message_ids=[MessageId.move_completed]
+    )
+
+    with patch.object(
+        MoveGroupRequestPayload, "build", wraps=MoveGroupRequestPayload.build
+    ) as build:
+        subject.start()
+        while not incoming_messages.empty():
+            await asyncio.sleep(0.01)
+        await subject.stop()
+
+    build.assert_not_called()
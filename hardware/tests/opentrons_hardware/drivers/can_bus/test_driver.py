@@ -1,11 +1,14 @@
 """Can Driver tests."""
-from typing import AsyncGenerator
+import asyncio
+from typing import AsyncGenerator, List
 
+import can
 import pytest
 from can import Bus, Message
+from mock import patch
 
 from opentrons_hardware.drivers.can_bus import CanDriver, ArbitrationId, CanMessage
-from opentrons_hardware.drivers.can_bus.errors import ErrorFrameCanError
+from opentrons_hardware.drivers.can_bus.errors import CanError, ErrorFrameCanError
 
 
 @pytest.fixture
@@ -101,3 +104,91 @@ async def test_raise_error_frame_error(subject: CanDriver, can_bus: Bus) -> None
     can_bus.send(m)
     with pytest.raises(ErrorFrameCanError):
         await subject.read()
+
+
+def _numbered_messages(count: int) -> List[CanMessage]:
+    return [
+        CanMessage(arbitration_id=ArbitrationId(id=i), data=bytearray([i]))
+        for i in range(count)
+    ]
+
+
+async def test_send_many(subject: CanDriver, can_bus: Bus) -> None:
+    """It should send all the messages in order."""
+    await subject.send_many(_numbered_messages(50))
+
+    received = [can_bus.recv(timeout=1) for _ in range(50)]
+    assert [m.arbitration_id for m in received] == list(range(50))
+
+
+async def test_send_many_waits_for_room(bus_channel: str, can_bus: Bus) -> None:
+    """It should send more messages than fit in its queue."""
+    subject = CanDriver(
+        bus=Bus(bus_channel, interface="virtual"),
+        loop=asyncio.get_event_loop(),
+        send_queue_size=2,
+    )
+    try:
+        await subject.send_many(_numbered_messages(10))
+    finally:
+        subject.shutdown()
+
+    received = [can_bus.recv(timeout=1) for _ in range(10)]
+    assert [m.arbitration_id for m in received] == list(range(10))
+
+
+async def test_concurrent_sends_are_batched(subject: CanDriver, can_bus: Bus) -> None:
+    """It should hand messages queued together to the bus in one burst."""
+    with patch.object(
+        subject._loop, "run_in_executor", wraps=subject._loop.run_in_executor
+    ) as run_in_executor:
+        await asyncio.gather(*(subject.send(m) for m in _numbered_messages(20)))
+
+    # The first message goes straight to the bus, and the rest wait for it.
+    assert run_in_executor.call_count == 2
+    received = [can_bus.recv(timeout=1) for _ in range(20)]
+    assert [m.arbitration_id for m in received] == list(range(20))
+
+
+async def test_send_many_raises_bus_errors(subject: CanDriver) -> None:
+    """It should raise a send error once the rest of the messages are sent."""
+    error = can.CanError("transmit buffer full")
+    with patch.object(
+        subject._bus, "send", side_effect=[None, error, None]
+    ) as bus_send:
+        with pytest.raises(can.CanError) as raised:
+            await subject.send_many(_numbered_messages(3))
+
+    assert raised.value is error
+    assert bus_send.call_count == 3
+
+
+async def test_shutdown_fails_burst_in_flight(bus_channel: str, can_bus: Bus) -> None:
+    """It should fail the messages it is sending when it is shut down."""
+    subject = CanDriver(
+        bus=Bus(bus_channel, interface="virtual"),
+        loop=asyncio.get_event_loop(),
+    )
+    sending = asyncio.Event()
+    release = asyncio.Event()
+    loop = asyncio.get_event_loop()
+
+    def _blocking_send(*args: object) -> None:
+        loop.call_soon_threadsafe(sending.set)
+        asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+
+    with patch.object(subject._bus, "send", side_effect=_blocking_send):
+        send_task = asyncio.ensure_future(subject.send_many(_numbered_messages(3)))
+        await asyncio.wait_for(sending.wait(), timeout=1)
+        writer = subject._writer
+        assert writer is not None
+        subject.shutdown()
+
+        try:
+            with pytest.raises(CanError, match="shut down"):
+                await asyncio.wait_for(send_task, timeout=1)
+        finally:
+            release.set()
+            await asyncio.wait([writer], timeout=1)
+
+        assert writer.cancelled()
@@ -0,0 +1,124 @@
+"""Tests for BinarySerializable."""
+from dataclasses import dataclass, field
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.utils.binary_serializable import (
+    SerializationException,
+)
+
+
+@dataclass
+class _Payload(utils.BinarySerializable):
+    first: utils.UInt8Field
+    second: utils.Int32Field
+
+
+@dataclass
+class _ExtendedPayload(_Payload):
+    third: utils.UInt16Field
+
+
+@dataclass
+class _LittleEndianPayload(utils.LittleEndianBinarySerializable):
+    first: utils.UInt8Field
+    second: utils.Int32Field
+
+
+@dataclass
+class _PayloadWithIndex(utils.BinarySerializable):
+    value: utils.UInt16Field
+    index: utils.UInt32Field = field(init=False, default=utils.UInt32Field(0))
+
+
+@dataclass
+class _BadPayload(utils.BinarySerializable):
+    value: int
+
+
+def test_serialize() -> None:
+    """It should pack the fields big endian in order."""
+    subject = _Payload(first=utils.UInt8Field(1), second=utils.Int32Field(-2))
+    assert subject.serialize() == b"\x01\xff\xff\xff\xfe"
+    assert _Payload.get_size() == 5
+
+
+def test_serialize_little_endian() -> None:
+    """It should pack the fields little endian in order."""
+    subject = _LittleEndianPayload(
+        first=utils.UInt8Field(1), second=utils.Int32Field(-2)
+    )
+    assert subject.serialize() == b"\x01\xfe\xff\xff\xff"
+
+
+def test_serialize_subclass() -> None:
+    """It should pack the fields of a subclass, not only its parent's."""
+    _Payload.get_size()
+    subject = _ExtendedPayload(
+        first=utils.UInt8Field(1),
+        second=utils.Int32Field(2),
+        third=utils.UInt16Field(3),
+    )
+    assert subject.serialize() == b"\x01\x00\x00\x00\x02\x00\x03"
+    assert _ExtendedPayload.get_size() == 7
+    assert _ExtendedPayload.build(subject.serialize()) == subject
+
+
+def test_serialize_out_of_range() -> None:
+    """It should raise if a value doesn't fit its field."""
+    subject = _Payload(first=utils.UInt8Field(256), second=utils.Int32Field(0))
+    with pytest.raises(SerializationException):
+        subject.serialize()
+
+
+def test_build() -> None:
+    """It should unpack the fields, ignoring extra bytes."""
+    assert _Payload.build(b"\x01\xff\xff\xff\xfe\x00\x00") == _Payload(
+        first=utils.UInt8Field(1), second=utils.Int32Field(-2)
+    )
+
+
+def test_build_too_short() -> None:
+    """It should raise if there aren't enough bytes for all fields."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Payload.build(b"\x01\xff")
+
+
+def test_build_non_init_field() -> None:
+    """It should set fields that aren't constructor arguments after construction."""
+    subject = _PayloadWithIndex(value=utils.UInt16Field(7))
+    subject.index = utils.UInt32Field(9)
+
+    result = _PayloadWithIndex.build(subject.serialize())
+
+    assert result.value == utils.UInt16Field(7)
+    assert result.index == utils.UInt32Field(9)
+
+
+def test_invalid_field() -> None:
+    """It should reject fields that aren't binary fields."""
+    with pytest.raises(utils.InvalidFieldException):
+        _BadPayload.get_size()
+
+
+def test_pack_into_unpack_from() -> None:
+    """It should pack into and unpack from a reusable buffer at an offset."""
+    buffer = bytearray(16)
+    first = _Payload(first=utils.UInt8Field(1), second=utils.Int32Field(-2))
+    second = _Payload(first=utils.UInt8Field(3), second=utils.Int32Field(4))
+
+    offset = first.pack_into(buffer)
+    offset += second.pack_into(buffer, offset)
+
+    assert offset == 10
+    assert bytes(buffer[:offset]) == first.serialize() + second.serialize()
+    assert _Payload.unpack_from(buffer) == first
+    assert _Payload.unpack_from(memoryview(buffer), 5) == second
+
+
+def test_pack_into_too_small() -> None:
+    """It should raise if the buffer is too small."""
+    subject = _Payload(first=utils.UInt8Field(1), second=utils.Int32Field(-2))
+    with pytest.raises(SerializationException):
+        subject.pack_into(bytearray(4))
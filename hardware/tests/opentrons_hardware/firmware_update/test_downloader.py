@@ -1,10 +1,16 @@
 """Tests for the firmware downloader."""
+import asyncio
 import binascii
-from typing import List
+from collections import defaultdict
+from typing import AsyncIterator, Dict, List, Set, cast
 
 import pytest
 from mock import AsyncMock, MagicMock, call
+from opentrons_hardware.drivers.can_bus import CanMessenger
+from opentrons_hardware.drivers.can_bus.can_messenger import WaitableCallback
+from opentrons_hardware.drivers.can_bus.socket_driver import SocketDriver
 from opentrons_hardware.firmware_bindings import (
+    CanMessage,
     NodeId,
     utils,
     ArbitrationId,
@@ -249,6 +255,27 @@ async def test_messaging_data_no_response(
         await subject.run(NodeId.gantry_y_bootloader, mock_hex_processor, 0.5)
 
 
+async def test_wait_data_message_ack_reader_stopped() -> None:
+    """It should time out the awaited data message if the reader stops."""
+
+    async def _no_messages() -> AsyncIterator[None]:
+        return
+        yield
+
+    data_message = FirmwareUpdateData(
+        payload=payloads.FirmwareUpdateData.create(address=0x100, data=b"\x01")
+    )
+
+    with pytest.raises(TimeoutResponse) as raised:
+        await downloader.FirmwareUpdateDownloader._wait_data_message_ack(
+            NodeId.gantry_y_bootloader,
+            cast(WaitableCallback, _no_messages()),
+            data_message,
+        )
+
+    assert raised.value.message is data_message
+
+
 async def test_messaging_complete_no_response(
     subject: downloader.FirmwareUpdateDownloader,
     chunks: List[Chunk],
@@ -284,3 +311,304 @@ async def test_messaging_complete_no_response(
 
     with pytest.raises(TimeoutResponse):
         await subject.run(NodeId.gantry_y_bootloader, mock_hex_processor, 0.5)
+
+
+def _data_ack(
+    can_message_notifier: MockCanMessageNotifier,
+    node_id: NodeId,
+    message: FirmwareUpdateData,
+    error_code: ErrorCode = ErrorCode.ok,
+) -> None:
+    can_message_notifier.notify(
+        FirmwareUpdateDataAcknowledge(
+            payload=payloads.FirmwareUpdateDataAcknowledge(
+                address=message.payload.address,
+                error_code=ErrorCodeField(error_code),
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=FirmwareUpdateDataAcknowledge.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+    )
+
+
+def _complete_ack(
+    can_message_notifier: MockCanMessageNotifier, node_id: NodeId
+) -> None:
+    can_message_notifier.notify(
+        FirmwareUpdateCompleteAcknowledge(
+            payload=payloads.FirmwareUpdateAcknowledge(
+                error_code=ErrorCodeField(ErrorCode.ok)
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=FirmwareUpdateCompleteAcknowledge.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+    )
+
+
+async def test_messaging_windowed(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+    crc32: int,
+) -> None:
+    """It should keep up to window_size data messages in flight."""
+    unacked: List[FirmwareUpdateData] = []
+    max_in_flight = 0
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Acknowledge data messages only once the window is full, newest first."""
+        nonlocal max_in_flight
+        if isinstance(message, FirmwareUpdateData):
+            unacked.append(message)
+            max_in_flight = max(max_in_flight, len(unacked))
+            if len(unacked) == 2 or message.payload.address.value == 0x200:
+                while unacked:
+                    _data_ack(can_message_notifier, node_id, unacked.pop())
+        elif isinstance(message, FirmwareUpdateComplete):
+            _complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    result = await subject.run(
+        NodeId.gantry_y_bootloader, mock_hex_processor, 0.5, window_size=2
+    )
+
+    assert max_in_flight == 2
+    assert result.num_messages == len(chunks)
+    assert result.num_bytes == sum(len(c.data) for c in chunks)
+    assert result.num_retransmits == 0
+    mock_messenger.send.assert_called_with(
+        node_id=NodeId.gantry_y_bootloader,
+        message=FirmwareUpdateComplete(
+            payload=payloads.FirmwareUpdateComplete(
+                num_messages=utils.UInt32Field(len(chunks)),
+                crc32=utils.UInt32Field(crc32),
+            )
+        ),
+    )
+
+
+async def test_messaging_retransmits_unacknowledged_data(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+    crc32: int,
+) -> None:
+    """It should resend data messages that time out or are rejected."""
+    attempts_by_address: Dict[int, int] = defaultdict(int)
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Drop the first ack at 0x100 and reject the first message at 0x200."""
+        if isinstance(message, FirmwareUpdateData):
+            address = message.payload.address.value
+            attempts_by_address[address] += 1
+            if address == 0x100 and attempts_by_address[address] == 1:
+                return
+            if address == 0x200 and attempts_by_address[address] == 1:
+                _data_ack(
+                    can_message_notifier, node_id, message, ErrorCode.bad_checksum
+                )
+                return
+            _data_ack(can_message_notifier, node_id, message)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    result = await subject.run(
+        NodeId.gantry_y_bootloader,
+        mock_hex_processor,
+        0.1,
+        window_size=3,
+        retry_count=1,
+    )
+
+    assert attempts_by_address == {0x000: 1, 0x100: 2, 0x200: 2}
+    assert result.num_messages == len(chunks)
+    assert result.num_retransmits == 2
+    mock_messenger.send.assert_called_with(
+        node_id=NodeId.gantry_y_bootloader,
+        message=FirmwareUpdateComplete(
+            payload=payloads.FirmwareUpdateComplete(
+                num_messages=utils.UInt32Field(len(chunks)),
+                crc32=utils.UInt32Field(crc32),
+            )
+        ),
+    )
+
+
+async def test_messaging_retransmit_limit(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+) -> None:
+    """It should give up on a data message after retry_count retransmits."""
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    with pytest.raises(TimeoutResponse):
+        await subject.run(
+            NodeId.gantry_y_bootloader,
+            mock_hex_processor,
+            0.1,
+            retry_count=2,
+        )
+
+    sent_addresses = [
+        c.kwargs["message"].payload.address.value
+        for c in mock_messenger.send.call_args_list
+    ]
+    assert sent_addresses == [0x000, 0x000, 0x000]
+
+
+class _SimulatedBootloader:
+    """Stores firmware data from the simulated CAN bus, dropping some acks.
+
+    Data messages are acknowledged in reverse order of arrival, in batches
+    of three or whenever the bus goes idle, and the first ack for every
+    fifth address is lost.
+    """
+
+    def __init__(self, driver: SocketDriver, node_id: NodeId) -> None:
+        self.image: Dict[int, bytes] = {}
+        self._driver = driver
+        self._node_id = node_id
+        self._pending: List[FirmwareUpdateData] = []
+        self._dropped: Set[int] = set()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                can_message = await asyncio.wait_for(self._driver.read(), 0.01)
+            except asyncio.TimeoutError:
+                # The bus went idle, so flush any acks being held back.
+                await self._ack_pending()
+                continue
+
+            message_id = can_message.arbitration_id.parts.message_id
+            if message_id == FirmwareUpdateData.message_id:
+                await self._data(can_message)
+            elif message_id == FirmwareUpdateComplete.message_id:
+                await self._ack_pending()
+                await self._complete(can_message)
+
+    async def _data(self, can_message: CanMessage) -> None:
+        data = FirmwareUpdateData(
+            payload=payloads.FirmwareUpdateData.build(can_message.data)
+        )
+        address = data.payload.address.value
+        num_bytes = data.payload.num_bytes.value
+        self.image[address] = bytes(data.payload.data.value[:num_bytes])
+        if address % 5 == 0 and address not in self._dropped:
+            self._dropped.add(address)
+        else:
+            self._pending.append(data)
+        if len(self._pending) >= 3:
+            await self._ack_pending()
+
+    async def _ack_pending(self) -> None:
+        while self._pending:
+            acked = self._pending.pop()
+            await self._reply(
+                FirmwareUpdateDataAcknowledge(
+                    payload=payloads.FirmwareUpdateDataAcknowledge(
+                        address=acked.payload.address,
+                        error_code=ErrorCodeField(ErrorCode.ok),
+                    )
+                )
+            )
+
+    async def _complete(self, can_message: CanMessage) -> None:
+        payload = payloads.FirmwareUpdateComplete.build(can_message.data)
+        crc32 = 0
+        for address in sorted(self.image):
+            crc32 = binascii.crc32(self.image[address], crc32)
+        ok = (
+            payload.num_messages.value == len(self.image)
+            and payload.crc32.value == crc32
+        )
+        await self._reply(
+            FirmwareUpdateCompleteAcknowledge(
+                payload=payloads.FirmwareUpdateAcknowledge(
+                    error_code=ErrorCodeField(
+                        ErrorCode.ok if ok else ErrorCode.bad_checksum
+                    )
+                )
+            )
+        )
+
+    async def _reply(self, message: MessageDefinition) -> None:
+        await self._driver.send(
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message.message_id,
+                        node_id=NodeId.host,
+                        function_code=0,
+                        originating_node_id=self._node_id,
+                    )
+                ),
+                data=message.payload.serialize(),
+            )
+        )
+
+
+async def test_download_over_simulated_can_bus(
+    mock_hex_processor: MagicMock,
+) -> None:
+    """It should download a whole image to a bootloader on a lossy bus."""
+    node_id = NodeId.gantry_y_bootloader
+    chunks = [
+        Chunk(address=i * 48, data=[(i + j) % 256 for j in range(48)])
+        for i in range(40)
+    ]
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    connected: "asyncio.Future[SocketDriver]" = asyncio.get_event_loop().create_future()
+
+    def on_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connected.set_result(SocketDriver(reader, writer))
+
+    server = await asyncio.start_server(on_connect, host="127.0.0.1", port=0)
+    assert server.sockets
+    port = server.sockets[0].getsockname()[1]
+    host_driver = await SocketDriver.build("127.0.0.1", port)
+    bootloader_driver = await connected
+    messenger = CanMessenger(host_driver)
+    messenger.start()
+    bootloader = _SimulatedBootloader(bootloader_driver, node_id)
+    bootloader_task = asyncio.get_event_loop().create_task(bootloader.run())
+
+    try:
+        result = await downloader.FirmwareUpdateDownloader(messenger).run(
+            node_id, mock_hex_processor, 0.2, window_size=8, retry_count=2
+        )
+    finally:
+        bootloader_task.cancel()
+        await messenger.stop()
+        host_driver.shutdown()
+        bootloader_driver.shutdown()
+        server.close()
+        await server.wait_closed()
+
+    assert bootloader.image == {c.address: bytes(c.data) for c in chunks}
+    assert result.num_messages == len(chunks)
+    assert result.num_retransmits == len([c for c in chunks if c.address % 5 == 0])
@@ -1,4 +1,5 @@
 """Tests for hex file processing."""
+from pathlib import Path
 from typing import Iterable, List
 
 import pytest
@@ -257,3 +258,24 @@ def test_process_failure_zero_size(hex_records: Iterable[hex_file.HexRecord]) ->
     subject = hex_file.HexRecordProcessor(records=hex_records)
     with pytest.raises(hex_file.BadChunkSizeException):
         list(subject.process(0))
+
+
+def test_process_again(hex_records: Iterable[hex_file.HexRecord]) -> None:
+    """It should reuse the chunks of a completed pass without re-reading records."""
+    subject = hex_file.HexRecordProcessor(records=iter(hex_records))
+
+    first = list(subject.process(4))
+    second = list(subject.process(4))
+
+    assert second == first
+    assert subject.start_address == 0x8090A0B0
+
+
+def test_from_file_path(tmp_path: Path) -> None:
+    """It should read records from a hex file on disk."""
+    path = tmp_path / "fw.hex"
+    path.write_text(":0400100000010203E6\n:00000001FF\n")
+
+    subject = hex_file.HexRecordProcessor.from_file_path(path)
+
+    assert list(subject.process(4)) == [hex_file.Chunk(address=0x10, data=[0, 1, 2, 3])]
@@ -1,5 +1,8 @@
 """Tests for run module."""
-from typing import Iterator
+import asyncio
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
 
 import mock
 import pytest
@@ -14,8 +17,13 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateDownloader,
     FirmwareUpdateEraser,
     run_update,
+    run_updates,
     HexRecordProcessor,
+    UpdateProgress,
+    UpdateStatus,
 )
+from opentrons_hardware.firmware_update.errors import BootloaderNotReady
+from opentrons_hardware.firmware_update.hex_file import MalformedLineException
 from opentrons_hardware.firmware_update.target import Target
 
 
@@ -70,6 +78,7 @@ async def test_run_update(
         retry_count=12,
         timeout_seconds=11,
         erase=should_erase,
+        window_size=4,
     )
     mock_initiator_run.assert_called_once_with(
         target=target, retry_count=12, ready_wait_time_sec=11
@@ -84,8 +93,135 @@ async def test_run_update(
         node_id=target.bootloader_node,
         hex_processor=mock_hex_record_processor,
         ack_wait_seconds=11,
+        window_size=4,
+        retry_count=0,
     )
     mock_messenger.send.assert_called_once_with(
         node_id=target.bootloader_node, message=FirmwareUpdateStartApp()
     )
     mock_hex_record_builder.assert_called_once_with(mock_hex_file)
+
+
+@pytest.fixture
+def hex_file_path(tmp_path: Path) -> Path:
+    """A firmware image on disk."""
+    path = tmp_path / "fw.hex"
+    path.write_text(":0400100000010203E6\n:00000001FF\n")
+    return path
+
+
+async def test_run_updates(
+    mock_initiator_run: AsyncMock,
+    mock_downloader_run: AsyncMock,
+    mock_eraser_run: AsyncMock,
+    hex_file_path: Path,
+) -> None:
+    """It should update all the nodes concurrently with a shared hex processor."""
+    mock_messenger = AsyncMock()
+    nodes = [NodeId.gantry_x, NodeId.gantry_y]
+    downloading = asyncio.Event()
+    in_progress = 0
+    max_in_progress = 0
+
+    async def download(**kwargs: Any) -> None:
+        nonlocal in_progress, max_in_progress
+        in_progress += 1
+        max_in_progress = max(max_in_progress, in_progress)
+        if in_progress == len(nodes):
+            downloading.set()
+        await asyncio.wait_for(downloading.wait(), 1)
+        in_progress -= 1
+
+    mock_downloader_run.side_effect = download
+    progress: List[UpdateProgress] = []
+
+    with mock.patch.object(
+        HexRecordProcessor, "from_file_path", wraps=HexRecordProcessor.from_file_path
+    ) as from_file_path:
+        results = await run_updates(
+            messenger=mock_messenger,
+            hex_files={node_id: hex_file_path for node_id in nodes},
+            retry_count=12,
+            timeout_seconds=11,
+            window_size=4,
+            download_retry_count=2,
+            progress_callback=progress.append,
+        )
+
+    assert max_in_progress == len(nodes)
+    from_file_path.assert_called_once_with(hex_file_path)
+    processors = {
+        id(c.kwargs["hex_processor"]) for c in mock_downloader_run.call_args_list
+    }
+    assert len(processors) == 1
+    assert all(c.kwargs["retry_count"] == 2 for c in mock_downloader_run.call_args_list)
+    assert results == {
+        node_id: UpdateProgress(node_id=node_id, status=UpdateStatus.done, attempt=1)
+        for node_id in nodes
+    }
+    assert [p.status for p in progress if p.node_id == NodeId.gantry_x] == [
+        UpdateStatus.queued,
+        UpdateStatus.initializing,
+        UpdateStatus.erasing,
+        UpdateStatus.downloading,
+        UpdateStatus.restarting,
+        UpdateStatus.done,
+    ]
+    for node_id in nodes:
+        target = Target(system_node=node_id)
+        mock_initiator_run.assert_any_call(
+            target=target, retry_count=12, ready_wait_time_sec=11
+        )
+        mock_eraser_run.assert_any_call(node_id=target.bootloader_node, timeout_sec=11)
+        mock_messenger.send.assert_any_call(
+            node_id=target.bootloader_node, message=FirmwareUpdateStartApp()
+        )
+
+
+async def test_run_updates_isolates_failures(
+    mock_initiator_run: AsyncMock,
+    mock_downloader_run: AsyncMock,
+    mock_eraser_run: AsyncMock,
+    hex_file_path: Path,
+    tmp_path: Path,
+) -> None:
+    """It should retry and fail nodes without affecting the others."""
+    mock_messenger = AsyncMock()
+    bad_hex_file_path = tmp_path / "bad.hex"
+    bad_hex_file_path.write_text("not a hex file\n")
+    erase_attempts: Dict[NodeId, int] = defaultdict(int)
+
+    async def erase(node_id: NodeId, timeout_sec: float) -> None:
+        erase_attempts[node_id] += 1
+        if node_id == NodeId.gantry_x_bootloader:
+            raise BootloaderNotReady()
+        if node_id == NodeId.gantry_y_bootloader and erase_attempts[node_id] == 1:
+            raise BootloaderNotReady()
+
+    mock_eraser_run.side_effect = erase
+
+    results = await run_updates(
+        messenger=mock_messenger,
+        hex_files={
+            NodeId.gantry_x: hex_file_path,
+            NodeId.gantry_y: hex_file_path,
+            NodeId.head: hex_file_path,
+            NodeId.gripper: bad_hex_file_path,
+        },
+        retry_count=1,
+        timeout_seconds=1,
+        attempts=2,
+    )
+
+    assert results[NodeId.gantry_x].status == UpdateStatus.failed
+    assert results[NodeId.gantry_x].attempt == 2
+    assert isinstance(results[NodeId.gantry_x].error, BootloaderNotReady)
+    assert results[NodeId.gantry_y] == UpdateProgress(
+        node_id=NodeId.gantry_y, status=UpdateStatus.done, attempt=2
+    )
+    assert results[NodeId.head] == UpdateProgress(
+        node_id=NodeId.head, status=UpdateStatus.done, attempt=1
+    )
+    assert results[NodeId.gripper].status == UpdateStatus.failed
+    assert isinstance(results[NodeId.gripper].error, MalformedLineException)
+    assert mock_downloader_run.call_count == 2
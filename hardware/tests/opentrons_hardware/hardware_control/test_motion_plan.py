@@ -1,5 +1,6 @@
 """Tests for motion planning."""
 import numpy as np
+import pytest
 from hypothesis import given, assume, strategies as st
 from hypothesis.extra import numpy as hynp
 from typing import Iterator, List
@@ -10,6 +11,7 @@ from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     MoveTarget,
     SystemConstraints,
+    ZeroLengthMoveError,
     vectorize,
 )
 
@@ -188,3 +190,77 @@ def test_close_move_plan(
     )
 
     assert converged
+
+
+@given(
+    x_constraint=generate_axis_constraint(),
+    y_constraint=generate_axis_constraint(),
+    z_constraint=generate_axis_constraint(),
+    a_constraint=generate_axis_constraint(),
+    b_constraint=generate_axis_constraint(),
+    c_constraint=generate_axis_constraint(),
+    origin=generate_coordinates(),
+    data=st.data(),
+    close=st.booleans(),
+    iteration_limit=st.integers(min_value=1, max_value=20),
+)
+def test_plan_motion_matches_plan_motion_by_move(
+    x_constraint: AxisConstraints,
+    y_constraint: AxisConstraints,
+    z_constraint: AxisConstraints,
+    a_constraint: AxisConstraints,
+    b_constraint: AxisConstraints,
+    c_constraint: AxisConstraints,
+    origin: Coordinates[str, np.float64],
+    data: st.DataObject,
+    close: bool,
+    iteration_limit: int,
+) -> None:
+    """Planning all moves at once should give exactly the move-by-move plan."""
+    if close:
+        targets = data.draw(generate_close_target_list(origin))
+    else:
+        targets = data.draw(generate_target_list())
+        assume(reject_close_coordinates(origin, targets[0].position))
+    constraints: SystemConstraints[str] = {
+        "X": x_constraint,
+        "Y": y_constraint,
+        "Z": z_constraint,
+        "A": a_constraint,
+        "B": b_constraint,
+        "C": c_constraint,
+    }
+    manager = move_manager.MoveManager(constraints=constraints)
+
+    expected = manager.plan_motion_by_move(
+        origin=origin, target_list=targets, iteration_limit=iteration_limit
+    )
+    result = manager.plan_motion(
+        origin=origin, target_list=targets, iteration_limit=iteration_limit
+    )
+
+    assert result == expected
+
+
+def test_plan_motion_rejects_zero_length_move() -> None:
+    """A repeated target should fail planning like it does move-by-move."""
+    constraints: SystemConstraints[str] = {
+        axis: AxisConstraints.build(
+            max_acceleration=1000,
+            max_speed_discont=20,
+            max_direction_change_speed_discont=10,
+            max_speed=500,
+        )
+        for axis in ["X", "Y"]
+    }
+    manager = move_manager.MoveManager(constraints=constraints)
+    origin = {"X": np.float64(0), "Y": np.float64(0)}
+    targets = [
+        MoveTarget.build({"X": np.float64(10), "Y": np.float64(5)}, np.float64(100)),
+        MoveTarget.build({"X": np.float64(10), "Y": np.float64(5)}, np.float64(100)),
+    ]
+
+    with pytest.raises(ZeroLengthMoveError):
+        manager.plan_motion_by_move(origin=origin, target_list=targets)
+    with pytest.raises(ZeroLengthMoveError):
+        manager.plan_motion(origin=origin, target_list=targets)
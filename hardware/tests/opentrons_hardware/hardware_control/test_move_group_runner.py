@@ -1,6 +1,7 @@
 """Tests for the move scheduler."""
 import pytest
-from typing import List, Any, Tuple
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple
 from numpy import float64, float32, int32
 from mock import AsyncMock, call, MagicMock
 import asyncio
@@ -35,6 +36,7 @@ from opentrons_hardware.hardware_control.motion import (
 )
 from opentrons_hardware.hardware_control.move_group_runner import (
     MoveGroupRunner,
+    MoveGroupTimeout,
     MoveScheduler,
     _CompletionPacket,
 )
@@ -76,6 +78,17 @@ def mock_can_messenger() -> AsyncMock:
     return AsyncMock()
 
 
+def _sent_calls(mock_can_messenger: AsyncMock) -> List[Any]:
+    """Every message sent with send or send_many, as a call to send."""
+    calls = list(mock_can_messenger.send.call_args_list)
+    for send_many_call in mock_can_messenger.send_many.call_args_list:
+        calls.extend(
+            call(node_id=node_id, message=message)
+            for node_id, message in send_many_call.args[0]
+        )
+    return calls
+
+
 @pytest.fixture
 def move_group_single() -> MoveGroups:
     """Move group with one move."""
@@ -247,7 +260,7 @@ async def test_home(
     await subject.prep(can_messenger=mock_can_messenger)
     step = move_group_home_single[0][0].get(NodeId.head)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
+    assert call(
         node_id=NodeId.head,
         message=HomeRequest(
             payload=HomeRequestPayload(
@@ -257,7 +270,7 @@ async def test_home(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in _sent_calls(mock_can_messenger)
 
 
 async def test_single_send_setup_commands(
@@ -268,7 +281,7 @@ async def test_single_send_setup_commands(
     await subject.prep(can_messenger=mock_can_messenger)
     step = move_group_single[0][0].get(NodeId.head)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
+    assert call(
         node_id=NodeId.head,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -280,7 +293,7 @@ async def test_single_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in _sent_calls(mock_can_messenger)
 
 
 async def test_multi_send_setup_commands(
@@ -293,7 +306,7 @@ async def test_multi_send_setup_commands(
     # Group 0
     step = move_group_multiple[0][0].get(NodeId.head)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
+    assert call(
         node_id=NodeId.head,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -305,12 +318,12 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in _sent_calls(mock_can_messenger)
 
     # Group 1
     step = move_group_multiple[1][0].get(NodeId.gantry_x)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
+    assert call(
         node_id=NodeId.gantry_x,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -322,11 +335,11 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in _sent_calls(mock_can_messenger)
 
     step = move_group_multiple[1][0].get(NodeId.gantry_y)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
+    assert call(
         node_id=NodeId.gantry_y,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -338,12 +351,12 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in _sent_calls(mock_can_messenger)
 
     # Group 2
     step = move_group_multiple[2][0].get(NodeId.pipette_left)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
+    assert call(
         node_id=NodeId.pipette_left,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -355,11 +368,11 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in _sent_calls(mock_can_messenger)
 
     step = move_group_multiple[2][1].get(NodeId.pipette_left)
     assert isinstance(step, MoveGroupSingleAxisStep)
-    mock_can_messenger.send.assert_any_call(
+    assert call(
         node_id=NodeId.pipette_left,
         message=AddLinearMoveRequest(
             payload=AddLinearMoveRequestPayload(
@@ -371,7 +384,25 @@ async def test_multi_send_setup_commands(
                 duration=UInt32Field(calc_duration(step)),
             )
         ),
-    )
+    ) in _sent_calls(mock_can_messenger)
+
+
+async def test_setup_commands_sent_in_one_batch(
+    mock_can_messenger: AsyncMock, move_group_multiple: MoveGroups
+) -> None:
+    """It should send the set up commands of every group with one send_many."""
+    subject = MoveGroupRunner(move_groups=move_group_multiple)
+    await subject.prep(can_messenger=mock_can_messenger)
+    mock_can_messenger.send_many.assert_called_once()
+    assert [
+        (node_id, message.payload.group_id.value, message.payload.seq_id.value)
+        for node_id, message in mock_can_messenger.send_many.call_args.args[0]
+    ] == [
+        (node, group_id, seq_id)
+        for group_id, group in enumerate(move_group_multiple)
+        for seq_id, sequence in enumerate(group)
+        for node in sequence
+    ]
 
 
 async def test_move() -> None:
@@ -950,3 +981,189 @@ async def test_groups_from_nonzero_index(
             )
         ]
     )
+
+
+def _linear_step(distance: float) -> MoveGroupSingleAxisStep:
+    return MoveGroupSingleAxisStep(
+        distance_mm=float64(distance),
+        velocity_mm_sec=float64(distance * 2),
+        duration_sec=float64(0.5),
+    )
+
+
+@pytest.fixture
+def move_group_stream() -> MoveGroups:
+    """More move groups than there are streaming slots, of different shapes."""
+    return [
+        [
+            {NodeId.gantry_x: _linear_step(10), NodeId.gantry_y: _linear_step(20)},
+            {NodeId.gantry_x: _linear_step(5)},
+        ],
+        [{NodeId.head: _linear_step(30)}],
+        [{NodeId.gantry_y: _linear_step(-4)}],
+        [{NodeId.head: _linear_step(-10)}, {NodeId.head: _linear_step(-10)}],
+        [{NodeId.gantry_x: _linear_step(1)}],
+    ]
+
+
+class MockSlottedMoveNodes:
+    """Side effect mock of CanMessenger that acts like nodes storing move groups.
+
+    Executing a group runs every step stored under its id, including any left
+    over from a group that was sent with the same id before.
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self._steps: Dict[Tuple[int, int, NodeId], AddLinearMoveRequest] = {}
+        self._positions: Dict[NodeId, float] = defaultdict(float)
+        self._listeners: List[MessageListenerCallback] = []
+        self.executed: List[int] = []
+        # The number of the execute request that the nodes ignore, if any.
+        self.stall_at: Optional[int] = None
+
+    def add_listener(
+        self, listener: MessageListenerCallback, *args: Any, **kwargs: Any
+    ) -> None:
+        """Mock add_listener function."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: MessageListenerCallback) -> None:
+        """Mock remove_listener function."""
+        self._listeners.remove(listener)
+
+    def position(self, node: NodeId) -> float:
+        """The position of a node in mm."""
+        return self._positions[node]
+
+    async def mock_send(self, node_id: NodeId, message: MessageDefinition) -> None:
+        """Mock send function."""
+        if isinstance(message, md.ClearAllMoveGroupsRequest):
+            self._steps.clear()
+        elif isinstance(message, AddLinearMoveRequest):
+            key = (message.payload.group_id.value, message.payload.seq_id.value)
+            self._steps[key + (node_id,)] = message
+        elif isinstance(message, md.ExecuteMoveGroupRequest):
+            self._execute(message.payload.group_id.value)
+
+    async def mock_send_many(
+        self, messages: List[Tuple[NodeId, MessageDefinition]]
+    ) -> None:
+        """Mock send_many function."""
+        for node_id, message in messages:
+            await self.mock_send(node_id, message)
+
+    async def mock_ensure_send(
+        self,
+        node_id: NodeId,
+        message: MessageDefinition,
+        timeout: float = 3,
+        expected_nodes: List[NodeId] = [],
+    ) -> ErrorCode:
+        """Mock ensure_send function."""
+        await self.mock_send(node_id, message)
+        return ErrorCode.ok
+
+    def _execute(self, group_id: int) -> None:
+        self.executed.append(group_id)
+        if len(self.executed) - 1 == self.stall_at:
+            return
+        for (group, seq, node), message in sorted(self._steps.items()):
+            if group != group_id:
+                continue
+            self._positions[node] += (
+                message.payload.velocity.value
+                / (2**31)
+                * message.payload.duration.value
+            )
+            payload = MoveCompletedPayload(
+                group_id=UInt8Field(group),
+                seq_id=UInt8Field(seq),
+                current_position_um=UInt32Field(
+                    int(round(self._positions[node] * 1000))
+                ),
+                encoder_position_um=Int32Field(0),
+                position_flags=MotorPositionFlagsField(0),
+                ack_id=UInt8Field(1),
+            )
+            arbitration_id = ArbitrationId(
+                parts=ArbitrationIdParts(originating_node_id=node)
+            )
+            for listener in list(self._listeners):
+                listener(md.MoveCompleted(payload=payload), arbitration_id)
+
+
+@pytest.fixture
+def mock_slotted_nodes(mock_can_messenger: AsyncMock) -> MockSlottedMoveNodes:
+    """Nodes that store and execute move groups by group id."""
+    nodes = MockSlottedMoveNodes()
+    mock_can_messenger.send.side_effect = nodes.mock_send
+    mock_can_messenger.send_many.side_effect = nodes.mock_send_many
+    mock_can_messenger.ensure_send.side_effect = nodes.mock_ensure_send
+    mock_can_messenger.add_listener = MagicMock(side_effect=nodes.add_listener)
+    mock_can_messenger.remove_listener = MagicMock(side_effect=nodes.remove_listener)
+    return nodes
+
+
+async def test_streaming_prep_sends_first_slots(
+    mock_can_messenger: AsyncMock, move_group_stream: MoveGroups
+) -> None:
+    """Streaming prep should only send the groups that fit in the slots."""
+    subject = MoveGroupRunner(move_groups=move_group_stream, streaming=True)
+    await subject.prep(can_messenger=mock_can_messenger)
+    sent = [
+        (c.kwargs["node_id"], c.kwargs["message"].payload.group_id.value)
+        for c in _sent_calls(mock_can_messenger)
+        if isinstance(c.kwargs["message"], AddLinearMoveRequest)
+    ]
+    assert sent == [
+        (NodeId.gantry_x, 0),
+        (NodeId.gantry_y, 0),
+        (NodeId.gantry_x, 0),
+        (NodeId.head, 1),
+    ]
+
+
+async def test_streaming_move(
+    mock_can_messenger: AsyncMock,
+    mock_slotted_nodes: MockSlottedMoveNodes,
+    move_group_stream: MoveGroups,
+) -> None:
+    """Streamed groups should run in order through two reused group ids."""
+    subject = MoveGroupRunner(
+        move_groups=move_group_stream, start_at_index=2, streaming=True
+    )
+    position = await subject.run(can_messenger=mock_can_messenger)
+    assert mock_slotted_nodes.executed == [2, 3, 2, 3, 2]
+    # steps left in a slot by an earlier group must not move anything again
+    assert mock_slotted_nodes.position(NodeId.gantry_x) == pytest.approx(16, abs=0.01)
+    assert mock_slotted_nodes.position(NodeId.gantry_y) == pytest.approx(16, abs=0.01)
+    assert mock_slotted_nodes.position(NodeId.head) == pytest.approx(10, abs=0.01)
+    assert {node: pos[0] for node, pos in position.items()} == pytest.approx(
+        {NodeId.gantry_x: 16, NodeId.gantry_y: 16, NodeId.head: 10}, abs=0.01
+    )
+
+
+async def test_streaming_move_timeout(
+    mock_can_messenger: AsyncMock,
+    mock_slotted_nodes: MockSlottedMoveNodes,
+    move_group_stream: MoveGroups,
+) -> None:
+    """A streamed group that times out should stop the run."""
+    mock_slotted_nodes.stall_at = 1
+    subject = MoveGroupRunner(move_groups=move_group_stream, streaming=True)
+    with pytest.raises(MoveGroupTimeout):
+        await subject.run(can_messenger=mock_can_messenger)
+    assert mock_slotted_nodes.executed == [0, 1]
+
+
+def test_streaming_rejects_leftover_gripper_moves(
+    move_group_gripper_multiple: MoveGroups,
+) -> None:
+    """Only stepper moves can be cleared out of a reused slot."""
+    with pytest.raises(ValueError):
+        MoveGroupRunner(
+            move_groups=move_group_gripper_multiple[:1]
+            + [[{NodeId.gantry_x: _linear_step(1)}]] * 2,
+            streaming=True,
+        )
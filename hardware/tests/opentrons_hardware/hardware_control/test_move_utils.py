@@ -488,6 +488,40 @@ def test_handle_rounding_error_when_calculating_block_final_speed() -> None:
     assert b.time
 
 
+def test_build_precomputed() -> None:
+    """Precomputed blocks and moves should equal the ones built normally."""
+    blocks = (
+        Block(distance=10, initial_speed=0, acceleration=100),
+        Block(distance=20, initial_speed=np.sqrt(2000), acceleration=0),
+        Block(distance=0, initial_speed=np.sqrt(2000), acceleration=0),
+    )
+    move = Move.build(
+        unit_vector={"X": 0.6, "Y": 0.8},
+        distance=30,
+        max_speed=np.sqrt(2000),
+        blocks=blocks,
+    )
+    precomputed = Move.build_precomputed(
+        unit_vector=move.unit_vector,
+        distance=move.distance,
+        max_speed=move.max_speed,
+        blocks=tuple(  # type: ignore[arg-type]
+            Block.build_precomputed(
+                distance=block.distance,
+                initial_speed=block.initial_speed,
+                acceleration=block.acceleration,
+                final_speed=block.final_speed,
+                time=block.time,
+            )
+            for block in blocks
+        ),
+        initial_speed=move.initial_speed,
+        final_speed=move.final_speed,
+        nonzero_blocks=move.nonzero_blocks,
+    )
+    assert precomputed == move
+
+
 def test_blend_motion() -> None:
     """Motion should blend."""
     manager = MoveManager(CONSTRAINTS)
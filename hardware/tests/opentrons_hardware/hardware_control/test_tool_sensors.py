@@ -9,6 +9,7 @@ from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     MoveCompleted,
     ReadFromSensorResponse,
     Acknowledgement,
+    StopRequest,
 )
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
 from opentrons_hardware.firmware_bindings.messages.payloads import (
@@ -34,6 +35,7 @@ from tests.conftest import CanLoopback
 from opentrons_hardware.hardware_control.tool_sensors import (
     capacitive_probe,
     capacitive_pass,
+    capacitive_capture,
     ProbeTarget,
 )
 from opentrons_hardware.firmware_bindings.constants import (
@@ -242,3 +244,54 @@ async def test_capacitive_sweep(
         mock_messenger, target_node, motor_node, distance, speed
     )
     assert result == list(range(10))
+
+
+async def test_capacitive_capture_stops_early(
+    mock_messenger: AsyncMock,
+    message_send_loopback: CanLoopback,
+) -> None:
+    """Test that leaving a capture before the move is done stops the mover."""
+
+    def move_responder(
+        node_id: NodeId, message: MessageDefinition
+    ) -> List[Tuple[NodeId, MessageDefinition, NodeId]]:
+        message.payload.serialize()
+        if isinstance(message, ExecuteMoveGroupRequest):
+            ack_payload = EmptyPayload()
+            ack_payload.message_index = message.payload.message_index
+            # The move never completes on its own.
+            responses: List[Tuple[NodeId, MessageDefinition, NodeId]] = [
+                (NodeId.host, Acknowledgement(payload=ack_payload), NodeId.head_l)
+            ]
+            for i in range(10):
+                responses.append(
+                    (
+                        NodeId.host,
+                        ReadFromSensorResponse(
+                            payload=ReadFromSensorResponsePayload(
+                                sensor=SensorTypeField(SensorType.capacitive.value),
+                                sensor_id=SensorIdField(SensorId.S0),
+                                sensor_data=Int32Field(i << 16),
+                            )
+                        ),
+                        NodeId.pipette_left,
+                    )
+                )
+            return responses
+        else:
+            return []
+
+    message_send_loopback.add_responder(move_responder)
+
+    seen: List[float] = []
+    async with capacitive_capture(
+        mock_messenger, NodeId.pipette_left, NodeId.head_l, 10, 1
+    ) as capture:
+        async for _, value in capture:
+            seen.append(value)
+            if value >= 3:
+                break
+    assert seen == [0, 1, 2, 3]
+    assert capture.closed
+    assert capture.values().tolist() == list(range(10))
+    mock_messenger.send.assert_any_call(node_id=NodeId.head_l, message=StopRequest())
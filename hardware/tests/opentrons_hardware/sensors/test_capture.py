@@ -0,0 +1,73 @@
+"""Tests for sensor captures."""
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from opentrons_hardware.sensors.capture import SensorCapture
+
+
+def test_capture_keeps_readings_in_order() -> None:
+    """Readings come back oldest first, with their timestamps."""
+    subject = SensorCapture(capacity=4)
+    for i in range(3):
+        subject.add(float(i), timestamp=10.0 + i)
+    assert len(subject) == 3
+    assert subject.values().tolist() == [0, 1, 2]
+    assert subject.timestamps().tolist() == [10, 11, 12]
+    assert subject.overwritten == 0
+
+
+def test_capture_overwrites_oldest() -> None:
+    """A full capture drops its oldest readings."""
+    subject = SensorCapture(capacity=4)
+    for i in range(10):
+        subject.add(float(i), timestamp=float(i))
+    assert len(subject) == 4
+    assert subject.count == 10
+    assert subject.overwritten == 6
+    assert subject.values().tolist() == [6, 7, 8, 9]
+    assert subject.timestamps().tolist() == [6, 7, 8, 9]
+
+
+def test_capture_rejects_empty_buffer() -> None:
+    """A capture has to hold something."""
+    with pytest.raises(ValueError):
+        SensorCapture(capacity=0)
+
+
+def test_closed_capture_drops_readings() -> None:
+    """Nothing is added after a capture is closed."""
+    subject = SensorCapture(capacity=4)
+    subject.add(1.0, timestamp=0.0)
+    subject.close()
+    subject.add(2.0, timestamp=1.0)
+    assert subject.values().tolist() == [1]
+
+
+async def test_iterate_while_capturing() -> None:
+    """Iteration yields readings as they arrive and ends on close."""
+    subject = SensorCapture(capacity=4)
+    received: List[Tuple[float, float]] = []
+
+    async def _read() -> None:
+        async for reading in subject:
+            received.append(reading)
+
+    reader = asyncio.get_event_loop().create_task(_read())
+    for i in range(3):
+        subject.add(float(i), timestamp=float(i) / 10)
+        await asyncio.sleep(0)
+    assert received == [(0.0, 0.0), (0.1, 1.0), (0.2, 2.0)]
+    assert not reader.done()
+    subject.close()
+    await asyncio.wait_for(reader, 1)
+
+
+async def test_slow_iteration_skips_overwritten() -> None:
+    """A reader that falls a buffer behind picks up at the oldest kept reading."""
+    subject = SensorCapture(capacity=4)
+    for i in range(10):
+        subject.add(float(i), timestamp=float(i))
+    subject.close()
+    assert [value async for _, value in subject] == [6, 7, 8, 9]
@@ -4,6 +4,7 @@ import mock
 import asyncio
 from typing import Iterator
 from opentrons_hardware.sensors import scheduler, sensor_types
+from opentrons_hardware.sensors.capture import SensorCapture
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
     SensorId,
@@ -101,3 +102,43 @@ async def test_capture_output(
 
     for index, value in enumerate(_drain()):
         assert value == index
+
+
+async def test_stream_output(
+    mock_messenger: mock.AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """Test that readings are streamed into a capture."""
+    subject = scheduler.SensorScheduler()
+    async with subject.stream_output(
+        sensor_types.SensorInformation(
+            sensor_type=SensorType.capacitive,
+            sensor_id=SensorId.S0,
+            node_id=NodeId.pipette_left,
+        ),
+        mock_messenger,
+        SensorCapture(capacity=8),
+    ) as capture:
+        for i in range(10):
+            can_message_notifier.notify(
+                ReadFromSensorResponse(
+                    payload=ReadFromSensorResponsePayload(
+                        sensor=SensorTypeField(SensorType.capacitive.value),
+                        sensor_id=SensorIdField(SensorId.S0),
+                        sensor_data=Int32Field(i << 16),
+                    )
+                ),
+                ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=ReadFromSensorResponse.message_id,
+                        node_id=NodeId.host,
+                        originating_node_id=NodeId.pipette_left,
+                        function_code=0,
+                    )
+                ),
+            )
+        assert not capture.closed
+    assert capture.closed
+    assert capture.count == 10
+    assert capture.values().tolist() == list(range(2, 10))
+    assert (capture.timestamps()[1:] >= capture.timestamps()[:-1]).all()
@@ -13,7 +13,13 @@ from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.settings import get_settings
 
 from .database import create_sql_engine, sqlite_rowid
-from .tables import protocol_table, analysis_table, run_table, action_table
+from .tables import (
+    protocol_table,
+    analysis_table,
+    run_table,
+    action_table,
+    run_command_table,
+)
 
 _sql_engine_accessor = AppStateAccessor[sqlalchemy.engine.Engine]("sql_engine")
 _persistence_directory_accessor = AppStateAccessor[Path]("persistence_directory")
@@ -117,6 +123,7 @@ __all__ = [
     "analysis_table",
     "run_table",
     "action_table",
+    "run_command_table",
     # database utilities and helpers
     "sqlite_rowid",
 ]
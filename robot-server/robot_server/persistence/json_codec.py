@@ -0,0 +1,85 @@
+"""Serialize Pydantic models to compact, versioned blobs for the database.
+
+Each blob starts with a short format tag, followed by the model's
+zlib-compressed JSON.
+
+Blobs that don't start with a known format tag are assumed to have been
+pickled by older robot-server versions, and are read with `legacy_pickle`.
+"""
+import json
+import zlib
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel, parse_obj_as
+from typing_extensions import Final, get_args
+
+from opentrons.protocol_engine.commands import Command
+
+from . import legacy_pickle
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Pickled data always starts with the PROTO opcode (b"\x80"),
+# so it can't be mistaken for this tag.
+_FORMAT_ZLIB_JSON_V1: Final = b"OTJ1"
+
+# Favor encode speed; higher levels barely shrink typical analyses further.
+_COMPRESSION_LEVEL: Final = 1
+
+_command_models_by_type: Dict[str, Type[BaseModel]] = {
+    model.__fields__["commandType"].default: model for model in get_args(Command)
+}
+
+
+def dumps(model: BaseModel) -> bytes:
+    """Serialize a Pydantic model into a blob for the database."""
+    return _FORMAT_ZLIB_JSON_V1 + zlib.compress(
+        model.json().encode("utf-8"), _COMPRESSION_LEVEL
+    )
+
+
+def loads(data: bytes, model_type: Type[_ModelT]) -> _ModelT:
+    """Deserialize a blob from the database into a Pydantic model.
+
+    Args:
+        data: A blob returned by `dumps()`, or a pickled dict
+            stored by an older robot-server version.
+        model_type: The Pydantic model to parse the data as.
+    """
+    return model_type.parse_obj(loads_obj(data))
+
+
+def loads_obj(data: bytes) -> Any:
+    """Deserialize a blob from the database without parsing it into a model.
+
+    This is for callers that need to parse parts of the data specially,
+    like with `parse_command()`.
+    """
+    if is_legacy(data):
+        return legacy_pickle.loads(data)
+
+    return json.loads(zlib.decompress(data[len(_FORMAT_ZLIB_JSON_V1) :]))
+
+
+def is_legacy(data: bytes) -> bool:
+    """Return whether the blob was pickled by an older robot-server version."""
+    return not data.startswith(_FORMAT_ZLIB_JSON_V1)
+
+
+def parse_command(obj: Any) -> Command:
+    """Parse a command, validating it against only the model for its `commandType`.
+
+    Parsing directly into the `Command` union makes Pydantic try each member
+    in turn, which is an order of magnitude slower for commands near the end
+    of the union.
+    """
+    command_type = obj.get("commandType") if isinstance(obj, dict) else None
+    model = (
+        _command_models_by_type.get(command_type)
+        if isinstance(command_type, str)
+        else None
+    )
+    if model is None:
+        return parse_obj_as(Command, obj)  # type: ignore[arg-type]
+    return model.parse_obj(obj)  # type: ignore[return-value]
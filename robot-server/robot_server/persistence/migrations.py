@@ -23,17 +23,37 @@ Database schema versions:
     - `run_table.commands` column added
     - `run_table.engine_status` column added
     - `run_table._updated_at` column added
+- Version 2
+    - `run_command_table` added
+    - `run_table.commands` contents copied into `run_command_table`,
+      one row per command
+- Version 3
+    - `analysis_table.files_hash` column added, with an index
+- Version 4
+    - `analysis_table.completed_analysis` and `run_table.state_summary`
+      re-encoded from pickle to `json_codec` blobs
+- Version 5
+    - `protocol_table.protocol_type`, `robot_type`, `api_version`, `metadata`,
+      and `files` columns added
 """
+import json
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional, Type
 from typing_extensions import Final
 
 import sqlalchemy
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
 
-from .tables import migration_table, run_table
+from opentrons.protocol_engine import StateSummary
 
-_LATEST_SCHEMA_VERSION: Final = 1
+from robot_server.protocols.analysis_models import CompletedAnalysis
+
+from . import json_codec, legacy_pickle
+from .tables import migration_table, analysis_table, run_table, run_command_table
+
+_LATEST_SCHEMA_VERSION: Final = 5
 
 _log = logging.getLogger(__name__)
 
@@ -53,6 +73,14 @@ def migrate(sql_engine: sqlalchemy.engine.Engine) -> None:
         if version is not None:
             if version < 1:
                 _migrate_0_to_1(transaction)
+            if version < 2:
+                _migrate_1_to_2(transaction)
+            if version < 3:
+                _migrate_2_to_3(transaction)
+            if version < 4:
+                _migrate_3_to_4(transaction)
+            if version < 5:
+                _migrate_4_to_5(transaction)
 
             _log.info(
                 f"Migrated database from schema {version}"
@@ -130,3 +158,140 @@ def _migrate_0_to_1(transaction: sqlalchemy.engine.Connection) -> None:
     transaction.execute(add_commands_column)
     transaction.execute(add_status_column)
     transaction.execute(add_updated_at_column)
+
+
+def _migrate_1_to_2(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 2.
+
+    SQLAlchemy has already created the empty `run_command` table by this point.
+    This migration backfills it from the pickled `run.commands` lists.
+
+    The legacy `run.commands` column is left as-is, so older software
+    can still read runs that were stored before this migration.
+    """
+    select_legacy_commands = sqlalchemy.select(
+        run_table.c.id, run_table.c.commands
+    ).where(run_table.c.commands.is_not(None))
+
+    for row in transaction.execute(select_legacy_commands).all():
+        legacy_commands: List[Dict[str, Any]] = row.commands
+
+        if len(legacy_commands) > 0:
+            transaction.execute(
+                sqlalchemy.insert(run_command_table),
+                [
+                    {
+                        "run_id": row.id,
+                        "index_in_run": index,
+                        "command_id": command["id"],
+                        "command_status": _legacy_status_value(command["status"]),
+                        "command": json.dumps(command, default=pydantic_encoder),
+                    }
+                    for index, command in enumerate(legacy_commands)
+                ],
+            )
+
+
+def _legacy_status_value(status: object) -> str:
+    """Get the plain string value of a pickled `CommandStatus`."""
+    # CommandStatus is a str-valued Enum, so a pickled status
+    # may be either the enum member or its raw string value.
+    return str(getattr(status, "value", status))
+
+
+def _migrate_2_to_3(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 3.
+
+    This migration adds the following nullable column to the analysis table:
+
+    - Column("files_hash", sqlalchemy.String, index=True, nullable=True)
+
+    Existing analyses are left without a hash, so they're never reused
+    for new protocols.
+    """
+    add_files_hash_column = sqlalchemy.text(
+        "ALTER TABLE analysis ADD files_hash VARCHAR"
+    )
+    add_files_hash_index = sqlalchemy.text(
+        "CREATE INDEX ix_analysis_files_hash ON analysis (files_hash)"
+    )
+
+    transaction.execute(add_files_hash_column)
+    transaction.execute(add_files_hash_index)
+
+
+def _migrate_3_to_4(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 4.
+
+    This migration re-encodes the pickled `analysis.completed_analysis`
+    and `run.state_summary` blobs with `json_codec`.
+
+    Rows that can no longer be parsed are left pickled and logged.
+    `json_codec` can still read them, so they fail the same way they did before.
+    """
+    select_analyses = sqlalchemy.select(
+        analysis_table.c.id, analysis_table.c.completed_analysis
+    )
+    for row in transaction.execute(select_analyses).all():
+        encoded = _reencode_legacy_blob(row.completed_analysis, CompletedAnalysis)
+        if encoded is not None:
+            transaction.execute(
+                sqlalchemy.update(analysis_table)
+                .where(analysis_table.c.id == row.id)
+                .values(completed_analysis=encoded)
+            )
+
+    select_summaries = sqlalchemy.select(
+        run_table.c.id, run_table.c.state_summary
+    ).where(run_table.c.state_summary.is_not(None))
+    for row in transaction.execute(select_summaries).all():
+        encoded = _reencode_legacy_blob(row.state_summary, StateSummary)
+        if encoded is not None:
+            transaction.execute(
+                sqlalchemy.update(run_table)
+                .where(run_table.c.id == row.id)
+                .values(state_summary=encoded)
+            )
+
+
+def _reencode_legacy_blob(data: bytes, model_type: Type[BaseModel]) -> Optional[bytes]:
+    """Convert a pickled model dict to a `json_codec` blob.
+
+    Returns:
+        The new blob, or None if the data is already encoded or can't be parsed.
+    """
+    if not json_codec.is_legacy(data):
+        return None
+    try:
+        model = model_type.parse_obj(legacy_pickle.loads(data))
+    except Exception:
+        _log.exception(f"Leaving unparseable {model_type.__name__} pickled.")
+        return None
+    return json_codec.dumps(model)
+
+
+def _migrate_4_to_5(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 5.
+
+    This migration adds the following nullable columns to the protocol table:
+
+    - Column("protocol_type", sqlalchemy.String, nullable=True)
+    - Column("robot_type", sqlalchemy.String, nullable=True)
+    - Column("api_version", sqlalchemy.String, nullable=True)
+    - Column("metadata", sqlalchemy.String, nullable=True)
+    - Column("files", sqlalchemy.String, nullable=True)
+
+    Filling them in requires parsing each protocol's files,
+    so that's left to `ProtocolStore.rehydrate()`.
+    """
+    add_type_column = sqlalchemy.text("ALTER TABLE protocol ADD protocol_type VARCHAR")
+    add_robot_column = sqlalchemy.text("ALTER TABLE protocol ADD robot_type VARCHAR")
+    add_api_column = sqlalchemy.text("ALTER TABLE protocol ADD api_version VARCHAR")
+    add_metadata_column = sqlalchemy.text("ALTER TABLE protocol ADD metadata VARCHAR")
+    add_files_column = sqlalchemy.text("ALTER TABLE protocol ADD files VARCHAR")
+
+    transaction.execute(add_type_column)
+    transaction.execute(add_robot_column)
+    transaction.execute(add_api_column)
+    transaction.execute(add_metadata_column)
+    transaction.execute(add_files_column)
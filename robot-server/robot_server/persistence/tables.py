@@ -33,6 +33,14 @@ protocol_table = sqlalchemy.Table(
         nullable=False,
     ),
     sqlalchemy.Column("protocol_key", sqlalchemy.String, nullable=True),
+    # columns added in schema v5
+    sqlalchemy.Column("protocol_type", sqlalchemy.String, nullable=True),
+    sqlalchemy.Column("robot_type", sqlalchemy.String, nullable=True),
+    sqlalchemy.Column("api_version", sqlalchemy.String, nullable=True),
+    # JSON-encoded
+    sqlalchemy.Column("metadata", sqlalchemy.String, nullable=True),
+    # JSON-encoded list of {"name": ..., "role": ...}
+    sqlalchemy.Column("files", sqlalchemy.String, nullable=True),
 )
 
 analysis_table = sqlalchemy.Table(
@@ -60,6 +68,13 @@ analysis_table = sqlalchemy.Table(
         sqlalchemy.LargeBinary,
         nullable=False,
     ),
+    # column added in schema v3
+    sqlalchemy.Column(
+        "files_hash",
+        sqlalchemy.String,
+        index=True,
+        nullable=True,
+    ),
 )
 
 
@@ -83,12 +98,14 @@ run_table = sqlalchemy.Table(
         nullable=True,
     ),
     # column added in schema v1
+    # NOTE: pickled until schema v4; now encoded with `json_codec`.
     sqlalchemy.Column(
         "state_summary",
-        sqlalchemy.PickleType(pickler=legacy_pickle),
+        sqlalchemy.LargeBinary,
         nullable=True,
     ),
     # column added in schema v1
+    # NOTE: no longer written as of schema v2; see `run_command_table`.
     sqlalchemy.Column(
         "commands",
         sqlalchemy.PickleType(pickler=legacy_pickle),
@@ -118,6 +135,35 @@ action_table = sqlalchemy.Table(
     ),
 )
 
+# table added in schema v2
+run_command_table = sqlalchemy.Table(
+    "run_command",
+    _metadata,
+    sqlalchemy.Column("row_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "run_id",
+        sqlalchemy.String,
+        sqlalchemy.ForeignKey("run.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("index_in_run", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("command_id", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("command_status", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("command", sqlalchemy.String, nullable=False),
+    sqlalchemy.Index(
+        "ix_run_command_run_id_index_in_run",
+        "run_id",
+        "index_in_run",
+        unique=True,
+    ),
+    sqlalchemy.Index(
+        "ix_run_command_run_id_command_id",
+        "run_id",
+        "command_id",
+        unique=True,
+    ),
+)
+
 
 def add_tables_to_db(sql_engine: sqlalchemy.engine.Engine) -> None:
     """Create the necessary database tables to back all data stores.
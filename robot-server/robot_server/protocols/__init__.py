@@ -1,7 +1,12 @@
 """Protocol file upload and management."""
 from .router import protocols_router, ProtocolNotFound
 from .dependencies import get_protocol_store
-from .protocol_store import ProtocolStore, ProtocolResource, ProtocolNotFoundError
+from .protocol_store import (
+    ProtocolStore,
+    ProtocolResource,
+    ProtocolSummary,
+    ProtocolNotFoundError,
+)
 
 __all__ = [
     # main protocols router
@@ -12,5 +17,6 @@ __all__ = [
     "get_protocol_store",
     "ProtocolStore",
     "ProtocolResource",
+    "ProtocolSummary",
     "ProtocolNotFoundError",
 ]
@@ -0,0 +1,205 @@
+"""Run protocol analyses in a pool of worker processes."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import traceback
+from collections import defaultdict
+from multiprocessing.connection import Connection
+from typing import Dict, List, Set, Union
+
+import anyio
+
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_runner import ProtocolRunResult, create_simulating_runner
+
+
+log = logging.getLogger(__name__)
+
+
+class AnalysisCancelledError(RuntimeError):
+    """Raised when an analysis is cancelled because its protocol was deleted."""
+
+    def __init__(self, protocol_id: str) -> None:
+        super().__init__(f'Analysis of protocol "{protocol_id}" was cancelled.')
+
+
+class AnalysisWorkerError(RuntimeError):
+    """Raised when a worker process fails to analyze a protocol."""
+
+
+class AnalysisExecutor:
+    """Simulate protocols without tying up the server's interpreter.
+
+    Each analysis runs in one of a fixed number of worker processes, which are
+    started up front and warmed up before they take any work, so an analysis
+    doesn't pay for importing `opentrons` and loading pipette definitions.
+    Analyses beyond the number of workers wait their turn.
+
+    With no workers, analyses run in the server process instead.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize the executor and start its workers.
+
+        Must be called from within an event loop.
+
+        Arguments:
+            max_workers: How many analyses may run at once. If 0, analyses run
+                in the server process, with no limit.
+        """
+        # Spawn rather than fork, so the workers don't inherit the server's
+        # threads, open sockets, or database connections.
+        self._context = multiprocessing.get_context("spawn")
+        self._idle_workers: asyncio.Queue[_Worker] = asyncio.Queue()
+        self._max_workers = max_workers
+        self._cancel_scopes: Dict[str, Set[anyio.CancelScope]] = defaultdict(set)
+        self._closed = False
+
+        for _ in range(max_workers):
+            self._idle_workers.put_nowait(_Worker(self._context))
+
+    async def analyze(
+        self, protocol_id: str, protocol_source: ProtocolSource
+    ) -> ProtocolRunResult:
+        """Simulate a protocol, waiting for a free worker if there isn't one.
+
+        Raises:
+            AnalysisCancelledError: `cancel` was called for the protocol
+                before the analysis was done.
+            AnalysisWorkerError: The worker failed or exited unexpectedly.
+        """
+        with anyio.CancelScope() as cancel_scope:
+            self._cancel_scopes[protocol_id].add(cancel_scope)
+            try:
+                if self._max_workers == 0:
+                    return await _analyze(protocol_source)
+                return await self._analyze_in_worker(protocol_source)
+            finally:
+                self._cancel_scopes[protocol_id].discard(cancel_scope)
+                if not self._cancel_scopes[protocol_id]:
+                    del self._cancel_scopes[protocol_id]
+
+        raise AnalysisCancelledError(protocol_id=protocol_id)
+
+    def cancel(self, protocol_id: str) -> None:
+        """Cancel any analyses of the given protocol, running or waiting."""
+        for cancel_scope in self._cancel_scopes.get(protocol_id, set()):
+            cancel_scope.cancel()
+
+    async def close(self) -> None:
+        """Stop all idle workers.
+
+        Busy workers are stopped when their analyses are cancelled.
+        """
+        self._closed = True
+        idle_workers: List[_Worker] = []
+        while not self._idle_workers.empty():
+            idle_workers.append(self._idle_workers.get_nowait())
+        for worker in idle_workers:
+            await anyio.to_thread.run_sync(worker.stop)
+
+    async def _analyze_in_worker(
+        self, protocol_source: ProtocolSource
+    ) -> ProtocolRunResult:
+        worker = await self._idle_workers.get()
+
+        try:
+            response = await anyio.to_thread.run_sync(
+                worker.analyze, protocol_source, cancellable=True
+            )
+        except BaseException:
+            # The worker may be midway through the protocol, or have died,
+            # so it can't be trusted with another one.
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(worker.stop)
+                if not self._closed:
+                    self._idle_workers.put_nowait(_Worker(self._context))
+            raise
+
+        self._idle_workers.put_nowait(worker)
+
+        if isinstance(response, _WorkerFailure):
+            raise AnalysisWorkerError(response.details)
+
+        return response
+
+
+class _WorkerFailure:
+    def __init__(self, details: str) -> None:
+        self.details = details
+
+
+class _Worker:
+    """A process that simulates one protocol at a time."""
+
+    def __init__(self, context: multiprocessing.context.SpawnContext) -> None:
+        self._connection, worker_connection = context.Pipe()
+        self._process = context.Process(
+            target=_serve,
+            args=(worker_connection,),
+            name="protocol-analysis",
+            daemon=True,
+        )
+        self._process.start()
+        worker_connection.close()
+
+    def analyze(
+        self, protocol_source: ProtocolSource
+    ) -> Union[ProtocolRunResult, _WorkerFailure]:
+        """Simulate a protocol in the worker, blocking until it's done."""
+        self._connection.send(protocol_source)
+        try:
+            response: Union[ProtocolRunResult, _WorkerFailure]
+            response = self._connection.recv()
+        except EOFError as e:
+            raise AnalysisWorkerError(
+                f"Analysis worker exited with code {self._process.exitcode}."
+            ) from e
+        return response
+
+    def stop(self) -> None:
+        """Kill the worker and wait for it to exit.
+
+        The connection isn't closed here, since a cancelled `analyze` may still
+        be waiting on it in another thread. Killing the worker ends that wait.
+        """
+        self._process.kill()
+        self._process.join()
+
+
+def _serve(connection: Connection) -> None:
+    """Analyze each protocol sent over the connection, until it closes."""
+    _warm_up()
+
+    while True:
+        try:
+            protocol_source: ProtocolSource = connection.recv()
+        except EOFError:
+            return
+
+        response: Union[ProtocolRunResult, _WorkerFailure]
+        try:
+            response = asyncio.run(_analyze(protocol_source))
+        except Exception:
+            response = _WorkerFailure(details=traceback.format_exc())
+
+        connection.send(response)
+
+
+def _warm_up() -> None:
+    # Inline import because only the workers need these loaded.
+    from opentrons_shared_data import pipette
+
+    pipette.model_config()
+    pipette.name_config()
+
+    # Building a runner imports the hardware simulator and the Protocol API,
+    # which would otherwise happen during the worker's first analysis.
+    asyncio.run(create_simulating_runner())
+
+
+async def _analyze(protocol_source: ProtocolSource) -> ProtocolRunResult:
+    protocol_runner = await create_simulating_runner()
+    return await protocol_runner.run(protocol_source)
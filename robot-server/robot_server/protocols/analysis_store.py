@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from typing_extensions import Literal
 
 import anyio
@@ -19,7 +19,7 @@ from opentrons.protocol_engine import (
 )
 
 from robot_server.persistence import analysis_table, sqlite_rowid
-from robot_server.persistence import legacy_pickle
+from robot_server.persistence import json_codec
 
 from .analysis_models import (
     AnalysisSummary,
@@ -57,6 +57,25 @@ _log = getLogger(__name__)
 _CURRENT_ANALYZER_VERSION = "initial"
 
 
+@dataclass
+class AnalysisCacheStats:
+    """Counters for lookups of completed analyses by protocol file contents.
+
+    Attributes:
+        hits: Lookups that found a reusable completed analysis.
+        misses: Lookups that found nothing, so the protocol had to be analyzed.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits, or 0 if there were none."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
 class AnalysisNotFoundError(ValueError):
     """Exception raised if a given analysis is not found."""
 
@@ -86,6 +105,12 @@ class AnalysisStore:
         """Initialize the `AnalysisStore`."""
         self._pending_store = _PendingAnalysisStore()
         self._completed_store = _CompletedAnalysisStore(sql_engine=sql_engine)
+        self._cache_stats = AnalysisCacheStats()
+
+    @property
+    def cache_stats(self) -> AnalysisCacheStats:
+        """Hit and miss counts for `get_cached_analysis()`."""
+        return self._cache_stats
 
     def add_pending(self, protocol_id: str, analysis_id: str) -> AnalysisSummary:
         """Add a new pending analysis to the store.
@@ -116,6 +141,7 @@ class AnalysisStore:
         liquids: List[Liquid],
         # TODO(mm, 2022-10-21): Find an enum for this.
         robot_type: Literal["OT-2 Standard", "OT-3 Standard"],
+        files_hash: Optional[str] = None,
     ) -> None:
         """Promote a pending analysis to completed, adding details of its results.
 
@@ -130,6 +156,9 @@ class AnalysisStore:
                 the completed analysis result is `OK` or `NOT_OK`.
             liquids: See `CompletedAnalysis.liquids`.
             robot_type: See `CompletedAnalysis.robotType`.
+            files_hash: A digest of the protocol's files, if known.
+                Stored so that later analyses of identical files
+                can reuse this one. See `get_cached_analysis()`.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -159,6 +188,7 @@ class AnalysisStore:
             protocol_id=protocol_id,
             analyzer_version=_CURRENT_ANALYZER_VERSION,
             completed_analysis=completed_analysis,
+            files_hash=files_hash,
         )
         await self._completed_store.add(
             completed_analysis_resource=completed_analysis_resource
@@ -184,6 +214,38 @@ class AnalysisStore:
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
+    async def get_cached_analysis(self, files_hash: str) -> Optional[CompletedAnalysis]:
+        """Get the most recent completed analysis of identical protocol files.
+
+        Only analyses that were produced by the current analyzer version
+        are considered, since older ones may not reflect how the protocol
+        would run now.
+
+        Args:
+            files_hash: A digest of the protocol's files,
+                as previously passed to `update()`.
+
+        Returns:
+            The matching completed analysis, or ``None`` if there is none.
+        """
+        resource = await self._completed_store.get_latest_by_files_hash(
+            files_hash=files_hash
+        )
+
+        if resource is None:
+            self._cache_stats.misses += 1
+        else:
+            self._cache_stats.hits += 1
+
+        _log.info(
+            f"Analysis cache {'miss' if resource is None else 'hit'}"
+            f" for files hash {files_hash}"
+            f" (hit rate {self._cache_stats.hit_rate:.0%}"
+            f" over {self._cache_stats.hits + self._cache_stats.misses} lookups)."
+        )
+
+        return resource.completed_analysis if resource is not None else None
+
     def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
         """Get summaries of all analyses for a protocol, in order from oldest first.
 
@@ -290,6 +352,7 @@ class _CompletedAnalysisResource:
     protocol_id: str
     analyzer_version: str
     completed_analysis: CompletedAnalysis
+    files_hash: Optional[str] = None
 
     async def to_sql_values(self) -> Dict[str, object]:
         """Return this data as a dict that can be passed to a SQLALchemy insert.
@@ -303,7 +366,7 @@ class _CompletedAnalysisResource:
         """
 
         def serialize_completed_analysis() -> bytes:
-            return legacy_pickle.dumps(self.completed_analysis.dict())
+            return json_codec.dumps(self.completed_analysis)
 
         serialized_completed_analysis = await anyio.to_thread.run_sync(
             serialize_completed_analysis,
@@ -317,6 +380,7 @@ class _CompletedAnalysisResource:
             "protocol_id": self.protocol_id,
             "analyzer_version": self.analyzer_version,
             "completed_analysis": serialized_completed_analysis,
+            "files_hash": self.files_hash,
         }
 
     @classmethod
@@ -344,9 +408,12 @@ class _CompletedAnalysisResource:
         protocol_id = sql_row.protocol_id
         assert isinstance(protocol_id, str)
 
+        files_hash = sql_row.files_hash
+        assert files_hash is None or isinstance(files_hash, str)
+
         def parse_completed_analysis() -> CompletedAnalysis:
-            return CompletedAnalysis.parse_obj(
-                legacy_pickle.loads(sql_row.completed_analysis)
+            return _parse_completed_analysis(
+                json_codec.loads_obj(sql_row.completed_analysis)
             )
 
         completed_analysis = await anyio.to_thread.run_sync(
@@ -361,6 +428,7 @@ class _CompletedAnalysisResource:
             protocol_id=protocol_id,
             analyzer_version=analyzer_version,
             completed_analysis=completed_analysis,
+            files_hash=files_hash,
         )
 
 
@@ -399,6 +467,23 @@ class _CompletedAnalysisStore:
             results = transaction.execute(statement).all()
         return [await _CompletedAnalysisResource.from_sql_row(r) for r in results]
 
+    async def get_latest_by_files_hash(
+        self, files_hash: str
+    ) -> Optional[_CompletedAnalysisResource]:
+        """Return the newest current-version analysis with the given files hash."""
+        statement = (
+            sqlalchemy.select(analysis_table)
+            .where(analysis_table.c.files_hash == files_hash)
+            .where(analysis_table.c.analyzer_version == _CURRENT_ANALYZER_VERSION)
+            .order_by(sqlite_rowid.desc())
+            .limit(1)
+        )
+        with self._sql_engine.begin() as transaction:
+            result = transaction.execute(statement).first()
+        if result is None:
+            return None
+        return await _CompletedAnalysisResource.from_sql_row(result)
+
     def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
         """Like `get_by_protocol()`, but return only the ID of each analysis."""
         statement = (
@@ -426,5 +511,16 @@ class _CompletedAnalysisStore:
             transaction.execute(statement)
 
 
+def _parse_completed_analysis(obj: Any) -> CompletedAnalysis:
+    """Parse a stored analysis, dispatching each command to its own model."""
+    raw_commands = obj.get("commands") if isinstance(obj, dict) else None
+    if not isinstance(raw_commands, list):
+        return CompletedAnalysis.parse_obj(obj)
+
+    commands = [json_codec.parse_command(c) for c in raw_commands]
+    analysis = CompletedAnalysis.parse_obj({**obj, "commands": []})
+    return analysis.copy(update={"commands": commands})
+
+
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
     return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
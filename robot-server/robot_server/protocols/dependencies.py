@@ -10,11 +10,11 @@ from pathlib import Path
 from anyio import Path as AsyncPath
 
 from opentrons.protocol_reader import ProtocolReader
-from opentrons.protocol_runner import create_simulating_runner
 
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.deletion_planner import ProtocolDeletionPlanner
 from robot_server.persistence import get_sql_engine, get_persistence_directory
+from robot_server.settings import get_settings
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
@@ -22,6 +22,7 @@ from .protocol_store import (
 )
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore
+from .analysis_executor import AnalysisExecutor
 
 
 _PROTOCOL_FILES_SUBDIRECTORY: Final = "protocols"
@@ -31,6 +32,7 @@ _log = logging.getLogger(__name__)
 _protocol_store_accessor = AppStateAccessor[ProtocolStore]("protocol_store")
 _analysis_store_accessor = AppStateAccessor[AnalysisStore]("analysis_store")
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
+_analysis_executor_accessor = AppStateAccessor[AnalysisExecutor]("analysis_executor")
 
 
 def get_protocol_reader() -> ProtocolReader:
@@ -87,23 +89,61 @@ def get_analysis_store(
     return analysis_store
 
 
+def initialize_analysis_executor(app_state: AppState) -> None:
+    """Create the `AnalysisExecutor` on `app_state`, starting its workers.
+
+    Intended to be called just once, when the server starts up,
+    so the workers are warmed up before the first protocol is uploaded.
+    """
+    analysis_executor = AnalysisExecutor(
+        max_workers=get_settings().protocol_analysis_workers
+    )
+    _analysis_executor_accessor.set_on(app_state, analysis_executor)
+
+
+async def clean_up_analysis_executor(app_state: AppState) -> None:
+    """Stop the workers of the `AnalysisExecutor` stored on `app_state`.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    analysis_executor = _analysis_executor_accessor.get_from(app_state)
+
+    if analysis_executor is not None:
+        await analysis_executor.close()
+
+
+async def get_analysis_executor(
+    app_state: AppState = Depends(get_app_state),
+) -> AnalysisExecutor:
+    """Get the singleton AnalysisExecutor that runs protocol analyses."""
+    analysis_executor = _analysis_executor_accessor.get_from(app_state)
+
+    if analysis_executor is None:
+        initialize_analysis_executor(app_state)
+        analysis_executor = _analysis_executor_accessor.get_from(app_state)
+        assert analysis_executor is not None
+
+    return analysis_executor
+
+
 async def get_protocol_analyzer(
     analysis_store: AnalysisStore = Depends(get_analysis_store),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> ProtocolAnalyzer:
     """Construct a ProtocolAnalyzer for a single request."""
-    protocol_runner = await create_simulating_runner()
-
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_executor=analysis_executor,
         analysis_store=analysis_store,
     )
 
 
 async def get_protocol_auto_deleter(
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> ProtocolAutoDeleter:
     """Get a `ProtocolAutoDeleter` to delete old protocols."""
     return ProtocolAutoDeleter(
         protocol_store=protocol_store,
         deletion_planner=ProtocolDeletionPlanner(),
+        analysis_executor=analysis_executor,
     )
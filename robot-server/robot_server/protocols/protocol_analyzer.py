@@ -1,9 +1,15 @@
 """Protocol analysis module."""
+import hashlib
 import logging
+from typing import Sequence
 
-from opentrons.protocol_runner import ProtocolRunner
+import anyio
+
+import opentrons
+from opentrons.protocol_reader import ProtocolSourceFile
 
 from .protocol_store import ProtocolResource
+from .analysis_executor import AnalysisExecutor, AnalysisCancelledError
 from .analysis_store import AnalysisStore
 
 
@@ -15,11 +21,11 @@ class ProtocolAnalyzer:
 
     def __init__(
         self,
-        protocol_runner: ProtocolRunner,
+        analysis_executor: AnalysisExecutor,
         analysis_store: AnalysisStore,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
-        self._protocol_runner = protocol_runner
+        self._analysis_executor = analysis_executor
         self._analysis_store = analysis_store
 
     async def analyze(
@@ -27,8 +33,47 @@ class ProtocolAnalyzer:
         protocol_resource: ProtocolResource,
         analysis_id: str,
     ) -> None:
-        """Analyze a given protocol, storing the analysis when complete."""
-        result = await self._protocol_runner.run(protocol_resource.source)
+        """Analyze a given protocol, storing the analysis when complete.
+
+        If a completed analysis already exists for byte-identical protocol files,
+        it's copied under the new analysis ID instead of re-running the protocol.
+
+        If the protocol is deleted before the analysis is done, the analysis is
+        abandoned and nothing is stored.
+        """
+        files_hash = await anyio.to_thread.run_sync(
+            compute_files_hash, protocol_resource.source.files
+        )
+        cached_analysis = await self._analysis_store.get_cached_analysis(
+            files_hash=files_hash
+        )
+
+        if cached_analysis is not None:
+            log.info(
+                f'Reusing analysis "{cached_analysis.id}"'
+                f' as analysis "{analysis_id}".'
+            )
+            await self._analysis_store.update(
+                analysis_id=analysis_id,
+                commands=cached_analysis.commands,
+                labware=cached_analysis.labware,
+                modules=cached_analysis.modules,
+                pipettes=cached_analysis.pipettes,
+                errors=cached_analysis.errors,
+                liquids=cached_analysis.liquids,
+                robot_type=cached_analysis.robotType,
+                files_hash=files_hash,
+            )
+            return
+
+        try:
+            result = await self._analysis_executor.analyze(
+                protocol_id=protocol_resource.protocol_id,
+                protocol_source=protocol_resource.source,
+            )
+        except AnalysisCancelledError:
+            log.info(f'Cancelled analysis "{analysis_id}".')
+            return
 
         log.info(f'Completed analysis "{analysis_id}".')
 
@@ -41,4 +86,30 @@ class ProtocolAnalyzer:
             errors=result.state_summary.errors,
             liquids=result.state_summary.liquids,
             robot_type=protocol_resource.source.robot_type,
+            files_hash=files_hash,
         )
+
+
+def compute_files_hash(files: Sequence[ProtocolSourceFile]) -> str:
+    """Return a digest identifying the contents of a protocol's files.
+
+    Each file's name, role, and contents contribute to the digest,
+    so e.g. changing a custom labware definition changes the hash.
+    The order that the files are given in does not matter.
+
+    The robot software version contributes too, so an analysis is never
+    reused by a software release other than the one that made it, which
+    might run the protocol differently or ship different definitions.
+
+    This reads every file, so it should be run in a worker thread.
+    """
+    digest = hashlib.sha256()
+    version = opentrons.__version__.encode()
+    digest.update(len(version).to_bytes(8, "big"))
+    digest.update(version)
+    for file in sorted(files, key=lambda f: f.path.name):
+        contents = file.path.read_bytes()
+        for part in (file.path.name.encode(), file.role.value.encode(), contents):
+            digest.update(len(part).to_bytes(8, "big"))
+            digest.update(part)
+    return digest.hexdigest()
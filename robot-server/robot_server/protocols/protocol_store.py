@@ -1,17 +1,28 @@
 """Store and retrieve information about uploaded protocols."""
 from __future__ import annotations
 
+import json
+import shutil
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 from anyio import Path as AsyncPath, create_task_group
+from pydantic.json import pydantic_encoder
 import sqlalchemy
-
-from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+from typing_extensions import Literal
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocol_reader import (
+    ProtocolReader,
+    ProtocolSource,
+    ProtocolType,
+    ProtocolFileRole,
+    PythonProtocolConfig,
+)
 from robot_server.persistence import (
     analysis_table,
     protocol_table,
@@ -36,6 +47,33 @@ class ProtocolResource:
     protocol_key: Optional[str]
 
 
+@dataclass(frozen=True)
+class ProtocolFileSummary:
+    """The name and role of a single file in a protocol."""
+
+    name: str
+    role: ProtocolFileRole
+
+
+@dataclass(frozen=True)
+class ProtocolSummary:
+    """The parts of a `ProtocolResource` that are stored in the SQL database.
+
+    Unlike a full `ProtocolResource`, these can be retrieved
+    without reading and parsing the protocol's files.
+    """
+
+    protocol_id: str
+    created_at: datetime
+    protocol_key: Optional[str]
+    protocol_type: ProtocolType
+    robot_type: Literal["OT-2 Standard", "OT-3 Standard"]
+    api_version: Optional[APIVersion]
+    """The Python Protocol API version, or ``None`` for JSON protocols."""
+    metadata: Dict[str, Any]
+    files: List[ProtocolFileSummary]
+
+
 @dataclass(frozen=True)
 class ProtocolUsageInfo:
     """Information about whether a particular protocol is being used by any runs.
@@ -88,6 +126,8 @@ class ProtocolStore:
         *,
         _sql_engine: sqlalchemy.engine.Engine,
         _sources_by_id: Dict[str, ProtocolSource],
+        _protocols_directory: Optional[Path] = None,
+        _protocol_reader: Optional[ProtocolReader] = None,
     ) -> None:
         """Do not call directly.
 
@@ -95,6 +135,8 @@ class ProtocolStore:
         """
         self._sql_engine = _sql_engine
         self._sources_by_id = _sources_by_id
+        self._protocols_directory = _protocols_directory
+        self._protocol_reader = _protocol_reader
 
     @classmethod
     def create_empty(
@@ -127,6 +169,11 @@ class ProtocolStore:
         They are allowed to contain no data, in which case this is equivalent to
         `create_empty()`.
 
+        Protocol files are not parsed here. Each protocol's `ProtocolSource`
+        is computed the first time it's needed, by `get()`. The exception is
+        protocols stored by older software, which didn't record a `ProtocolSummary`
+        in the database. Those are parsed once, here, to backfill it.
+
         Params:
             sql_engine: A reference to the database that this ProtocolStore should
                 use as its backing storage.
@@ -140,19 +187,40 @@ class ProtocolStore:
         """
         # The SQL database is the canonical source of which protocols
         # have been added successfully.
-        expected_ids = set(
-            r.protocol_id for r in cls._sql_get_all_from_engine(sql_engine=sql_engine)
+        sql_resources = cls._sql_get_all_from_engine(sql_engine=sql_engine)
+        expected_ids = set(r.protocol_id for r in sql_resources)
+        unsummarized_ids = set(
+            r.protocol_id for r in sql_resources if r.summary is None
         )
 
-        sources_by_id = await _compute_protocol_sources(
+        await _check_protocol_subdirectories(
             expected_protocol_ids=expected_ids,
             protocols_directory=AsyncPath(protocols_directory),
+        )
+
+        sources_by_id = await _compute_protocol_sources(
+            protocol_ids=unsummarized_ids,
+            protocols_directory=AsyncPath(protocols_directory),
             protocol_reader=protocol_reader,
         )
 
+        if sources_by_id:
+            _log.info(
+                f"Backfilling stored summaries of {len(sources_by_id)} protocols."
+            )
+            with sql_engine.begin() as transaction:
+                for protocol_id, source in sources_by_id.items():
+                    transaction.execute(
+                        sqlalchemy.update(protocol_table)
+                        .where(protocol_table.c.id == protocol_id)
+                        .values(_convert_source_to_sql_values(source))
+                    )
+
         return ProtocolStore(
             _sql_engine=sql_engine,
             _sources_by_id=sources_by_id,
+            _protocols_directory=protocols_directory,
+            _protocol_reader=protocol_reader,
         )
 
     def insert(self, resource: ProtocolResource) -> None:
@@ -160,44 +228,55 @@ class ProtocolStore:
 
         The resource must have a unique ID.
         """
-        self._sql_insert(
-            resource=_DBProtocolResource(
-                protocol_id=resource.protocol_id,
-                created_at=resource.created_at,
-                protocol_key=resource.protocol_key,
-            )
-        )
+        self._sql_insert(resource=resource)
         self._sources_by_id[resource.protocol_id] = resource.source
         self._clear_caches()
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get(self, protocol_id: str) -> ProtocolResource:
+    async def get(self, protocol_id: str) -> ProtocolResource:
         """Get a single protocol by ID.
 
+        The first call for each protocol in a rehydrated store reads and parses
+        that protocol's files. The result is kept in memory for later calls.
+        Prefer `get_summary()` when the full `ProtocolSource` isn't needed.
+
         Raises:
             ProtocolNotFoundError
         """
-        sql_resource = self._sql_get(protocol_id=protocol_id)
+        summary = self.get_summary(protocol_id=protocol_id)
+        source = self._sources_by_id.get(protocol_id)
+
+        if source is None:
+            source = await self._compute_source(protocol_id=protocol_id)
+            self._sources_by_id[protocol_id] = source
+
         return ProtocolResource(
-            protocol_id=sql_resource.protocol_id,
-            created_at=sql_resource.created_at,
-            protocol_key=sql_resource.protocol_key,
-            source=self._sources_by_id[sql_resource.protocol_id],
+            protocol_id=summary.protocol_id,
+            created_at=summary.created_at,
+            protocol_key=summary.protocol_key,
+            source=source,
         )
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
-    def get_all(self) -> List[ProtocolResource]:
-        """Get all protocols currently saved in this store."""
-        all_sql_resources = self._sql_get_all()
-        return [
-            ProtocolResource(
-                protocol_id=r.protocol_id,
-                created_at=r.created_at,
-                protocol_key=r.protocol_key,
-                source=self._sources_by_id[r.protocol_id],
-            )
-            for r in all_sql_resources
-        ]
+    def get_summary(self, protocol_id: str) -> ProtocolSummary:
+        """Get a summary of a single protocol by ID, without parsing its files.
+
+        Raises:
+            ProtocolNotFoundError
+        """
+        summary = self._sql_get(protocol_id=protocol_id).summary
+        assert summary is not None, "Protocol summaries are backfilled on rehydrate."
+        return summary
+
+    @lru_cache(maxsize=_CACHE_ENTRIES)
+    def get_all_summaries(self) -> List[ProtocolSummary]:
+        """Get summaries of all protocols currently saved in this store."""
+        summaries = []
+        for r in self._sql_get_all():
+            assert (
+                r.summary is not None
+            ), "Protocol summaries are backfilled on rehydrate."
+            summaries.append(r.summary)
+        return summaries
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def has(self, protocol_id: str) -> bool:
@@ -228,13 +307,18 @@ class ProtocolStore:
         """
         self._sql_remove(protocol_id=protocol_id)
 
-        deleted_source = self._sources_by_id.pop(protocol_id)
-        protocol_dir = deleted_source.directory
+        deleted_source = self._sources_by_id.pop(protocol_id, None)
 
-        for source_file in deleted_source.files:
-            source_file.path.unlink()
-        if protocol_dir:
-            protocol_dir.rmdir()
+        if deleted_source is not None:
+            for source_file in deleted_source.files:
+                source_file.path.unlink()
+            if deleted_source.directory:
+                deleted_source.directory.rmdir()
+        else:
+            # The source was never computed, so there's no record of which files
+            # it has. Remove its whole directory, whatever is in there.
+            assert self._protocols_directory is not None
+            shutil.rmtree(self._protocols_directory / protocol_id)
 
         self._clear_caches()
 
@@ -276,9 +360,23 @@ class ProtocolStore:
 
         return usage_info
 
-    def _sql_insert(self, resource: _DBProtocolResource) -> None:
+    async def _compute_source(self, protocol_id: str) -> ProtocolSource:
+        assert (
+            self._protocols_directory is not None and self._protocol_reader is not None
+        ), "Only a rehydrated ProtocolStore has protocols without a known source."
+        sources_by_id = await _compute_protocol_sources(
+            protocol_ids={protocol_id},
+            protocols_directory=AsyncPath(self._protocols_directory),
+            protocol_reader=self._protocol_reader,
+        )
+        return sources_by_id[protocol_id]
+
+    def _sql_insert(self, resource: ProtocolResource) -> None:
         statement = sqlalchemy.insert(protocol_table).values(
-            _convert_dataclass_to_sql_values(resource=resource)
+            id=resource.protocol_id,
+            created_at=resource.created_at,
+            protocol_key=resource.protocol_key,
+            **_convert_source_to_sql_values(resource.source),
         )
         with self._sql_engine.begin() as transaction:
             transaction.execute(statement)
@@ -334,20 +432,46 @@ class ProtocolStore:
             raise ProtocolNotFoundError(protocol_id=protocol_id)
 
     def _clear_caches(self) -> None:
-        self.get.cache_clear()
-        self.get_all.cache_clear()
+        self.get_summary.cache_clear()
+        self.get_all_summaries.cache_clear()
         self.has.cache_clear()
 
 
+async def _check_protocol_subdirectories(
+    expected_protocol_ids: Set[str],
+    protocols_directory: AsyncPath,
+) -> None:
+    """Check that every expected protocol has a subdirectory of files.
+
+    Raises:
+        SubdirectoryMissingError
+    """
+    directory_members = [m async for m in protocols_directory.iterdir()]
+    directory_member_names = set(m.name for m in directory_members)
+    extra_members = directory_member_names - expected_protocol_ids
+    missing_members = expected_protocol_ids - directory_member_names
+
+    if extra_members:
+        # Extra members may be left over from prior interrupted writes
+        # and other kinds of failed insertions.
+        _log.warning(
+            f"Unexpected files or directories inside protocol storage directory:"
+            f" {extra_members}."
+            f" Ignoring them."
+        )
+
+    if missing_members:
+        raise SubdirectoryMissingError(
+            f"Missing subdirectories for protocols: {missing_members}"
+        )
+
+
 # TODO(mm, 2022-04-18):
 # Restructure to degrade gracefully in the face of ProtocolReader failures.
-#
-# * ProtocolStore.get_all() should omit protocols for which it failed to compute
-#   a ProtocolSource.
-# * ProtocolStore.get(id) should continue to raise an exception if it failed to compute
-#   that protocol's ProtocolSource.
+# ProtocolStore.get(id) should continue to raise an exception if it failed to compute
+# that protocol's ProtocolSource, but rehydrate() shouldn't.
 async def _compute_protocol_sources(
-    expected_protocol_ids: Set[str],
+    protocol_ids: Set[str],
     protocols_directory: AsyncPath,
     protocol_reader: ProtocolReader,
 ) -> Dict[str, ProtocolSource]:
@@ -359,7 +483,7 @@ async def _compute_protocol_sources(
     and keep them in memory.
 
     Params:
-        expected_protocol_ids: The ID of every protocol for which to compute a
+        protocol_ids: The ID of every protocol for which to compute a
             `ProtocolSource`.
         protocols_directory: A directory containing one subdirectory per protocol
             named by protocol ID. Scanned for files to pass to `protocol_reader`.
@@ -375,25 +499,6 @@ async def _compute_protocol_sources(
     """
     sources_by_id: Dict[str, ProtocolSource] = {}
 
-    directory_members = [m async for m in protocols_directory.iterdir()]
-    directory_member_names = set(m.name for m in directory_members)
-    extra_members = directory_member_names - expected_protocol_ids
-    missing_members = expected_protocol_ids - directory_member_names
-
-    if extra_members:
-        # Extra members may be left over from prior interrupted writes
-        # and other kinds of failed insertions.
-        _log.warning(
-            f"Unexpected files or directories inside protocol storage directory:"
-            f" {extra_members}."
-            f" Ignoring them."
-        )
-
-    if missing_members:
-        raise SubdirectoryMissingError(
-            f"Missing subdirectories for protocols: {missing_members}"
-        )
-
     async def compute_source(
         protocol_id: str, protocol_subdirectory: AsyncPath
     ) -> None:
@@ -415,11 +520,11 @@ async def _compute_protocol_sources(
         # Use a TaskGroup instead of asyncio.gather() so,
         # if any task raises an unexpected exception,
         # it cancels every other task and raises an exception to signal the bug.
-        for protocol_id in expected_protocol_ids:
+        for protocol_id in protocol_ids:
             protocol_subdirectory = protocols_directory / protocol_id
             task_group.start_soon(compute_source, protocol_id, protocol_subdirectory)
 
-    for id in expected_protocol_ids:
+    for id in protocol_ids:
         assert id in sources_by_id
 
     return sources_by_id
@@ -432,6 +537,8 @@ class _DBProtocolResource:
     protocol_id: str
     created_at: datetime
     protocol_key: Optional[str]
+    summary: Optional[ProtocolSummary]
+    """``None`` if the protocol was stored by older software that didn't record it."""
 
 
 def _convert_sql_row_to_dataclass(
@@ -446,18 +553,47 @@ def _convert_sql_row_to_dataclass(
         protocol_key, str
     ), f"Protocol Key {protocol_key} not a string or None"
 
+    summary = (
+        ProtocolSummary(
+            protocol_id=protocol_id,
+            created_at=created_at,
+            protocol_key=protocol_key,
+            protocol_type=ProtocolType(sql_row.protocol_type),
+            robot_type=sql_row.robot_type,
+            api_version=(
+                APIVersion.from_string(sql_row.api_version)
+                if sql_row.api_version is not None
+                else None
+            ),
+            metadata=json.loads(sql_row.metadata),
+            files=[
+                ProtocolFileSummary(name=f["name"], role=ProtocolFileRole(f["role"]))
+                for f in json.loads(sql_row.files)
+            ],
+        )
+        if sql_row.protocol_type is not None
+        else None
+    )
+
     return _DBProtocolResource(
         protocol_id=protocol_id,
         created_at=created_at,
         protocol_key=protocol_key,
+        summary=summary,
     )
 
 
-def _convert_dataclass_to_sql_values(
-    resource: _DBProtocolResource,
-) -> Dict[str, object]:
+def _convert_source_to_sql_values(source: ProtocolSource) -> Dict[str, object]:
     return {
-        "id": resource.protocol_id,
-        "created_at": resource.created_at,
-        "protocol_key": resource.protocol_key,
+        "protocol_type": source.config.protocol_type.value,
+        "robot_type": source.robot_type,
+        "api_version": (
+            str(source.config.api_version)
+            if isinstance(source.config, PythonProtocolConfig)
+            else None
+        ),
+        "metadata": json.dumps(source.metadata, default=pydantic_encoder),
+        "files": json.dumps(
+            [{"name": f.path.name, "role": f.role.value} for f in source.files]
+        ),
     }
@@ -24,6 +24,7 @@ from robot_server.service.json_api import (
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_models import Protocol, ProtocolFile, Metadata
 from .protocol_analyzer import ProtocolAnalyzer
+from .analysis_executor import AnalysisExecutor
 from .analysis_store import AnalysisStore, AnalysisNotFoundError
 from .analysis_models import ProtocolAnalysis
 from .protocol_store import (
@@ -39,6 +40,7 @@ from .dependencies import (
     get_analysis_store,
     get_protocol_analyzer,
     get_protocol_directory,
+    get_analysis_executor,
 )
 
 
@@ -196,18 +198,18 @@ async def get_protocols(
         protocol_store: In-memory database of protocol resources.
         analysis_store: In-memory database of protocol analyses.
     """
-    protocol_resources = protocol_store.get_all()
+    protocol_summaries = protocol_store.get_all_summaries()
     data = [
         Protocol(
-            id=r.protocol_id,
-            createdAt=r.created_at,
-            protocolType=r.source.config.protocol_type,
-            metadata=Metadata.parse_obj(r.source.metadata),
-            analysisSummaries=analysis_store.get_summaries_by_protocol(r.protocol_id),
-            key=r.protocol_key,
-            files=[ProtocolFile(name=f.path.name, role=f.role) for f in r.source.files],
+            id=s.protocol_id,
+            createdAt=s.created_at,
+            protocolType=s.protocol_type,
+            metadata=Metadata.parse_obj(s.metadata),
+            analysisSummaries=analysis_store.get_summaries_by_protocol(s.protocol_id),
+            key=s.protocol_key,
+            files=[ProtocolFile(name=f.name, role=f.role) for f in s.files],
         )
-        for r in protocol_resources
+        for s in protocol_summaries
     ]
     meta = MultiBodyMeta(cursor=0, totalLength=len(data))
 
@@ -238,7 +240,7 @@ async def get_protocol_by_id(
         analysis_store: In-memory database of protocol analyses.
     """
     try:
-        resource = protocol_store.get(protocol_id=protocolId)
+        summary = protocol_store.get_summary(protocol_id=protocolId)
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
@@ -246,14 +248,12 @@ async def get_protocol_by_id(
 
     data = Protocol.construct(
         id=protocolId,
-        createdAt=resource.created_at,
-        protocolType=resource.source.config.protocol_type,
-        metadata=Metadata.parse_obj(resource.source.metadata),
+        createdAt=summary.created_at,
+        protocolType=summary.protocol_type,
+        metadata=Metadata.parse_obj(summary.metadata),
         analysisSummaries=analyses,
-        key=resource.protocol_key,
-        files=[
-            ProtocolFile(name=f.path.name, role=f.role) for f in resource.source.files
-        ],
+        key=summary.protocol_key,
+        files=[ProtocolFile(name=f.name, role=f.role) for f in summary.files],
     )
 
     return await PydanticResponse.create(
@@ -274,15 +274,19 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_executor: Protocol analysis runner, to cancel any analyses
+            of the deleted protocol.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
+        analysis_executor.cancel(protocol_id=protocolId)
 
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
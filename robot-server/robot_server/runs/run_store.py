@@ -1,18 +1,19 @@
 """Runs' on-db store."""
+import json
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, cast
+from typing import Dict, List, Optional
 
 import sqlalchemy
-from pydantic import parse_obj_as
 
 from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice
 from opentrons.protocol_engine.commands import Command
 
-from robot_server.persistence import run_table, action_table
+from robot_server.persistence import run_table, action_table, run_command_table
+from robot_server.persistence import json_codec
 from robot_server.protocols import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
@@ -82,13 +83,15 @@ class RunStore:
             .where(run_table.c.id == run_id)
             .values(
                 _convert_state_to_sql_values(
-                    run_id=run_id,
-                    commands=commands,
                     state_summary=summary,
                     engine_status=summary.status,
                 )
             )
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
+        insert_commands = sqlalchemy.insert(run_command_table)
         select_run_resource = sqlalchemy.select(_run_columns).where(
             run_table.c.id == run_id
         )
@@ -107,6 +110,18 @@ class RunStore:
 
             action_rows = transaction.execute(select_actions).all()
 
+            transaction.execute(delete_commands)
+            if len(commands) > 0:
+                transaction.execute(
+                    insert_commands,
+                    [
+                        _convert_command_to_sql_values(
+                            run_id=run_id, index_in_run=index, command=command
+                        )
+                        for index, command in enumerate(commands)
+                    ],
+                )
+
         self._clear_caches()
         return _convert_row_to_run(row=run_row, action_rows=action_rows)
 
@@ -253,27 +268,11 @@ class RunStore:
             row = transaction.execute(select_run_data).one()
 
         return (
-            StateSummary.parse_obj(row.state_summary)
+            json_codec.loads(row.state_summary, StateSummary)
             if row.state_summary is not None
             else None
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def _get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound:
-                raise RunNotFoundError(run_id=run_id)
-
-        return (
-            cast(List[Dict[str, Any]], row.commands) if row.commands is not None else []
-        )
-
     def get_commands_slice(
         self,
         run_id: str,
@@ -282,6 +281,8 @@ class RunStore:
     ) -> CommandSlice:
         """Get a slice of run commands from the store.
 
+        Only the rows inside the requested slice are read and parsed.
+
         Args:
             run_id: Run ID to pull commands from.
             length: Number of commands to return.
@@ -294,17 +295,36 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        command_intent_dicts = self._get_all_unparsed_commands(run_id)
-        commands_length = len(command_intent_dicts)
-        if cursor is None:
-            cursor = commands_length - length
-
-        # start is inclusive, stop is exclusive
-        actual_cursor = max(0, min(cursor, commands_length - 1))
-        stop = min(commands_length, actual_cursor + length)
+        select_run = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+        select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+            run_command_table.c.run_id == run_id
+        )
+
+        with self._sql_engine.begin() as transaction:
+            if transaction.execute(select_run).first() is None:
+                raise RunNotFoundError(run_id=run_id)
+
+            commands_length: int = transaction.execute(select_count).scalar_one()
+            if cursor is None:
+                cursor = commands_length - length
+
+            # start is inclusive, stop is exclusive
+            actual_cursor = max(0, min(cursor, commands_length - 1))
+            stop = min(commands_length, actual_cursor + length)
+
+            select_slice = (
+                sqlalchemy.select(run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= actual_cursor,
+                    run_command_table.c.index_in_run < stop,
+                )
+                .order_by(run_command_table.c.index_in_run)
+            )
+            slice_rows = transaction.execute(select_slice).all()
+
         sliced_commands: List[Command] = [
-            parse_obj_as(Command, command)  # type: ignore[arg-type]
-            for command in command_intent_dicts[actual_cursor:stop]
+            json_codec.parse_command(json.loads(row.command)) for row in slice_rows
         ]
 
         return CommandSlice(
@@ -328,21 +348,22 @@ class RunStore:
             RunNotFoundError: The given run ID was not found in the store.
             CommandNotFoundError: The given command ID was not found in the store.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
+        select_run = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+        select_command = sqlalchemy.select(run_command_table.c.command).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.command_id == command_id,
         )
+
         with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id=run_id) from e
+            if transaction.execute(select_run).first() is None:
+                raise RunNotFoundError(run_id=run_id)
 
-        try:
-            command = next(c for c in row.commands if c["id"] == command_id)
-        except StopIteration as e:
-            raise CommandNotFoundError(command_id=command_id) from e
+            command_row = transaction.execute(select_command).first()
 
-        return parse_obj_as(Command, command)  # type: ignore[arg-type]
+        if command_row is None:
+            raise CommandNotFoundError(command_id=command_id)
+
+        return json_codec.parse_command(json.loads(command_row.command))
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -357,8 +378,12 @@ class RunStore:
         delete_actions = sqlalchemy.delete(action_table).where(
             action_table.c.run_id == run_id
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
         with self._sql_engine.begin() as transaction:
             transaction.execute(delete_actions)
+            transaction.execute(delete_commands)
             result = transaction.execute(delete_run)
 
         if result.rowcount < 1:
@@ -372,7 +397,6 @@ class RunStore:
         self.get_all.cache_clear()
         self.get_state_summary.cache_clear()
         self.get_command.cache_clear()
-        self._get_all_unparsed_commands.cache_clear()
 
 
 # The columns that must be present in a row passed to _convert_row_to_run().
@@ -425,14 +449,25 @@ def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, o
 
 
 def _convert_state_to_sql_values(
-    run_id: str,
     state_summary: StateSummary,
-    commands: List[Command],
     engine_status: str,
 ) -> Dict[str, object]:
     return {
-        "state_summary": state_summary.dict(),
+        "state_summary": json_codec.dumps(state_summary),
         "engine_status": engine_status,
-        "commands": [command.dict() for command in commands],
         "_updated_at": utc_now(),
     }
+
+
+def _convert_command_to_sql_values(
+    run_id: str,
+    index_in_run: int,
+    command: Command,
+) -> Dict[str, object]:
+    return {
+        "run_id": run_id,
+        "index_in_run": index_in_run,
+        "command_id": command.id,
+        "command_status": command.status.value,
+        "command": command.json(),
+    }
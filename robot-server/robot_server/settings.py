@@ -75,5 +75,16 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    protocol_analysis_workers: int = Field(
+        0,
+        ge=0,
+        description=(
+            "How many protocol analyses may run at once in worker processes,"
+            " which are started when the server starts."
+            " If this is 0, analyses run in the server process instead,"
+            " so no extra processes are started."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -0,0 +1,74 @@
+"""Tests for the database's Pydantic model codec."""
+import json
+from datetime import datetime, timezone
+
+from opentrons.protocol_engine import commands as pe_commands
+
+from robot_server.persistence import json_codec, legacy_pickle
+from robot_server.protocols.analysis_models import AnalysisResult, CompletedAnalysis
+
+
+def _make_analysis() -> CompletedAnalysis:
+    return CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        commands=[
+            pe_commands.WaitForResume(
+                id=f"pause-{i}",
+                key="command-key",
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+                params=pe_commands.WaitForResumeParams(message="hello world"),
+                result=pe_commands.WaitForResumeResult(),
+            )
+            for i in range(10)
+        ],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        errors=[],
+        liquids=[],
+    )
+
+
+def test_round_trip() -> None:
+    """It should decode exactly what it encoded."""
+    analysis = _make_analysis()
+
+    data = json_codec.dumps(analysis)
+
+    assert not json_codec.is_legacy(data)
+    assert json_codec.loads(data, CompletedAnalysis) == analysis
+
+
+def test_smaller_than_pickle() -> None:
+    """It should produce smaller blobs than the legacy pickle format."""
+    analysis = _make_analysis()
+
+    assert len(json_codec.dumps(analysis)) < len(legacy_pickle.dumps(analysis.dict()))
+
+
+def test_loads_legacy_pickle() -> None:
+    """It should read dicts pickled by older robot-server versions."""
+    analysis = _make_analysis()
+
+    data = legacy_pickle.dumps(analysis.dict())
+
+    assert json_codec.is_legacy(data)
+    assert json_codec.loads(data, CompletedAnalysis) == analysis
+
+
+def test_parse_command() -> None:
+    """It should parse a command into the model for its commandType."""
+    command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+
+    result = json_codec.parse_command(json.loads(command.json()))
+
+    assert isinstance(result, pe_commands.WaitForResume)
+    assert result == command
@@ -1,11 +1,19 @@
 """Test SQL database migrations."""
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List
 
 import pytest
 import sqlalchemy
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import]
 
+from opentrons.protocol_engine import (
+    EngineStatus,
+    StateSummary,
+    commands as pe_commands,
+)
+
+from robot_server.persistence import json_codec, legacy_pickle
 from robot_server.persistence.database import create_sql_engine
 from robot_server.persistence.tables import (
     migration_table,
@@ -13,10 +21,57 @@ from robot_server.persistence.tables import (
     action_table,
     protocol_table,
     analysis_table,
+    run_command_table,
 )
+from robot_server.protocols.analysis_models import AnalysisResult, CompletedAnalysis
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.runs.run_store import RunStore
+
+
+TABLES = [run_table, action_table, protocol_table, analysis_table, run_command_table]
+
+
+def _create_v0_analysis_table(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """Replace the analysis table with the one from schema versions 0-2."""
+    sql_engine.execute("DROP TABLE analysis")
+    sql_engine.execute(
+        """
+        CREATE TABLE analysis (
+            id VARCHAR NOT NULL,
+            protocol_id VARCHAR NOT NULL,
+            analyzer_version VARCHAR NOT NULL,
+            completed_analysis BLOB NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY(protocol_id) REFERENCES protocol (id)
+        )
+        """
+    )
+    sql_engine.execute("CREATE INDEX ix_analysis_protocol_id ON analysis (protocol_id)")
+
+
+def _create_v0_protocol_table(sql_engine: sqlalchemy.engine.Engine) -> None:
+    """Replace the protocol table with the one from schema versions 0-4."""
+    sql_engine.execute("DROP TABLE protocol")
+    sql_engine.execute(
+        """
+        CREATE TABLE protocol (
+            id VARCHAR NOT NULL,
+            created_at DATETIME NOT NULL,
+            protocol_key VARCHAR,
+            PRIMARY KEY (id)
+        )
+        """
+    )
 
 
-TABLES = [run_table, action_table, protocol_table, analysis_table]
+def _set_schema_version(sql_engine: sqlalchemy.engine.Engine, version: int) -> None:
+    """Mark the database as being at the given schema version."""
+    sql_engine.execute("DELETE FROM migration")
+    sql_engine.execute(
+        sqlalchemy.insert(migration_table).values(
+            created_at=datetime.now(tz=timezone.utc), version=version
+        )
+    )
 
 
 @pytest.fixture
@@ -25,6 +80,7 @@ def database_v0(tmp_path: Path) -> Path:
     db_path = tmp_path / "migration-test-v0.db"
     sql_engine = create_sql_engine(db_path)
     sql_engine.execute("DROP TABLE migration")
+    sql_engine.execute("DROP TABLE run_command")
     sql_engine.execute("DROP TABLE run")
     sql_engine.execute(
         """
@@ -37,6 +93,8 @@ def database_v0(tmp_path: Path) -> Path:
         )
         """
     )
+    _create_v0_analysis_table(sql_engine)
+    _create_v0_protocol_table(sql_engine)
     sql_engine.dispose()
     return db_path
 
@@ -46,10 +104,73 @@ def database_v1(tmp_path: Path) -> Path:
     """Create a database matching schema version 1."""
     db_path = tmp_path / "migration-test-v1.db"
     sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP TABLE run_command")
+    _create_v0_analysis_table(sql_engine)
+    _create_v0_protocol_table(sql_engine)
+    _set_schema_version(sql_engine, 1)
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v2(tmp_path: Path) -> Path:
+    """Create a database matching schema version 2."""
+    db_path = tmp_path / "migration-test-v2.db"
+    sql_engine = create_sql_engine(db_path)
+    _create_v0_analysis_table(sql_engine)
+    _create_v0_protocol_table(sql_engine)
+    _set_schema_version(sql_engine, 2)
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v3(tmp_path: Path) -> Path:
+    """Create a database matching schema version 3."""
+    db_path = tmp_path / "migration-test-v3.db"
+    sql_engine = create_sql_engine(db_path)
+    _create_v0_protocol_table(sql_engine)
+    _set_schema_version(sql_engine, 3)
     sql_engine.dispose()
     return db_path
 
 
+@pytest.fixture
+def database_v4(tmp_path: Path) -> Path:
+    """Create a database matching schema version 4."""
+    db_path = tmp_path / "migration-test-v4.db"
+    sql_engine = create_sql_engine(db_path)
+    _create_v0_protocol_table(sql_engine)
+    _set_schema_version(sql_engine, 4)
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v5(tmp_path: Path) -> Path:
+    """Create a database matching schema version 5."""
+    db_path = tmp_path / "migration-test-v5.db"
+    sql_engine = create_sql_engine(db_path)
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def legacy_commands() -> List[pe_commands.Command]:
+    """Get commands as they would have been stored in schema version 1."""
+    return [
+        pe_commands.WaitForResume(
+            id=f"pause-{i}",
+            key="command-key",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2021, month=1, day=1),
+            params=pe_commands.WaitForResumeParams(message=f"hello {i}"),
+            result=pe_commands.WaitForResumeResult(),
+        )
+        for i in range(3)
+    ]
+
+
 @pytest.fixture
 def subject(database_path: Path) -> Generator[sqlalchemy.engine.Engine, None, None]:
     """Get a SQLEngine test subject.
@@ -68,15 +189,124 @@ def subject(database_path: Path) -> Generator[sqlalchemy.engine.Engine, None, No
     [
         lazy_fixture("database_v0"),
         lazy_fixture("database_v1"),
+        lazy_fixture("database_v2"),
+        lazy_fixture("database_v3"),
+        lazy_fixture("database_v4"),
+        lazy_fixture("database_v5"),
     ],
 )
 def test_migration(subject: sqlalchemy.engine.Engine) -> None:
     """It should migrate a table."""
     migrations = subject.execute(sqlalchemy.select(migration_table)).all()
 
-    assert [m.version for m in migrations] == [1]
+    assert migrations[-1].version == 5
 
     # all table queries work without raising
     for table in TABLES:
         values = subject.execute(sqlalchemy.select(table)).all()
         assert values == []
+
+
+def test_migration_1_to_2_backfills_run_commands(
+    database_v1: Path,
+    legacy_commands: List[pe_commands.Command],
+) -> None:
+    """It should copy pickled run commands into the run command table."""
+    # Write directly, without running migrations, to simulate a v1 robot.
+    legacy_engine = sqlalchemy.create_engine(f"sqlite:///{database_v1}")
+    legacy_engine.execute(
+        sqlalchemy.insert(run_table).values(
+            id="run-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            protocol_id=None,
+            commands=[command.dict() for command in legacy_commands],
+        )
+    )
+    legacy_engine.dispose()
+
+    subject = create_sql_engine(database_v1)
+    run_store = RunStore(sql_engine=subject)
+
+    try:
+        command_slice = run_store.get_commands_slice(
+            run_id="run-id", cursor=1, length=2
+        )
+        command = run_store.get_command(run_id="run-id", command_id="pause-0")
+    finally:
+        subject.dispose()
+
+    assert command_slice.total_length == 3
+    assert command_slice.commands == legacy_commands[1:]
+    assert command == legacy_commands[0]
+
+
+async def test_migration_3_to_4_reencodes_pickled_blobs(
+    database_v3: Path,
+    legacy_commands: List[pe_commands.Command],
+) -> None:
+    """It should convert pickled analyses and state summaries to JSON blobs."""
+    completed_analysis = CompletedAnalysis(
+        id="analysis-id",
+        result=AnalysisResult.OK,
+        commands=legacy_commands,
+        labware=[],
+        modules=[],
+        pipettes=[],
+        errors=[],
+        liquids=[],
+    )
+    state_summary = StateSummary(
+        status=EngineStatus.SUCCEEDED,
+        errors=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        labwareOffsets=[],
+        liquids=[],
+    )
+
+    # Write directly, without running migrations, to simulate a v3 robot.
+    legacy_engine = sqlalchemy.create_engine(f"sqlite:///{database_v3}")
+    legacy_engine.execute(
+        sqlalchemy.insert(protocol_table).values(
+            id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            protocol_key=None,
+        )
+    )
+    legacy_engine.execute(
+        sqlalchemy.insert(analysis_table).values(
+            id="analysis-id",
+            protocol_id="protocol-id",
+            analyzer_version="initial",
+            completed_analysis=legacy_pickle.dumps(completed_analysis.dict()),
+        )
+    )
+    legacy_engine.execute(
+        sqlalchemy.insert(run_table).values(
+            id="run-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            protocol_id=None,
+            state_summary=legacy_pickle.dumps(state_summary.dict()),
+        )
+    )
+    legacy_engine.dispose()
+
+    subject = create_sql_engine(database_v3)
+
+    try:
+        analysis_blob = subject.execute(
+            sqlalchemy.select(analysis_table.c.completed_analysis)
+        ).scalar_one()
+        summary_blob = subject.execute(
+            sqlalchemy.select(run_table.c.state_summary)
+        ).scalar_one()
+        analysis = await AnalysisStore(sql_engine=subject).get("analysis-id")
+        summary = RunStore(sql_engine=subject).get_state_summary("run-id")
+    finally:
+        subject.dispose()
+
+    assert not json_codec.is_legacy(analysis_blob)
+    assert not json_codec.is_legacy(summary_blob)
+    assert analysis == completed_analysis
+    assert summary == state_summary
@@ -32,6 +32,11 @@ EXPECTED_STATEMENTS = [
         id VARCHAR NOT NULL,
         created_at DATETIME NOT NULL,
         protocol_key VARCHAR,
+        protocol_type VARCHAR,
+        robot_type VARCHAR,
+        api_version VARCHAR,
+        metadata VARCHAR,
+        files VARCHAR,
         PRIMARY KEY (id)
     )
     """,
@@ -41,11 +46,15 @@ EXPECTED_STATEMENTS = [
         protocol_id VARCHAR NOT NULL,
         analyzer_version VARCHAR NOT NULL,
         completed_analysis BLOB NOT NULL,
+        files_hash VARCHAR,
         PRIMARY KEY (id),
         FOREIGN KEY(protocol_id) REFERENCES protocol (id)
     )
     """,
     """
+    CREATE INDEX ix_analysis_files_hash ON analysis (files_hash)
+    """,
+    """
     CREATE INDEX ix_analysis_protocol_id ON analysis (protocol_id)
     """,
     """
@@ -71,6 +80,24 @@ EXPECTED_STATEMENTS = [
         FOREIGN KEY(run_id) REFERENCES run (id)
     )
     """,
+    """
+    CREATE TABLE run_command (
+        row_id INTEGER NOT NULL,
+        run_id VARCHAR NOT NULL,
+        index_in_run INTEGER NOT NULL,
+        command_id VARCHAR NOT NULL,
+        command_status VARCHAR NOT NULL,
+        command VARCHAR NOT NULL,
+        PRIMARY KEY (row_id),
+        FOREIGN KEY(run_id) REFERENCES run (id)
+    )
+    """,
+    """
+    CREATE UNIQUE INDEX ix_run_command_run_id_command_id ON run_command (run_id, command_id)
+    """,
+    """
+    CREATE UNIQUE INDEX ix_run_command_run_id_index_in_run ON run_command (run_id, index_in_run)
+    """,
 ]
 
 
@@ -87,6 +114,25 @@ def _normalize_statement(statement: str) -> str:
     return "\n".join(lines)
 
 
+def _sort_index_statements(statements: List[str]) -> List[str]:
+    """Sort each run of consecutive CREATE INDEX statements.
+
+    SQLAlchemy keeps a table's indexes in an unordered set,
+    so the order they're emitted in is arbitrary.
+    """
+    result: List[str] = []
+    index_run: List[str] = []
+    for statement in statements:
+        if " INDEX " in statement.split("\n", 1)[0]:
+            index_run.append(statement)
+        else:
+            result.extend(sorted(index_run))
+            index_run = []
+            result.append(statement)
+    result.extend(sorted(index_run))
+    return result
+
+
 def test_creating_tables_emits_expected_statements() -> None:
     """Test that fresh databases are created with with the expected statements.
 
@@ -106,7 +152,11 @@ def test_creating_tables_emits_expected_statements() -> None:
     engine = sqlalchemy.create_mock_engine("sqlite://", record_statement)
     add_tables_to_db(cast(sqlalchemy.engine.Engine, engine))
 
-    normalized_actual = [_normalize_statement(s) for s in actual_statements]
-    normalized_expected = [_normalize_statement(s) for s in EXPECTED_STATEMENTS]
+    normalized_actual = _sort_index_statements(
+        [_normalize_statement(s) for s in actual_statements]
+    )
+    normalized_expected = _sort_index_statements(
+        [_normalize_statement(s) for s in EXPECTED_STATEMENTS]
+    )
 
     assert normalized_actual == normalized_expected
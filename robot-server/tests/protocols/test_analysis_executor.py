@@ -0,0 +1,97 @@
+"""Tests for the AnalysisExecutor."""
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+
+from opentrons.protocol_engine import commands as pe_commands
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisCancelledError,
+)
+
+
+_COMMENT_PROTOCOL = """
+metadata = {"apiLevel": "2.13"}
+
+def run(ctx):
+    ctx.comment("hello world")
+"""
+
+_SLOW_PROTOCOL = """
+import time
+
+metadata = {"apiLevel": "2.13"}
+
+def run(ctx):
+    time.sleep(60)
+"""
+
+
+async def _read_protocol(tmp_path: Path, name: str, contents: str) -> ProtocolSource:
+    path = tmp_path / name
+    path.write_text(contents)
+    return await ProtocolReader().read_saved(files=[path], directory=None)
+
+
+@pytest.fixture(params=[0, 1])
+async def subject(request: pytest.FixtureRequest) -> AsyncIterator[AnalysisExecutor]:
+    """Get an AnalysisExecutor, running analyses in-process or in a worker."""
+    executor = AnalysisExecutor(max_workers=request.param)  # type: ignore[attr-defined]
+    yield executor
+    await executor.close()
+
+
+async def test_analyze(subject: AnalysisExecutor, tmp_path: Path) -> None:
+    """It should simulate the protocol and return the result."""
+    protocol_source = await _read_protocol(tmp_path, "comment.py", _COMMENT_PROTOCOL)
+
+    result = await subject.analyze(
+        protocol_id="protocol-id", protocol_source=protocol_source
+    )
+
+    assert result.state_summary.errors == []
+    assert [
+        c.params.dict()["legacyCommandText"]
+        for c in result.commands
+        if isinstance(c, pe_commands.Custom)
+    ] == ["hello world"]
+
+
+@pytest.fixture
+async def worker_subject() -> AsyncIterator[AnalysisExecutor]:
+    """Get an AnalysisExecutor with a single worker."""
+    executor = AnalysisExecutor(max_workers=1)
+    yield executor
+    await executor.close()
+
+
+async def test_cancel(worker_subject: AnalysisExecutor, tmp_path: Path) -> None:
+    """It should stop a worker's analysis when its protocol is deleted.
+
+    Only tested with a worker, since a Python protocol running in-process
+    keeps going in its thread after its analysis is abandoned.
+    """
+    subject = worker_subject
+    slow_source = await _read_protocol(tmp_path, "slow.py", _SLOW_PROTOCOL)
+    comment_source = await _read_protocol(tmp_path, "comment.py", _COMMENT_PROTOCOL)
+
+    slow_analysis = asyncio.create_task(
+        subject.analyze(protocol_id="slow-id", protocol_source=slow_source)
+    )
+    await asyncio.sleep(1)
+    subject.cancel(protocol_id="other-id")
+    assert not slow_analysis.done()
+
+    subject.cancel(protocol_id="slow-id")
+    with pytest.raises(AnalysisCancelledError):
+        await asyncio.wait_for(slow_analysis, timeout=10)
+
+    # The worker that was cancelled should have been replaced.
+    result = await subject.analyze(
+        protocol_id="comment-id", protocol_source=comment_source
+    )
+    assert result.state_summary.errors == []
@@ -257,3 +257,39 @@ async def test_update_infers_status_from_errors(
     analysis = (await subject.get_by_protocol("protocol-id"))[0]
     assert isinstance(analysis, CompletedAnalysis)
     assert analysis.result == expected_result
+
+
+async def test_get_cached_analysis(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should return the newest completed analysis with a matching files hash."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id-1"))
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id-2"))
+
+    for protocol_id, analysis_id, files_hash in [
+        ("protocol-id-1", "analysis-id-1", "hash-1"),
+        ("protocol-id-1", "analysis-id-2", "hash-2"),
+        ("protocol-id-2", "analysis-id-3", "hash-1"),
+    ]:
+        subject.add_pending(protocol_id=protocol_id, analysis_id=analysis_id)
+        await subject.update(
+            analysis_id=analysis_id,
+            labware=[],
+            modules=[],
+            pipettes=[],
+            commands=[],
+            errors=[],
+            liquids=[],
+            robot_type="OT-2 Standard",
+            files_hash=files_hash,
+        )
+
+    hit = await subject.get_cached_analysis(files_hash="hash-1")
+    miss = await subject.get_cached_analysis(files_hash="hash-3")
+
+    assert hit is not None
+    assert hit.id == "analysis-id-3"
+    assert miss is None
+    assert subject.cache_stats.hits == 1
+    assert subject.cache_stats.misses == 1
+    assert subject.cache_stats.hit_rate == 0.5
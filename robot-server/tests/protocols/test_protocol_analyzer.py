@@ -1,11 +1,12 @@
 """Tests for the ProtocolAnalyzer."""
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
 from pathlib import Path
 
 from opentrons_shared_data.pipette.dev_types import PipetteNameType
 
+import opentrons
 from opentrons.types import MountType, DeckSlotName
 from opentrons.protocol_engine import (
     StateSummary,
@@ -14,18 +15,34 @@ from opentrons.protocol_engine import (
     errors as pe_errors,
     types as pe_types,
 )
-from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
-from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
+from opentrons.protocol_runner import ProtocolRunResult
+from opentrons.protocol_reader import (
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolFileRole,
+    JsonProtocolConfig,
+)
 
+from robot_server.protocols.analysis_models import (
+    AnalysisResult,
+    CompletedAnalysis,
+)
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisCancelledError,
+)
 from robot_server.protocols.protocol_store import ProtocolResource
-from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.protocol_analyzer import (
+    ProtocolAnalyzer,
+    compute_files_hash,
+)
 
 
 @pytest.fixture
-def protocol_runner(decoy: Decoy) -> ProtocolRunner:
-    """Get a mocked out ProtocolRunner."""
-    return decoy.mock(cls=ProtocolRunner)
+def analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mocked out AnalysisExecutor."""
+    return decoy.mock(cls=AnalysisExecutor)
 
 
 @pytest.fixture
@@ -36,19 +53,19 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
 
 @pytest.fixture
 def subject(
-    protocol_runner: ProtocolRunner,
+    analysis_executor: AnalysisExecutor,
     analysis_store: AnalysisStore,
 ) -> ProtocolAnalyzer:
     """Get a ProtocolAnalyzer test subject."""
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_executor=analysis_executor,
         analysis_store=analysis_store,
     )
 
 
 async def test_analyze(
     decoy: Decoy,
-    protocol_runner: ProtocolRunner,
+    analysis_executor: AnalysisExecutor,
     analysis_store: AnalysisStore,
     subject: ProtocolAnalyzer,
 ) -> None:
@@ -97,7 +114,11 @@ async def test_analyze(
         mount=MountType.LEFT,
     )
 
-    decoy.when(await protocol_runner.run(protocol_resource.source)).then_return(
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", protocol_source=protocol_resource.source
+        )
+    ).then_return(
         ProtocolRunResult(
             commands=[analysis_command],
             state_summary=StateSummary(
@@ -128,5 +149,221 @@ async def test_analyze(
             errors=[analysis_error],
             liquids=[],
             robot_type="OT-3 Standard",
+            files_hash=compute_files_hash([]),
         ),
     )
+
+
+async def test_analyze_reuses_cached_analysis(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should copy an existing analysis of identical files instead of running."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-2 Standard",
+            labware_definitions=[],
+        ),
+        protocol_key="dummy-data-111",
+    )
+
+    analysis_command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+
+    cached_analysis = CompletedAnalysis(
+        id="cached-analysis-id",
+        result=AnalysisResult.OK,
+        commands=[analysis_command],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        errors=[],
+        liquids=[],
+        robotType="OT-2 Standard",
+    )
+
+    decoy.when(
+        await analysis_store.get_cached_analysis(files_hash=compute_files_hash([]))
+    ).then_return(cached_analysis)
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", protocol_source=protocol_resource.source
+        ),
+        times=0,
+    )
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[analysis_command],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+            robot_type="OT-2 Standard",
+            files_hash=compute_files_hash([]),
+        ),
+    )
+
+
+async def test_analyze_cancelled(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should not store anything if the analysis is cancelled."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-2 Standard",
+            labware_definitions=[],
+        ),
+        protocol_key=None,
+    )
+
+    decoy.when(
+        await analysis_store.get_cached_analysis(files_hash=compute_files_hash([]))
+    ).then_return(None)
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", protocol_source=protocol_resource.source
+        )
+    ).then_raise(AnalysisCancelledError(protocol_id="protocol-id"))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=matchers.Anything(),
+            labware=matchers.Anything(),
+            modules=matchers.Anything(),
+            pipettes=matchers.Anything(),
+            errors=matchers.Anything(),
+            liquids=matchers.Anything(),
+            robot_type=matchers.Anything(),
+            files_hash=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
+async def test_analyze_ignores_cache_from_other_version(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should not reuse an analysis made by a different software version."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-2 Standard",
+            labware_definitions=[],
+        ),
+        protocol_key=None,
+    )
+    cached_analysis = CompletedAnalysis(
+        id="cached-analysis-id",
+        result=AnalysisResult.OK,
+        commands=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        errors=[],
+        liquids=[],
+        robotType="OT-2 Standard",
+    )
+
+    monkeypatch.setattr(opentrons, "__version__", "1.0.0")
+    old_files_hash = compute_files_hash([])
+    decoy.when(
+        await analysis_store.get_cached_analysis(files_hash=old_files_hash)
+    ).then_return(cached_analysis)
+
+    monkeypatch.setattr(opentrons, "__version__", "2.0.0")
+    new_files_hash = compute_files_hash([])
+    decoy.when(
+        await analysis_store.get_cached_analysis(files_hash=new_files_hash)
+    ).then_return(None)
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", protocol_source=protocol_resource.source
+        )
+    ).then_raise(AnalysisCancelledError(protocol_id="protocol-id"))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    assert new_files_hash != old_files_hash
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=matchers.Anything(),
+            labware=matchers.Anything(),
+            modules=matchers.Anything(),
+            pipettes=matchers.Anything(),
+            errors=matchers.Anything(),
+            liquids=matchers.Anything(),
+            robot_type=matchers.Anything(),
+            files_hash=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
+def test_compute_files_hash(tmp_path: Path) -> None:
+    """It should hash file contents, independent of file order."""
+    main_path = tmp_path / "protocol.py"
+    labware_path = tmp_path / "labware.json"
+    main_path.write_text("# protocol")
+    labware_path.write_text("{}")
+
+    main_file = ProtocolSourceFile(path=main_path, role=ProtocolFileRole.MAIN)
+    labware_file = ProtocolSourceFile(path=labware_path, role=ProtocolFileRole.LABWARE)
+
+    original_hash = compute_files_hash([main_file, labware_file])
+    assert compute_files_hash([labware_file, main_file]) == original_hash
+    assert compute_files_hash([main_file]) != original_hash
+
+    labware_path.write_text('{"changed": true}')
+    assert compute_files_hash([main_file, labware_file]) != original_hash
@@ -1,5 +1,7 @@
 """Tests for the ProtocolStore interface."""
 import pytest
+import sqlalchemy
+from decoy import Decoy
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -8,6 +10,9 @@ from opentrons.protocol_reader import (
     ProtocolSource,
     ProtocolSourceFile,
     ProtocolFileRole,
+    ProtocolReader,
+    ProtocolFilesInvalidError,
+    ProtocolType,
     JsonProtocolConfig,
     PythonProtocolConfig,
 )
@@ -15,11 +20,14 @@ from opentrons.protocol_reader import (
 from robot_server.protocols.protocol_store import (
     ProtocolStore,
     ProtocolResource,
+    ProtocolSummary,
+    ProtocolFileSummary,
     ProtocolUsageInfo,
     ProtocolNotFoundError,
     ProtocolUsedByRunError,
 )
 
+from robot_server.persistence import protocol_table
 from robot_server.runs.run_store import RunStore
 
 from sqlalchemy.engine import Engine as SQLEngine
@@ -67,7 +75,7 @@ async def test_insert_and_get_protocol(
     assert subject.has("protocol-id") is False
 
     subject.insert(protocol_resource)
-    result = subject.get("protocol-id")
+    result = await subject.get("protocol-id")
 
     assert result == protocol_resource
     assert subject.has("protocol-id") is True
@@ -112,19 +120,21 @@ async def test_insert_with_duplicate_key_raises(
     with pytest.raises(Exception):
         subject.insert(protocol_resource_2)
 
-    assert subject.get_all() == [protocol_resource_1]  # No traces of the failed insert.
+    # No traces of the failed insert.
+    assert [s.protocol_id for s in subject.get_all_summaries()] == ["protocol-id"]
+    assert await subject.get("protocol-id") == protocol_resource_1
 
 
 async def test_get_missing_protocol_raises(subject: ProtocolStore) -> None:
     """It should raise an error when protocol not found."""
     with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
-        subject.get("protocol-id")
+        await subject.get("protocol-id")
 
 
-async def test_get_all_protocols(
+async def test_get_all_summaries(
     protocol_file_directory: Path, subject: ProtocolStore
 ) -> None:
-    """It should get all protocols existing in the store."""
+    """It should get summaries of all protocols existing in the store."""
     created_at_1 = datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
     created_at_2 = datetime(year=2022, month=2, day=2, tzinfo=timezone.utc)
 
@@ -135,8 +145,12 @@ async def test_get_all_protocols(
             directory=protocol_file_directory,
             main_file=(protocol_file_directory / "abc.py"),
             config=PythonProtocolConfig(api_version=APIVersion(1234, 5678)),
-            files=[],
-            metadata={},
+            files=[
+                ProtocolSourceFile(
+                    path=protocol_file_directory / "abc.py", role=ProtocolFileRole.MAIN
+                )
+            ],
+            metadata={"protocolName": "My Protocol"},
             robot_type="OT-2 Standard",
             labware_definitions=[],
         ),
@@ -159,9 +173,31 @@ async def test_get_all_protocols(
 
     subject.insert(resource_1)
     subject.insert(resource_2)
-    result = subject.get_all()
-
-    assert result == [resource_1, resource_2]
+    result = subject.get_all_summaries()
+
+    assert result == [
+        ProtocolSummary(
+            protocol_id="abc",
+            created_at=created_at_1,
+            protocol_key="dummy-data-111",
+            protocol_type=ProtocolType.PYTHON,
+            robot_type="OT-2 Standard",
+            api_version=APIVersion(1234, 5678),
+            metadata={"protocolName": "My Protocol"},
+            files=[ProtocolFileSummary(name="abc.py", role=ProtocolFileRole.MAIN)],
+        ),
+        ProtocolSummary(
+            protocol_id="123",
+            created_at=created_at_2,
+            protocol_key="dummy-data-222",
+            protocol_type=ProtocolType.JSON,
+            robot_type="OT-3 Standard",
+            api_version=None,
+            metadata={},
+            files=[],
+        ),
+    ]
+    assert subject.get_summary("123") == result[1]
 
 
 async def test_remove_protocol(
@@ -201,7 +237,7 @@ async def test_remove_protocol(
     assert other_file.exists() is False
 
     with pytest.raises(ProtocolNotFoundError, match="protocol-id"):
-        subject.get("protocol-id")
+        await subject.get("protocol-id")
 
 
 def test_remove_missing_protocol_raises(
@@ -327,3 +363,150 @@ def test_get_usage_info(
             is_used_by_run=False,
         ),
     ]
+
+
+async def test_rehydrate_computes_sources_lazily(
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+) -> None:
+    """It should read a rehydrated protocol's files only when it's first requested."""
+    protocol_directory = protocol_file_directory / "protocol-id"
+    protocol_directory.mkdir()
+    main_file = protocol_directory / "protocol.py"
+    main_file.write_text("metadata = {'apiLevel': '2.13'}\ndef run(ctx): pass\n")
+
+    protocol_reader = ProtocolReader()
+    source = await protocol_reader.read_saved(
+        files=[main_file], directory=protocol_directory
+    )
+    created_at = datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
+    ProtocolStore.create_empty(sql_engine=sql_engine).insert(
+        ProtocolResource(
+            protocol_id="protocol-id",
+            created_at=created_at,
+            source=source,
+            protocol_key=None,
+        )
+    )
+
+    # Break the file so that any attempt to parse it will fail.
+    main_file.write_text("this is not a protocol")
+
+    subject = await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocol_file_directory,
+        protocol_reader=protocol_reader,
+    )
+
+    assert subject.get_summary("protocol-id") == ProtocolSummary(
+        protocol_id="protocol-id",
+        created_at=created_at,
+        protocol_key=None,
+        protocol_type=ProtocolType.PYTHON,
+        robot_type="OT-2 Standard",
+        api_version=APIVersion(2, 13),
+        metadata={"apiLevel": "2.13"},
+        files=[ProtocolFileSummary(name="protocol.py", role=ProtocolFileRole.MAIN)],
+    )
+
+    with pytest.raises(ProtocolFilesInvalidError):
+        await subject.get("protocol-id")
+
+
+async def test_rehydrate_backfills_legacy_summaries(
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+) -> None:
+    """It should parse protocols stored without a summary, and store their summary."""
+    protocol_directory = protocol_file_directory / "protocol-id"
+    protocol_directory.mkdir()
+    main_file = protocol_directory / "protocol.json"
+    main_file.touch()
+
+    source = ProtocolSource(
+        directory=protocol_directory,
+        main_file=main_file,
+        config=JsonProtocolConfig(schema_version=6),
+        files=[ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN)],
+        metadata={},
+        robot_type="OT-3 Standard",
+        labware_definitions=[],
+    )
+    created_at = datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
+
+    # Written by older software that only stored these columns.
+    sql_engine.execute(
+        sqlalchemy.insert(protocol_table).values(
+            id="protocol-id", created_at=created_at, protocol_key=None
+        )
+    )
+
+    protocol_reader = decoy.mock(cls=ProtocolReader)
+    decoy.when(
+        await protocol_reader.read_saved(
+            files=[main_file], directory=protocol_directory
+        )
+    ).then_return(source)
+
+    await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocol_file_directory,
+        protocol_reader=protocol_reader,
+    )
+    subject = ProtocolStore.create_empty(sql_engine=sql_engine)
+
+    assert subject.get_all_summaries() == [
+        ProtocolSummary(
+            protocol_id="protocol-id",
+            created_at=created_at,
+            protocol_key=None,
+            protocol_type=ProtocolType.JSON,
+            robot_type="OT-3 Standard",
+            api_version=None,
+            metadata={},
+            files=[
+                ProtocolFileSummary(name="protocol.json", role=ProtocolFileRole.MAIN)
+            ],
+        )
+    ]
+
+
+async def test_remove_rehydrated_protocol(
+    sql_engine: SQLEngine,
+    protocol_file_directory: Path,
+) -> None:
+    """It should delete a protocol's files even if they were never read."""
+    protocol_directory = protocol_file_directory / "protocol-id"
+    protocol_directory.mkdir()
+    main_file = protocol_directory / "protocol.json"
+    main_file.touch()
+    (protocol_directory / "subdirectory").mkdir()
+    (protocol_directory / "subdirectory" / "labware.json").touch()
+
+    ProtocolStore.create_empty(sql_engine=sql_engine).insert(
+        ProtocolResource(
+            protocol_id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            source=ProtocolSource(
+                directory=protocol_directory,
+                main_file=main_file,
+                config=JsonProtocolConfig(schema_version=6),
+                files=[ProtocolSourceFile(path=main_file, role=ProtocolFileRole.MAIN)],
+                metadata={},
+                robot_type="OT-2 Standard",
+                labware_definitions=[],
+            ),
+            protocol_key=None,
+        )
+    )
+
+    subject = await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocol_file_directory,
+        protocol_reader=ProtocolReader(),
+    )
+    subject.remove("protocol-id")
+
+    assert protocol_directory.exists() is False
+    assert subject.get_all_summaries() == []
@@ -13,7 +13,6 @@ from opentrons.protocol_reader import (
     ProtocolSourceFile,
     ProtocolFileRole,
     JsonProtocolConfig,
-    PythonProtocolConfig,
     ProtocolFilesInvalidError,
 )
 
@@ -22,6 +21,7 @@ from robot_server.service.json_api import SimpleEmptyBody, MultiBodyMeta
 from robot_server.service.task_runner import TaskRunner
 from robot_server.protocols.analysis_store import AnalysisStore, AnalysisNotFoundError
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 from robot_server.protocols.protocol_auto_deleter import ProtocolAutoDeleter
 from robot_server.protocols.analysis_models import (
     AnalysisStatus,
@@ -40,6 +40,8 @@ from robot_server.protocols.protocol_models import (
 from robot_server.protocols.protocol_store import (
     ProtocolStore,
     ProtocolResource,
+    ProtocolSummary,
+    ProtocolFileSummary,
     ProtocolNotFoundError,
     ProtocolUsedByRunError,
 )
@@ -72,6 +74,12 @@ def protocol_reader(decoy: Decoy) -> ProtocolReader:
     return decoy.mock(cls=ProtocolReader)
 
 
+@pytest.fixture
+def analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mocked out AnalysisExecutor."""
+    return decoy.mock(cls=AnalysisExecutor)
+
+
 @pytest.fixture
 def protocol_analyzer(decoy: Decoy) -> ProtocolAnalyzer:
     """Get a mocked out ProtocolAnalyzer."""
@@ -95,7 +103,7 @@ async def test_get_protocols_no_protocols(
     protocol_store: ProtocolStore,
 ) -> None:
     """It should return an empty collection response with no protocols loaded."""
-    decoy.when(protocol_store.get_all()).then_return([])
+    decoy.when(protocol_store.get_all_summaries()).then_return([])
 
     result = await get_protocols(protocol_store=protocol_store)
 
@@ -113,33 +121,25 @@ async def test_get_protocols(
     created_at_1 = datetime(year=2021, month=1, day=1)
     created_at_2 = datetime(year=2022, month=2, day=2)
 
-    resource_1 = ProtocolResource(
+    summary_1 = ProtocolSummary(
         protocol_id="abc",
         created_at=created_at_1,
-        source=ProtocolSource(
-            directory=Path("/dev/null"),
-            main_file=Path("/dev/null/abc.py"),
-            config=PythonProtocolConfig(api_version=APIVersion(1234, 5678)),
-            files=[],
-            metadata={},
-            robot_type="OT-2 Standard",
-            labware_definitions=[],
-        ),
         protocol_key="dummy-key-111",
+        protocol_type=ProtocolType.PYTHON,
+        robot_type="OT-2 Standard",
+        api_version=APIVersion(1234, 5678),
+        metadata={},
+        files=[ProtocolFileSummary(name="abc.py", role=ProtocolFileRole.MAIN)],
     )
-    resource_2 = ProtocolResource(
+    summary_2 = ProtocolSummary(
         protocol_id="123",
         created_at=created_at_2,
-        source=ProtocolSource(
-            directory=Path("/dev/null"),
-            main_file=Path("/dev/null/123.json"),
-            config=JsonProtocolConfig(schema_version=1234),
-            files=[],
-            metadata={},
-            robot_type="OT-3 Standard",
-            labware_definitions=[],
-        ),
         protocol_key="dummy-key-222",
+        protocol_type=ProtocolType.JSON,
+        robot_type="OT-3 Standard",
+        api_version=None,
+        metadata={},
+        files=[],
     )
 
     analysis_1 = AnalysisSummary(id="analysis-id-abc", status=AnalysisStatus.PENDING)
@@ -151,7 +151,7 @@ async def test_get_protocols(
         protocolType=ProtocolType.PYTHON,
         metadata=Metadata(),
         analysisSummaries=[analysis_1],
-        files=[],
+        files=[ProtocolFile(name="abc.py", role=ProtocolFileRole.MAIN)],
         key="dummy-key-111",
     )
     expected_protocol_2 = Protocol(
@@ -164,7 +164,7 @@ async def test_get_protocols(
         key="dummy-key-222",
     )
 
-    decoy.when(protocol_store.get_all()).then_return([resource_1, resource_2])
+    decoy.when(protocol_store.get_all_summaries()).then_return([summary_1, summary_2])
     decoy.when(analysis_store.get_summaries_by_protocol("abc")).then_return(
         [analysis_1]
     )
@@ -188,19 +188,15 @@ async def test_get_protocol_by_id(
     analysis_store: AnalysisStore,
 ) -> None:
     """It should return a single protocol file."""
-    resource = ProtocolResource(
+    summary = ProtocolSummary(
         protocol_id="protocol-id",
         created_at=datetime(year=2021, month=1, day=1),
-        source=ProtocolSource(
-            directory=Path("/dev/null"),
-            main_file=Path("/dev/null/protocol.py"),
-            config=PythonProtocolConfig(api_version=APIVersion(1234, 5678)),
-            files=[],
-            metadata={},
-            robot_type="OT-2 Standard",
-            labware_definitions=[],
-        ),
         protocol_key="dummy-key-111",
+        protocol_type=ProtocolType.PYTHON,
+        robot_type="OT-2 Standard",
+        api_version=APIVersion(1234, 5678),
+        metadata={},
+        files=[],
     )
 
     analysis_summary = AnalysisSummary(
@@ -208,7 +204,9 @@ async def test_get_protocol_by_id(
         status=AnalysisStatus.COMPLETED,
     )
 
-    decoy.when(protocol_store.get(protocol_id="protocol-id")).then_return(resource)
+    decoy.when(protocol_store.get_summary(protocol_id="protocol-id")).then_return(
+        summary
+    )
     decoy.when(
         analysis_store.get_summaries_by_protocol(protocol_id="protocol-id")
     ).then_return([analysis_summary])
@@ -238,7 +236,7 @@ async def test_get_protocol_not_found(
     """It should return a 404 error when requesting a non-existent protocol."""
     not_found_error = ProtocolNotFoundError("protocol-id")
 
-    decoy.when(protocol_store.get(protocol_id="protocol-id")).then_raise(
+    decoy.when(protocol_store.get_summary(protocol_id="protocol-id")).then_raise(
         not_found_error
     )
 
@@ -367,11 +365,19 @@ async def test_create_protocol_not_readable(
 async def test_delete_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
-    """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    """It should remove a single protocol file and cancel its analyses."""
+    result = await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_executor=analysis_executor,
+    )
 
-    decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
+    decoy.verify(
+        protocol_store.remove(protocol_id="protocol-id"),
+        analysis_executor.cancel(protocol_id="protocol-id"),
+    )
 
     assert result.content == SimpleEmptyBody()
     assert result.status_code == 200
@@ -380,6 +386,7 @@ async def test_delete_protocol_by_id(
 async def test_delete_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     not_found_error = ProtocolNotFoundError("protocol-id")
@@ -389,7 +396,11 @@ async def test_delete_protocol_not_found(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_executor=analysis_executor,
+        )
 
     assert exc_info.value.status_code == 404
 
@@ -397,6 +408,7 @@ async def test_delete_protocol_not_found(
 async def test_delete_protocol_run_exists(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     run_exists_error = ProtocolUsedByRunError("protocol-id")
@@ -406,9 +418,14 @@ async def test_delete_protocol_run_exists(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_executor=analysis_executor,
+        )
 
     assert exc_info.value.status_code == 409
+    decoy.verify(analysis_executor.cancel(protocol_id="protocol-id"), times=0)
 
 
 async def test_get_protocol_analyses(
@@ -12,6 +12,7 @@ import os
 import re
 import subprocess
 import tempfile
+import zipfile
 from typing import Callable, Generator, Optional
 
 from otupdate.common.constants import MODEL_OT2
@@ -21,9 +22,10 @@ from otupdate.common.file_actions import (
     InvalidRobotType,
     load_version_file,
     unzip_update,
-    hash_file,
+    write_zipped_file,
     HashMismatch,
     verify_signature,
+    WRITE_CHUNK_SIZE,
 )
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
 
@@ -50,9 +52,13 @@ class OT2UpdateActions(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
+        - Unzips the hash, signature and version files to filepath's directory
+        - Checks that the rootfs is in the zip
         - If requested, checks the signature of the hash
+
+        The rootfs itself is left in the zip, to be hashed as it's written by
+        :py:meth:`write_update`.
+
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
                                   and 1.0. May never reach precisely 1.0, best
@@ -60,7 +66,7 @@ class OT2UpdateActions(UpdateActionsInterface):
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
 
-        :returns str: Path to the rootfs file to update
+        :returns str: Path to the update zip file to write
 
         Will also raise an exception if validation fails
         """
@@ -72,16 +78,16 @@ class OT2UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidPKGName(msg)
 
-        def zip_callback(progress):
-            progress_callback(progress / 2.0)
-
         required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
         if cert_path:
             required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress):
-            progress_callback(progress / 2.0 + 0.5)
+        files, _ = unzip_update(
+            filepath,
+            progress_callback,
+            UPDATE_FILES,
+            required,
+            extract_files=[ROOTFS_HASH_NAME, ROOTFS_SIG_NAME, UPDATE_PKG_VERSION_FILE],
+        )
 
         version_file = str(files.get("VERSION.json"))
         version_dict = load_version_file(version_file)
@@ -91,55 +97,59 @@ class OT2UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidRobotType(msg)
 
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
-        hashfile = files.get(ROOTFS_HASH_NAME)
-        assert hashfile
-        packaged_hash = open(hashfile, "rb").read().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
-
         if cert_path:
+            hashfile = files.get(ROOTFS_HASH_NAME)
             sigfile = files.get(ROOTFS_SIG_NAME)
-            assert sigfile
+            assert hashfile and sigfile
             verify_signature(hashfile, sigfile, cert_path)
 
-        return rootfs
+        return filepath
 
     def write_update(
         self,
-        rootfs_filepath: str,
+        update_filepath: str,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
-        file_size: Optional[int] = None,
+        chunk_size: int = WRITE_CHUNK_SIZE,
     ) -> Partition:
         """
         Write the new rootfs to the next root partition
 
         - Figure out, from the system, the correct root partition to write to
-        - Write the rootfs at ``rootfs_filepath`` there, with progress
+        - Unzip the rootfs straight there, with progress, hashing it as it goes
+        - Check the hash against the packaged one
 
-        :param rootfs_filepath: The path to a checked rootfs.ext4
+        The partition isn't booted from until :py:meth:`commit_update`, which
+        must not be called if this raises.
+
+        :param update_filepath: The path to an update zip checked by
+                                :py:meth:`validate_update`
         :param progress_callback: A callback to call periodically with progress
                                   between 0 and 1.0. May never reach precisely
                                   1.0, best only for user information.
         :param chunk_size: The size of file chunks to copy in between progress
                            notifications
-        :param file_size: The total size of the update file (for generating
-                          progress percentage). If ``None``, generated with
-                          ``seek``/``tell``.
         :returns: The root partition that the rootfs image was written to, e.g.
                   ``RootPartitions.TWO`` or ``RootPartitions.THREE``.
+        :raises HashMismatch: If the written rootfs doesn't match its hash
         """
         unused = _find_unused_partition()
         part_path = unused.value.path
-        write_file(rootfs_filepath, part_path, progress_callback, chunk_size, file_size)
+        rootfs_hash = write_zipped_file(
+            update_filepath,
+            ROOTFS_NAME,
+            part_path,
+            progress_callback,
+            chunk_size=chunk_size,
+        )
+        with zipfile.ZipFile(update_filepath, "r") as zf:
+            packaged_hash = zf.read(ROOTFS_HASH_NAME).strip()
+        if packaged_hash != rootfs_hash:
+            msg = (
+                f"Hash mismatch: calculated {rootfs_hash!r} != "
+                f"packaged {packaged_hash!r}"
+            )
+            LOG.error(msg)
+            raise HashMismatch(msg)
         return unused.value
 
     @contextlib.contextmanager
@@ -186,43 +196,6 @@ def _find_unused_partition() -> RootPartitions:
     return {b"2": RootPartitions.TWO, b"3": RootPartitions.THREE}[which]
 
 
-def write_file(
-    infile: str,
-    outfile: str,
-    progress_callback: Callable[[float], None],
-    chunk_size: int = 1024,
-    file_size: Optional[int] = None,
-) -> None:
-    """Write a file to another file with progress callbacks.
-
-    :param infile: The input filepath
-    :param outfile: The output filepath
-    :param progress_callback: The callback to call for progress
-    :param chunk_size: The size of file chunks to copy in between progress
-                       notifications
-    :param file_size: The total size of the update file (for generating
-                      progress percentage). If ``None``, generated with
-                      ``seek``/``tell``.
-    """
-    total_written = 0
-    with open(infile, "rb") as img, open(outfile, "wb") as part:
-        if None is file_size:
-            file_size = img.seek(0, 2)
-            img.seek(0)
-            LOG.info(f"write_file: file size calculated as {file_size}B")
-        LOG.info(
-            f"write_file: writing {infile} ({file_size}B)"
-            f" to {outfile} in {chunk_size}B chunks"
-        )
-        while True:
-            chunk = img.read(chunk_size)
-            part.write(chunk)
-            total_written += len(chunk)
-            progress_callback(total_written / file_size)
-            if len(chunk) != chunk_size:
-                break
-
-
 def _mountpoint_root():
     """provides mountpoint location for :py:meth:`mount_update`.
 
@@ -9,12 +9,27 @@ import json
 import logging
 import os
 import subprocess
-from typing import Callable, Sequence, Mapping, Optional, Tuple, List, Dict
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Sequence,
+    Mapping,
+    Optional,
+    Tuple,
+    List,
+    Dict,
+)
 import tempfile
 import zipfile
 
 LOG = logging.getLogger(__name__)
 
+#: The size of the chunks that an update image is copied to its partition in.
+#: A large multiple of the page and SD card block sizes, so that each chunk
+#: is written to the partition in whole blocks.
+WRITE_CHUNK_SIZE = 1024 * 1024
+
 
 class FileMissing(ValueError):
     def __init__(self, message: str) -> None:
@@ -82,6 +97,7 @@ def unzip_update(
     acceptable_files: Sequence[str],
     mandatory_files: Sequence[str],
     chunk_size: int = 1024,
+    extract_files: Optional[Sequence[str]] = None,
 ) -> Tuple[Mapping[str, Optional[str]], Mapping[str, int]]:
     """Unzip an update file
 
@@ -114,6 +130,9 @@ def unzip_update(
                             ``acceptable_files``.
     :param chunk_size: If specified, the size of the chunk to read and write.
                        If not specified, will default to 1024
+    :param extract_files: If specified, only these files are unzipped. Other
+                          acceptable files are still checked for and sized,
+                          but left in the zip with a path of ``None``.
     :return: Two dictionaries, the first mapping file names to paths and the
              second mapping file names to sizes
 
@@ -131,10 +150,12 @@ def unzip_update(
         remaining_filenames = [fn for fn in acceptable_files]
         for fi in files:
             if fi.filename in acceptable_files:
-                to_unzip.append(fi)
-                total_size += fi.file_size
                 remaining_filenames.remove(fi.filename)
+                file_sizes[fi.filename] = fi.file_size
                 LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
+                if extract_files is None or fi.filename in extract_files:
+                    to_unzip.append(fi)
+                    total_size += fi.file_size
             else:
                 LOG.debug(f"Ignoring {fi.filename}")
 
@@ -154,7 +175,6 @@ def unzip_update(
                     if len(chunk) != chunk_size:
                         break
                 file_paths[fi.filename] = uncomp_path
-                file_sizes[fi.filename] = fi.file_size
                 LOG.debug(f"Unzipped {fi.filename} to {uncomp_path}")
     LOG.info(
         f"Unzipped {filepath}, results: \n\t"
@@ -205,6 +225,98 @@ def hash_file(
     return binascii.hexlify(hasher.digest())
 
 
+class _HashingReader:
+    """A readable file wrapper that hashes everything read through it."""
+
+    def __init__(
+        self,
+        source: IO[bytes],
+        hasher: Any,
+        progress_callback: Callable[[float], None],
+        size: int,
+    ) -> None:
+        self._source = source
+        self._hasher = hasher
+        self._progress_callback = progress_callback
+        self._size = size
+        self._have_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self._update(data)
+        return data
+
+    def readinto(self, buffer: memoryview) -> int:
+        count = self._source.readinto(buffer)  # type: ignore[attr-defined]
+        self._update(buffer[:count])
+        return int(count)
+
+    def _update(self, data: Any) -> None:
+        self._hasher.update(data)
+        self._have_read += len(data)
+        self._progress_callback(self._have_read / max(self._size, 1))
+
+
+def write_zipped_file(
+    zip_path: str,
+    filename: str,
+    outfile: str,
+    progress_callback: Callable[[float], None],
+    decompress: Optional[Callable[[Any], IO[bytes]]] = None,
+    chunk_size: int = WRITE_CHUNK_SIZE,
+    algo: str = "sha256",
+) -> bytes:
+    """
+    Write a file from a zip straight to another file, hashing it on the way
+
+    The file is unzipped, hashed and written in one pass, without being
+    extracted to disk first, and is flushed to storage before returning.
+    Nothing is checked here: the caller must compare the returned hash to
+    the expected one before trusting what was written.
+
+    :param zip_path: The path of the zip to read from
+    :param filename: The name of the file in the zip to write
+    :param outfile: The path to write the file to, e.g. a partition
+    :param progress_callback: The callback to call with progress between 0
+                              and 1. May not ever be precisely 1.0.
+    :param decompress: If specified, a function like :py:func:`lzma.open`
+                       that wraps the zipped file in a reader for its
+                       decompressed contents, which are written instead.
+                       The hash is still of the file as it is in the zip.
+    :param chunk_size: The size of the chunks to write in one call
+    :param algo: The algorithm to use. Can be anything used by
+                 :py:mod:`hashlib`
+    :returns: The hash of the file in the zip, as ascii hex
+    :raises FileMissing: If the file isn't in the zip
+    """
+    hasher = hashlib.new(algo)
+    buffer = memoryview(bytearray(chunk_size))
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        try:
+            info = zf.getinfo(filename)
+        except KeyError:
+            raise FileMissing(f"File {filename} missing from zip")
+        LOG.info(f"Writing {filename} from {zip_path} to {outfile}")
+        with zf.open(info) as zipped, open(outfile, "wb") as out:
+            reader = _HashingReader(zipped, hasher, progress_callback, info.file_size)
+            if decompress:
+                with decompress(reader) as decompressed:
+                    _copy(decompressed, out, buffer)
+            else:
+                _copy(reader, out, buffer)
+            out.flush()
+            os.fsync(out.fileno())
+    return binascii.hexlify(hasher.digest())
+
+
+def _copy(source: Any, out: IO[bytes], buffer: memoryview) -> None:
+    while True:
+        count = source.readinto(buffer)
+        if not count:
+            break
+        out.write(buffer[:count])
+
+
 def verify_signature(message_path: str, sigfile_path: str, cert_path: str) -> None:
     """
     Verify the signature (assumed, of the hash file)
@@ -18,6 +18,7 @@ from aiohttp import web, BodyPartReader
 
 from . import config, update_actions
 from .constants import APP_VARIABLE_PREFIX, RESTART_LOCK_NAME
+from .file_actions import WRITE_CHUNK_SIZE
 from .handler_type import Handler
 from .session import UpdateSession, Stages
 
@@ -99,7 +100,7 @@ async def _save_file(part: BodyPartReader, path: str) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
     with open(os.path.join(path, part.name), "wb") as write:
         while not part.at_eof():
-            chunk = await part.read_chunk()
+            chunk = await part.read_chunk(WRITE_CHUNK_SIZE)
             decoded = part.decode(chunk)
             write.write(decoded)
     try:
@@ -112,17 +113,21 @@ async def _save_file(part: BodyPartReader, path: str) -> None:
 def _begin_write(
     session: UpdateSession,
     loop: asyncio.AbstractEventLoop,
-    rootfs_file_path: str,
+    update_file_path: str,
     actions: update_actions.UpdateActionsInterface,
 ) -> None:
-    """Start the write process."""
+    """Start the write process.
+
+    This is a single pass over the update file that writes the rootfs and
+    checks its hash. The session is only done if the hash matches.
+    """
     session.set_progress(0)
     session.set_stage(Stages.WRITING)
     write_future = asyncio.ensure_future(
         loop.run_in_executor(
             None,
             actions.write_update,
-            rootfs_file_path,
+            update_file_path,
             session.set_progress,
         )
     )
@@ -164,8 +169,8 @@ def _begin_validation(
         if exc:
             session.set_error(getattr(exc, "short", str(type(exc))), str(exc))
         else:
-            rootfs_file = fut.result()
-            loop.call_soon_threadsafe(_begin_write, session, loop, rootfs_file, actions)
+            update_file = fut.result()
+            loop.call_soon_threadsafe(_begin_write, session, loop, update_file, actions)
 
     validation_future.add_done_callback(validation_done)
     return validation_future
@@ -50,8 +50,8 @@ class UpdateActionsInterface:
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
+        - Unzips the small files in filepath to its directory
+        - Checks that the rootfs is there, without unzipping it
         - If requested, checks the signature of the hash
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
@@ -59,7 +59,7 @@ class UpdateActionsInterface:
                                   only for user information
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
-        :returns str: Path to the rootfs file to update
+        :returns str: Path to the update file to pass to ``write_update``
 
         Will also raise an exception if validation fails
         """
@@ -67,13 +67,15 @@ class UpdateActionsInterface:
     @abc.abstractmethod
     def write_update(
         self,
-        rootfs_filepath: str,
+        update_filepath: str,
         progress_callback: Callable[[float], None],
         chunk_size: int,
-        file_size: Optional[int],
     ) -> Partition:
         """
-        Write the object to a specific rootfs path
+        Write the rootfs in a validated update file to the unused partition
+
+        The rootfs is hashed as it's written, and an exception is raised if
+        the hash doesn't match, in which case the update must not be committed.
         """
         ...
 
@@ -3,19 +3,21 @@ import os
 import contextlib
 import lzma
 import tempfile
+import zipfile
 
 from otupdate.common.constants import MODEL_OT3
 from otupdate.common.file_actions import (
     InvalidRobotType,
     unzip_update,
-    hash_file,
+    write_zipped_file,
     HashMismatch,
     InvalidPKGName,
     verify_signature,
     load_version_file,
+    WRITE_CHUNK_SIZE,
 )
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
-from typing import Any, Callable, Generator, Optional
+from typing import Callable, Generator, Optional
 import enum
 import subprocess
 
@@ -100,35 +102,36 @@ class RootFSInterface:
 
     def write_update(
         self,
-        rootfs_filepath: str,
+        update_filepath: str,
         part: Partition,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = WRITE_CHUNK_SIZE,
     ) -> None:
-        total_size = 0
-        written_size = 0
-        try:
-            # the double pass here is
-            # temporary until we have
-            # xz size decoding working
-            with lzma.open(rootfs_filepath, "rb") as fsrc:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    total_size += len(chunk)
-                    if len(chunk) != chunk_size:
-                        break
-            with lzma.open(rootfs_filepath, "rb") as fsrc, open(
-                part.path, "wb"
-            ) as fdst:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    fdst.write(chunk)
-                    written_size += chunk_size
-                    progress_callback(written_size / total_size)
-                    if len(chunk) != chunk_size:
-                        break
-        except Exception:
-            LOG.exception("RootFSInterface::write_update exception reading")
+        """Decompress the system image from an update zip onto a partition.
+
+        The image is unzipped, hashed, decompressed and written in one pass,
+        then its hash is checked against the packaged one.
+
+        :raises HashMismatch: If the image doesn't match its hash
+        """
+        rootfs_hash = write_zipped_file(
+            update_filepath,
+            ROOTFS_NAME,
+            part.path,
+            progress_callback,
+            decompress=lzma.open,
+            chunk_size=chunk_size,
+        )
+        with zipfile.ZipFile(update_filepath, "r") as zf:
+            with zf.open(ROOTFS_HASH_NAME) as fh:
+                packaged_hash = fh.readline().strip()
+        if packaged_hash != rootfs_hash:
+            msg = (
+                f"Hash mismatch: calculated {rootfs_hash!r} != "
+                f"packaged {packaged_hash!r}"
+            )
+            LOG.error(msg)
+            raise HashMismatch(msg)
 
 
 class OT3UpdateActions(UpdateActionsInterface):
@@ -146,9 +149,13 @@ class OT3UpdateActions(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
+        - Unzips the hash, signature and version files to filepath's directory
+        - Checks that the system image is in the zip
         - If requested, checks the signature of the hash
+
+        The system image itself is left in the zip, to be hashed as it's
+        written by :py:meth:`write_update`.
+
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
                                   and 1.0. May never reach precisely 1.0, best
@@ -156,7 +163,7 @@ class OT3UpdateActions(UpdateActionsInterface):
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
 
-        :returns str: Path to the rootfs file to update
+        :returns str: Path to the update zip file to write
 
         Will also raise an exception if validation fails
         """
@@ -168,16 +175,16 @@ class OT3UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidPKGName(msg)
 
-        def zip_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0)
-
         required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
         if cert_path:
             required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0 + 0.5)
+        files, _ = unzip_update(
+            filepath,
+            progress_callback,
+            UPDATE_FILES,
+            required,
+            extract_files=[ROOTFS_HASH_NAME, ROOTFS_SIG_NAME, UPDATE_PKG_VERSION_FILE],
+        )
 
         version_file = str(files.get("VERSION.json"))
         version_dict = load_version_file(version_file)
@@ -187,28 +194,13 @@ class OT3UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidRobotType(msg)
 
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
-        hashfile = files.get(ROOTFS_HASH_NAME)
-        assert hashfile
-        packaged_hash = b""
-        with open(hashfile, "rb") as fh:
-            packaged_hash = fh.readline().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
-
         if cert_path:
+            hashfile = files.get(ROOTFS_HASH_NAME)
             sigfile = files.get(ROOTFS_SIG_NAME)
-            assert sigfile
+            assert hashfile and sigfile
             verify_signature(hashfile, sigfile, cert_path)
 
-        return rootfs
+        return filepath
 
     def commit_update(self) -> None:
         """Switch the target boot partition."""
@@ -253,12 +245,11 @@ class OT3UpdateActions(UpdateActionsInterface):
 
     def write_update(
         self,
-        rootfs_filepath: str,
+        update_filepath: str,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
-        file_size: Optional[int] = None,
+        chunk_size: int = WRITE_CHUNK_SIZE,
     ) -> Partition:
-        self.decomp_and_write(rootfs_filepath, progress_callback)
+        self.decomp_and_write(update_filepath, progress_callback)
         unused_partition = self.part_mngr.find_unused_partition(
             self.part_mngr.used_partition()
         )
@@ -269,7 +260,8 @@ class OT3UpdateActions(UpdateActionsInterface):
     ) -> None:
         """Decompress and write update to partition
 
-        Function expects the update file to be a .xz compressed file
+        Function expects the update file to be a zip containing
+        a .xz compressed system image
 
         """
 
@@ -19,59 +19,38 @@ from otupdate.common import file_actions
 def test_validate_hash_only(downloaded_update_file):
     updater = update_actions.OT2UpdateActions()
     cb = mock.Mock()
-    assert updater.validate_update(
-        downloaded_update_file,
-        cb,
-        None,
+    assert (
+        updater.validate_update(
+            downloaded_update_file,
+            cb,
+            None,
+        )
+        == downloaded_update_file
+    )
+    # The rootfs should be left in the zip, so we should only have a callback
+    # call for unzipping the hash file, which is less than a chunk
+    assert cb.call_count == 1
+    assert not os.path.exists(
+        os.path.join(
+            os.path.dirname(downloaded_update_file), update_actions.ROOTFS_NAME
+        )
     )
-    # We should have a callback call for
-    # - the unzips (see test_unzip for calculation)
-    with zipfile.ZipFile(downloaded_update_file) as zf:
-        rootfs_size = zf.getinfo(update_actions.ROOTFS_NAME).file_size
-        rootfs_calls = rootfs_size // 1024
-        if rootfs_calls * 1024 != rootfs_size:
-            rootfs_calls += 1
-    # only adding 1 extra call because we don’t have a signature file
-    calls = rootfs_calls + 1
-
-    # - the hashes, one for each chunk, the same chunks as unzip
-    calls += rootfs_calls
-    assert cb.call_count == calls
 
 
 def test_validate(downloaded_update_file, testing_cert):
     cb = mock.Mock()
     updater = update_actions.OT2UpdateActions()
     cert_path = testing_cert
-    assert updater.validate_update(
-        downloaded_update_file,
-        cb,
-        cert_path,
-    )
-    # We should have a callback call for
-    # - the unzips (see test_unzip for calculation)
-    with zipfile.ZipFile(downloaded_update_file) as zf:
-        rootfs_size = zf.getinfo(update_actions.ROOTFS_NAME).file_size
-        rootfs_calls = rootfs_size // 1024
-        if rootfs_calls * 1024 != rootfs_size:
-            rootfs_calls += 1
-    calls = rootfs_calls + 2
-
-    # - the hashes, one for each chunk, the same chunks as unzip
-    calls += rootfs_calls
-    assert cb.call_count == calls
-
-
-@pytest.mark.bad_hash
-def test_validate_catches_bad_hash(downloaded_update_file):
-    cb = mock.Mock()
-    updater = update_actions.OT2UpdateActions()
-    with pytest.raises(file_actions.HashMismatch):
+    assert (
         updater.validate_update(
             downloaded_update_file,
             cb,
-            None,
+            cert_path,
         )
+        == downloaded_update_file
+    )
+    # We should have a callback call for each of the hash and signature files
+    assert cb.call_count == 2
 
 
 @pytest.mark.bad_sig
@@ -122,29 +101,27 @@ def test_validate_catches_missing_image(downloaded_update_file, testing_cert):
         )
 
 
-def test_write_update(extracted_update_file, testing_partition):
+def test_write_update(downloaded_update_file, testing_partition):
     updater = update_actions.OT2UpdateActions()
-    img = os.path.join(extracted_update_file, "rootfs.ext4")
     cb = mock.Mock()
-    updater.write_update(img, cb)
-
-    filesize = open(testing_partition).seek(0, 2)
+    updater.write_update(downloaded_update_file, cb)
 
-    call_count = filesize // 1024
-    if call_count * 1024 != filesize:
-        call_count += 1
-
-    assert cb.call_count == call_count
+    # The rootfs is less than a chunk, so it should be read all at once
+    assert cb.call_args_list[0] == mock.call(1.0)
 
     hasher = hashlib.sha256()
     hasher.update(open(testing_partition, "rb").read())
     hash_val = binascii.hexlify(hasher.digest())
-    assert (
-        hash_val
-        == open(os.path.join(extracted_update_file, "rootfs.ext4.hash"), "rb")
-        .read()
-        .strip()
-    )
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        assert hash_val == zf.read("rootfs.ext4.hash").strip()
+
+
+@pytest.mark.bad_hash
+def test_write_update_catches_bad_hash(downloaded_update_file, testing_partition):
+    cb = mock.Mock()
+    updater = update_actions.OT2UpdateActions()
+    with pytest.raises(file_actions.HashMismatch):
+        updater.write_update(downloaded_update_file, cb)
 
 
 def test_commit_update(monkeypatch):
@@ -1,4 +1,7 @@
 from unittest import mock
+import binascii
+import hashlib
+import lzma
 import os
 import zipfile
 
@@ -32,6 +35,27 @@ def test_unzip(downloaded_update_file):
     assert cb.call_count == calls
 
 
+def test_unzip_only_extract_files(downloaded_update_file):
+    cb = mock.Mock()
+    paths, sizes = file_actions.unzip_update(
+        downloaded_update_file,
+        cb,
+        UPDATE_FILES,
+        UPDATE_FILES,
+        extract_files=UPDATE_FILES[1:],
+    )
+    assert paths["rootfs.ext4"] is None
+    assert not os.path.exists(
+        os.path.join(os.path.dirname(downloaded_update_file), "rootfs.ext4")
+    )
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        assert sizes["rootfs.ext4"] == zf.getinfo("rootfs.ext4").file_size
+        for filename in UPDATE_FILES[1:]:
+            assert zf.read(filename) == open(paths[filename], "rb").read()
+    # We should only have callback calls for the two small files
+    assert cb.call_count == 2
+
+
 @pytest.mark.exclude_rootfs_ext4
 def test_unzip_requires_rootfs(downloaded_update_file):
     cb = mock.Mock()
@@ -79,6 +103,53 @@ def test_hash(extracted_update_file):
     cb.assert_called()
 
 
+def test_write_zipped_file(tmpdir):
+    contents = os.urandom(100000)
+    zip_path = os.path.join(tmpdir, "update.zip")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("rootfs.ext4", contents)
+    out_path = os.path.join(tmpdir, "partition")
+    cb = mock.Mock()
+
+    hash_output = file_actions.write_zipped_file(
+        zip_path, "rootfs.ext4", out_path, cb, chunk_size=4096
+    )
+
+    assert open(out_path, "rb").read() == contents
+    assert hash_output == binascii.hexlify(hashlib.sha256(contents).digest())
+    # One callback call per chunk, including the fractional one at the end,
+    # and one for the empty read that finds the end of the file
+    assert cb.call_count == 26
+    assert cb.call_args_list[-1] == mock.call(1.0)
+
+
+def test_write_zipped_file_decompressed(tmpdir):
+    contents = os.urandom(100000)
+    compressed = lzma.compress(contents)
+    zip_path = os.path.join(tmpdir, "update.zip")
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("systemfs.xz", compressed)
+    out_path = os.path.join(tmpdir, "partition")
+
+    hash_output = file_actions.write_zipped_file(
+        zip_path, "systemfs.xz", out_path, mock.Mock(), decompress=lzma.open
+    )
+
+    # The decompressed contents are written, but the compressed ones hashed
+    assert open(out_path, "rb").read() == contents
+    assert hash_output == binascii.hexlify(hashlib.sha256(compressed).digest())
+
+
+def test_write_zipped_file_requires_file(tmpdir):
+    zip_path = os.path.join(tmpdir, "update.zip")
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("rootfs.ext4.hash", b"abc")
+    with pytest.raises(file_actions.FileMissing):
+        file_actions.write_zipped_file(
+            zip_path, "rootfs.ext4", os.path.join(tmpdir, "partition"), mock.Mock()
+        )
+
+
 def test_verify_signature_ok(extracted_update_file, testing_cert):
     file_actions.verify_signature(
         os.path.join(extracted_update_file, "rootfs.ext4.hash"),
@@ -1,15 +1,21 @@
 """Tests for OE Updater."""
+import binascii
+import hashlib
 import os
+import zipfile
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
+from otupdate.common.file_actions import HashMismatch
 from otupdate.common.update_actions import Partition
 from otupdate.openembedded.update_actions import (
     OT3UpdateActions,
     PartitionManager,
     RootFSInterface,
+    ROOTFS_NAME,
+    ROOTFS_HASH_NAME,
 )
 
 import lzma
@@ -104,32 +110,37 @@ def test_commit_update(
     mock_partition_manager_valid_switch.resize_partition.assert_called()
 
 
-def test_lzma(testing_partition, tmpdir):
-    """Test that lzma decompresses a .xz correctly.
+def _write_system_update(tmpdir, contents: bytes, hash_value=None) -> str:
+    compressed = lzma.compress(contents)
+    if hash_value is None:
+        hash_value = binascii.hexlify(hashlib.sha256(compressed).digest())
+    zip_path = os.path.join(tmpdir, "system-update.zip")
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr(ROOTFS_NAME, compressed)
+        zf.writestr(ROOTFS_HASH_NAME, hash_value + b"\n")
+    return zip_path
+
 
-    Updater::write_update has a callback to report progress. callback gets kicked
-    off on writing every chunk.
+def test_lzma(testing_partition, tmpdir):
+    """Test that the system image is decompressed onto the partition.
 
-    This test uses callback call count to see if
-    the entire file decompresses correctly.
+    RootFSInterface::write_update has a callback to report progress, called
+    for every chunk of the compressed image read from the zip.
     """
-    rfs_path = os.path.join(tmpdir, "rootfs.xz")
-    with lzma.open(rfs_path, "w") as f:
-        f.write(os.urandom(400000))
+    contents = os.urandom(400000)
+    zip_path = _write_system_update(tmpdir, contents)
     cb = mock.Mock()
     root_FS_intf = RootFSInterface()
     p = Partition(2, testing_partition, "/media/mmcblk0p2")
-    total_size = 0
-    chunk_size = 1024 * 32
-    with lzma.open(rfs_path, "rb") as fsrc:
-        while True:
-            chunk = fsrc.read(chunk_size)
-            total_size += len(chunk)
-            if len(chunk) != chunk_size:
-                break
-    root_FS_intf.write_update(rfs_path, p, cb, chunk_size)
-    if total_size % chunk_size != 0:
-        calls = int(total_size / chunk_size) + 1
-    else:
-        calls = total_size / chunk_size
-    assert cb.call_count == calls
+    root_FS_intf.write_update(zip_path, p, cb, 1024 * 32)
+    assert open(testing_partition, "rb").read() == contents
+    cb.assert_called_with(1.0)
+
+
+def test_lzma_catches_bad_hash(testing_partition, tmpdir):
+    """Test that a system image that doesn't match its hash is an error."""
+    zip_path = _write_system_update(tmpdir, os.urandom(1000), hash_value=b"abc123")
+    root_FS_intf = RootFSInterface()
+    p = Partition(2, testing_partition, "/media/mmcblk0p2")
+    with pytest.raises(HashMismatch):
+        root_FS_intf.write_update(zip_path, p, mock.Mock())